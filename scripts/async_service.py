@@ -5,7 +5,7 @@ import inspect
 import re
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
 
 import requests
 
@@ -101,6 +101,23 @@ class ServiceEndpoint:
             return url[1:]
         return url
 
+    def request_url(self) -> str:
+        """Returns the expression of the URL of the endpoint, formatted with the path parameters."""
+        path_params = [p for p in self.params if p.in_ == "path"]
+        if len(path_params) == 0:
+            return f"urljoin(self.host, '{self.url}')"
+        else:
+            # note that here we have a condition on `namespace` because `namespace` can be a global configuration. So,
+            # we either take it from the endpoint (prioritized just in case users rely on the service to use
+            # generated models but not Hera models) or from the global configuration
+            req_url_params = []
+            for p in path_params:
+                if p.name == "namespace":
+                    req_url_params.append("namespace=namespace if namespace is not None else self.namespace")
+                else:
+                    req_url_params.append(f"{p.field}={p.name}")
+            return f"urljoin(self.host, '{self.url}').format({', '.join(req_url_params)})"
+
     def __str__(self) -> str:
         """Builds the entire string signature of the service endpoints."""
         if len(self.params) == 0:
@@ -119,20 +136,7 @@ class ServiceEndpoint:
         \"\"\"{self.summary}\"\"\""""
 
         # url
-        path_params = [p for p in self.params if p.in_ == "path"]
-        if len(path_params) == 0:
-            req_url = f"urljoin(self.host, '{self.url}')"
-        else:
-            # note that here we have a condition on `namespace` because `namespace` can be a global configuration. So,
-            # we either take it from the endpoint (prioritized just in case users rely on the service to use
-            # generated models but not Hera models) or from the global configuration
-            req_url_params = []
-            for p in path_params:
-                if p.name == "namespace":
-                    req_url_params.append("namespace=namespace if namespace is not None else self.namespace")
-                else:
-                    req_url_params.append(f"{p.field}={p.name}")
-            req_url = f"urljoin(self.host, '{self.url}').format({', '.join(req_url_params)})"
+        req_url = self.request_url()
 
         # query params
         query_params = [p for p in self.params if p.in_ == "query"]
@@ -167,7 +171,11 @@ class ServiceEndpoint:
         elif "Response" in self.response.ref and "InfoResponse" not in self.response.ref:
             ret_val = f"{self.response}()"
         else:
-            ret_val = f"{self.response}(**resp.json())"
+            # a response projected with `fields` lacks the other fields, including required ones, so it is not validated
+            validate = "self.validate_responses"
+            if any(p.name == "fields" for p in self.params):
+                validate += " and fields is None"
+            ret_val = f"parse_response({self.response}, resp.content, {validate})"
 
         return f"""
     {signature}
@@ -187,6 +195,297 @@ class ServiceEndpoint:
 """
 
 
+class PaginatedEndpoint:
+    """A generator paging through the results of a list endpoint, which yields the listed items one at a time."""
+
+    # the parameters of the list endpoints used to watch the resources or to page through them
+    excluded_params = {
+        "watch",
+        "allow_watch_bookmarks",
+        "send_initial_events",
+        "timeout_seconds",
+        "limit",
+        "continue_",
+    }
+
+    def __init__(self, endpoint: ServiceEndpoint) -> None:
+        """Instantiate a paginated endpoint from the given list endpoint.
+
+        Args:
+            endpoint: (ServiceEndpoint) the list endpoint returning a page of items, e.g. a `WorkflowList`.
+        """
+        self.endpoint = endpoint
+        self.name = endpoint.name.replace("list_", "iter_", 1)
+        self.item = endpoint.response.ref[: -len("List")]
+        self.params = [p for p in endpoint.params if p.name not in self.excluded_params]
+
+    @staticmethod
+    def is_paginated(endpoint: ServiceEndpoint) -> bool:
+        """Return whether the given endpoint lists items by pages, which the generator can page through."""
+        return (
+            endpoint.name.startswith("list_")
+            and endpoint.response.ref.endswith("List")
+            and any(p.name == "continue_" for p in endpoint.params)
+        )
+
+    @staticmethod
+    def argument(param: Parameter) -> str:
+        """Return the value of the given parameter passed to the list endpoint for each page."""
+        if param.name == "fields":
+            return "paginated_fields(fields)"
+        if param.name in {"resource_version", "resource_version_match"}:
+            # the continue token of the next pages already holds the resource version of the first one
+            return f"{param.name} if continue_ is None else None"
+        return param.name
+
+    def __str__(self) -> str:
+        """Builds the generator method in the service."""
+        params = "".join(f"\n        {p}," for p in self.params)
+        arguments = "".join(f"\n                {p.name}={self.argument(p)}," for p in self.params)
+        resources = self.name[len("iter_") :].replace("_", " ")
+        fields_doc = (
+            "\n        If `fields` is given, the token needed to fetch the next page is added to it."
+            if any(p.name == "fields" for p in self.params)
+            else ""
+        )
+        return f"""
+    async def {self.name}(
+        self,{params}
+        limit: int = 500,
+    ) -> AsyncGenerator[{self.item}, None]:
+        \"\"\"Yield the {resources} one at a time, paging through them with `{self.endpoint.name}`.
+
+        Pages of `limit` {resources} are fetched as they are consumed, so only one page is held in memory at a time.{fields_doc}
+        \"\"\"
+        continue_ = None
+        while True:
+            page = await self.{self.endpoint.name}({arguments}
+                limit=str(limit),
+                continue_=continue_,
+            )
+            for item in page.items or []:
+                yield item
+            continue_ = page.metadata.continue_ if page.metadata is not None else None
+            if not continue_:
+                return
+"""
+
+
+class DownloadEndpoint:
+    """Methods downloading the file of an endpoint, such as an artifact, in chunks rather than all at once."""
+
+    def __init__(self, endpoint: ServiceEndpoint) -> None:
+        """Instantiate a download endpoint from the given file endpoint.
+
+        Args:
+            endpoint: (ServiceEndpoint) the endpoint responding with the content of a file, e.g. `get_output_artifact`.
+        """
+        self.endpoint = endpoint
+        self.resource = endpoint.name[len("get_") :]
+        self.required = [p for p in endpoint.params if p.required]
+        self.optional = [p for p in endpoint.params if not p.required]
+
+    @staticmethod
+    def is_download(endpoint: ServiceEndpoint) -> bool:
+        """Return whether the given endpoint responds with the content of an artifact."""
+        return endpoint.name.startswith("get_") and "artifact" in endpoint.name and endpoint.response.ref == "str"
+
+    def __str__(self) -> str:
+        """Builds the streaming and downloading methods in the service."""
+        required = "".join(f"\n        {p}," for p in self.required)
+        optional = "".join(f"\n        {p}," for p in self.optional)
+        description = self.resource.replace("_", " ").replace(" uid", " UID")
+        url = self.endpoint.request_url()
+        return f"""
+    async def stream_{self.resource}(
+        self,{required}{optional}
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> AsyncGenerator[bytes, None]:
+        \"\"\"Yield the content of the {description} in chunks of up to `chunk_size` bytes, as it is received.
+
+        Unlike `{self.endpoint.name}`, the content is never held in memory all at once. If the connection is lost,
+        the download is resumed from the last received byte, making at most `max_retries` consecutive attempts.
+        \"\"\"
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        async for chunk in aiter_download(
+            self.session,
+            url={url},
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={{"Authorization": self.token or ""}},
+        ):
+            yield chunk
+
+    async def download_{self.resource}(
+        self,{required}
+        destination: Union[str, os.PathLike, BinaryIO],{optional}
+        checksum: Optional[str] = None,
+        resume: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> int:
+        \"\"\"Download the {description} to `destination`, a path or a binary file object, returning its size in bytes.
+
+        The content is written in chunks of up to `chunk_size` bytes as it is received, and the download is resumed
+        from the last received byte if the connection is lost (see `stream_{self.resource}`). A path is written to
+        as `<path>.part` until the download completes. If `resume` is true, a `.part` file left by an interrupted
+        download is resumed from its end rather than downloaded again, unless the file changed since (as told by its
+        ETag or Last-Modified date), in which case it is downloaded again.
+
+        If `checksum` is given, as `algorithm:hexdigest` (e.g. `sha256:...`), the downloaded content is verified
+        against it, raising `ChecksumMismatch` if it differs.
+        \"\"\"
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        return await async_download(
+            self.session,
+            url={url},
+            destination=destination,
+            checksum=checksum,
+            resume=resume,
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={{"Authorization": self.token or ""}},
+        )
+"""
+
+
+class StreamEndpoint:
+    """A watch endpoint of the Argo server, which streams events until the connection is closed."""
+
+    def __init__(self, url: str, name: str, response: str, resources: str, fields: bool = False) -> None:
+        """Instantiate a stream endpoint.
+
+        Args:
+            url: (str) the relative URL of the endpoint.
+            name: (str) the name of the method consuming the stream in the service.
+            response: (str) the type of the streamed events.
+            resources: (str) the plural name of the watched resources, used in the method documentation.
+            fields: (bool = False) whether the endpoint supports the `fields` parameter, to only return some fields.
+        """
+        self.url = url
+        self.name = name
+        self.response = response
+        self.resources = resources
+        self.fields = fields
+
+    def __str__(self) -> str:
+        """Builds the method consuming the stream in the service."""
+        fields_param = "\n        fields: Optional[str] = None," if self.fields else ""
+        fields_item = ", 'fields': fields" if self.fields else ""
+        validate = "self.validate_responses and fields is None" if self.fields else "self.validate_responses"
+        return f"""
+    async def {self.name}(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,{fields_param}
+        reconnect: bool = True,
+        max_reconnects: Optional[int] = None,
+    ) -> AsyncGenerator[{self.response}, None]:
+        \"\"\"Stream the changes to the {self.resources} of the namespace, yielding each event as soon as it is received.
+
+        If `reconnect` is true, the stream is reopened with an exponential backoff when the connection is lost or
+        closed by the server, resuming after the last received event, or after `resource_version` if given.
+        `max_reconnects` limits the number of consecutive failed attempts to reconnect.
+        \"\"\"
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        async for result in aiter_watch_results(
+            self.session,
+            url=urljoin(self.host, '{self.url}').format(namespace=namespace if namespace is not None else self.namespace),
+            params={{'listOptions.labelSelector': label_selector, 'listOptions.fieldSelector': field_selector{fields_item}}},
+            resource_version=resource_version,
+            reconnect=reconnect,
+            max_reconnects=max_reconnects,
+            headers={{"Authorization": self.token or ""}},
+        ):
+            yield build_model({self.response}, result, {validate})
+"""
+
+
+class LogStreamEndpoint:
+    """A log endpoint of the Argo server, which streams the log entries of the pods of a workflow."""
+
+    def __init__(self, url: str, name: str, response: str) -> None:
+        """Instantiate a log stream endpoint.
+
+        Args:
+            url: (str) the relative URL of the endpoint.
+            name: (str) the name of the method consuming the stream in the service.
+            response: (str) the type of the streamed log entries.
+        """
+        self.url = url
+        self.name = name
+        self.response = response
+
+    def __str__(self) -> str:
+        """Builds the method consuming the stream in the service."""
+        return f"""
+    async def {self.name}(
+        self,
+        name: str,
+        namespace: Optional[str] = None,
+        pod_name: Optional[str] = None,
+        container: str = "main",
+        follow: bool = False,
+        timestamps: bool = False,
+        since_seconds: Optional[int] = None,
+        tail_lines: Optional[int] = None,
+        grep: Optional[str] = None,
+        selector: Optional[str] = None,
+        reconnect: bool = True,
+        max_reconnects: Optional[int] = None,
+    ) -> AsyncGenerator[{self.response}, None]:
+        \"\"\"Stream the logs of the pods of the workflow, or of `pod_name`, yielding each entry as soon as it is received.
+
+        The Argo server merges the logs of all the pods of the workflow (or the ones matching the `selector` label
+        selector) into the stream. If `follow` is true, the stream continues until the workflow completes, otherwise it
+        ends with the logs written so far. Only the last `tail_lines` lines, or the lines of the last `since_seconds`
+        seconds, of each pod are streamed if given, and only the lines matching the `grep` regular expression.
+
+        If `reconnect` is true, the stream is reopened with an exponential backoff when the connection is lost,
+        resuming after the last received entries. `max_reconnects` limits the number of consecutive failed attempts to
+        reconnect.
+        \"\"\"
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        async for result in aiter_log_results(
+            self.session,
+            url=urljoin(self.host, '{self.url}').format(name=name, namespace=namespace if namespace is not None else self.namespace),
+            params={{
+                'podName': pod_name,
+                'logOptions.container': container,
+                'logOptions.follow': follow,
+                'logOptions.sinceSeconds': since_seconds,
+                'logOptions.tailLines': tail_lines,
+                'grep': grep,
+                'selector': selector,
+            }},
+            timestamps=timestamps,
+            reconnect=reconnect,
+            max_reconnects=max_reconnects,
+            headers={{"Authorization": self.token or ""}},
+        ):
+            yield build_model({self.response}, result, self.validate_responses)
+"""
+
+
+stream_endpoints: Dict[str, List[Union[StreamEndpoint, LogStreamEndpoint]]] = {
+    "workflows": [
+        StreamEndpoint(
+            "api/v1/workflow-events/{namespace}", "stream_workflows", "WorkflowWatchEvent", "workflows", fields=True
+        ),
+        LogStreamEndpoint("api/v1/workflows/{namespace}/{name}/log", "stream_workflow_logs", "LogEntry"),
+    ],
+    "events": [
+        StreamEndpoint(
+            "api/v1/stream/event-sources/{namespace}", "stream_event_sources", "EventSourceWatchEvent", "event sources"
+        ),
+        StreamEndpoint("api/v1/stream/sensors/{namespace}", "stream_sensors", "SensorWatchEvent", "sensors"),
+    ],
+}
+
+
 def get_models_type() -> str:
     """Gets the model type to generate from argv and returns it. This is either `workflows` or `events`."""
     assert len(sys.argv) == 3, "Expected two argv arguments - the Argo OpenAPI spec URL and [workflows|events]"
@@ -402,9 +701,13 @@ def get_service_def() -> str:
 from urllib.parse import urljoin
 import os
 from hera.{module}.models import {imports}
-from hera.shared import global_config
+from hera.shared import TransportConfig, global_config
+from hera.shared._download import DEFAULT_CHUNK_SIZE, DEFAULT_MAX_RETRIES, aiter_download, async_download
+from hera.shared._pagination import paginated_fields
+from hera.shared._responses import build_model, parse_response
+from hera.shared._stream import aiter_log_results, aiter_watch_results
 from hera.exceptions import exception_from_server_response
-from typing import Optional, Tuple, cast, TYPE_CHECKING
+from typing import AsyncGenerator, BinaryIO, Optional, Tuple, Union, cast, TYPE_CHECKING
 
 if TYPE_CHECKING:
     import httpx
@@ -423,9 +726,11 @@ class {models_type}Service:
         client_certs: Optional[Tuple[str, str]] = None,
         namespace: Optional[str] = None,
         session: Optional["httpx.AsyncClient"] = None,
+        transport_config: Optional[TransportConfig] = None,
+        validate_responses: Optional[bool] = None,
     ) -> None:
         \"\"\"{models_type} service constructor.\"\"\"
-        import httpx
+        from hera.shared._async_transport import build_async_client
 
         self.host = cast(str, host or global_config.host)
         self.verify_ssl = verify_ssl if verify_ssl is not None else global_config.verify_ssl
@@ -451,7 +756,12 @@ class {models_type}Service:
         else:
             self.token = None
 
-        self.session = session or httpx.AsyncClient(verify=self.verify_ssl, cert=self.client_certs)
+        # unvalidated responses are returned as lazy models, whose fields are only validated when first accessed
+        self.validate_responses = (
+            validate_responses if validate_responses is not None else global_config.validate_responses
+        )
+        self.transport_config = transport_config or global_config.transport_config
+        self.session = session or build_async_client(self.transport_config, verify=self.verify_ssl, cert=self.client_certs)
 
         self.namespace = namespace or global_config.namespace
 
@@ -506,6 +816,14 @@ def make_service(service_def: str, endpoints: List[ServiceEndpoint], models_type
     if models_type in {"workflows"}:
         result = add_get_workflow_link(result)
         result = add_get_cron_workflow_link(result)
+    for endpoint in endpoints:
+        if PaginatedEndpoint.is_paginated(endpoint):
+            result = result + f"{PaginatedEndpoint(endpoint)}\n"
+    for endpoint in endpoints:
+        if DownloadEndpoint.is_download(endpoint):
+            result = result + f"{DownloadEndpoint(endpoint)}\n"
+    for stream_endpoint in stream_endpoints[models_type]:
+        result = result + f"{stream_endpoint}\n"
     result += f"\n\n__all__ = ['Async{models_type.capitalize()}Service']"
     return result
 
@@ -543,7 +861,11 @@ if __name__ == "__main__":
     produces = get_produces(payload)
     paths = get_paths(payload)
     endpoints = get_endpoints(paths, models_type, consumes=consumes, produces=produces)
-    imports = get_imports(endpoints)
+    imports = sorted(
+        set(get_imports(endpoints))
+        | {e.response for e in stream_endpoints[models_type]}
+        | {PaginatedEndpoint(e).item for e in endpoints if PaginatedEndpoint.is_paginated(e)}
+    )
     service_def = get_service_def()
     service_def = service_def.format(
         imports=", ".join(imports),
@@ -0,0 +1,90 @@
+"""A script that measures the cold start of the Hera runner, as paid by every script pod running a Hera function.
+
+Run it with `make benchmark-runner`, optionally passing the number of runs, e.g.
+`poetry run python scripts/benchmark_runner.py 20`. Each run is a fresh `python -m hera.workflows.runner` process,
+running a function taking a pydantic v2 `Input`, and the median wall time and peak memory of the runs are printed,
+along with the time taken to import the runner and the heaviest modules it imports.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+FUNCTION_MODULE = textwrap.dedent(
+    """
+    from typing import Annotated
+
+    from hera.workflows import Parameter
+    from hera.workflows.io.v2 import Input
+
+
+    class MyInput(Input):
+        name: str
+        count: Annotated[int, Parameter(name="repeat")] = 1
+
+
+    def greet(my_input: MyInput) -> str:
+        return " ".join([f"Hello {my_input.name}!"] * my_input.count)
+    """
+)
+
+ARGUMENTS = [{"name": "name", "value": "Hera"}, {"name": "repeat", "value": "2"}]
+
+
+def run(directory: Path, args_path: Path) -> Tuple[float, float]:
+    """Run the runner in a fresh process, returning its wall time in seconds and its peak memory in MB."""
+    command = [sys.executable, "-m", "hera.workflows.runner", "-e", "benchmark_function:greet", str(args_path)]
+    start = time.perf_counter()
+    process = subprocess.Popen(command, cwd=directory, stdout=subprocess.DEVNULL)
+    _, status, usage = os.wait4(process.pid, 0)
+    elapsed = time.perf_counter() - start
+    assert status == 0, "The runner failed"
+    # `ru_maxrss` is in kilobytes on Linux, and in bytes on macOS
+    return elapsed, usage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def import_times(directory: Path) -> List[Tuple[int, str]]:
+    """Return the cumulative import times in microseconds of the modules imported by the runner, slowest first."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import hera.workflows._runner.util"],
+        cwd=directory,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    # each line is `import time: <self us> | <cumulative us> | <module>`
+    times = []
+    for line in stderr.splitlines()[1:]:
+        _, cumulative, module = line.split("|")
+        times.append((int(cumulative), module.strip()))
+    return sorted(times, reverse=True)
+
+
+def main(n_runs: int) -> None:
+    """Print the median wall time and peak memory of `n_runs` runs of the runner, and its slowest imports."""
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        (directory / "benchmark_function.py").write_text(FUNCTION_MODULE)
+        args_path = directory / "args.json"
+        args_path.write_text(json.dumps(ARGUMENTS))
+
+        runs = [run(directory, args_path) for _ in range(n_runs)]
+        times = import_times(directory)
+
+    print(f"Runner cold start over {n_runs} runs")
+    print(f"  {'wall time':>12}: {statistics.median(elapsed for elapsed, _ in runs):.3f}s")
+    print(f"  {'peak memory':>12}: {statistics.median(memory for _, memory in runs):.0f}MB")
+    print("Slowest imports (cumulative)")
+    for cumulative, module in times[:10]:
+        print(f"  {cumulative / 1000:>8.1f}ms {module}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
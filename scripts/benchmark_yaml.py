@@ -0,0 +1,64 @@
+"""A script that compares the speed of `Workflow.to_yaml` with the libyaml emitter and the pure-Python emitter.
+
+Run it with `make benchmark-yaml`, optionally passing the number of tasks of the generated Workflow, e.g.
+`poetry run python scripts/benchmark_yaml.py 2000`.
+"""
+
+import sys
+import timeit
+
+import yaml
+
+from hera import _yaml
+from hera.workflows import DAG, Parameter, Workflow, script
+
+
+@script(outputs=[Parameter(name="result", value_from={"path": "/tmp/result"})])
+def step(index: int, message: str):
+    """Prints a message."""
+    import json
+
+    print(json.dumps({"index": index, "message": message}))
+
+
+def make_workflow(n_tasks: int) -> Workflow:
+    """Build a Workflow with a DAG of `n_tasks` tasks using a script template."""
+    with Workflow(generate_name="benchmark-", entrypoint="dag") as w:
+        with DAG(name="dag"):
+            previous = None
+            for i in range(n_tasks):
+                task = step(
+                    name=f"step-{i}",
+                    arguments={
+                        "index": i,
+                        "message": "{{workflow.name}} is running a step with a long message "
+                        + (f"{{{{tasks.step-{i - 1}.outputs.parameters.result}}}}" if previous else "first"),
+                    },
+                )
+                if previous is not None:
+                    previous >> task
+                previous = task
+    return w
+
+
+def main(n_tasks: int) -> None:
+    """Print the time taken by `Workflow.to_yaml` for a large Workflow with each emitter."""
+    workflow = make_workflow(n_tasks)
+    c_output = workflow.to_yaml()
+    # Passing the `Dumper` explicitly opts out of the libyaml emitter
+    python_output = workflow.to_yaml(Dumper=yaml.Dumper)
+    assert c_output == python_output, "The libyaml and pure-Python emitters produced different output"
+
+    print(f"Workflow.to_yaml with {n_tasks} tasks ({c_output.count(chr(10))} lines of YAML)")
+    for name, dump in [
+        ("pure-Python emitter", lambda: workflow.to_yaml(Dumper=yaml.Dumper)),
+        ("libyaml emitter", workflow.to_yaml),
+    ]:
+        best = min(timeit.repeat(dump, number=1, repeat=5))
+        print(f"  {name:>20}: {best:.3f}s")
+
+
+if __name__ == "__main__":
+    if _yaml._CDumper is None:
+        sys.exit("PyYAML was not built with libyaml, only the pure-Python emitter is available")
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
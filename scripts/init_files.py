@@ -22,20 +22,61 @@ header = '''
 # themselves, as it introduces a circular dependency.
 '''
 
+# The exported objects are only imported once accessed (see PEP 562), so that importing `hera.workflows` does not import
+# all of its submodules, with the models and the services. Type checkers see the imports of the `TYPE_CHECKING` block.
+lazy_loader = """
+# the module of each exported object, imported when the object is first accessed
+_EXPORTS = {exports}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+class _LazyModule(ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # an imported submodule is set as an attribute of its package, which must not shadow the object of the same
+        # name exported by the package, e.g. the `script` module and the `script` decorator
+        if name in _EXPORTS and isinstance(value, ModuleType) and value.__name__ == f"{{__name__}}.{{name}}":
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyModule
+"""
+
 hera_workflows_init = Path(hera_workflows.__file__)
 
-exports = []
+exports = {}
 
-outputs = [header]
+outputs = [
+    header,
+    "import importlib",
+    "import sys",
+    "from types import ModuleType",
+    "from typing import TYPE_CHECKING, Any, List",
+    "",
+    "if TYPE_CHECKING:",
+]
 
 for module_name in workflow_modules:
     module = importlib.import_module(f"hera.workflows.{module_name}")
     for export in getattr(module, "__all__", []):
         if export in exports:
             raise ValueError(f"Duplicate export {export}")
-        exports.append(export)
-        outputs.append(f"from hera.workflows.{module_name} import {export}")
+        exports[export] = f"hera.workflows.{module_name}"
+        outputs.append(f"    from hera.workflows.{module_name} import {export}")
 
+outputs.append(lazy_loader.format(exports=repr(exports)))
 outputs.append(f"__all__ = {repr(list(sorted(exports)))}")
 
 hera_workflows_init.write_text("\n".join(outputs))
@@ -3,6 +3,7 @@
 # we want the init of `workflows.models` to have a filtered import of Workflow models
 # we can parse out the JSON using the old code and filter on Workflow objects
 import os
+import re
 import sys
 from dataclasses import dataclass
 from pathlib import Path
@@ -34,20 +35,36 @@ class ImportReference:
         return self.name
 
 
+DEFER_BUILD_FLAG = "--defer-build"
+
+ARGV_USAGE = (
+    "Expected the Argo OpenAPI spec URL and [workflows|events] argv arguments, optionally followed by --defer-build"
+)
+
+
 def get_openapi_spec_url() -> str:
     """Gets the OpenAPI spec URL from argv and returns it."""
-    assert len(sys.argv) == 3, "Expected two argv arguments - the Argo OpenAPI spec URL and [workflows|events]"
+    assert len(sys.argv) in (3, 4), ARGV_USAGE
     return sys.argv[1]
 
 
 def get_models_type() -> str:
     """Gets the model type to generate from argv and returns it. This is either `workflows` or `events`."""
-    assert len(sys.argv) == 3, "Expected two argv arguments - the Argo OpenAPI spec URL and [workflows|events]"
+    assert len(sys.argv) in (3, 4), ARGV_USAGE
     arg = sys.argv[2]
     assert arg in model_types, f"Unsupported model type {arg}, expected one of {model_types}"
     return arg
 
 
+def get_defer_build() -> bool:
+    """Gets whether the models should defer building their validators from argv, given by the `--defer-build` flag."""
+    assert len(sys.argv) in (3, 4), ARGV_USAGE
+    if len(sys.argv) == 4:
+        assert sys.argv[3] == DEFER_BUILD_FLAG, ARGV_USAGE
+        return True
+    return False
+
+
 def fetch_openapi_spec(url: str) -> dict:
     """Fetches the OpenAPI specification at the given URI."""
     response = requests.get(url, timeout=60)
@@ -154,6 +171,43 @@ def write_imports(references: List[ImportReference], models_type: str, openapi_s
         f.write(f"\n__all__ = [{models_str}]\n")
 
 
+def _add_pydantic_import(source: str, name: str) -> str:
+    """Adds the given name to the `from pydantic import ...` statement of the given module source."""
+    match = re.search(r"^from pydantic import (.*)$", source, flags=re.M)
+    assert match is not None, "Expected the models to import from pydantic"
+    names = sorted({*match.group(1).split(", "), name}, key=str.lower)
+    return source[: match.start()] + f"from pydantic import {', '.join(names)}" + source[match.end() :]
+
+
+def defer_builds(models_type: str) -> None:
+    """Makes the generated models build their validators when they are first used, rather than when imported.
+
+    Most processes only use a few of the models, e.g. the runner, so building the validators of all the models when
+    importing them wastes time and memory. The models are made to subclass `DeferredAPIBaseModel`, whose config sets
+    `defer_build`, and the root models set it in their own config. The `model_rebuild` calls added for the forward
+    references are removed, as they would build the validators of most models, the forward references being resolved
+    when the validators are built instead.
+    """
+    for path in sorted(Path(f"src/hera/{models_type}/models").rglob("*.py")):
+        source = path.read_text()
+        deferred = re.sub(r"^\w+\.model_rebuild\(\)\n", "", source, flags=re.M)
+        deferred = deferred.replace(
+            "from hera.shared._pydantic import APIBaseModel\n",
+            "from hera.shared._pydantic import DeferredAPIBaseModel\n",
+        )
+        deferred = deferred.replace("(APIBaseModel):", "(DeferredAPIBaseModel):")
+        deferred, root_models = re.subn(
+            r"^(class \w+\(RootModel\[.*\]\):\n)",
+            r"\1    model_config = ConfigDict(defer_build=True)\n\n",
+            deferred,
+            flags=re.M,
+        )
+        if root_models:
+            deferred = _add_pydantic_import(deferred, "ConfigDict")
+        if deferred != source:
+            path.write_text(deferred)
+
+
 def ensure_init():
     """Ensure that an init file is present in every folder.
 
@@ -180,3 +234,5 @@ if __name__ == "__main__":
     imports = get_import_paths_from_refs(filtered_refs, root_path)
     write_imports(imports, models_type, openapi_spec_url)
     ensure_init()
+    if get_defer_build():
+        defer_builds(models_type)
@@ -82,6 +82,34 @@ class GenerateYaml:
             ),
         ),
     ] = field(default_factory=list)
+    jobs: Annotated[
+        int,
+        Arg(
+            short="-j",
+            long=True,
+            help=(
+                "The number of processes used to load the Python files and generate their YAML. "
+                "Use 0 to start one process per CPU. The output is the same as with the default of 1 process."
+            ),
+        ),
+    ] = 1
+    cache_dir: Annotated[
+        Union[Path, None],
+        Arg(
+            long=True,
+            help=(
+                "Optional folder to cache the generated YAML in. Python files are only loaded again if they, "
+                "or the local files they import, have changed since the YAML was cached, or if the Hera version "
+                "or options have changed."
+            ),
+        ),
+    ] = None
+    changed_only: Annotated[
+        bool,
+        Arg(
+            help="Only write the output files whose content has changed, leaving the others untouched.",
+        ),
+    ] = False
 
 
 @command(
@@ -0,0 +1,154 @@
+"""On-disk cache of the output generated for each input file, used by `hera generate yaml --cache-dir`."""
+
+import ast
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+
+def _hash_file(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _is_installed(path: Path) -> bool:
+    """Return whether the path is part of the Python installation or environment, rather than a local file."""
+    prefixes = {sys.prefix, sys.base_prefix, sys.exec_prefix, sys.base_exec_prefix}
+    return any(path.is_relative_to(Path(prefix).resolve()) for prefix in prefixes)
+
+
+def _local_search_paths() -> List[Path]:
+    """Return the folders local modules can be imported from (i.e. `sys.path` without the Python environment)."""
+    search_paths = []
+    for entry in sys.path + [os.getcwd()]:
+        search_path = Path(entry or os.getcwd()).resolve()
+        if search_path.is_dir() and not _is_installed(search_path) and search_path not in search_paths:
+            search_paths.append(search_path)
+    return search_paths
+
+
+def _module_files(base: Path, module_parts: List[str]) -> Iterator[Path]:
+    """Yield the files executed when importing the module at `module_parts` relative to `base`.
+
+    This includes the `__init__.py` of each parent package, as they are executed first.
+    """
+    for i in range(1, len(module_parts) + 1):
+        module_path = base.joinpath(*module_parts[:i])
+        if (module_path / "__init__.py").is_file():
+            yield module_path / "__init__.py"
+        elif module_path.with_suffix(".py").is_file():
+            yield module_path.with_suffix(".py")
+
+
+def _imported_files(path: Path, search_paths: List[Path]) -> Set[Path]:
+    """Return the local files directly imported by the Python file at `path`."""
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except SyntaxError:
+        return set()
+
+    imported: Set[Path] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            candidates = [(search_paths, alias.name.split(".")) for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            module_parts = node.module.split(".") if node.module else []
+            if node.level:
+                # Relative imports are resolved from the file's package, going up one package per extra level
+                package = path.parent
+                for _ in range(node.level - 1):
+                    package = package.parent
+                bases = [package]
+            else:
+                bases = search_paths
+            # Imported names may be submodules, e.g. `from package import module`
+            candidates = [(bases, module_parts)] + [(bases, module_parts + [alias.name]) for alias in node.names]
+        else:
+            continue
+
+        for bases, module_parts in candidates:
+            for base in bases:
+                imported.update(_module_files(base, module_parts))
+    imported.discard(path)
+    return imported
+
+
+def find_local_dependencies(path: Path, imports_cache: Optional[Dict[Path, Set[Path]]] = None) -> Set[Path]:
+    """Return the given Python file and all the local files it transitively imports, as resolved paths.
+
+    `imports_cache` can be given to reuse the parsed imports of each file across calls.
+    """
+    imports_cache = {} if imports_cache is None else imports_cache
+    search_paths = _local_search_paths()
+    path = path.resolve()
+    dependencies = {path}
+    to_visit = [path]
+    while to_visit:
+        visiting = to_visit.pop()
+        if visiting not in imports_cache:
+            imports_cache[visiting] = {
+                imported.resolve()
+                for imported in _imported_files(visiting, search_paths)
+                if not _is_installed(imported.resolve())
+            }
+        for imported in imports_cache[visiting]:
+            if imported not in dependencies:
+                dependencies.add(imported)
+                to_visit.append(imported)
+    return dependencies
+
+
+class OutputCache:
+    """A cache of the outputs generated from each input file, stored as one JSON file per input file in `cache_dir`.
+
+    An entry is reused if the content of the input file and of every local file it (transitively) imports are
+    unchanged. The `key` must contain anything else the outputs depend on, such as the Hera version and the command
+    options.
+    """
+
+    def __init__(self, cache_dir: Path, key: Dict[str, Any]) -> None:
+        self.cache_dir = cache_dir
+        self.key = json.dumps(key, sort_keys=True, default=str)
+        self._file_hashes: Dict[Path, Optional[str]] = {}
+        self._imports: Dict[Path, Set[Path]] = {}
+
+    def _entry_path(self, path: Path) -> Path:
+        entry_key = hashlib.sha256(f"{self.key}\n{path.resolve()}".encode()).hexdigest()
+        return self.cache_dir / f"{entry_key}.json"
+
+    def _current_hash(self, path: Path) -> Optional[str]:
+        # Files are hashed at most once per run as many input files share the same dependencies
+        if path not in self._file_hashes:
+            self._file_hashes[path] = _hash_file(path) if path.is_file() else None
+        return self._file_hashes[path]
+
+    def get(self, path: Path) -> Optional[List[str]]:
+        """Return the cached outputs for the input file at `path`, or None if it or its dependencies have changed."""
+        try:
+            entry = json.loads(self._entry_path(path).read_text())
+        except (OSError, ValueError):
+            return None
+
+        for dependency, file_hash in entry["dependencies"].items():
+            if self._current_hash(Path(dependency)) != file_hash:
+                return None
+        return entry["outputs"]
+
+    def put(self, path: Path, outputs: List[str]) -> None:
+        """Store the outputs generated from the input file at `path`."""
+        entry = {
+            "dependencies": {
+                str(dependency): self._current_hash(dependency)
+                for dependency in find_local_dependencies(path, self._imports)
+            },
+            "outputs": outputs,
+        }
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry_path = self._entry_path(path)
+        # Write to a temporary file first so an interrupted run cannot leave a truncated entry
+        tmp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(entry))
+        os.replace(tmp_path, entry_path)
@@ -13,10 +13,7 @@ from hera._cli.base import GeneratePython
 from hera._cli.generate.util import YAML_EXTENSIONS, convert_code, expand_paths, write_output
 from hera.shared import global_config
 from hera.shared._pydantic import APIBaseModel
-from hera.shared._type_util import (
-    get_annotated_metadata,
-)
-from hera.workflows._meta_mixins import ModelMapperMixin, _get_model_attr
+from hera.workflows._meta_mixins import _get_model_attr
 from hera.workflows.cluster_workflow_template import ClusterWorkflowTemplate
 from hera.workflows.container import Container
 from hera.workflows.container_set import ContainerNode, ContainerSet
@@ -59,17 +56,16 @@ def generate_python(options: GeneratePython):
     """
     paths = sorted(expand_paths(options.from_, YAML_EXTENSIONS, recursive=options.recursive))
 
-    path_to_output = convert_code(
+    documents = convert_code(
         paths,
         options,
         loader_func=load_yaml_workflows,
         dumper_func=workflow_to_python,
-        join_delimiter="\n",
     )
 
     write_output(
         options.to,
-        path_to_output,
+        documents,
         extensions={DEFAULT_EXTENSION},
         default_extension=DEFAULT_EXTENSION,
         join_delimiter="\n",
@@ -163,52 +159,50 @@ class WorkflowPythonBuilder:
         keywords: List[ast.keyword] = []
         body = []
 
-        for attr, annotation in hera_workflow_class._get_all_annotations().items():
-            if mappers := get_annotated_metadata(annotation, ModelMapperMixin.ModelMapper):
-                if len(mappers) != 1:
-                    raise ValueError("Expected only one model mapper")
-                if model_path := mappers[0].model_path:
-                    try:
-                        if hera_workflow_class == CronWorkflow and attr == "suspend":
-                            # Special case for CronWorkflow which has `cron_suspend` and `suspend`,
-                            # which should go to the workflow_spec (but is also a valid attribute of
-                            # CronWorkflow and exists in the model at the same model_path)
-                            raise AttributeError()
-
-                        value = _get_model_attr(self.model, model_path)
-                    except AttributeError:
-                        if hera_workflow_class == CronWorkflow:
-                            model_path = [model_path[0], "workflow_spec"] + model_path[1:]
-                            try:
-                                value = _get_model_attr(self.model, model_path)
-                            except AttributeError:
-                                continue
-                        else:
+        for mapping in hera_workflow_class._get_model_mappings():
+            attr = mapping.attr
+            if model_path := mapping.mapper.model_path:
+                try:
+                    if hera_workflow_class == CronWorkflow and attr == "suspend":
+                        # Special case for CronWorkflow which has `cron_suspend` and `suspend`,
+                        # which should go to the workflow_spec (but is also a valid attribute of
+                        # CronWorkflow and exists in the model at the same model_path)
+                        raise AttributeError()
+
+                    value = _get_model_attr(self.model, model_path)
+                except AttributeError:
+                    if hera_workflow_class == CronWorkflow:
+                        model_path = [model_path[0], "workflow_spec"] + model_path[1:]
+                        try:
+                            value = _get_model_attr(self.model, model_path)
+                        except AttributeError:
                             continue
-
-                    if value is None:
+                    else:
                         continue
 
-                    if attr == "templates":
-                        for template in value:
-                            if not isinstance(template, Template):
-                                raise ValueError(f"Expected template to be a Template, got {type(template)}")
+                if value is None:
+                    continue
 
-                            body.append(self._build_statement(template))
-                    else:
-                        if self._should_skip_workflow_kwarg(attr, value, hera_workflow_class):
-                            continue
-                        value = self._build_expression(value)
-                        keywords.append(
-                            ast.keyword(
-                                arg=attr,
-                                value=value,
-                            )
+                if attr == "templates":
+                    for template in value:
+                        if not isinstance(template, Template):
+                            raise ValueError(f"Expected template to be a Template, got {type(template)}")
+
+                        body.append(self._build_statement(template))
+                else:
+                    if self._should_skip_workflow_kwarg(attr, value, hera_workflow_class):
+                        continue
+                    value = self._build_expression(value)
+                    keywords.append(
+                        ast.keyword(
+                            arg=attr,
+                            value=value,
                         )
+                    )
 
-                        if attr == "workflow_template_ref":
-                            body.append(ast.Pass())
-                            pass
+                    if attr == "workflow_template_ref":
+                        body.append(ast.Pass())
+                        pass
 
         if len(body) == 0:
             body.append(ast.Pass())
@@ -1,10 +1,20 @@
+import filecmp
+import functools
+import itertools
+import operator
 import os
+import shutil
 import sys
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
 from fnmatch import fnmatch
 from pathlib import Path
-from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Set, Union
+from typing import Any, Callable, Deque, Dict, Generator, Iterable, Iterator, List, Optional, Set, TextIO, Tuple, Union
 
 from hera._cli.base import GeneratePython, GenerateYaml
+from hera._cli.generate.cache import OutputCache
 
 YAML_EXTENSIONS = {".yml", ".yaml"}
 
@@ -51,32 +61,139 @@ def filter_paths(
         yield path
 
 
+def _replace_output(tmp_path: Path, dest: Path, changed_only: bool) -> None:
+    """Replace `dest` with the temporary file, unless its content is unchanged and `changed_only` is True."""
+    if dest.is_file():
+        if changed_only and filecmp.cmp(tmp_path, dest, shallow=False):
+            return
+        shutil.copymode(dest, tmp_path)
+    os.replace(tmp_path, dest)
+
+
+@contextmanager
+def _open_outputs(changed_only: bool) -> Iterator[Callable[[Path], TextIO]]:
+    """Give a function opening temporary files for the destinations, which replace them once all are written.
+
+    The documents are only known to be complete once they have all been converted, so the destinations are left
+    untouched if the conversion of any of them raises.
+    """
+    tmp_paths: Dict[Path, Path] = {}
+
+    def open_output(dest: Path) -> TextIO:
+        tmp_path = tmp_paths.setdefault(dest, dest.with_name(f".{dest.name}.{os.getpid()}.tmp"))
+        return tmp_path.open("w")
+
+    try:
+        yield open_output
+        for dest, tmp_path in tmp_paths.items():
+            _replace_output(tmp_path, dest, changed_only)
+    finally:
+        for tmp_path in tmp_paths.values():
+            tmp_path.unlink(missing_ok=True)
+
+
+def _write_documents(stream: TextIO, documents: Iterable[str], join_delimiter: str) -> None:
+    for i, document in enumerate(documents):
+        if i:
+            stream.write(join_delimiter)
+        stream.write(document)
+
+
 def write_output(
     output_path: Optional[Path],
-    input_paths_to_output: Dict[str, str],
+    documents: Iterable[Tuple[str, str]],
     extensions: Set[str],
     default_extension: str,
     join_delimiter: str,
+    changed_only: bool = False,
 ) -> None:
+    """Write the documents to stdout, a single file or a folder of files, depending on `output_path`.
+
+    `documents` is an iterable of (output path, document) pairs, where the documents of each output path are
+    contiguous, as given by `convert_code`. Each document is written to a temporary file as soon as it is produced,
+    so only one document needs to be held in memory at a time. The output is only written once all the documents
+    have been produced, so it is left untouched if the conversion of one of them raises.
+
+    If `changed_only` is True, files whose content would not change are not written, leaving their mtime untouched.
+    """
     if not output_path:
-        output = join_delimiter.join(input_paths_to_output.values())
-        sys.stdout.write(output)
+        # Spool the documents to a temporary file, so nothing is printed if the conversion of one of them raises
+        with tempfile.TemporaryFile("w+") as f:
+            _write_documents(f, (document for _, document in documents), join_delimiter)
+            f.seek(0)
+            shutil.copyfileobj(f, sys.stdout)
         return
 
     dest_is_file = output_path.suffix.lower() in extensions or output_path.exists() and output_path.is_file()
 
-    if dest_is_file:
-        output_path.parent.mkdir(exist_ok=True)
+    with _open_outputs(changed_only) as open_output:
+        if dest_is_file:
+            output_path.parent.mkdir(exist_ok=True)
+
+            with open_output(output_path) as f:
+                _write_documents(f, (document for _, document in documents), join_delimiter)
+        else:
+            output_path.mkdir(exist_ok=True)
+
+            for dest_path, dest_documents in itertools.groupby(documents, key=operator.itemgetter(0)):
+                dest = (output_path / dest_path).with_suffix(default_extension)
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                with open_output(dest) as f:
+                    _write_documents(f, (document for _, document in dest_documents), join_delimiter)
+
 
-        output = join_delimiter.join(input_paths_to_output.values())
-        output_path.write_text(output)
-    else:
-        output_path.mkdir(exist_ok=True)
+def _convert_path(path: Path, loader_func: Callable[[Path], Any], dumper_func: Callable[[Any], str]) -> List[str]:
+    """Load the workflows from the given path and dump each of them."""
+    return [dumper_func(workflow) for workflow in loader_func(path)]
 
-        for dest_path, content in input_paths_to_output.items():
-            dest = (output_path / dest_path).with_suffix(default_extension)
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            dest.write_text(content)
+
+def _convert_paths(
+    paths: List[Path],
+    loader_func: Callable[[Path], Any],
+    dumper_func: Callable[[Any], str],
+    jobs: int,
+) -> Iterator[Tuple[Path, Iterable[str]]]:
+    """Convert each path, in a pool of `jobs` processes if `jobs` is not 1, yielding the outputs in order of `paths`.
+
+    When converting serially, the workflows of each path are dumped lazily, one at a time. When using a process pool,
+    `loader_func` and `dumper_func` must be picklable (i.e. module-level functions), and only a bounded number of
+    paths are converted ahead of the consumer.
+    """
+    if jobs == 1:
+        for path in paths:
+            yield path, (dumper_func(workflow) for workflow in loader_func(path))
+        return
+
+    max_workers = jobs if jobs > 0 else (os.cpu_count() or 1)
+    convert = functools.partial(_convert_path, loader_func=loader_func, dumper_func=dumper_func)
+    errors = []
+
+    def result(path: Path, future: "Future[List[str]]") -> Tuple[Path, List[str]]:
+        try:
+            return path, future.result()
+        except Exception as e:
+            # Keep going to report all the failing paths at once, once every other path has been yielded
+            errors.append(f"{path}: {type(e).__name__}: {e}")
+            return path, []
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Keep every worker busy, without letting finished outputs pile up in memory
+        pending: Deque[Tuple[Path, "Future[List[str]]"]] = deque()
+        for path in paths:
+            pending.append((path, executor.submit(convert, path)))
+            if len(pending) >= 2 * max_workers:
+                yield result(*pending.popleft())
+        while pending:
+            yield result(*pending.popleft())
+
+    if errors:
+        raise RuntimeError("Failed to convert the following paths:\n" + "\n".join(errors))
+
+
+def _output_path(path: Path, options: Union[GenerateYaml, GeneratePython]) -> str:
+    if options.recursive and not options.flatten:
+        return str(path.relative_to(options.from_))
+    return path.name
 
 
 def convert_code(
@@ -84,26 +201,49 @@ def convert_code(
     options: Union[GenerateYaml, GeneratePython],
     loader_func: Callable[[Path], Any],
     dumper_func: Callable[[Any], str],
-    join_delimiter: str,
-) -> Dict[str, str]:
-    """Convert inputs list of workflows into a dict of output paths to their output text."""
-    path_to_output: dict[str, str] = {}
+    jobs: int = 1,
+    cache: Optional[OutputCache] = None,
+) -> Iterator[Tuple[str, str]]:
+    """Convert inputs list of workflows, lazily yielding (output path, document) pairs for `write_output`.
+
+    The documents of each output path are yielded contiguously, in order of the input paths (inputs flattened into
+    the same output path are grouped together).
+
+    If `jobs` is not 1, the paths are loaded and dumped in a pool of `jobs` processes (or one per CPU if `jobs` is 0);
+    the output is the same as when converting the paths one after another. If a `cache` is given, paths with cached
+    outputs are not loaded, and the outputs of the other paths are added to the cache.
+    """
+    paths_by_output_path: Dict[str, List[Path]] = {}
     for path in filter_paths(paths, includes=options.include, excludes=options.exclude):
-        outputs = []
-        for workflow in loader_func(path):
-            outputs.append(dumper_func(workflow))
-
-        if not outputs:
-            continue
-
-        if options.recursive:
-            if options.flatten:
-                if path.name in path_to_output:
-                    path_to_output[path.name] = join_delimiter.join([path_to_output[path.name]] + outputs)
-                else:
-                    path_to_output[path.name] = join_delimiter.join(outputs)
-            else:
-                path_to_output[str(path.relative_to(options.from_))] = join_delimiter.join(outputs)
+        paths_by_output_path.setdefault(_output_path(path, options), []).append(path)
+    ordered_paths = [path for output_paths in paths_by_output_path.values() for path in output_paths]
+
+    # Each entry is only read once, so the cached outputs are kept until they are yielded
+    cached_outputs: Dict[Path, List[str]] = {}
+    if cache is not None:
+        for path in ordered_paths:
+            cached = cache.get(path)
+            if cached is not None:
+                cached_outputs[path] = cached
+
+    converted = _convert_paths(
+        [path for path in ordered_paths if path not in cached_outputs], loader_func, dumper_func, jobs
+    )
+    for path in ordered_paths:
+        outputs: Optional[Iterable[str]]
+        if path in cached_outputs:
+            outputs = cached_outputs.pop(path)
         else:
-            path_to_output[path.name] = join_delimiter.join(outputs)
-    return path_to_output
+            converted_path, outputs = next(converted)
+            assert converted_path == path
+            if cache is not None:
+                outputs = list(outputs)
+                cache.put(path, outputs)
+
+        output_path = _output_path(path, options)
+        for output in outputs:
+            yield output_path, output
+
+    # Exhaust the conversions to raise any errors reported at the end of a parallel conversion
+    for _ in converted:
+        pass
@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import importlib.util
 import sys
+from dataclasses import asdict
 from pathlib import Path
+from typing import Optional
 
 from hera._cli.base import GenerateYaml
+from hera._cli.generate.cache import OutputCache
 from hera._cli.generate.util import YAML_EXTENSIONS, convert_code, expand_paths, write_output
+from hera._version import version
 from hera.workflows._runner.util import create_module_string
 from hera.workflows.workflow import Workflow
 
@@ -20,23 +24,46 @@ def generate_yaml(options: GenerateYaml):
     """
     paths = sorted(expand_paths(options.from_, {".py"}, recursive=options.recursive))
 
-    path_to_output = convert_code(
+    documents = convert_code(
         paths,
         options,
         loader_func=load_workflows_from_module,
-        dumper_func=lambda w: w.to_yaml(),
-        join_delimiter="---\n",
+        dumper_func=dump_workflow,
+        jobs=options.jobs,
+        cache=_get_cache(options),
     )
 
     write_output(
         options.to,
-        path_to_output,
+        documents,
         extensions=YAML_EXTENSIONS,
         default_extension=DEFAULT_EXTENSION,
         join_delimiter="---\n",
+        changed_only=options.changed_only,
+    )
+
+
+def _get_cache(options: GenerateYaml) -> Optional[OutputCache]:
+    if options.cache_dir is None:
+        return None
+
+    # Options that only affect how the command runs or where the YAML is written do not affect the cached YAML
+    key_options = asdict(options)
+    for option in ("to", "jobs", "cache_dir", "changed_only"):
+        key_options.pop(option)
+
+    # The module name is part of the key as it is used in the YAML of runner scripts, and depends on `sys.path`
+    return OutputCache(
+        options.cache_dir,
+        key={"hera": version, "options": key_options, "sys_path": sys.path},
     )
 
 
+def dump_workflow(workflow: Workflow) -> str:
+    """Dump the given `Workflow` to a YAML string."""
+    return workflow.to_yaml()
+
+
 def load_workflows_from_module(path: Path) -> list[Workflow]:
     """Load the set of `Workflow` objects defined within a given module.
 
@@ -1,5 +1,6 @@
+import re
 from types import ModuleType
-from typing import Optional
+from typing import Any, Optional, Type
 
 _yaml: Optional[ModuleType] = None
 try:
@@ -23,23 +24,59 @@ else:
     _yaml.representer.SafeRepresenter.add_representer(str, str_presenter)
 
 
+class _EmitterFallback(Exception):
+    """Raised when the libyaml emitter may not produce the same output as the pure-Python emitter."""
+
+
+_CDumper: Optional[Type[Any]] = None
+if _yaml is not None and _yaml.__with_libyaml__:
+    # Strings made only of printable ASCII characters on a single line are never emitted double-quoted
+    _SIMPLE_STRING = re.compile(r"[\x20-\x7e]*")
+    _analyzer = _yaml.emitter.Emitter(None)
+
+    def _c_str_presenter(dumper, data):
+        """Presents strings like `str_presenter`, bailing out for strings libyaml would emit differently.
+
+        libyaml folds long double-quoted scalars at different positions than PyYAML, so documents containing
+        strings PyYAML would emit double-quoted are dumped with the pure-Python emitter instead.
+        """
+        if not _SIMPLE_STRING.fullmatch(data):
+            analysis = _analyzer.analyze_scalar(data)
+            # Mirrors `yaml.emitter.Emitter.choose_scalar_style` for the styles given by `str_presenter`
+            if "\n" in data:
+                double_quoted = not analysis.allow_block
+            else:
+                double_quoted = not analysis.allow_block_plain and not analysis.allow_single_quoted
+            if double_quoted:
+                raise _EmitterFallback
+        return str_presenter(dumper, data)
+
+    class _LibyamlDumper(yaml.CDumper):
+        """A libyaml-backed Dumper producing the same output as the default `yaml.Dumper`."""
+
+    _LibyamlDumper.add_representer(str, _c_str_presenter)
+    _CDumper = _LibyamlDumper
+
+# `dump` options supported by the libyaml emitter in the same way as by the pure-Python emitter
+_C_DUMP_OPTIONS = {"default_flow_style", "sort_keys", "indent", "width", "explicit_start", "explicit_end"}
+
+
 def _line_indent(line: str) -> int:
     return len(line) - len(line.lstrip())
 
 
+_BLOCK_SCALAR_INDICATORS = (": |", ": |-", ": |+", ": >", ": >-", ": >+")
+
+
 def _is_block_scalar(line: str) -> bool:
-    stripped = line.rstrip()
-    return (
-        stripped.endswith(": |")
-        or stripped.endswith(": |-")
-        or stripped.endswith(": |+")
-        or stripped.endswith(": >")
-        or stripped.endswith(": >-")
-        or stripped.endswith(": >+")
-    )
+    return line.rstrip().endswith(_BLOCK_SCALAR_INDICATORS)
 
 
 def _squash_wrapped_expressions(yaml_str: str) -> str:
+    # Nothing can have been wrapped inside an expression if there are no expressions
+    if "{{" not in yaml_str:
+        return yaml_str
+
     lines = yaml_str.splitlines()
     if not lines:
         return yaml_str
@@ -85,4 +122,11 @@ def dump(*args, **kwargs) -> str:
     # Set some default options if not provided by the user
     kwargs.setdefault("default_flow_style", False)
     kwargs.setdefault("sort_keys", False)
+
+    # Use the (much faster) libyaml emitter when it is guaranteed to give the same output as the default Dumper
+    if _CDumper is not None and len(args) == 1 and _C_DUMP_OPTIONS.issuperset(kwargs):
+        try:
+            return _squash_wrapped_expressions(_yaml.dump(*args, Dumper=_CDumper, **kwargs))
+        except _EmitterFallback:
+            pass
     return _squash_wrapped_expressions(_yaml.dump(*args, **kwargs))
@@ -1,13 +1,28 @@
 """The auth module of Hera consists of authentication related implementation.
 
 The module provides basic functionality such as token generation via the Argo CLI, the basis of token generation for
-implementing a client token generator, etc.
+implementing a client token generator, caching of generated tokens, reading tokens from files, etc.
 """
 
+import base64
+import binascii
+import json
+import logging
 import os
 import random
 import shutil
 import subprocess
+import threading
+import time
+from typing import Callable, Optional, Union
+
+_logger = logging.getLogger(__name__)
+
+# A JWT is considered expired this many seconds before its `exp` claim, so it is not sent just before it expires
+_JWT_EXPIRY_LEEWAY = 10.0
+
+# The path of the service account token projected by Kubernetes in pods
+_SERVICE_ACCOUNT_TOKEN_PATH = "/var/run/secrets/kubernetes.io/serviceaccount/token"
 
 
 class TokenGenerator:
@@ -48,3 +63,147 @@ class ArgoCLITokenGenerator(TokenGenerator):
         if token.startswith("Bearer "):
             token = token[7:]
         return token
+
+
+def _jwt_expiry(token: str) -> Optional[float]:
+    """Return the expiry time of the given token (as a Unix timestamp) if it is a JWT with an `exp` claim."""
+    if token.startswith("Bearer "):
+        token = token[7:]
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    payload = parts[1]
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    if isinstance(exp, (int, float)) and not isinstance(exp, bool):
+        return float(exp)
+    return None
+
+
+class CachedTokenGenerator(TokenGenerator):
+    """A token generator caching the tokens of another one, such as `ArgoCLITokenGenerator`, until they expire.
+
+    Services get the global token each time they are created, which includes the service created by each `Workflow`,
+    so an expensive token generator, such as one spawning a process, should be cached:
+
+    ```python
+    global_config.token = CachedTokenGenerator(ArgoCLITokenGenerator())
+    ```
+
+    A token expires after `ttl` seconds, or when its `exp` claim expires if it is a JWT, whichever comes first. Once a
+    token is within `refresh_ahead` seconds of its expiry, it is still returned while a new one is generated in a
+    background thread, so callers only wait for the first token, or when the background refresh failed. The generator
+    can be shared by threads.
+    """
+
+    def __init__(
+        self,
+        generator: Union[TokenGenerator, Callable[[], Optional[str]]],
+        ttl: Optional[float] = 300.0,
+        refresh_ahead: float = 30.0,
+    ) -> None:
+        """Caching token generator constructor.
+
+        Args:
+            generator: the token generator to cache the tokens of.
+            ttl: the time in seconds after which a token expires. If None, the tokens which are not JWTs never expire.
+            refresh_ahead: the time in seconds before the expiry of a token from which a new token is generated in
+                the background.
+        """
+        self.generator = generator
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        self._refreshing = False
+        # incremented each time the cached token is replaced or invalidated, so a background refresh started before
+        # then does not cache its (older) token
+        self._generation = 0
+
+    def _expiry(self, token: Optional[str], now: float) -> float:
+        expires_at = float("inf") if self.ttl is None else now + self.ttl
+        jwt_expiry = _jwt_expiry(token) if token else None
+        if jwt_expiry is not None:
+            expires_at = min(expires_at, jwt_expiry - _JWT_EXPIRY_LEEWAY)
+        return expires_at
+
+    def _generate(self) -> Optional[str]:
+        """Generate a new token and cache it."""
+        now = time.time()
+        token = self.generator()
+        self._token, self._expires_at = token, self._expiry(token, now)
+        self._generation += 1
+        return token
+
+    def _refresh(self, generation: int) -> None:
+        try:
+            now = time.time()
+            # the lock is not held while generating, so the cached token is still returned in the meantime
+            token = self.generator()
+        except Exception:
+            # the cached token is used until it expires, and generated again by the next call after that
+            _logger.warning("Failed to refresh the token in the background", exc_info=True)
+            with self._lock:
+                self._refreshing = False
+            return
+        with self._lock:
+            if generation == self._generation:
+                self._token, self._expires_at = token, self._expiry(token, now)
+                self._generation += 1
+            self._refreshing = False
+
+    def __call__(self) -> Optional[str]:  # type: ignore[override]
+        """Returns the cached token, generating a new one if it expired."""
+        with self._lock:
+            now = time.time()
+            if now >= self._expires_at:
+                # callers wait for the token generated by the first one rather than generating their own
+                return self._generate()
+            if now >= self._expires_at - self.refresh_ahead and not self._refreshing:
+                self._refreshing = True
+                threading.Thread(
+                    target=self._refresh, args=(self._generation,), name="hera-token-refresh", daemon=True
+                ).start()
+            return self._token
+
+    def invalidate(self) -> None:
+        """Discard the cached token, for instance after the Argo server rejected it, so the next call generates one.
+
+        A token being generated in the background when the token is invalidated is discarded too.
+        """
+        with self._lock:
+            self._token, self._expires_at = None, 0.0
+            self._generation += 1
+
+
+class FileTokenGenerator(TokenGenerator):
+    """A token generator reading the token from a file, such as a service account token projected by Kubernetes.
+
+    Kubernetes rotates projected tokens by replacing the file, so the file is only read again once its modification
+    time changes, rather than at each call.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike] = _SERVICE_ACCOUNT_TOKEN_PATH) -> None:
+        """File token generator constructor.
+
+        Args:
+            path: the path of the file holding the token, which is the service account token of the pod by default.
+        """
+        self.path = path
+        self._token: Optional[str] = None
+        self._mtime_ns: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def __call__(self) -> str:
+        """Returns the token of the file, reading it again only if the file was modified since it was last read."""
+        with self._lock:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+            if self._token is None or mtime_ns != self._mtime_ns:
+                with open(self.path) as f:
+                    self._token = f.read().strip()
+                self._mtime_ns = mtime_ns
+            return self._token
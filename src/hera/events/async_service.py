@@ -1,7 +1,7 @@
 """Interact with the events REST service asynchronously. Requires you to `pip install hera[async-client]`."""
 
 # [DO NOT MODIFY] Auto-generated by `hera/scripts/async_service.py`
-from typing import TYPE_CHECKING, Optional, Tuple, cast
+from typing import TYPE_CHECKING, AsyncGenerator, Optional, Tuple, cast
 from urllib.parse import urljoin
 
 from hera.events.models import (
@@ -27,7 +27,9 @@ from hera.events.models import (
     Version,
 )
 from hera.exceptions import exception_from_server_response
-from hera.shared import global_config
+from hera.shared import TransportConfig, global_config
+from hera.shared._responses import build_model, parse_response
+from hera.shared._stream import aiter_watch_results
 
 if TYPE_CHECKING:
     import httpx
@@ -49,9 +51,11 @@ class AsyncEventsService:
         client_certs: Optional[Tuple[str, str]] = None,
         namespace: Optional[str] = None,
         session: Optional["httpx.AsyncClient"] = None,
+        transport_config: Optional[TransportConfig] = None,
+        validate_responses: Optional[bool] = None,
     ) -> None:
         """AsyncEvents service constructor."""
-        import httpx
+        from hera.shared._async_transport import build_async_client
 
         self.host = cast(str, host or global_config.host)
         self.verify_ssl = verify_ssl if verify_ssl is not None else global_config.verify_ssl
@@ -77,7 +81,14 @@ class AsyncEventsService:
         else:
             self.token = None
 
-        self.session = session or httpx.AsyncClient(verify=self.verify_ssl, cert=self.client_certs)
+        # unvalidated responses are returned as lazy models, whose fields are only validated when first accessed
+        self.validate_responses = (
+            validate_responses if validate_responses is not None else global_config.validate_responses
+        )
+        self.transport_config = transport_config or global_config.transport_config
+        self.session = session or build_async_client(
+            self.transport_config, verify=self.verify_ssl, cert=self.client_certs
+        )
 
         self.namespace = namespace or global_config.namespace
 
@@ -139,7 +150,7 @@ class AsyncEventsService:
         )
 
         if resp.is_success:
-            return EventSourceList(**resp.json())
+            return parse_response(EventSourceList, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -157,7 +168,7 @@ class AsyncEventsService:
         )
 
         if resp.is_success:
-            return EventSource(**resp.json())
+            return parse_response(EventSource, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -175,7 +186,7 @@ class AsyncEventsService:
         )
 
         if resp.is_success:
-            return EventSource(**resp.json())
+            return parse_response(EventSource, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -195,7 +206,7 @@ class AsyncEventsService:
         )
 
         if resp.is_success:
-            return EventSource(**resp.json())
+            return parse_response(EventSource, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -270,7 +281,7 @@ class AsyncEventsService:
         )
 
         if resp.is_success:
-            return InfoResponse(**resp.json())
+            return parse_response(InfoResponse, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -316,7 +327,7 @@ class AsyncEventsService:
         )
 
         if resp.is_success:
-            return SensorList(**resp.json())
+            return parse_response(SensorList, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -334,7 +345,7 @@ class AsyncEventsService:
         )
 
         if resp.is_success:
-            return Sensor(**resp.json())
+            return parse_response(Sensor, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -354,7 +365,7 @@ class AsyncEventsService:
         )
 
         if resp.is_success:
-            return Sensor(**resp.json())
+            return parse_response(Sensor, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -372,7 +383,7 @@ class AsyncEventsService:
         )
 
         if resp.is_success:
-            return Sensor(**resp.json())
+            return parse_response(Sensor, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -459,7 +470,7 @@ class AsyncEventsService:
         )
 
         if resp.is_success:
-            return EventSourceWatchEvent(**resp.json())
+            return parse_response(EventSourceWatchEvent, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -515,7 +526,7 @@ class AsyncEventsService:
         )
 
         if resp.is_success:
-            return EventsourceLogEntry(**resp.json())
+            return parse_response(EventsourceLogEntry, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -561,7 +572,7 @@ class AsyncEventsService:
         )
 
         if resp.is_success:
-            return Event(**resp.json())
+            return parse_response(Event, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -607,7 +618,7 @@ class AsyncEventsService:
         )
 
         if resp.is_success:
-            return SensorWatchEvent(**resp.json())
+            return parse_response(SensorWatchEvent, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -661,7 +672,7 @@ class AsyncEventsService:
         )
 
         if resp.is_success:
-            return SensorLogEntry(**resp.json())
+            return parse_response(SensorLogEntry, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -677,7 +688,7 @@ class AsyncEventsService:
         )
 
         if resp.is_success:
-            return GetUserInfoResponse(**resp.json())
+            return parse_response(GetUserInfoResponse, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -693,7 +704,7 @@ class AsyncEventsService:
         )
 
         if resp.is_success:
-            return Version(**resp.json())
+            return parse_response(Version, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -813,5 +824,123 @@ class AsyncEventsService:
 
         raise exception_from_server_response(resp)
 
+    async def iter_event_sources(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        resource_version_match: Optional[str] = None,
+        limit: int = 500,
+    ) -> AsyncGenerator[EventSource, None]:
+        """Yield the event sources one at a time, paging through them with `list_event_sources`.
+
+        Pages of `limit` event sources are fetched as they are consumed, so only one page is held in memory at a time.
+        """
+        continue_ = None
+        while True:
+            page = await self.list_event_sources(
+                namespace=namespace,
+                label_selector=label_selector,
+                field_selector=field_selector,
+                resource_version=resource_version if continue_ is None else None,
+                resource_version_match=resource_version_match if continue_ is None else None,
+                limit=str(limit),
+                continue_=continue_,
+            )
+            for item in page.items or []:
+                yield item
+            continue_ = page.metadata.continue_ if page.metadata is not None else None
+            if not continue_:
+                return
+
+    async def iter_sensors(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        resource_version_match: Optional[str] = None,
+        limit: int = 500,
+    ) -> AsyncGenerator[Sensor, None]:
+        """Yield the sensors one at a time, paging through them with `list_sensors`.
+
+        Pages of `limit` sensors are fetched as they are consumed, so only one page is held in memory at a time.
+        """
+        continue_ = None
+        while True:
+            page = await self.list_sensors(
+                namespace=namespace,
+                label_selector=label_selector,
+                field_selector=field_selector,
+                resource_version=resource_version if continue_ is None else None,
+                resource_version_match=resource_version_match if continue_ is None else None,
+                limit=str(limit),
+                continue_=continue_,
+            )
+            for item in page.items or []:
+                yield item
+            continue_ = page.metadata.continue_ if page.metadata is not None else None
+            if not continue_:
+                return
+
+    async def stream_event_sources(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        reconnect: bool = True,
+        max_reconnects: Optional[int] = None,
+    ) -> AsyncGenerator[EventSourceWatchEvent, None]:
+        """Stream the changes to the event sources of the namespace, yielding each event as soon as it is received.
+
+        If `reconnect` is true, the stream is reopened with an exponential backoff when the connection is lost or
+        closed by the server, resuming after the last received event, or after `resource_version` if given.
+        `max_reconnects` limits the number of consecutive failed attempts to reconnect.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        async for result in aiter_watch_results(
+            self.session,
+            url=urljoin(self.host, "api/v1/stream/event-sources/{namespace}").format(
+                namespace=namespace if namespace is not None else self.namespace
+            ),
+            params={"listOptions.labelSelector": label_selector, "listOptions.fieldSelector": field_selector},
+            resource_version=resource_version,
+            reconnect=reconnect,
+            max_reconnects=max_reconnects,
+            headers={"Authorization": self.token or ""},
+        ):
+            yield build_model(EventSourceWatchEvent, result, self.validate_responses)
+
+    async def stream_sensors(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        reconnect: bool = True,
+        max_reconnects: Optional[int] = None,
+    ) -> AsyncGenerator[SensorWatchEvent, None]:
+        """Stream the changes to the sensors of the namespace, yielding each event as soon as it is received.
+
+        If `reconnect` is true, the stream is reopened with an exponential backoff when the connection is lost or
+        closed by the server, resuming after the last received event, or after `resource_version` if given.
+        `max_reconnects` limits the number of consecutive failed attempts to reconnect.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        async for result in aiter_watch_results(
+            self.session,
+            url=urljoin(self.host, "api/v1/stream/sensors/{namespace}").format(
+                namespace=namespace if namespace is not None else self.namespace
+            ),
+            params={"listOptions.labelSelector": label_selector, "listOptions.fieldSelector": field_selector},
+            resource_version=resource_version,
+            reconnect=reconnect,
+            max_reconnects=max_reconnects,
+            headers={"Authorization": self.token or ""},
+        ):
+            yield build_model(SensorWatchEvent, result, self.validate_responses)
+
 
 __all__ = ["AsyncEventsService"]
@@ -5,9 +5,9 @@ from __future__ import annotations
 
 from pydantic import Base64Str
 
-from hera.shared._pydantic import APIBaseModel
+from hera.shared._pydantic import DeferredAPIBaseModel
 
 
-class Any(APIBaseModel):
+class Any(DeferredAPIBaseModel):
     type_url: str | None = None
     value: Base64Str | None = None
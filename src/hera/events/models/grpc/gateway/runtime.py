@@ -3,19 +3,19 @@
 
 from __future__ import annotations
 
-from hera.shared._pydantic import APIBaseModel
+from hera.shared._pydantic import DeferredAPIBaseModel
 
 from ...google import protobuf
 
 
-class Error(APIBaseModel):
+class Error(DeferredAPIBaseModel):
     code: int | None = None
     details: list[protobuf.Any] | None = None
     error: str | None = None
     message: str | None = None
 
 
-class StreamError(APIBaseModel):
+class StreamError(DeferredAPIBaseModel):
     details: list[protobuf.Any] | None = None
     grpc_code: int | None = None
     http_code: int | None = None
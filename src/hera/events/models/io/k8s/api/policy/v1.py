@@ -7,13 +7,13 @@ from typing import Annotated
 
 from pydantic import Field
 
-from hera.shared._pydantic import APIBaseModel
+from hera.shared._pydantic import DeferredAPIBaseModel
 
 from ...apimachinery.pkg.apis.meta import v1
 from ...apimachinery.pkg.util import intstr
 
 
-class PodDisruptionBudgetSpec(APIBaseModel):
+class PodDisruptionBudgetSpec(DeferredAPIBaseModel):
     max_unavailable: Annotated[
         intstr.IntOrString | None,
         Field(
@@ -5,12 +5,14 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from pydantic import AwareDatetime, Field, RootModel
+from pydantic import AwareDatetime, ConfigDict, Field, RootModel
 
-from hera.shared._pydantic import APIBaseModel
+from hera.shared._pydantic import DeferredAPIBaseModel
 
 
 class Time(RootModel[AwareDatetime]):
+    model_config = ConfigDict(defer_build=True)
+
     root: Annotated[
         AwareDatetime,
         Field(
@@ -23,7 +25,7 @@ class Time(RootModel[AwareDatetime]):
     ]
 
 
-class ListMeta(APIBaseModel):
+class ListMeta(DeferredAPIBaseModel):
     continue_: Annotated[
         str | None,
         Field(
@@ -84,13 +86,13 @@ class ListMeta(APIBaseModel):
     ] = None
 
 
-class GroupVersionResource(APIBaseModel):
+class GroupVersionResource(DeferredAPIBaseModel):
     group: str | None = None
     resource: str | None = None
     version: str | None = None
 
 
-class CreateOptions(APIBaseModel):
+class CreateOptions(DeferredAPIBaseModel):
     dry_run: Annotated[
         list[str] | None,
         Field(
@@ -141,7 +143,7 @@ class CreateOptions(APIBaseModel):
     ] = None
 
 
-class OwnerReference(APIBaseModel):
+class OwnerReference(DeferredAPIBaseModel):
     api_version: Annotated[str, Field(alias="apiVersion", description="API version of the referent.")]
     block_owner_deletion: Annotated[
         bool | None,
@@ -193,17 +195,19 @@ class OwnerReference(APIBaseModel):
 
 
 class MicroTime(RootModel[AwareDatetime]):
+    model_config = ConfigDict(defer_build=True)
+
     root: Annotated[
         AwareDatetime,
         Field(description="MicroTime is version of Time with microsecond level precision."),
     ]
 
 
-class FieldsV1(APIBaseModel):
+class FieldsV1(DeferredAPIBaseModel):
     pass
 
 
-class LabelSelectorRequirement(APIBaseModel):
+class LabelSelectorRequirement(DeferredAPIBaseModel):
     key: Annotated[str, Field(description="key is the label key that the selector applies to.")]
     operator: Annotated[
         str,
@@ -227,7 +231,7 @@ class LabelSelectorRequirement(APIBaseModel):
     ] = None
 
 
-class ManagedFieldsEntry(APIBaseModel):
+class ManagedFieldsEntry(DeferredAPIBaseModel):
     api_version: Annotated[
         str | None,
         Field(
@@ -299,7 +303,7 @@ class ManagedFieldsEntry(APIBaseModel):
     ] = None
 
 
-class LabelSelector(APIBaseModel):
+class LabelSelector(DeferredAPIBaseModel):
     match_expressions: Annotated[
         list[LabelSelectorRequirement] | None,
         Field(
@@ -321,7 +325,7 @@ class LabelSelector(APIBaseModel):
     ] = None
 
 
-class ObjectMeta(APIBaseModel):
+class ObjectMeta(DeferredAPIBaseModel):
     annotations: Annotated[
         dict[str, str] | None,
         Field(
@@ -8,7 +8,7 @@ from typing import Annotated
 
 from pydantic import Field
 
-from hera.shared._pydantic import APIBaseModel
+from hera.shared._pydantic import DeferredAPIBaseModel
 
 
 class SyncConfigType(Enum):
@@ -16,11 +16,11 @@ class SyncConfigType(Enum):
     database = "DATABASE"
 
 
-class DeleteSyncLimitResponse(APIBaseModel):
+class DeleteSyncLimitResponse(DeferredAPIBaseModel):
     pass
 
 
-class CreateSyncLimitRequest(APIBaseModel):
+class CreateSyncLimitRequest(DeferredAPIBaseModel):
     cm_name: Annotated[str | None, Field(alias="cmName")] = None
     key: str | None = None
     limit: int | None = None
@@ -28,7 +28,7 @@ class CreateSyncLimitRequest(APIBaseModel):
     type: SyncConfigType | None = None
 
 
-class SyncLimitResponse(APIBaseModel):
+class SyncLimitResponse(DeferredAPIBaseModel):
     cm_name: Annotated[str | None, Field(alias="cmName")] = None
     key: str | None = None
     limit: int | None = None
@@ -36,7 +36,7 @@ class SyncLimitResponse(APIBaseModel):
     type: SyncConfigType | None = None
 
 
-class UpdateSyncLimitRequest(APIBaseModel):
+class UpdateSyncLimitRequest(DeferredAPIBaseModel):
     cm_name: Annotated[str | None, Field(alias="cmName")] = None
     key: str | None = None
     limit: int | None = None
@@ -1,7 +1,7 @@
 """Interact with the events REST service."""
 
 # [DO NOT MODIFY] Auto-generated by `hera/scripts/service.py`
-from typing import Optional, Tuple, cast
+from typing import Generator, Optional, Tuple, cast
 from urllib.parse import urljoin
 
 import requests
@@ -29,7 +29,10 @@ from hera.events.models import (
     Version,
 )
 from hera.exceptions import exception_from_server_response
-from hera.shared import global_config
+from hera.shared import TransportConfig, global_config
+from hera.shared._responses import build_model, parse_response
+from hera.shared._stream import iter_watch_results
+from hera.shared._transport import build_session
 
 
 def valid_host_scheme(host: str) -> bool:
@@ -48,6 +51,8 @@ class EventsService:
         client_certs: Optional[Tuple[str, str]] = None,
         namespace: Optional[str] = None,
         session: Optional[requests.Session] = None,
+        transport_config: Optional[TransportConfig] = None,
+        validate_responses: Optional[bool] = None,
     ) -> None:
         """Events service constructor."""
         self.host = cast(str, host or global_config.host)
@@ -74,13 +79,18 @@ class EventsService:
         else:
             self.token = None
 
-        self.session = session or requests.Session()
+        # unvalidated responses are returned as lazy models, whose fields are only validated when first accessed
+        self.validate_responses = (
+            validate_responses if validate_responses is not None else global_config.validate_responses
+        )
+        self.transport_config = transport_config or global_config.transport_config
+        self.session = session or build_session(self.transport_config)
 
         self.namespace = namespace or global_config.namespace
 
     def _request(self, method, **kwargs):
         """Make a request using the session if enabled."""
-        return self.session.request(method, **kwargs)
+        return self.session.request(method, timeout=self.transport_config.timeout, **kwargs)
 
     def close(self):
         """Close the service session."""
@@ -134,7 +144,7 @@ class EventsService:
         )
 
         if resp.ok:
-            return EventSourceList(**resp.json())
+            return parse_response(EventSourceList, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -154,7 +164,7 @@ class EventsService:
         )
 
         if resp.ok:
-            return EventSource(**resp.json())
+            return parse_response(EventSource, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -174,7 +184,7 @@ class EventsService:
         )
 
         if resp.ok:
-            return EventSource(**resp.json())
+            return parse_response(EventSource, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -196,7 +206,7 @@ class EventsService:
         )
 
         if resp.ok:
-            return EventSource(**resp.json())
+            return parse_response(EventSource, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -273,7 +283,7 @@ class EventsService:
         )
 
         if resp.ok:
-            return InfoResponse(**resp.json())
+            return parse_response(InfoResponse, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -317,7 +327,7 @@ class EventsService:
         )
 
         if resp.ok:
-            return SensorList(**resp.json())
+            return parse_response(SensorList, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -337,7 +347,7 @@ class EventsService:
         )
 
         if resp.ok:
-            return Sensor(**resp.json())
+            return parse_response(Sensor, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -357,7 +367,7 @@ class EventsService:
         )
 
         if resp.ok:
-            return Sensor(**resp.json())
+            return parse_response(Sensor, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -377,7 +387,7 @@ class EventsService:
         )
 
         if resp.ok:
-            return Sensor(**resp.json())
+            return parse_response(Sensor, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -460,7 +470,7 @@ class EventsService:
         )
 
         if resp.ok:
-            return EventSourceWatchEvent(**resp.json())
+            return parse_response(EventSourceWatchEvent, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -514,7 +524,7 @@ class EventsService:
         )
 
         if resp.ok:
-            return EventsourceLogEntry(**resp.json())
+            return parse_response(EventsourceLogEntry, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -558,7 +568,7 @@ class EventsService:
         )
 
         if resp.ok:
-            return Event(**resp.json())
+            return parse_response(Event, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -602,7 +612,7 @@ class EventsService:
         )
 
         if resp.ok:
-            return SensorWatchEvent(**resp.json())
+            return parse_response(SensorWatchEvent, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -654,7 +664,7 @@ class EventsService:
         )
 
         if resp.ok:
-            return SensorLogEntry(**resp.json())
+            return parse_response(SensorLogEntry, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -672,7 +682,7 @@ class EventsService:
         )
 
         if resp.ok:
-            return GetUserInfoResponse(**resp.json())
+            return parse_response(GetUserInfoResponse, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -690,7 +700,7 @@ class EventsService:
         )
 
         if resp.ok:
-            return Version(**resp.json())
+            return parse_response(Version, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -816,5 +826,125 @@ class EventsService:
 
         raise exception_from_server_response(resp)
 
+    def iter_event_sources(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        resource_version_match: Optional[str] = None,
+        limit: int = 500,
+    ) -> Generator[EventSource, None, None]:
+        """Yield the event sources one at a time, paging through them with `list_event_sources`.
+
+        Pages of `limit` event sources are fetched as they are consumed, so only one page is held in memory at a time.
+        """
+        continue_ = None
+        while True:
+            page = self.list_event_sources(
+                namespace=namespace,
+                label_selector=label_selector,
+                field_selector=field_selector,
+                resource_version=resource_version if continue_ is None else None,
+                resource_version_match=resource_version_match if continue_ is None else None,
+                limit=str(limit),
+                continue_=continue_,
+            )
+            yield from page.items or []
+            continue_ = page.metadata.continue_ if page.metadata is not None else None
+            if not continue_:
+                return
+
+    def iter_sensors(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        resource_version_match: Optional[str] = None,
+        limit: int = 500,
+    ) -> Generator[Sensor, None, None]:
+        """Yield the sensors one at a time, paging through them with `list_sensors`.
+
+        Pages of `limit` sensors are fetched as they are consumed, so only one page is held in memory at a time.
+        """
+        continue_ = None
+        while True:
+            page = self.list_sensors(
+                namespace=namespace,
+                label_selector=label_selector,
+                field_selector=field_selector,
+                resource_version=resource_version if continue_ is None else None,
+                resource_version_match=resource_version_match if continue_ is None else None,
+                limit=str(limit),
+                continue_=continue_,
+            )
+            yield from page.items or []
+            continue_ = page.metadata.continue_ if page.metadata is not None else None
+            if not continue_:
+                return
+
+    def stream_event_sources(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        reconnect: bool = True,
+        max_reconnects: Optional[int] = None,
+    ) -> Generator[EventSourceWatchEvent, None, None]:
+        """Stream the changes to the event sources of the namespace, yielding each event as soon as it is received.
+
+        If `reconnect` is true, the stream is reopened with an exponential backoff when the connection is lost or
+        closed by the server, resuming after the last received event, or after `resource_version` if given.
+        `max_reconnects` limits the number of consecutive failed attempts to reconnect.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        for result in iter_watch_results(
+            self.session,
+            url=urljoin(self.host, "api/v1/stream/event-sources/{namespace}").format(
+                namespace=namespace if namespace is not None else self.namespace
+            ),
+            params={"listOptions.labelSelector": label_selector, "listOptions.fieldSelector": field_selector},
+            resource_version=resource_version,
+            reconnect=reconnect,
+            max_reconnects=max_reconnects,
+            headers={"Authorization": self.token},
+            verify=self.verify_ssl,
+            cert=self.client_certs,
+        ):
+            yield build_model(EventSourceWatchEvent, result, self.validate_responses)
+
+    def stream_sensors(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        reconnect: bool = True,
+        max_reconnects: Optional[int] = None,
+    ) -> Generator[SensorWatchEvent, None, None]:
+        """Stream the changes to the sensors of the namespace, yielding each event as soon as it is received.
+
+        If `reconnect` is true, the stream is reopened with an exponential backoff when the connection is lost or
+        closed by the server, resuming after the last received event, or after `resource_version` if given.
+        `max_reconnects` limits the number of consecutive failed attempts to reconnect.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        for result in iter_watch_results(
+            self.session,
+            url=urljoin(self.host, "api/v1/stream/sensors/{namespace}").format(
+                namespace=namespace if namespace is not None else self.namespace
+            ),
+            params={"listOptions.labelSelector": label_selector, "listOptions.fieldSelector": field_selector},
+            resource_version=resource_version,
+            reconnect=reconnect,
+            max_reconnects=max_reconnects,
+            headers={"Authorization": self.token},
+            verify=self.verify_ssl,
+            cert=self.client_certs,
+        ):
+            yield build_model(SensorWatchEvent, result, self.validate_responses)
+
 
 __all__ = ["EventsService"]
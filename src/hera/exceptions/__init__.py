@@ -62,6 +62,14 @@ class InternalServerError(HeraException):
     status_code = HTTPStatus.INTERNAL_SERVER_ERROR.value
 
 
+class ChecksumMismatch(HeraException):
+    """Exception that indicates a file downloaded from the server does not match its expected checksum."""
+
+
+class ContentChanged(HeraException):
+    """Exception that indicates a file downloaded from the server changed while its download was being resumed."""
+
+
 status_code_to_exception_map: Dict[int, Type[HeraException]] = {
     Unauthorized.status_code: Unauthorized,
     BadRequest.status_code: BadRequest,
@@ -75,7 +83,10 @@ status_code_to_exception_map: Dict[int, Type[HeraException]] = {
 
 def exception_from_status_code(status_code: int, msg: str) -> HeraException:
     """Return a `HeraException` mapped from the given status code initialized with the given message."""
-    return status_code_to_exception_map.get(status_code, HeraException)(msg)
+    exception = status_code_to_exception_map.get(status_code, HeraException)(msg)
+    # unmapped status codes (e.g. 429 or 503) are kept on the generic exception, so callers can tell them apart
+    exception.status_code = status_code
+    return exception
 
 
 def exception_from_server_response(resp: Union[Response, "httpx.Response"]) -> HeraException:
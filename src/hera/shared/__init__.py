@@ -1,5 +1,6 @@
 """The shared module of Hera provides control over global configurations, hooks, and some base mixins."""
 
 from hera.shared._global_config import BaseMixin, GlobalConfig, global_config, register_pre_build_hook
+from hera.shared._transport import TransportConfig
 
-__all__ = ["global_config", "register_pre_build_hook", "GlobalConfig", "BaseMixin"]
+__all__ = ["global_config", "register_pre_build_hook", "GlobalConfig", "BaseMixin", "TransportConfig"]
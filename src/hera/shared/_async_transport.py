@@ -0,0 +1,57 @@
+"""Asynchronous counterpart of `hera.shared._transport`, which requires `httpx`."""
+
+import asyncio
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from hera.shared._transport import TransportConfig, retry_delay
+
+# The limits of the connections of httpx clients, unless given
+_DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0)
+
+
+class _RetryTransport(httpx.AsyncBaseTransport):
+    """A transport retrying the requests which received one of the `retry_status_codes` of the configuration.
+
+    Failed connections are retried by the wrapped transport.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, config: TransportConfig) -> None:
+        self._transport = transport
+        self._config = config
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            response = await self._transport.handle_async_request(request)
+            if response.status_code not in self._config.retry_status_codes or attempt >= self._config.max_retries:
+                return response
+            await response.aclose()
+            await asyncio.sleep(retry_delay(self._config, attempt, response.headers.get("Retry-After")))
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def build_async_client(config: TransportConfig, verify: bool, cert: Optional[Tuple[str, str]]) -> httpx.AsyncClient:
+    """Return a client pooling its connections and retrying its requests as set in the given configuration."""
+    limits = httpx.Limits(
+        max_connections=config.max_connections_per_host or _DEFAULT_LIMITS.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections or _DEFAULT_LIMITS.max_keepalive_connections,
+        keepalive_expiry=_DEFAULT_LIMITS.keepalive_expiry
+        if config.keepalive_expiry is None
+        else config.keepalive_expiry,
+    )
+    client_kwargs: Dict[str, Any] = {"verify": verify, "cert": cert}
+    if limits != _DEFAULT_LIMITS:
+        client_kwargs["limits"] = limits
+    if config.timeout is not None:
+        connect, read = config.timeout if isinstance(config.timeout, tuple) else (config.timeout, config.timeout)
+        client_kwargs["timeout"] = httpx.Timeout(read, connect=connect)
+    if config.max_retries:
+        # note that httpx does not use the proxies set in the environment with a custom transport
+        transport = httpx.AsyncHTTPTransport(verify=verify, cert=cert, limits=limits, retries=config.max_retries)
+        client_kwargs["transport"] = _RetryTransport(transport, config)
+    return httpx.AsyncClient(**client_kwargs)
@@ -0,0 +1,384 @@
+"""Helpers to download files, such as artifacts, from the Argo server in chunks, without holding them in memory.
+
+Interrupted downloads are resumed with HTTP range requests, from the last received byte. The range requests are
+conditional on the file being unchanged (with `If-Range` and the validator of the first response), so the bytes of a
+changed file are never appended to the ones received already.
+"""
+
+import asyncio
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import requests
+
+from hera.exceptions import ChecksumMismatch, ContentChanged, exception_from_server_response
+from hera.shared._stream import _REQUESTS_CONNECTION_ERRORS, RETRYABLE_STATUS_CODES, backoff_delay
+
+if TYPE_CHECKING:
+    import httpx
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+"""The default size in bytes of the chunks downloaded files are read and written in."""
+
+DEFAULT_MAX_RETRIES = 5
+"""The default number of consecutive failed attempts to resume a download."""
+
+Destination = Union[str, os.PathLike, BinaryIO]
+
+
+def _request_headers(headers: Optional[Dict[str, Any]], offset: int, validator: Optional[str]) -> Dict[str, Any]:
+    # ranges apply to the encoded content, so the content is requested unencoded for the offsets to be the ones of the
+    # received bytes
+    request_headers = {**(headers or {}), "Accept-Encoding": "identity"}
+    if offset:
+        request_headers["Range"] = f"bytes={offset}-"
+        if validator is not None:
+            # the server sends the whole file instead of the range if it changed
+            request_headers["If-Range"] = validator
+    return request_headers
+
+
+def _validator(headers: Mapping[str, str]) -> Optional[str]:
+    """Return the validator of the response to send in `If-Range`, its strong ETag, or else its Last-Modified date."""
+    etag = headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return headers.get("Last-Modified")
+
+
+def _complete_size(content_range: Optional[str]) -> Optional[int]:
+    """Return the size of the file given by the `Content-Range: bytes */<size>` header of a 416 response, if any."""
+    if not content_range or not content_range.startswith("bytes */"):
+        return None
+    size = content_range[len("bytes */") :]
+    return int(size) if size.isdigit() else None
+
+
+def _skipped(offset: int, status_code: int, headers: Mapping[str, str], validator: Optional[str]) -> Optional[int]:
+    """Return the number of bytes of the response to skip, or None if the file was entirely received already.
+
+    All the received bytes are skipped if the server ignored the range, which can only be told apart from the file
+    having changed if there is no validator to send in `If-Range`.
+
+    Raises:
+        ContentChanged: if the file changed since its first `offset` bytes were received.
+    """
+    if not offset or status_code == 206:
+        return 0
+    if status_code == 416:
+        # the range starts at or after the end of the file, which is only complete if it ends at the offset
+        size = _complete_size(headers.get("Content-Range"))
+        if size == offset:
+            return None
+        raise ContentChanged(
+            f"The file has {size if size is not None else 'an unknown number of'} bytes, not {offset}"
+        )
+    if validator is not None:
+        raise ContentChanged("The file changed since its download started")
+    return offset
+
+
+def iter_download(
+    session: requests.Session,
+    url: str,
+    offset: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    headers: Optional[Dict[str, Any]] = None,
+    validator: Optional[str] = None,
+    on_validator: Optional[Callable[[Optional[str]], None]] = None,
+    **kwargs: Any,
+) -> Iterator[bytes]:
+    """Yield the content of the file at `url`, from the `offset` byte, in chunks of up to `chunk_size` bytes.
+
+    If the connection is lost, or the server responds with a retryable status code, the download is resumed from the
+    last received byte with a range request, waiting for `backoff_delay` between consecutive failed attempts. At most
+    `max_retries` consecutive failed attempts are made. Servers ignoring ranges send the whole file again, in which case
+    the bytes received already are skipped.
+
+    The range requests are sent with the `validator` (ETag or Last-Modified date) of the file the bytes before `offset`
+    were received from, or of the first response, which is passed to `on_validator`. `ContentChanged` is raised if the
+    file changed since, rather than yielding the bytes of two different files.
+
+    Extra `kwargs` are passed to `session.request`.
+    """
+    attempt = 0
+    while True:
+        error: Exception
+        try:
+            request_headers = _request_headers(headers, offset, validator)
+            with session.request("get", url, headers=request_headers, stream=True, **kwargs) as resp:
+                if resp.ok or (resp.status_code == 416 and offset):
+                    skip = _skipped(offset, resp.status_code, resp.headers, validator)
+                    if skip is None:
+                        return
+                    if not offset:
+                        validator = _validator(resp.headers)
+                        if on_validator is not None:
+                            on_validator(validator)
+                    for chunk in resp.iter_content(chunk_size=chunk_size):
+                        if skip:
+                            chunk, skip = chunk[skip:], max(0, skip - len(chunk))
+                            if not chunk:
+                                continue
+                        attempt = 0
+                        offset += len(chunk)
+                        yield chunk
+                    return
+                error = exception_from_server_response(resp)
+                if resp.status_code not in RETRYABLE_STATUS_CODES:
+                    raise error
+        except _REQUESTS_CONNECTION_ERRORS as e:
+            error = e
+
+        if attempt >= max_retries:
+            raise error
+        time.sleep(backoff_delay(attempt))
+        attempt += 1
+
+
+async def aiter_download(
+    client: "httpx.AsyncClient",
+    url: str,
+    offset: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    headers: Optional[Dict[str, Any]] = None,
+    validator: Optional[str] = None,
+    on_validator: Optional[Callable[[Optional[str]], None]] = None,
+    **kwargs: Any,
+) -> AsyncIterator[bytes]:
+    """Yield the content of the file at `url`, from the `offset` byte, in chunks, asynchronously.
+
+    See `iter_download` for the arguments and the resumption of interrupted downloads. Extra `kwargs` are passed to `client.stream`.
+    """
+    import httpx
+
+    attempt = 0
+    while True:
+        error: Exception
+        try:
+            request_headers = _request_headers(headers, offset, validator)
+            async with client.stream("GET", url, headers=request_headers, **kwargs) as resp:
+                if resp.is_success or (resp.status_code == 416 and offset):
+                    skip = _skipped(offset, resp.status_code, resp.headers, validator)
+                    if skip is None:
+                        return
+                    if not offset:
+                        validator = _validator(resp.headers)
+                        if on_validator is not None:
+                            on_validator(validator)
+                    async for chunk in resp.aiter_bytes(chunk_size=chunk_size):
+                        if skip:
+                            chunk, skip = chunk[skip:], max(0, skip - len(chunk))
+                            if not chunk:
+                                continue
+                        attempt = 0
+                        offset += len(chunk)
+                        yield chunk
+                    return
+                await resp.aread()
+                error = exception_from_server_response(resp)
+                if resp.status_code not in RETRYABLE_STATUS_CODES:
+                    raise error
+        except httpx.TransportError as e:
+            error = e
+
+        if attempt >= max_retries:
+            raise error
+        await asyncio.sleep(backoff_delay(attempt))
+        attempt += 1
+
+
+def _digest(checksum: Optional[str]) -> Optional[Tuple[Any, str]]:
+    """Return a hash object for the given `algorithm:hexdigest` checksum, and the expected digest, if any."""
+    if checksum is None:
+        return None
+    algorithm, separator, expected = checksum.partition(":")
+    if not separator or not expected:
+        raise ValueError(f"Invalid checksum {checksum!r}, expected `algorithm:hexdigest`, e.g. `sha256:e3b0...`")
+    return hashlib.new(algorithm), expected.lower()
+
+
+def _verify(digest: Optional[Tuple[Any, str]], source: str) -> None:
+    if digest is not None and digest[0].hexdigest() != digest[1]:
+        raise ChecksumMismatch(
+            f"The {digest[0].name} checksum of {source} is {digest[0].hexdigest()}, but {digest[1]} was expected"
+        )
+
+
+class _Writer:
+    """Writes a download to a destination, either a binary file object, or a path.
+
+    Downloads to a path are written to a `.part` file next to it, which is renamed once the download completed and its
+    checksum was verified, so the path never holds an incomplete file. The validator of the file (see `iter_download`)
+    is saved to a `.part.validator` file next to it. If `resume` is true, a `.part` file left by a previous download is
+    resumed from its end, rather than downloaded again, if it has a validator to check the file did not change since.
+    """
+
+    def __init__(self, destination: Destination, checksum: Optional[str], resume: bool) -> None:
+        self.checksum = checksum
+        self.digest = _digest(checksum)
+        self.path: Optional[Path] = None
+        self.offset = 0
+        self.validator: Optional[str] = None
+        self.restarted = False
+        if isinstance(destination, (str, os.PathLike)):
+            self.path = Path(destination)
+            self.part = self.path.with_name(self.path.name + ".part")
+            self.validator_path = self.path.with_name(self.path.name + ".part.validator")
+            if resume and self.part.exists() and self.validator_path.exists():
+                self.validator = self.validator_path.read_text()
+                self.offset = self.part.stat().st_size
+                if self.digest is not None:
+                    with open(self.part, "rb") as f:
+                        for chunk in iter(lambda: f.read(DEFAULT_CHUNK_SIZE), b""):
+                            self.digest[0].update(chunk)
+            self.file: BinaryIO = open(self.part, "ab" if self.offset else "wb")
+        else:
+            self.file = destination
+
+    def set_validator(self, validator: Optional[str]) -> None:
+        self.validator = validator
+        if self.path is None:
+            return
+        if validator is None:
+            self.validator_path.unlink(missing_ok=True)
+        else:
+            self.validator_path.write_text(validator)
+
+    def restart(self) -> bool:
+        """Discard the bytes written so far, to download the file again, returning whether it could be done.
+
+        Bytes written to a file object cannot be discarded, and a file is only downloaded again once, so a file
+        changing continuously fails its download.
+        """
+        if self.path is None or self.restarted:
+            return False
+        self.restarted = True
+        self.file.seek(0)
+        self.file.truncate()
+        self.offset = 0
+        self.digest = _digest(self.checksum)
+        self.set_validator(None)
+        return True
+
+    def write(self, chunk: bytes) -> None:
+        self.file.write(chunk)
+        if self.digest is not None:
+            self.digest[0].update(chunk)
+        self.offset += len(chunk)
+
+    def close(self, completed: bool) -> None:
+        if self.path is None:
+            if completed:
+                _verify(self.digest, "the downloaded file")
+            return
+        self.file.close()
+        if not completed:
+            return
+        try:
+            _verify(self.digest, str(self.path))
+        except ChecksumMismatch:
+            # the partial file is corrupted, so the next download starts over
+            self.part.unlink()
+            self.validator_path.unlink(missing_ok=True)
+            raise
+        os.replace(self.part, self.path)
+        self.validator_path.unlink(missing_ok=True)
+
+
+def download(
+    session: requests.Session,
+    url: str,
+    destination: Destination,
+    checksum: Optional[str] = None,
+    resume: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    **kwargs: Any,
+) -> int:
+    """Download the file at `url` to `destination` (a path or a binary file object), returning its size in bytes.
+
+    If `checksum` is given, as `algorithm:hexdigest` with any algorithm of `hashlib`, the downloaded file is verified
+    against it, raising `ChecksumMismatch` if it differs. See `_Writer` for the resumption of downloads to a path, and
+    `iter_download` for the other arguments. A download to a path is started over once if the file changed while it was
+    downloaded, or since the `.part` file was written; `ContentChanged` is raised otherwise.
+    """
+    writer = _Writer(destination, checksum, resume)
+    completed = False
+    try:
+        while not completed:
+            try:
+                for chunk in iter_download(
+                    session,
+                    url,
+                    writer.offset,
+                    chunk_size,
+                    max_retries,
+                    validator=writer.validator,
+                    on_validator=writer.set_validator,
+                    **kwargs,
+                ):
+                    writer.write(chunk)
+                completed = True
+            except ContentChanged:
+                if not writer.restart():
+                    raise
+    finally:
+        writer.close(completed)
+    return writer.offset
+
+
+async def async_download(
+    client: "httpx.AsyncClient",
+    url: str,
+    destination: Destination,
+    checksum: Optional[str] = None,
+    resume: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    **kwargs: Any,
+) -> int:
+    """Download the file at `url` to `destination`, returning its size in bytes, asynchronously.
+
+    See `download` for the arguments.
+    """
+    writer = _Writer(destination, checksum, resume)
+    completed = False
+    try:
+        while not completed:
+            try:
+                async for chunk in aiter_download(
+                    client,
+                    url,
+                    writer.offset,
+                    chunk_size,
+                    max_retries,
+                    validator=writer.validator,
+                    on_validator=writer.set_validator,
+                    **kwargs,
+                ):
+                    writer.write(chunk)
+                completed = True
+            except ContentChanged:
+                if not writer.restart():
+                    raise
+    finally:
+        writer.close(completed)
+    return writer.offset
@@ -15,6 +15,7 @@ else:
     from warnings import deprecated
 
 from hera.auth import TokenGenerator
+from hera.shared._transport import TransportConfig
 
 TBase = TypeVar("TBase", bound="BaseMixin")
 TypeTBase = Type[TBase]
@@ -79,6 +80,22 @@ class _GlobalConfig:
     script_command: Optional[List[str]] = field(default_factory=lambda: ["python"])
     """the default script command to use in starting up `Script` containers"""
 
+    cache_builds: bool = False
+    """whether to memoize built templates between builds of the same workflow.
+
+    When enabled, a template is only rebuilt after one of its fields, or a field of a Hera object it contains (such as
+    the tasks of a DAG and the templates they call), is set. In-place changes to field values, such as appending to a
+    list of `Env`, are not tracked, so the field must be reassigned for the template to be rebuilt. Each build returns
+    copies of the memoized templates, so the built workflow can be mutated without changing later builds.
+    """
+
+    transport_config: TransportConfig = field(default_factory=TransportConfig)
+    """the configuration of the connections, timeouts and retries of the services' requests to the Argo server"""
+
+    validate_responses: bool = True
+    """whether the services validate the responses of the Argo server as they are received. Otherwise, they return lazy
+    models, whose fields are only validated when first accessed, which is much faster for large responses"""
+
     _experimental_features: Dict[str, bool] = field(default_factory=lambda: defaultdict(bool))
 
     @property
@@ -0,0 +1,16 @@
+"""Helpers to page through the results of the list endpoints of the Argo server."""
+
+from typing import Optional
+
+
+def paginated_fields(fields: Optional[str]) -> Optional[str]:
+    """Return the given `fields` projection of a list, including the token needed to fetch the next page.
+
+    Projections excluding fields (e.g. `-items.status.nodes`) keep the token, so they are returned unchanged.
+    """
+    if not fields or fields.startswith("-"):
+        return fields
+    included = fields.split(",")
+    if "metadata" in included or "metadata.continue" in included:
+        return fields
+    return f"{fields},metadata.continue"
@@ -1,8 +1,9 @@
 """Module that holds the underlying base Pydantic models for Hera objects."""
 
+import sys
 from collections import ChainMap
 from inspect import get_annotations
-from typing import Any, Dict, Type
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Type
 
 from pydantic import (
     VERSION,
@@ -10,12 +11,36 @@ from pydantic import (
     ConfigDict,
 )
 from pydantic.fields import FieldInfo
-from pydantic.v1 import BaseModel as V1BaseModel
+
+if TYPE_CHECKING:
+    from pydantic.v1 import BaseModel as V1BaseModel
 
 _PYDANTIC_VERSION: int = int(VERSION.split(".")[0])
 
 
-def get_fields(cls: Type[V1BaseModel] | Type[V2BaseModel]) -> Dict[str, FieldInfo]:
+def _v1_base_model() -> Optional[type]:
+    """Return the pydantic v1 `BaseModel`, if `pydantic.v1` was imported.
+
+    No object is a v1 model before `pydantic.v1` is imported, so it is not imported only to check for v1 models, which
+    would slow down the imports of Hera (and the start of the runner) for users of pydantic v2 models.
+    """
+    v1 = sys.modules.get("pydantic.v1")
+    return getattr(v1, "BaseModel", None)
+
+
+def is_v1_model(obj: Any) -> bool:
+    """Return whether `obj` is an instance of a pydantic v1 model."""
+    base_model = _v1_base_model()
+    return base_model is not None and isinstance(obj, base_model)
+
+
+def is_v1_model_class(cls: Any) -> bool:
+    """Return whether `cls` is a pydantic v1 model class."""
+    base_model = _v1_base_model()
+    return base_model is not None and isinstance(cls, type) and issubclass(cls, base_model)
+
+
+def get_fields(cls: "Type[V1BaseModel] | Type[V2BaseModel]") -> Dict[str, FieldInfo]:
     """Centralize access to __fields__."""
     try:
         return cls.model_fields  # type: ignore
@@ -23,14 +48,14 @@ def get_fields(cls: Type[V1BaseModel] | Type[V2BaseModel]) -> Dict[str, FieldInf
         return cls.__fields__  # type: ignore
 
 
-def model_dump(obj: V1BaseModel | V2BaseModel) -> Dict[str, Any]:
+def model_dump(obj: "V1BaseModel | V2BaseModel", exclude: Optional[Set[str]] = None) -> Dict[str, Any]:
     """Call model_dump, with V1 fallback."""
-    if isinstance(obj, V1BaseModel):
-        return obj.dict()
-    return obj.model_dump(warnings="none")
+    if not isinstance(obj, V2BaseModel):
+        return obj.dict(exclude=exclude)
+    return obj.model_dump(exclude=exclude, warnings="none")
 
 
-def get_field_annotations(cls: Type[V1BaseModel] | Type[V2BaseModel]) -> Dict[str, Any]:
+def get_field_annotations(cls: "Type[V1BaseModel] | Type[V2BaseModel]") -> Dict[str, Any]:
     return {k: v for k, v in ChainMap(*(get_annotations(c) for c in cls.__mro__)).items()}
 
 
@@ -45,10 +70,19 @@ class APIBaseModel(V2BaseModel):
     )
 
 
+class DeferredAPIBaseModel(APIBaseModel):
+    """BaseModel for the API classes generated with deferred builds, whose validators are built when first used."""
+
+    model_config = ConfigDict(defer_build=True)
+
+
 __all__ = [
     "APIBaseModel",
+    "DeferredAPIBaseModel",
     "FieldInfo",
     "get_field_annotations",
     "get_fields",
+    "is_v1_model",
+    "is_v1_model_class",
     "model_dump",
 ]
@@ -0,0 +1,243 @@
+"""Decoding of the responses of the Argo server into models, optionally validating them only when they are used.
+
+Large payloads, such as workflows with thousands of nodes, or long lists of workflows, take much longer to validate
+than to decode. When the services are created with `validate_responses=False`, they return lazy models instead: the
+decoded JSON is kept as is, and a field is only validated when it is first accessed. Nested models are lazy as well, so
+reading `workflow.status.phase` validates neither the spec nor the nodes of the workflow.
+
+A lazy model is an instance of a subclass of the model class, so `isinstance` checks still hold. It is validated
+entirely, and turned into an instance of the model class itself, when it is dumped, copied, compared or printed, or
+when its `__dict__` is read, which is how pydantic serializes it as a field of another model.
+"""
+
+import json
+import types
+from typing import Any, Dict, Optional, Type, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel, RootModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+M = TypeVar("M", bound=BaseModel)
+
+# The key of the raw data of a lazy model in its `__pydantic_private__`
+_RAW = "__hera_raw__"
+
+# The lazy subclasses of the model classes
+_LAZY_CLASSES: Dict[Type[BaseModel], Type[BaseModel]] = {}
+
+
+def loads(content: Union[str, bytes]) -> Any:
+    """Decode the given JSON content, using `orjson` if it is installed, which is several times faster than `json`."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def parse_response(model: Type[M], content: Union[str, bytes], validate: bool = True) -> M:
+    """Return the given JSON response content as a `model`, which is lazy if `validate` is false."""
+    if validate:
+        # pydantic parses and validates the JSON in a single pass, which is faster than decoding it first
+        return model.model_validate_json(content)
+    return lazy_model(model, loads(content))
+
+
+def build_model(model: Type[M], data: Dict[str, Any], validate: bool = True) -> M:
+    """Return the given decoded JSON data as a `model`, which is lazy if `validate` is false."""
+    if validate:
+        return model(**data)
+    return lazy_model(model, data)
+
+
+def _model_class(annotation: Any) -> Optional[Type[BaseModel]]:
+    """Return the model class of a field annotated with a model, or an optional model, if any."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _model_class(args[0]) if len(args) == 1 else None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel) and not issubclass(annotation, RootModel):
+        return annotation
+    return None
+
+
+def _lazy_value(annotation: Any, value: Any) -> Any:
+    """Return the given raw value as lazy models if the annotation is a model, or a list or dict of models.
+
+    Returns None if the value has to be validated instead.
+    """
+    model = _model_class(annotation)
+    if model is not None:
+        return lazy_model(model, value) if isinstance(value, dict) else None
+
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    origin = get_origin(annotation)
+    if origin is list and isinstance(value, list):
+        model = _model_class(get_args(annotation)[0])
+        if model is not None and all(isinstance(item, dict) for item in value):
+            return [lazy_model(model, item) for item in value]
+    elif origin is dict and isinstance(value, dict):
+        model = _model_class(get_args(annotation)[1])
+        if model is not None and all(isinstance(item, dict) for item in value.values()):
+            return {key: lazy_model(model, item) for key, item in value.items()}
+    return None
+
+
+def _validate_field(model: Type[BaseModel], name: str, value: Any) -> Any:
+    """Validate the raw value of a single field of the model, using the model's own validator and configuration."""
+    target = model.__new__(model)
+    object.__setattr__(target, "__dict__", {})
+    object.__setattr__(target, "__pydantic_fields_set__", set())
+    object.__setattr__(target, "__pydantic_extra__", None)
+    object.__setattr__(target, "__pydantic_private__", None)
+    model.__pydantic_validator__.validate_assignment(target, name, value)
+    return target.__dict__[name]
+
+
+def _materialize_value(value: Any) -> None:
+    if isinstance(value, _LazyModel):
+        value._materialize()
+    elif isinstance(value, list):
+        for item in value:
+            _materialize_value(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _materialize_value(item)
+
+
+class _LazyModel:
+    """The base of the lazy subclasses of models, validating each field of the raw data when it is first accessed."""
+
+    __hera_model__: Type[BaseModel]
+
+    def __getattribute__(self, name: str) -> Any:
+        if name == "__dict__":
+            # the fields not accessed yet are missing from `__dict__`, which is read to serialize, compare or copy
+            # models, so it is only handed out once complete
+            object.__getattribute__(self, "_materialize")()
+        return object.__getattribute__(self, name)
+
+    def __getattr__(self, name: str) -> Any:
+        model = object.__getattribute__(self, "__hera_model__")
+        private = object.__getattribute__(self, "__pydantic_private__")
+        field = model.model_fields.get(name)
+        if field is None or private is None:
+            return super().__getattr__(name)  # type: ignore
+
+        raw = private[_RAW]
+        key = field.alias or name
+        if key not in raw:
+            if field.is_required():
+                # as for `model_construct`, required fields missing from the data (e.g. projected out of the response
+                # with `fields`) are not set
+                raise AttributeError(f"{model.__name__!r} object has no attribute {name!r}")
+            value = field.get_default(call_default_factory=True)
+        else:
+            value = _lazy_value(field.annotation, raw[key])
+            if value is None:
+                value = _validate_field(model, name, raw[key])
+        object.__getattribute__(self, "__dict__")[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        model = object.__getattribute__(self, "__hera_model__")
+        if name not in model.model_fields:
+            return super().__setattr__(name, value)
+        # as for models, assigned values are not validated
+        object.__getattribute__(self, "__dict__")[name] = value
+        object.__getattribute__(self, "__pydantic_fields_set__").add(name)
+
+    def _materialize(self) -> None:
+        """Validate the fields not accessed yet, and turn the lazy models into instances of their model class."""
+        model = object.__getattribute__(self, "__hera_model__")
+        private = object.__getattribute__(self, "__pydantic_private__")
+        fields = object.__getattribute__(self, "__dict__")
+        values = {}
+        # the fields are set in the order of the model, rather than the order they were accessed in, to be serialized
+        # as the model would be
+        for name, field in model.model_fields.items():
+            key = field.alias or name
+            if name in fields:
+                values[name] = fields[name]
+                _materialize_value(values[name])
+            elif key in private[_RAW]:
+                values[name] = _validate_field(model, name, private[_RAW][key])
+            elif not field.is_required():
+                values[name] = field.get_default(call_default_factory=True)
+        fields.clear()
+        fields.update(values)
+        object.__setattr__(self, "__pydantic_private__", None)
+        object.__setattr__(self, "__class__", model)
+
+    def model_dump(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        self._materialize()
+        return self.model_dump(*args, **kwargs)
+
+    def model_dump_json(self, *args: Any, **kwargs: Any) -> str:
+        self._materialize()
+        return self.model_dump_json(*args, **kwargs)
+
+    def model_copy(self, *args: Any, **kwargs: Any) -> Any:
+        self._materialize()
+        return self.model_copy(*args, **kwargs)
+
+    def __copy__(self) -> Any:
+        self._materialize()
+        return self.__copy__()
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> Any:
+        self._materialize()
+        return self.__deepcopy__(memo)
+
+    def __eq__(self, other: Any) -> bool:
+        self._materialize()
+        if isinstance(other, _LazyModel):
+            other._materialize()
+        return self == other
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        self._materialize()
+        return self.__reduce_ex__(protocol)
+
+    def __repr__(self) -> str:
+        self._materialize()
+        return repr(self)
+
+
+def _lazy_class(model: Type[M]) -> Type[M]:
+    lazy_class = _LAZY_CLASSES.get(model)
+    if lazy_class is None:
+        lazy_class = type(
+            model.__name__,
+            (_LazyModel, model),
+            {
+                "__module__": model.__module__,
+                # pickling a lazy model refers to its model class, as it is turned into one when it is pickled
+                "__qualname__": model.__qualname__,
+                "__hera_model__": model,
+                # lazy models are never validated as a whole, so their own schema is not needed
+                "model_config": {**model.model_config, "defer_build": True},
+            },
+        )
+        _LAZY_CLASSES[model] = lazy_class
+    return lazy_class  # type: ignore
+
+
+def lazy_model(model: Type[M], data: Dict[str, Any]) -> M:
+    """Return a lazy `model` of the given decoded JSON data, whose fields are only validated when first accessed."""
+    lazy_class = _lazy_class(model)
+    instance = lazy_class.__new__(lazy_class)
+    object.__setattr__(instance, "__dict__", {})
+    object.__setattr__(
+        instance,
+        "__pydantic_fields_set__",
+        {name for name, field in model.model_fields.items() if (field.alias or name) in data},
+    )
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", {_RAW: data})
+    return instance
@@ -0,0 +1,317 @@
+"""Helpers to consume the streaming endpoints of the Argo server, which send one JSON message per line."""
+
+import asyncio
+import random
+import re
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, Optional, Set, Tuple, Type, Union
+
+import requests
+
+from hera.exceptions import exception_from_server_response, exception_from_status_code
+from hera.shared._responses import loads
+
+if TYPE_CHECKING:
+    import httpx
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+"""Status codes of responses that are worth retrying, as the server may succeed later."""
+
+# Maps the gRPC status codes sent in stream errors to the matching HTTP status codes
+_GRPC_TO_HTTP_STATUS_CODES = {3: 400, 5: 404, 6: 409, 7: 403, 12: 501, 13: 500, 14: 503, 16: 401}
+
+_REQUESTS_CONNECTION_ERRORS: Tuple[Type[Exception], ...] = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+def backoff_delay(attempt: int, initial: float = 0.5, maximum: float = 30.0) -> float:
+    """Return the delay before the given (0-based) retry attempt, using an exponential backoff with full jitter.
+
+    The jitter spreads the retries of many clients over time, instead of all of them retrying at once.
+    """
+    return random.uniform(0, min(maximum, initial * 2**attempt))
+
+
+def parse_stream_line(line: Union[str, bytes]) -> Optional[Dict[str, Any]]:
+    """Parse a line of a stream, returning the result it contains, or None if it does not contain a result.
+
+    Lines are either plain JSON messages, or server-sent events (`data: {...}`) if the server was asked for a
+    `text/event-stream`. Errors sent in the stream are raised as the matching `HeraException`.
+    """
+    if isinstance(line, bytes):
+        line = line.decode()
+    line = line.strip()
+    if line.startswith("data:"):
+        line = line[len("data:") :].strip()
+    if not line.startswith("{"):
+        # Blank keep-alive lines, and the other fields of server-sent events
+        return None
+
+    message = loads(line)
+    if error := message.get("error"):
+        status_code = error.get("http_code") or _GRPC_TO_HTTP_STATUS_CODES.get(error.get("code"), 500)
+        raise exception_from_status_code(
+            status_code,
+            f"Server sent an error in the stream with status code {status_code} and message: `{error.get('message')}`",
+        )
+    return message.get("result")
+
+
+def _resource_version(result: Dict[str, Any]) -> Optional[str]:
+    return ((result.get("object") or {}).get("metadata") or {}).get("resourceVersion")
+
+
+def _without_none(params: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in params.items() if v is not None}
+
+
+def iter_watch_results(
+    session: requests.Session,
+    url: str,
+    params: Dict[str, Any],
+    resource_version: Optional[str] = None,
+    reconnect: bool = True,
+    max_reconnects: Optional[int] = None,
+    **kwargs: Any,
+) -> Iterator[Dict[str, Any]]:
+    """Yield the results of the watch stream at `url` as they are received.
+
+    If `reconnect` is true, the stream is reopened when the connection is lost, the server closes it, or the server
+    responds with a retryable status code, waiting for `backoff_delay` between consecutive failed attempts. The watch
+    resumes from the resource version of the last received event, or from `resource_version` if no event was received
+    yet. At most `max_reconnects` consecutive failed attempts to reconnect are made, if given.
+
+    Extra `kwargs` are passed to `session.request`.
+    """
+    attempt = 0
+    while True:
+        error: Optional[Exception] = None
+        try:
+            with session.request(
+                "get",
+                url,
+                params={**params, "listOptions.resourceVersion": resource_version},
+                stream=True,
+                **kwargs,
+            ) as resp:
+                if not resp.ok:
+                    error = exception_from_server_response(resp)
+                    if resp.status_code not in RETRYABLE_STATUS_CODES:
+                        raise error
+                else:
+                    attempt = 0
+                    # Without a chunk size, lines are yielded as soon as the server sends them
+                    for line in resp.iter_lines(chunk_size=None):
+                        if (result := parse_stream_line(line)) is None:
+                            continue
+                        resource_version = _resource_version(result) or resource_version
+                        yield result
+        except _REQUESTS_CONNECTION_ERRORS as e:
+            error = e
+
+        if not reconnect or (max_reconnects is not None and attempt >= max_reconnects):
+            if error is not None:
+                raise error
+            return
+        time.sleep(backoff_delay(attempt))
+        attempt += 1
+
+
+async def aiter_watch_results(
+    client: "httpx.AsyncClient",
+    url: str,
+    params: Dict[str, Any],
+    resource_version: Optional[str] = None,
+    reconnect: bool = True,
+    max_reconnects: Optional[int] = None,
+    **kwargs: Any,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield the results of the watch stream at `url` as they are received, asynchronously.
+
+    See `iter_watch_results` for the reconnection behaviour. Extra `kwargs` are passed to `client.stream`.
+    """
+    import httpx
+
+    attempt = 0
+    while True:
+        error: Optional[Exception] = None
+        try:
+            async with client.stream(
+                "GET",
+                url,
+                params=_without_none({**params, "listOptions.resourceVersion": resource_version}),
+                **kwargs,
+            ) as resp:
+                if not resp.is_success:
+                    await resp.aread()
+                    error = exception_from_server_response(resp)
+                    if resp.status_code not in RETRYABLE_STATUS_CODES:
+                        raise error
+                else:
+                    attempt = 0
+                    async for line in resp.aiter_lines():
+                        if (result := parse_stream_line(line)) is None:
+                            continue
+                        resource_version = _resource_version(result) or resource_version
+                        yield result
+        except httpx.TransportError as e:
+            error = e
+
+        if not reconnect or (max_reconnects is not None and attempt >= max_reconnects):
+            if error is not None:
+                raise error
+            return
+        await asyncio.sleep(backoff_delay(attempt))
+        attempt += 1
+
+
+# The RFC 3339 timestamp Kubernetes prefixes log lines with when asked for timestamps
+_LOG_TIMESTAMP = re.compile(r"^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d{1,9}))?Z ")
+
+
+def _log_timestamp(content: str) -> Tuple[Optional[int], str]:
+    """Return the timestamp (in nanoseconds since the epoch) the given log line is prefixed with, and the line without it."""
+    match = _LOG_TIMESTAMP.match(content)
+    if match is None:
+        return None, content
+    seconds = datetime.strptime(match.group(1), "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc).timestamp()
+    nanos = int((match.group(2) or "").ljust(9, "0"))
+    return int(seconds) * 1_000_000_000 + nanos, content[match.end() :]
+
+
+class _LogResumer:
+    """Keeps track of the log entries received from a log stream, to resume it after the last ones when it reconnects.
+
+    The entries are requested with timestamps, so the stream can be reopened from the timestamp of the last received
+    entries. Kubernetes only resumes logs from a whole second, so the entries received again are skipped.
+    """
+
+    def __init__(self, params: Dict[str, Any], timestamps: bool) -> None:
+        self.params = {**params, "logOptions.timestamps": True}
+        self.timestamps = timestamps
+        # the timestamp of the last entry of each pod, and the entries of the pod received at that timestamp
+        self.last: Dict[Optional[str], Tuple[int, Set[str]]] = {}
+
+    def resume_params(self) -> Dict[str, Any]:
+        """Return the parameters of the request (re)opening the stream."""
+        if not self.last:
+            return self.params
+        since = min(timestamp for timestamp, _ in self.last.values()) // 1_000_000_000
+        return {
+            **self.params,
+            "logOptions.sinceTime.seconds": str(since),
+            "logOptions.sinceSeconds": None,
+            "logOptions.tailLines": None,
+        }
+
+    def accept(self, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the given entry as it is to be yielded, or None if it was already received."""
+        content = result.get("content") or ""
+        timestamp, line = _log_timestamp(content)
+        if timestamp is not None:
+            pod = result.get("podName")
+            last_timestamp, seen = self.last.get(pod, (-1, set()))
+            if timestamp < last_timestamp or (timestamp == last_timestamp and content in seen):
+                return None
+            if timestamp > last_timestamp:
+                seen = set()
+            seen.add(content)
+            self.last[pod] = (timestamp, seen)
+        return result if self.timestamps else {**result, "content": line}
+
+
+def iter_log_results(
+    session: requests.Session,
+    url: str,
+    params: Dict[str, Any],
+    timestamps: bool = False,
+    reconnect: bool = True,
+    max_reconnects: Optional[int] = None,
+    **kwargs: Any,
+) -> Iterator[Dict[str, Any]]:
+    """Yield the entries of the log stream at `url` as they are received, until the server ends the stream.
+
+    If `reconnect` is true, the stream is reopened when the connection is lost, or the server responds with a
+    retryable status code, waiting for `backoff_delay` between consecutive failed attempts. The stream resumes from the
+    timestamp of the last received entries, skipping the ones received already. At most `max_reconnects` consecutive
+    failed attempts to reconnect are made, if given. The log lines are only prefixed with their timestamp if
+    `timestamps` is true.
+
+    Extra `kwargs` are passed to `session.request`.
+    """
+    resumer = _LogResumer(params, timestamps)
+    attempt = 0
+    while True:
+        error: Optional[Exception] = None
+        try:
+            with session.request("get", url, params=resumer.resume_params(), stream=True, **kwargs) as resp:
+                if not resp.ok:
+                    error = exception_from_server_response(resp)
+                    if resp.status_code not in RETRYABLE_STATUS_CODES:
+                        raise error
+                else:
+                    attempt = 0
+                    for line in resp.iter_lines(chunk_size=None):
+                        if (result := parse_stream_line(line)) is None:
+                            continue
+                        if (entry := resumer.accept(result)) is not None:
+                            yield entry
+                    return
+        except _REQUESTS_CONNECTION_ERRORS as e:
+            error = e
+
+        # the stream only ends without an error when the server ends it
+        assert error is not None
+        if not reconnect or (max_reconnects is not None and attempt >= max_reconnects):
+            raise error
+        time.sleep(backoff_delay(attempt))
+        attempt += 1
+
+
+async def aiter_log_results(
+    client: "httpx.AsyncClient",
+    url: str,
+    params: Dict[str, Any],
+    timestamps: bool = False,
+    reconnect: bool = True,
+    max_reconnects: Optional[int] = None,
+    **kwargs: Any,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield the entries of the log stream at `url` as they are received, asynchronously.
+
+    See `iter_log_results` for the reconnection behaviour. Extra `kwargs` are passed to `client.stream`.
+    """
+    import httpx
+
+    resumer = _LogResumer(params, timestamps)
+    attempt = 0
+    while True:
+        error: Optional[Exception] = None
+        try:
+            async with client.stream("GET", url, params=_without_none(resumer.resume_params()), **kwargs) as resp:
+                if not resp.is_success:
+                    await resp.aread()
+                    error = exception_from_server_response(resp)
+                    if resp.status_code not in RETRYABLE_STATUS_CODES:
+                        raise error
+                else:
+                    attempt = 0
+                    async for line in resp.aiter_lines():
+                        if (result := parse_stream_line(line)) is None:
+                            continue
+                        if (entry := resumer.accept(result)) is not None:
+                            yield entry
+                    return
+        except httpx.TransportError as e:
+            error = e
+
+        # the stream only ends without an error when the server ends it
+        assert error is not None
+        if not reconnect or (max_reconnects is not None and attempt >= max_reconnects):
+            raise error
+        await asyncio.sleep(backoff_delay(attempt))
+        attempt += 1
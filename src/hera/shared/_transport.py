@@ -0,0 +1,107 @@
+"""Configuration of the HTTP connections the services make to the Argo server."""
+
+import email.utils
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import requests
+
+# The maximum delay in seconds between two retries, as used by urllib3
+_BACKOFF_MAX = 120.0
+
+
+@dataclass
+class TransportConfig:
+    """Configuration of the connections, timeouts and retries of the services' requests to the Argo server.
+
+    The configuration is used by the workflows and events services (sync and async) to build their session, unless a
+    session is passed to them. Set `global_config.transport_config` to configure all the services, or pass
+    `transport_config` to a service to configure only that one.
+    """
+
+    max_connections_per_host: Optional[int] = None
+    """the maximum number of connections to the Argo server kept open for reuse by sync services (10 by default), or
+    open at once by async services (100 by default). It should be at least the number of threads sharing a service"""
+
+    max_keepalive_connections: Optional[int] = None
+    """the maximum number of idle connections kept open by async services (20 by default). Sync services keep up to
+    `max_connections_per_host` idle connections"""
+
+    keepalive_expiry: Optional[float] = None
+    """the time in seconds after which idle connections are closed by async services (5 by default)"""
+
+    timeout: Optional[Union[float, Tuple[float, float]]] = None
+    """the timeout in seconds of the requests, or a `(connect, read)` tuple of timeouts. Sync services do not time out
+    by default, async services time out after 5 seconds by default"""
+
+    max_retries: int = 0
+    """the number of times a request is retried if the connection to the Argo server fails, or if it responds with
+    one of the `retry_status_codes`"""
+
+    retry_status_codes: Tuple[int, ...] = (429, 503)
+    """the status codes of the responses to retry, which are retried for any request method, including the ones
+    creating resources, so they should only include status codes meaning the request was not processed"""
+
+    backoff_factor: float = 0.5
+    """the retries are made immediately and then after `backoff_factor * 2 ** retry` seconds, unless the response has
+    a `Retry-After` header, in which case the delay it requests is respected"""
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """Return the delay in seconds requested by the given `Retry-After` header value, if any.
+
+    The header either holds a number of seconds, or an HTTP date.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def retry_delay(config: TransportConfig, attempt: int, retry_after: Optional[str] = None) -> float:
+    """Return the delay before the given (0-based) retry, computed as urllib3 does for the sync services."""
+    requested = _retry_after(retry_after)
+    if requested is not None:
+        return requested
+    if attempt == 0:
+        return 0.0
+    return min(_BACKOFF_MAX, config.backoff_factor * 2**attempt)
+
+
+def build_session(config: TransportConfig) -> "requests.Session":
+    """Return a session pooling its connections and retrying its requests as set in the given configuration."""
+    # `requests` is imported when a session is built, as this module is imported by all of Hera (through the global
+    # config), including the runner, which makes no requests
+    import requests
+    from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=config.max_retries,
+        # reading the response may fail after the server processed the request, so it is not retried
+        read=False,
+        status_forcelist=config.retry_status_codes,
+        # any method is retried, as the retried status codes mean the request was not processed
+        allowed_methods=None,
+        backoff_factor=config.backoff_factor,
+        raise_on_status=False,
+    )
+    pool_maxsize = config.max_connections_per_host or DEFAULT_POOLSIZE
+    adapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+__all__ = ["TransportConfig"]
@@ -5,7 +5,8 @@ from json import JSONEncoder
 from typing import Any, Optional
 
 from pydantic import BaseModel as V2BaseModel
-from pydantic.v1 import BaseModel as V1BaseModel
+
+from hera.shared._pydantic import is_v1_model
 
 MISSING = object()
 """`MISSING` is a placeholder that indicates field value nullity.
@@ -23,7 +24,7 @@ class PydanticEncoder(JSONEncoder):
         # Note that these are slightly different outputs b/w v1 and v2
         # v1 will give the actual python object whereas v2 will serialize it into
         # a json compatible format.
-        if isinstance(o, V1BaseModel):
+        if is_v1_model(o):
             return o.dict(by_alias=True)
         if isinstance(o, V2BaseModel):
             return o.model_dump(by_alias=True, mode="json")
@@ -6,81 +6,237 @@
 # Hera submodules should not use `from hera.workflows import X`
 # themselves, as it introduces a circular dependency.
 
-from hera.workflows.archive import ArchiveStrategy, NoneArchiveStrategy, TarArchiveStrategy, ZipArchiveStrategy
-from hera.workflows.artifact import (
-    Artifact,
-    ArtifactLoader,
-    ArtifactoryArtifact,
-    AzureArtifact,
-    GCSArtifact,
-    GitArtifact,
-    HDFSArtifact,
-    HTTPArtifact,
-    OSSArtifact,
-    PluginArtifact,
-    RawArtifact,
-    S3Artifact,
-)
-from hera.workflows.async_service import AsyncWorkflowsService
-from hera.workflows.cluster_workflow_template import ClusterWorkflowTemplate
-from hera.workflows.container import Container
-from hera.workflows.container_set import ContainerNode, ContainerSet
-from hera.workflows.cron_workflow import CronWorkflow
-from hera.workflows.dag import DAG
-from hera.workflows.data import Data
-from hera.workflows.env import ConfigMapEnv, Env, FieldEnv, ResourceEnv, SecretEnv
-from hera.workflows.env_from import ConfigMapEnvFrom, SecretEnvFrom
-from hera.workflows.exceptions import InvalidDispatchType, InvalidTemplateCall, InvalidType, NodeNameConflict
-from hera.workflows.http_template import HTTP
-from hera.workflows.io import Input, Output
-from hera.workflows.metrics import Counter, Gauge, Histogram, Label, Metric, Metrics
-from hera.workflows.operator import Operator
-from hera.workflows.parameter import Parameter
-from hera.workflows.resource import Resource
-from hera.workflows.resources import Resources
-from hera.workflows.retry_strategy import RetryPolicy, RetryStrategy
-from hera.workflows.script import InlineScriptConstructor, RunnerScriptConstructor, Script, ScriptConstructor, script
-from hera.workflows.service import WorkflowsService
-from hera.workflows.steps import Parallel, Step, Steps, parallel
-from hera.workflows.suspend import Suspend
-from hera.workflows.task import Task, TaskResult
-from hera.workflows.user_container import UserContainer
-from hera.workflows.volume import (
-    AccessMode,
-    AWSElasticBlockStoreVolume,
-    AzureDiskVolume,
-    AzureFileVolume,
-    CephFSVolume,
-    CinderVolume,
-    ConfigMapVolume,
-    CSIVolume,
-    DownwardAPIVolume,
-    EmptyDirVolume,
-    EphemeralVolume,
-    ExistingVolume,
-    FCVolume,
-    FlexVolume,
-    FlockerVolume,
-    GCEPersistentDiskVolume,
-    GitRepoVolume,
-    GlusterfsVolume,
-    HostPathVolume,
-    ISCSIVolume,
-    NFSVolume,
-    PhotonPersistentDiskVolume,
-    PortworxVolume,
-    ProjectedVolume,
-    QuobyteVolume,
-    RBDVolume,
-    ScaleIOVolume,
-    SecretVolume,
-    StorageOSVolume,
-    Volume,
-    VsphereVirtualDiskVolume,
-)
-from hera.workflows.workflow import Workflow
-from hera.workflows.workflow_status import WorkflowStatus
-from hera.workflows.workflow_template import WorkflowTemplate
+import importlib
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from hera.workflows.archive import ArchiveStrategy, NoneArchiveStrategy, TarArchiveStrategy, ZipArchiveStrategy
+    from hera.workflows.artifact import (
+        Artifact,
+        ArtifactLoader,
+        ArtifactoryArtifact,
+        AzureArtifact,
+        GCSArtifact,
+        GitArtifact,
+        HDFSArtifact,
+        HTTPArtifact,
+        OSSArtifact,
+        PluginArtifact,
+        RawArtifact,
+        S3Artifact,
+    )
+    from hera.workflows.async_service import AsyncWorkflowsService
+    from hera.workflows.cluster_workflow_template import ClusterWorkflowTemplate
+    from hera.workflows.container import Container
+    from hera.workflows.container_set import ContainerNode, ContainerSet
+    from hera.workflows.cron_workflow import CronWorkflow
+    from hera.workflows.dag import DAG
+    from hera.workflows.data import Data
+    from hera.workflows.env import ConfigMapEnv, Env, FieldEnv, ResourceEnv, SecretEnv
+    from hera.workflows.env_from import ConfigMapEnvFrom, SecretEnvFrom
+    from hera.workflows.exceptions import (
+        InvalidDispatchType,
+        InvalidTemplateCall,
+        InvalidType,
+        NodeNameConflict,
+        SubmissionError,
+    )
+    from hera.workflows.http_template import HTTP
+    from hera.workflows.io import Input, Output
+    from hera.workflows.log_tailer import LogTailer
+    from hera.workflows.metrics import Counter, Gauge, Histogram, Label, Metric, Metrics
+    from hera.workflows.operator import Operator
+    from hera.workflows.parameter import Parameter
+    from hera.workflows.resource import Resource
+    from hera.workflows.resources import Resources
+    from hera.workflows.retry_strategy import RetryPolicy, RetryStrategy
+    from hera.workflows.script import (
+        InlineScriptConstructor,
+        RunnerScriptConstructor,
+        Script,
+        ScriptConstructor,
+        script,
+    )
+    from hera.workflows.service import WorkflowsService
+    from hera.workflows.steps import Parallel, Step, Steps, parallel
+    from hera.workflows.submit import async_submit_many, submit_many
+    from hera.workflows.suspend import Suspend
+    from hera.workflows.task import Task, TaskResult
+    from hera.workflows.user_container import UserContainer
+    from hera.workflows.volume import (
+        AccessMode,
+        AWSElasticBlockStoreVolume,
+        AzureDiskVolume,
+        AzureFileVolume,
+        CephFSVolume,
+        CinderVolume,
+        ConfigMapVolume,
+        CSIVolume,
+        DownwardAPIVolume,
+        EmptyDirVolume,
+        EphemeralVolume,
+        ExistingVolume,
+        FCVolume,
+        FlexVolume,
+        FlockerVolume,
+        GCEPersistentDiskVolume,
+        GitRepoVolume,
+        GlusterfsVolume,
+        HostPathVolume,
+        ISCSIVolume,
+        NFSVolume,
+        PhotonPersistentDiskVolume,
+        PortworxVolume,
+        ProjectedVolume,
+        QuobyteVolume,
+        RBDVolume,
+        ScaleIOVolume,
+        SecretVolume,
+        StorageOSVolume,
+        Volume,
+        VsphereVirtualDiskVolume,
+    )
+    from hera.workflows.workflow import Workflow
+    from hera.workflows.workflow_outputs import async_get_workflow_outputs, get_workflow_outputs
+    from hera.workflows.workflow_status import WorkflowStatus
+    from hera.workflows.workflow_template import WorkflowTemplate
+    from hera.workflows.workflow_waiter import WorkflowWaiter
+
+# the module of each exported object, imported when the object is first accessed
+_EXPORTS = {
+    "ArchiveStrategy": "hera.workflows.archive",
+    "NoneArchiveStrategy": "hera.workflows.archive",
+    "TarArchiveStrategy": "hera.workflows.archive",
+    "ZipArchiveStrategy": "hera.workflows.archive",
+    "Artifact": "hera.workflows.artifact",
+    "ArtifactoryArtifact": "hera.workflows.artifact",
+    "AzureArtifact": "hera.workflows.artifact",
+    "GCSArtifact": "hera.workflows.artifact",
+    "GitArtifact": "hera.workflows.artifact",
+    "HDFSArtifact": "hera.workflows.artifact",
+    "HTTPArtifact": "hera.workflows.artifact",
+    "OSSArtifact": "hera.workflows.artifact",
+    "PluginArtifact": "hera.workflows.artifact",
+    "RawArtifact": "hera.workflows.artifact",
+    "S3Artifact": "hera.workflows.artifact",
+    "ArtifactLoader": "hera.workflows.artifact",
+    "AsyncWorkflowsService": "hera.workflows.async_service",
+    "ClusterWorkflowTemplate": "hera.workflows.cluster_workflow_template",
+    "Container": "hera.workflows.container",
+    "ContainerNode": "hera.workflows.container_set",
+    "ContainerSet": "hera.workflows.container_set",
+    "CronWorkflow": "hera.workflows.cron_workflow",
+    "DAG": "hera.workflows.dag",
+    "Data": "hera.workflows.data",
+    "Env": "hera.workflows.env",
+    "SecretEnv": "hera.workflows.env",
+    "ConfigMapEnv": "hera.workflows.env",
+    "FieldEnv": "hera.workflows.env",
+    "ResourceEnv": "hera.workflows.env",
+    "SecretEnvFrom": "hera.workflows.env_from",
+    "ConfigMapEnvFrom": "hera.workflows.env_from",
+    "InvalidType": "hera.workflows.exceptions",
+    "InvalidTemplateCall": "hera.workflows.exceptions",
+    "InvalidDispatchType": "hera.workflows.exceptions",
+    "NodeNameConflict": "hera.workflows.exceptions",
+    "SubmissionError": "hera.workflows.exceptions",
+    "HTTP": "hera.workflows.http_template",
+    "Input": "hera.workflows.io",
+    "Output": "hera.workflows.io",
+    "LogTailer": "hera.workflows.log_tailer",
+    "Label": "hera.workflows.metrics",
+    "Counter": "hera.workflows.metrics",
+    "Gauge": "hera.workflows.metrics",
+    "Histogram": "hera.workflows.metrics",
+    "Metric": "hera.workflows.metrics",
+    "Metrics": "hera.workflows.metrics",
+    "Operator": "hera.workflows.operator",
+    "Parameter": "hera.workflows.parameter",
+    "Resource": "hera.workflows.resource",
+    "Resources": "hera.workflows.resources",
+    "RetryPolicy": "hera.workflows.retry_strategy",
+    "RetryStrategy": "hera.workflows.retry_strategy",
+    "Script": "hera.workflows.script",
+    "script": "hera.workflows.script",
+    "ScriptConstructor": "hera.workflows.script",
+    "InlineScriptConstructor": "hera.workflows.script",
+    "RunnerScriptConstructor": "hera.workflows.script",
+    "WorkflowsService": "hera.workflows.service",
+    "Steps": "hera.workflows.steps",
+    "Step": "hera.workflows.steps",
+    "Parallel": "hera.workflows.steps",
+    "parallel": "hera.workflows.steps",
+    "async_submit_many": "hera.workflows.submit",
+    "submit_many": "hera.workflows.submit",
+    "Suspend": "hera.workflows.suspend",
+    "Task": "hera.workflows.task",
+    "TaskResult": "hera.workflows.task",
+    "UserContainer": "hera.workflows.user_container",
+    "AccessMode": "hera.workflows.volume",
+    "AWSElasticBlockStoreVolume": "hera.workflows.volume",
+    "AzureDiskVolume": "hera.workflows.volume",
+    "AzureFileVolume": "hera.workflows.volume",
+    "CephFSVolume": "hera.workflows.volume",
+    "CinderVolume": "hera.workflows.volume",
+    "ConfigMapVolume": "hera.workflows.volume",
+    "CSIVolume": "hera.workflows.volume",
+    "DownwardAPIVolume": "hera.workflows.volume",
+    "EmptyDirVolume": "hera.workflows.volume",
+    "EphemeralVolume": "hera.workflows.volume",
+    "FCVolume": "hera.workflows.volume",
+    "FlexVolume": "hera.workflows.volume",
+    "FlockerVolume": "hera.workflows.volume",
+    "GCEPersistentDiskVolume": "hera.workflows.volume",
+    "GitRepoVolume": "hera.workflows.volume",
+    "GlusterfsVolume": "hera.workflows.volume",
+    "HostPathVolume": "hera.workflows.volume",
+    "ISCSIVolume": "hera.workflows.volume",
+    "NFSVolume": "hera.workflows.volume",
+    "PhotonPersistentDiskVolume": "hera.workflows.volume",
+    "PortworxVolume": "hera.workflows.volume",
+    "ProjectedVolume": "hera.workflows.volume",
+    "QuobyteVolume": "hera.workflows.volume",
+    "RBDVolume": "hera.workflows.volume",
+    "ScaleIOVolume": "hera.workflows.volume",
+    "SecretVolume": "hera.workflows.volume",
+    "StorageOSVolume": "hera.workflows.volume",
+    "VsphereVirtualDiskVolume": "hera.workflows.volume",
+    "ExistingVolume": "hera.workflows.volume",
+    "Volume": "hera.workflows.volume",
+    "Workflow": "hera.workflows.workflow",
+    "async_get_workflow_outputs": "hera.workflows.workflow_outputs",
+    "get_workflow_outputs": "hera.workflows.workflow_outputs",
+    "WorkflowStatus": "hera.workflows.workflow_status",
+    "WorkflowTemplate": "hera.workflows.workflow_template",
+    "WorkflowWaiter": "hera.workflows.workflow_waiter",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+class _LazyModule(ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # an imported submodule is set as an attribute of its package, which must not shadow the object of the same
+        # name exported by the package, e.g. the `script` module and the `script` decorator
+        if name in _EXPORTS and isinstance(value, ModuleType) and value.__name__ == f"{__name__}.{name}":
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyModule
 
 __all__ = [
     "AWSElasticBlockStoreVolume",
@@ -134,6 +290,7 @@ __all__ = [
     "InvalidTemplateCall",
     "InvalidType",
     "Label",
+    "LogTailer",
     "Metric",
     "Metrics",
     "NFSVolume",
@@ -167,6 +324,7 @@ __all__ = [
     "Step",
     "Steps",
     "StorageOSVolume",
+    "SubmissionError",
     "Suspend",
     "TarArchiveStrategy",
     "Task",
@@ -177,8 +335,13 @@ __all__ = [
     "Workflow",
     "WorkflowStatus",
     "WorkflowTemplate",
+    "WorkflowWaiter",
     "WorkflowsService",
     "ZipArchiveStrategy",
+    "async_get_workflow_outputs",
+    "async_submit_many",
+    "get_workflow_outputs",
     "parallel",
     "script",
+    "submit_many",
 ]
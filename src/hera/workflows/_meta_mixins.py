@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import dataclasses
 import functools
 import inspect
-import sys
+import json
+import operator
+import re
+import weakref
 from collections import ChainMap
 from dataclasses import dataclass
 from inspect import get_annotations
@@ -18,6 +22,7 @@ from typing import (
     List,
     Optional,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -29,10 +34,7 @@ from hera.shared._pydantic import APIBaseModel, get_fields
 from hera.shared._type_util import construct_io_from_annotation, get_annotated_metadata, unwrap_annotation
 from hera.workflows._context import _context
 from hera.workflows.exceptions import InvalidTemplateCall
-from hera.workflows.io.v2 import (
-    Input as InputV2,
-    Output as OutputV2,
-)
+from hera.workflows.io._io_mixins import InputMixin, OutputMixin
 from hera.workflows.models import (
     Artifact as ModelArtifact,
     Parameter as ModelParameter,
@@ -40,17 +42,6 @@ from hera.workflows.models import (
 from hera.workflows.parameter import Parameter
 from hera.workflows.protocol import Templatable, TWorkflow
 
-if sys.version_info >= (3, 14):
-    from hera.workflows.io.v2 import (
-        Input as InputV1,
-        Output as OutputV1,
-    )
-else:
-    from hera.workflows.io.v1 import (
-        Input as InputV1,
-        Output as OutputV1,
-    )
-
 if TYPE_CHECKING:
     from hera.workflows.steps import Step
     from hera.workflows.task import Task
@@ -135,6 +126,38 @@ def _get_model_attr(model: APIBaseModel, attrs: List[str]) -> Any:
     return getattr(curr, attrs[-1])
 
 
+def _compile_model_getter(attrs: List[str]) -> Callable[[Any], Any]:
+    """Returns a function that gets the attribute at the `attrs` path of a model, as in `_get_model_attr`."""
+    return operator.attrgetter(".".join(attrs))
+
+
+def _compile_model_setter(attrs: List[str]) -> Callable[[Any, Any], None]:
+    """Returns a function that sets the attribute at the `attrs` path of a model, as in `_set_model_attr`."""
+    *parents, last = attrs
+    if not parents:
+        return lambda model, value: setattr(model, last, value)
+
+    get_parent = operator.attrgetter(".".join(parents))
+    return lambda model, value: setattr(get_parent(model), last, value)
+
+
+@dataclass(frozen=True)
+class _ModelMapping:
+    """A Hera attribute resolved against its `ModelMapper`.
+
+    `get_value` returns the value to put in the model for a Hera object, either by calling the mapper's builder
+    function on the object, or by getting the attribute directly.
+    """
+
+    attr: str
+    mapper: ModelMapperMixin.ModelMapper
+    get_value: Callable[[Any], Any]
+
+
+_build_plans: Dict[Tuple[type, type], Tuple[_ModelMapping, ...]] = {}
+"""Cache of the build plans of each (`ModelMapper`, Hera class) pair, see `ModelMapper._get_build_plan`."""
+
+
 class ModelMapperMixin:
     """`ModelMapperMixin` allows Hera classes to be mapped to auto-generated Argo classes."""
 
@@ -155,27 +178,36 @@ class ModelMapperMixin:
                     raise ValueError(f"Model key '{key}' does not exist in class {curr_class}")
                 curr_class = fields[key].annotation  # type: ignore
 
+            self.get_model_value = _compile_model_getter(self.model_path)
+            self.set_model_value = _compile_model_setter(self.model_path)
+
         @classmethod
         def _get_model_class(cls) -> Type[APIBaseModel]:
             raise NotImplementedError
 
+        @classmethod
+        def _is_built(cls, mapper: ModelMapperMixin.ModelMapper) -> bool:
+            """Returns whether `build_model` should set the value for the given mapper."""
+            return bool(mapper.model_path)
+
+        @classmethod
+        def _get_build_plan(cls, hera_class: Type[ModelMapperMixin]) -> Tuple[_ModelMapping, ...]:
+            """Returns the mappings of `hera_class` used by this mapper's `build_model`, computed once per class."""
+            key = (cls, hera_class)
+            if key not in _build_plans:
+                _build_plans[key] = tuple(
+                    mapping for mapping in hera_class._get_model_mappings() if cls._is_built(mapping.mapper)
+                )
+            return _build_plans[key]
+
         @classmethod
         def build_model(
             cls, hera_class: Type[ModelMapperMixin], hera_obj: ModelMapperMixin, model: TWorkflow
         ) -> TWorkflow:
-            for attr, annotation in hera_class._get_all_annotations().items():
-                if mappers := get_annotated_metadata(annotation, ModelMapperMixin.ModelMapper):
-                    if len(mappers) != 1:
-                        raise ValueError("Expected only one ModelMapper")
-
-                    # Value comes from builder function if it exists on hera_obj, otherwise directly from the attr
-                    value = (
-                        getattr(hera_obj, mappers[0].builder.__name__)()
-                        if mappers[0].builder is not None
-                        else getattr(hera_obj, attr)
-                    )
-                    if value is not None:
-                        _set_model_attr(model, mappers[0].model_path, value)
+            for mapping in cls._get_build_plan(hera_class):
+                value = mapping.get_value(hera_obj)
+                if value is not None:
+                    mapping.mapper.set_model_value(model, value)
 
             return model
 
@@ -185,18 +217,51 @@ class ModelMapperMixin:
         return ChainMap(*(get_annotations(c) for c in cls.__mro__))
 
     @classmethod
-    def _from_model(cls, model: APIBaseModel) -> ModelMapperMixin:
-        """Parse from given model to cls's type."""
-        hera_obj = cls()
+    @functools.cache
+    def _get_model_mappings(cls) -> Tuple[_ModelMapping, ...]:
+        """Gets the attributes of this class annotated with a `ModelMapper`, in annotation order.
 
+        The mappings are computed once per class, so the annotations are not re-scanned on every build.
+        """
+        mappings = []
         for attr, annotation in cls._get_all_annotations().items():
             if mappers := get_annotated_metadata(annotation, ModelMapperMixin.ModelMapper):
                 if len(mappers) != 1:
-                    raise ValueError("Expected only one model mapper")
-                if mappers[0].model_path:
-                    value = _get_model_attr(model, mappers[0].model_path)
-                    if value is not None:
-                        setattr(hera_obj, attr, value)
+                    raise ValueError("Expected only one ModelMapper")
+
+                # Value comes from builder function if it exists on hera_obj, otherwise directly from the attr
+                get_value = (
+                    operator.methodcaller(mappers[0].builder.__name__)
+                    if mappers[0].builder is not None
+                    else operator.attrgetter(attr)
+                )
+                mappings.append(_ModelMapping(attr, mappers[0], get_value))
+        return tuple(mappings)
+
+    @classmethod
+    def _get_model_value_getter(cls, mapper: ModelMapperMixin.ModelMapper) -> Optional[Callable[[Any], Any]]:
+        """Returns the function used by `_from_model` to get the mapper's value from a model, or None to skip it."""
+        return mapper.get_model_value if mapper.model_path else None
+
+    @classmethod
+    @functools.cache
+    def _get_from_model_plan(cls) -> Tuple[Tuple[str, Callable[[Any], Any]], ...]:
+        """Returns the attributes set by `_from_model`, with their model value getters, computed once per class."""
+        plan = []
+        for mapping in cls._get_model_mappings():
+            if get_model_value := cls._get_model_value_getter(mapping.mapper):
+                plan.append((mapping.attr, get_model_value))
+        return tuple(plan)
+
+    @classmethod
+    def _from_model(cls, model: APIBaseModel) -> ModelMapperMixin:
+        """Parse from given model to cls's type."""
+        hera_obj = cls()
+
+        for attr, get_model_value in cls._get_from_model_plan():
+            value = get_model_value(model)
+            if value is not None:
+                setattr(hera_obj, attr, value)
 
         return hera_obj
 
@@ -250,14 +315,82 @@ class HookMixin(BaseMixin):
         return output
 
 
-def _get_pydantic_input_type(source: Callable) -> Union[None, Type[InputV1], Type[InputV2]]:
+class BuildCacheMixin(BaseMixin):
+    """`BuildCacheMixin` memoizes the built template of inheritors when `global_config.cache_builds` is set.
+
+    Setting an attribute marks the object, and every Hera object holding it (its "parents"), as dirty, which clears
+    their memoized templates. An object becomes a parent of the `BuildCacheMixin` objects it is given as attribute
+    values (directly or in a list) or through `_add_sub`, e.g. a `DAG` is a parent of its tasks, and a `Task` is a
+    parent of its template.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if isinstance(value, BuildCacheMixin):
+            value._add_build_parent(self)
+        elif isinstance(value, list):
+            for v in value:
+                if isinstance(v, BuildCacheMixin):
+                    v._add_build_parent(self)
+
+        # Skip the walk for objects that were never built nor added to another object, e.g. during `__init__`
+        self_dict = object.__getattribute__(self, "__dict__")
+        if "_build_cache" in self_dict or "_build_parents" in self_dict:
+            self._mark_dirty()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Parents are weak references and the memoized template belongs to this object only, so neither are copied
+        state = dict(self.__dict__)
+        state.pop("_build_parents", None)
+        state.pop("_build_cache", None)
+        return state
+
+    def _add_build_parent(self, parent: BuildCacheMixin) -> None:
+        self.__dict__.setdefault("_build_parents", {})[id(parent)] = weakref.ref(parent)
+
+    def _adopt(self, node: Any) -> None:
+        """Records that `node` was added to this object in-place (e.g. appended to a list attribute)."""
+        if isinstance(node, BuildCacheMixin):
+            node._add_build_parent(self)
+        self._mark_dirty()
+
+    def _mark_dirty(self) -> None:
+        """Clears the memoized template of this object and all its ancestors."""
+        seen: Set[int] = set()
+        stack: List[BuildCacheMixin] = [self]
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            node_dict = object.__getattribute__(node, "__dict__")
+            node_dict.pop("_build_cache", None)
+            for parent_ref in node_dict.get("_build_parents", {}).values():
+                if (parent := parent_ref()) is not None:
+                    stack.append(parent)
+
+    def _build_template_cached(self) -> Any:
+        """Returns `self._build_template()`, memoized until this object is marked dirty.
+
+        A deep copy of the memoized template is returned, so mutating the result of a build does not change later ones.
+        """
+        if not global_config.cache_builds:
+            return self._build_template()  # type: ignore
+
+        self_dict = object.__getattribute__(self, "__dict__")
+        if "_build_cache" not in self_dict:
+            self_dict["_build_cache"] = self._build_template()  # type: ignore
+        return self_dict["_build_cache"].model_copy(deep=True)
+
+
+def _get_pydantic_input_type(source: Callable) -> Optional[Type[InputMixin]]:
     """Returns a Pydantic Input type for the source, if it is using Pydantic IO."""
     function_parameters = inspect.signature(source).parameters
     if len(function_parameters) != 1:
         return None
     parameter = next(iter(function_parameters.values()))
     parameter_type = unwrap_annotation(parameter.annotation)
-    if not isinstance(parameter_type, type) or not issubclass(parameter_type, (InputV1, InputV2)):
+    if not isinstance(parameter_type, type) or not issubclass(parameter_type, InputMixin):
         return None
     return parameter_type
 
@@ -343,6 +476,55 @@ def _get_parameters_used_in_with_items(with_items: Any) -> Optional[List[Paramet
     return None
 
 
+_ITEM_REFERENCE = re.compile(r"^\{\{item(?:\.([\w-]+))?\}\}$")
+"""Matches the `{{item}}` and `{{item.<key>}}` argument values, capturing the key."""
+
+
+def _batch_loop(batch_size: int, kwargs: Dict[str, Any], arguments: List) -> List:
+    """Group the items of the loop of a call to a batched template into batches, returning the arguments of the call.
+
+    The `with_items` or `with_param` list of the call is replaced with the lists of `batch_size` of its items, and the
+    arguments taking the item, or a key of the item, take the batch instead. They are mapped to the key in the
+    `hera-batch` argument, for the runner to run the function for each item of the batch. The items of a `with_param`
+    given as an expression or a `Parameter` are only known by Argo, so they are not batched.
+    """
+    from hera.workflows._runner.util import BATCH_PARAMETER
+
+    loop = "with_items" if kwargs.get("with_items") is not None else "with_param"
+    items = kwargs.get(loop)
+    if not isinstance(items, list):
+        return arguments
+
+    batch: Dict[str, Optional[str]] = {}
+
+    def batched(name: str, value: Any) -> Any:
+        if isinstance(value, str) and (match := _ITEM_REFERENCE.match(value)):
+            batch[name] = match.group(1)
+            return "{{item}}"
+        if isinstance(value, str) and "{{item" in value:
+            raise ValueError(
+                f"Argument '{name}' of a batched template must be the item or a key of the item, not '{value}'"
+            )
+        return value
+
+    batched_arguments: List = []
+    for argument in arguments:
+        if isinstance(argument, dict):
+            batched_arguments.append({name: batched(name, value) for name, value in argument.items()})
+        elif isinstance(argument, Parameter):
+            batched_arguments.append(dataclasses.replace(argument, value=batched(str(argument.name), argument.value)))
+        elif isinstance(argument, ModelParameter):
+            batched_arguments.append(argument.model_copy(update={"value": batched(argument.name, argument.value)}))
+        else:
+            batched_arguments.append(argument)
+
+    if not batch:
+        # no argument takes the item, so there is nothing to run the function for in a batch
+        return arguments
+    kwargs[loop] = [items[start : start + batch_size] for start in range(0, len(items), batch_size)]
+    return batched_arguments + [Parameter(name=BATCH_PARAMETER, value=json.dumps(batch))]
+
+
 @dataclass
 class CallableTemplateMixin(BaseMixin):
     """`CallableTemplateMixin` provides the ability to 'call' the template like a regular Python function.
@@ -379,6 +561,9 @@ class CallableTemplateMixin(BaseMixin):
                 self.source,  # type: ignore
             )
 
+        if (batch_size := getattr(self, "batch_size", None)) is not None:
+            arguments = _batch_loop(batch_size, kwargs, arguments)
+
         # it is possible for the user to pass `arguments` via `kwargs` along with `with_param`. The `with_param`
         # additional parameters are inferred and have to be added to the `kwargs['arguments']`, otherwise
         # the step/task will miss adding them when building the final arguments
@@ -520,6 +705,6 @@ class CallableTemplateMixin(BaseMixin):
 
 
 class HeraBuildObj:
-    def __init__(self, subnode_type: str, output_class: Type[Union[OutputV1, OutputV2]]) -> None:
+    def __init__(self, subnode_type: str, output_class: Type[OutputMixin]) -> None:
         self.subnode_type = subnode_type
         self.output_class = output_class
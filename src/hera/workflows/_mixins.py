@@ -19,7 +19,7 @@ from hera.shared._pydantic import get_field_annotations, get_fields
 from hera.shared._type_util import construct_io_from_annotation
 from hera.shared.serialization import serialize
 from hera.workflows._context import SubNodeMixin, _context
-from hera.workflows._meta_mixins import HeraBuildObj, HookMixin
+from hera.workflows._meta_mixins import BuildCacheMixin, HeraBuildObj, HookMixin
 from hera.workflows.artifact import Artifact
 from hera.workflows.env import Env, _BaseEnv
 from hera.workflows.env_from import _BaseEnvFrom
@@ -401,7 +401,7 @@ class MetricsMixin(BaseMixin):
 
 
 @dataclass(kw_only=True)
-class TemplateMixin(SubNodeMixin, HookMixin, MetricsMixin):
+class TemplateMixin(SubNodeMixin, HookMixin, MetricsMixin, BuildCacheMixin):
     """`TemplateMixin` provides the Argo template fields that are shared between different sub-template fields.
 
     The supported sub-template fields are `Script`, `Data`, `DAG`, `Resource`, `Container`, `ContainerSet`, etc.
@@ -731,7 +731,7 @@ class EnvIOMixin(EnvMixin, IOMixin):
 
 
 @dataclass(kw_only=True)
-class TemplateInvocatorSubNodeMixin(SubNodeMixin):
+class TemplateInvocatorSubNodeMixin(SubNodeMixin, BuildCacheMixin):
     """Used for classes that form sub nodes of Template invocators - `Steps` and `DAG`.
 
     See Also:
@@ -1,31 +1,52 @@
 """The script_annotations_util module contains functionality for the script annotations feature when used with the runner."""
 
+import inspect
 import json
 import os
-import sys
+from collections.abc import (
+    AsyncIterable,
+    Iterator as IteratorABC,
+)
 from pathlib import Path
 from types import NoneType
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union, cast
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from pydantic import BaseModel as V2BaseModel
-from pydantic.v1 import BaseModel as V1BaseModel
+from typing_extensions import get_args, get_origin
 
-from hera.shared._pydantic import get_field_annotations, get_fields, model_dump
+from hera.shared._pydantic import get_field_annotations, get_fields, is_v1_model_class, model_dump
 from hera.shared._type_util import (
     get_unsubscripted_type,
     get_workflow_annotation,
     origin_type_issubtype,
     unwrap_annotation,
 )
-from hera.shared.serialization import serialize
-from hera.workflows import Artifact, Parameter
-from hera.workflows.artifact import ArtifactLoader
-from hera.workflows.io.v2 import Output as OutputV2
+from hera.shared.serialization import PydanticEncoder, serialize
+from hera.workflows.artifact import (
+    _RECORD_LENGTH,
+    Artifact,
+    ArtifactLoader,
+    _open_artifact_file,
+    load_artifact_file,
+)
+from hera.workflows.io._io_mixins import OutputMixin
+from hera.workflows.parameter import Parameter
 
-if sys.version_info >= (3, 14):
-    from hera.workflows.io.v2 import Output as OutputV1
-else:
-    from hera.workflows.io.v1 import Output as OutputV1
+if TYPE_CHECKING:
+    from pydantic.v1 import BaseModel as V1BaseModel
 
 
 def _get_outputs_path(destination: Union[Parameter, Artifact]) -> Path:
@@ -123,25 +144,20 @@ def get_annotated_artifact_value(param_name: str, artifact_annotation: Artifact)
         return None
 
     if artifact_annotation.loads is not None:
-        return artifact_annotation.loads(path.read_text())
+        with _open_artifact_file(path, "rt", artifact_annotation.compression) as f:
+            return artifact_annotation.loads(f.read())
 
     if artifact_annotation.loadb is not None:
-        return artifact_annotation.loadb(path.read_bytes())
-
-    if artifact_annotation.loader == ArtifactLoader.json:
-        with path.open() as f:
-            return json.load(f)
-
-    if artifact_annotation.loader == ArtifactLoader.file:
-        return path.read_text()
+        with _open_artifact_file(path, "rb", artifact_annotation.compression) as f:
+            return artifact_annotation.loadb(f.read())
 
     if artifact_annotation.loader is None:
         return artifact_annotation.path
 
-    raise RuntimeError(f"Artifact {artifact_annotation.name} was not given a value")
+    return load_artifact_file(path, artifact_annotation.loader, artifact_annotation.compression)
 
 
-T = TypeVar("T", bound=Type[V1BaseModel] | Type[V2BaseModel])
+T = TypeVar("T", bound="Type[V1BaseModel] | Type[V2BaseModel]")
 
 
 def map_runner_input(
@@ -197,48 +213,94 @@ def map_runner_input(
     for field in get_fields(runner_input_class):
         input_model_obj[field] = map_field(field, kwargs)
 
-    if issubclass(runner_input_class, V1BaseModel):
-        return cast(T, cast(V1BaseModel, runner_input_class).parse_obj(input_model_obj))
+    if is_v1_model_class(runner_input_class):
+        return cast(T, cast("Type[V1BaseModel]", runner_input_class).parse_obj(input_model_obj))
 
     assert issubclass(runner_input_class, V2BaseModel)
     return cast(T, runner_input_class.model_validate(input_model_obj))
 
 
-def _save_annotated_return_outputs(
+def _extract_return_annotation_output(source: Callable) -> List:
+    """Extract the output annotations from the return annotation of the function signature."""
+    output: List[Union[Tuple[type, Union[Parameter, Artifact]], Type[OutputMixin]]] = []
+
+    return_annotation = inspect.signature(source).return_annotation
+    origin_type = get_origin(return_annotation)
+    annotation_args = get_args(return_annotation)
+    if get_workflow_annotation(return_annotation):
+        output.append(annotation_args)
+    elif origin_type is tuple:
+        workflow_args = [
+            get_args(annotated_type) for annotated_type in annotation_args if get_workflow_annotation(annotated_type)
+        ]
+
+        # If all tuple elements are annotated as Parameter/Artifact
+        if len(workflow_args) == len(annotation_args):
+            output.extend(workflow_args)
+        # Only some tuple elements are annotated as Parameter/Artifact
+        elif workflow_args:
+            raise ValueError(
+                f"Function '{source.__name__}' output has partially annotated tuple return type. "
+                "Tuple elements must be all Annotated as Parameter/Artifact, or contain no Parameter/Artifact annotations for a raw tuple return type."
+            )
+    elif origin_type is None and isinstance(return_annotation, type) and issubclass(return_annotation, OutputMixin):
+        output.append(return_annotation)
+
+    return output
+
+
+def _is_iterated_generator(value: Any, type_: Any) -> bool:
+    """Tells whether the value is the items of a generator annotated as an iterator or an async iterable.
+
+    The items of a generator are collected in a list when they are not streamed, and the items of an async generator are
+    streamed by an iterator running it in an event loop.
+    """
+    if not isinstance(type_, type):
+        return False
+    if isinstance(value, list):
+        return issubclass(type_, (IteratorABC, AsyncIterable))
+    return isinstance(value, IteratorABC) and issubclass(type_, AsyncIterable)
+
+
+def _match_annotated_return_outputs(
     function_outputs: Union[Tuple[Any], Any],
-    output_annotations: List[Union[Tuple[type, Union[Parameter, Artifact]], Union[Type[OutputV1], Type[OutputV2]]]],
-) -> Optional[Union[OutputV1, OutputV2]]:
-    """Save the outputs of the function to the specified output destinations.
+    output_annotations: List[Union[Tuple[type, Union[Parameter, Artifact]], Type[OutputMixin]]],
+) -> Tuple[List[Tuple[Union[Parameter, Artifact], Any]], Optional[OutputMixin]]:
+    """Match the outputs of the function with the output annotations.
 
-    The output values are matched with the output annotations and saved using the schema:
-    <parent_directory>/artifacts/<name>
-    <parent_directory>/parameters/<name>
-    If the artifact path or parameter value_from.path is specified, that is used instead.
-    <parent_directory> can be provided by the user or is set to /tmp/hera-outputs by default
+    Returns the annotation and value of each output, and the `Output` object returned by the function, if any.
     """
     if not isinstance(function_outputs, tuple):
         function_outputs = [function_outputs]
     if len(function_outputs) != len(output_annotations):
         raise ValueError("The number of outputs does not match the annotation")
 
+    outputs: List[Tuple[Union[Parameter, Artifact], Any]] = []
     return_obj = None
 
     for output_value, dest in zip(function_outputs, output_annotations):
-        if isinstance(output_value, (OutputV1, OutputV2)):
+        if isinstance(output_value, OutputMixin):
             return_obj = output_value
 
-            for field, value in model_dump(output_value).items():
+            # the iterators are not dumped, as they are iterated over when they are written
+            streams = {
+                field: value
+                for field in get_fields(cast(Type[V2BaseModel], type(output_value)))
+                if isinstance(value := getattr(output_value, field), IteratorABC)
+            }
+            for field, value in {
+                **model_dump(cast(V2BaseModel, output_value), exclude=set(streams)),
+                **streams,
+            }.items():
                 if field in {"exit_code", "result"}:
                     continue
 
-                matching_output = output_value._get_output(field)
-                path = _get_outputs_path(matching_output)
-                _write_to_path(path, value, _get_dumper_function(matching_output))
+                outputs.append((output_value._get_output(field), value))
         else:
             assert isinstance(dest, tuple)
 
             type_ = get_unsubscripted_type(dest[0])
-            if not isinstance(output_value, type_):
+            if not isinstance(output_value, type_) and not _is_iterated_generator(output_value, type_):
                 raise ValueError(
                     f"The type of output `{dest[1].name}`, `{type(output_value)}` does not match the annotated type `{dest[0]}`"
                 )
@@ -246,20 +308,67 @@ def _save_annotated_return_outputs(
             if not dest[1].name:
                 raise ValueError("The name was not provided for one of the outputs.")
 
-            path = _get_outputs_path(dest[1])
-            _write_to_path(path, output_value, _get_dumper_function(dest[1]))
+            outputs.append((dest[1], output_value))
 
-    if return_obj is not None:
-        return return_obj
+    return outputs, return_obj
 
-    return None
+
+def _save_annotated_return_outputs(
+    function_outputs: Union[Tuple[Any], Any],
+    output_annotations: List[Union[Tuple[type, Union[Parameter, Artifact]], Type[OutputMixin]]],
+) -> Optional[OutputMixin]:
+    """Save the outputs of the function to the specified output destinations.
+
+    The output values are matched with the output annotations and saved using the schema:
+    <parent_directory>/artifacts/<name>
+    <parent_directory>/parameters/<name>
+    If the artifact path or parameter value_from.path is specified, that is used instead.
+    <parent_directory> can be provided by the user or is set to /tmp/hera-outputs by default
+    """
+    outputs, return_obj = _match_annotated_return_outputs(function_outputs, output_annotations)
+    for annotation, value in outputs:
+        path = _get_outputs_path(annotation)
+        if isinstance(annotation, Artifact) and (
+            isinstance(value, IteratorABC) or annotation.compression or _is_streamed_loader(annotation.loader)
+        ):
+            _write_artifact(path, value, annotation)
+        else:
+            if isinstance(value, IteratorABC):
+                value = list(value)
+            _write_to_path(path, value, _get_dumper_function(annotation))
+    return return_obj
+
+
+def _save_batched_return_outputs(
+    batch_outputs: List[Union[Tuple[Any], Any]],
+    output_annotations: List[Union[Tuple[type, Union[Parameter, Artifact]], Type[OutputMixin]]],
+) -> List[Optional[OutputMixin]]:
+    """Save the outputs of the function for each item of a batch, as the JSON list of their values.
+
+    The outputs of each item are matched with the output annotations as for a single item, and saved to the same
+    destinations. The `dumps` and `dumpb` functions of the annotations are not used, as they dump a single value.
+    Returns the `Output` object returned for each item, if any.
+    """
+    values: Dict[Path, List] = {}
+    return_objs = []
+    for function_outputs in batch_outputs:
+        outputs, return_obj = _match_annotated_return_outputs(function_outputs, output_annotations)
+        for annotation, value in outputs:
+            values.setdefault(_get_outputs_path(annotation), []).append(
+                list(value) if isinstance(value, IteratorABC) else value
+            )
+        return_objs.append(return_obj)
+
+    for path, path_values in values.items():
+        _write_to_path(path, path_values)
+    return return_objs
 
 
 def _save_dummy_outputs(
     output_annotations: List[
         Union[
             Tuple[type, Union[Parameter, Artifact]],
-            Union[Type[OutputV1], Type[OutputV2]],
+            Type[OutputMixin],
         ]
     ],
 ) -> None:
@@ -280,8 +389,8 @@ def _save_dummy_outputs(
     <parent_directory> can be provided by the user or is set to /tmp/hera-outputs by default
     """
     for dest in output_annotations:
-        if isinstance(dest, type) and issubclass(dest, (OutputV1, OutputV2)):
-            for field in get_fields(dest):
+        if isinstance(dest, type) and issubclass(dest, OutputMixin):
+            for field in get_fields(cast(Type[V2BaseModel], dest)):
                 if field in {"exit_code", "result"}:
                     continue
 
@@ -306,3 +415,75 @@ def _write_to_path(path: Path, output_value: Any, dumper: Callable = serialize)
             path.write_text(dumped_output)
         elif isinstance(dumped_output, bytes):
             path.write_bytes(dumped_output)
+
+
+def _is_streamed_loader(loader: Optional[Union[ArtifactLoader, str]]) -> bool:
+    """Return whether the loader reads the artifact file item by item, so its items are written one by one."""
+    return loader is not None and ArtifactLoader(loader) in (ArtifactLoader.jsonl, ArtifactLoader.records)
+
+
+def _dump_json(item: Any) -> str:
+    return json.dumps(item, cls=PydanticEncoder)
+
+
+def _write_items(f: IO, items: IteratorABC, artifact: Artifact) -> None:
+    """Write the items to the artifact file in the format read by the loader of the artifact.
+
+    The `jsonl` loader reads JSON Lines, each item being dumped to a line with `dumps` or as JSON, and the `records`
+    loader reads records of bytes prefixed with their length, each item being dumped with `dumpb` or being bytes.
+    Otherwise, the items are dumped as JSON to the JSON array a list of them is serialized to.
+    """
+    loader = None if artifact.loader is None else ArtifactLoader(artifact.loader)
+    if loader == ArtifactLoader.jsonl:
+        dumper: Callable[[Any], Any] = artifact.dumps or artifact.dumpb or _dump_json
+        for item in items:
+            dumped = dumper(item)
+            if not isinstance(dumped, str):
+                raise TypeError(
+                    f"An item of output `{artifact.name}` was dumped to {type(dumped).__name__}, expected a str to "
+                    "write a line of JSON Lines for the `jsonl` loader"
+                )
+            if "\n" in dumped:
+                raise ValueError(f"An item of output `{artifact.name}` was dumped to more than one line")
+            f.write(dumped.encode() + b"\n")
+    elif loader == ArtifactLoader.records:
+        dumper = artifact.dumpb or artifact.dumps or (lambda item: item)
+        for item in items:
+            dumped = dumper(item)
+            if not isinstance(dumped, bytes):
+                raise TypeError(
+                    f"An item of output `{artifact.name}` was dumped to {type(dumped).__name__}, expected bytes to "
+                    "write a record for the `records` loader"
+                )
+            f.write(_RECORD_LENGTH.pack(len(dumped)))
+            f.write(dumped)
+    else:
+        f.write(b"[")
+        for index, item in enumerate(items):
+            if index:
+                f.write(b", ")
+            f.write(_dump_json(item).encode())
+        f.write(b"]")
+
+
+def _write_artifact(path: Path, value: Any, artifact: Artifact) -> None:
+    """Write the value of the output artifact to the path, compressed with the compression of the artifact.
+
+    An iterator is written item by item as it is iterated over, so its items are not all held in memory, unless the
+    artifact has a `dumps` or `dumpb` function and no `jsonl` or `records` loader, in which case it is collected in a
+    list dumped as other values are. A list is written item by item too for the `jsonl` and `records` loaders.
+    """
+    streamed = _is_streamed_loader(artifact.loader)
+    if streamed and isinstance(value, (list, tuple)):
+        value = iter(value)
+    elif isinstance(value, IteratorABC) and not streamed and (artifact.dumps or artifact.dumpb):
+        value = list(value)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _open_artifact_file(path, "wb", artifact.compression) as f:
+        if isinstance(value, IteratorABC):
+            _write_items(f, value, artifact)
+            return
+        dumped = _get_dumper_function(artifact)(value)
+        if dumped is not None:
+            f.write(dumped.encode() if isinstance(dumped, str) else dumped)
@@ -1,18 +1,31 @@
 """The util module contains the functionality required for the script runner."""
 
 import argparse
+import dataclasses
 import functools
 import importlib
 import inspect
+import itertools
 import json
 import os
 import sys
 from pathlib import Path
-from types import NoneType
-from typing import Any, Callable, Dict, List, Optional, cast
+from types import ModuleType, NoneType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+    cast,
+)
 
 from pydantic.type_adapter import TypeAdapter
-from pydantic.v1 import parse_obj_as
 
 from hera.shared._pydantic import _PYDANTIC_VERSION
 from hera.shared._type_util import (
@@ -23,9 +36,10 @@ from hera.shared._type_util import (
     unwrap_annotation,
 )
 from hera.shared.serialization import serialize
-from hera.workflows import Artifact, Parameter
 from hera.workflows._runner.script_annotations_util import (
+    _extract_return_annotation_output,
     _save_annotated_return_outputs,
+    _save_batched_return_outputs,
     _save_dummy_outputs,
     get_annotated_artifact_value,
     get_annotated_input_param,
@@ -33,23 +47,13 @@ from hera.workflows._runner.script_annotations_util import (
     load_param_input,
     map_runner_input,
 )
-from hera.workflows.artifact import ArtifactLoader
-from hera.workflows.io.v2 import (
-    Input as InputV2,
-    Output as OutputV2,
-)
-from hera.workflows.script import _extract_return_annotation_output
+from hera.workflows.artifact import Artifact, ArtifactLoader
+from hera.workflows.io._io_mixins import InputMixin, OutputMixin
+from hera.workflows.models import ValueFrom
+from hera.workflows.parameter import Parameter
 
-if sys.version_info >= (3, 14):
-    from hera.workflows.io.v2 import (
-        Input as InputV1,
-        Output as OutputV1,
-    )
-else:
-    from hera.workflows.io.v1 import (
-        Input as InputV1,
-        Output as OutputV1,
-    )
+if TYPE_CHECKING:
+    from hera.workflows.io.v2 import Output as OutputV2
 
 
 def _ignore_unmatched_kwargs(f: Callable) -> Callable:
@@ -97,8 +101,12 @@ def _parse(value: str, key: str, f: Callable) -> Any:
     """
     if _is_str_kwarg_of(key, f) or _is_artifact_loaded(key, f) or _is_output_kwarg(key, f):
         return value
+    return _load_json_value(value, _get_unannotated_type(key, f))
+
+
+def _load_json_value(value: str, type_: Optional[type]) -> Any:
+    """Load the JSON value, validated as `type_` if given, or return the value as-is if it is not JSON."""
     try:
-        type_ = _get_unannotated_type(key, f)
         loaded_json_value = json.loads(value)
 
         if not type_:
@@ -106,13 +114,29 @@ def _parse(value: str, key: str, f: Callable) -> Any:
 
         _pydantic_mode = int(os.environ.get("hera__pydantic_mode", _PYDANTIC_VERSION))
         if _pydantic_mode == 1:
+            from pydantic.v1 import parse_obj_as
+
             return parse_obj_as(type_, loaded_json_value)
         else:
-            return TypeAdapter(type_).validate_python(loaded_json_value)
+            return _type_adapter(type_).validate_python(loaded_json_value)
     except (json.JSONDecodeError, TypeError):
         return value
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_type_adapter(type_: Any) -> TypeAdapter:
+    return TypeAdapter(type_)
+
+
+def _type_adapter(type_: Any) -> TypeAdapter:
+    """Return a `TypeAdapter` for the type, reused for the other values of the type validated by the process."""
+    try:
+        hash(type_)
+    except TypeError:
+        return TypeAdapter(type_)
+    return _cached_type_adapter(type_)
+
+
 def _get_function_param_annotation(key: str, f: Callable) -> Optional[type]:
     func_param_annotation = inspect.signature(f).parameters[key].annotation
     if func_param_annotation is inspect.Parameter.empty:
@@ -140,7 +164,7 @@ def _is_artifact_loaded(key: str, f: Callable) -> bool:
     if param_annotation := _get_function_param_annotation(key, f):
         if (artifact := get_workflow_annotation(param_annotation)) and isinstance(artifact, Artifact):
             return (
-                artifact.loader == ArtifactLoader.json.value
+                (artifact.loader is not None and ArtifactLoader(artifact.loader) != ArtifactLoader.file)
                 or artifact.loads is not None
                 or artifact.loadb is not None
             )
@@ -190,14 +214,8 @@ def _map_function_annotations(function: Callable, template_inputs: Dict[str, str
             else:
                 function_kwargs[func_param_name] = get_annotated_artifact_value(func_param_name, param_or_artifact)
 
-        elif not is_subscripted(func_param.annotation) and issubclass(func_param.annotation, (InputV1, InputV2)):
+        elif _is_input_class_annotation(func_param.annotation):
             # We collect all relevant kwargs for the single `Input` function parameter
-            function_kwargs[func_param_name] = map_runner_input(func_param.annotation, template_inputs)
-        elif (
-            is_annotated(func_param.annotation)
-            and inspect.isclass(unwrap_annotation(func_param.annotation))
-            and issubclass(unwrap_annotation(func_param.annotation), (InputV1, InputV2))
-        ):
             function_kwargs[func_param_name] = map_runner_input(
                 unwrap_annotation(func_param.annotation), template_inputs
             )
@@ -207,23 +225,343 @@ def _map_function_annotations(function: Callable, template_inputs: Dict[str, str
     return function_kwargs
 
 
-def _runner(entrypoint: str, template_inputs_list: List) -> Any:
-    """Run the function defined by the entrypoint with the given list of kwargs.
+CALL_MANIFEST_ENV = "hera__call_manifest"
+"""The environment variable `RunnerScriptConstructor` passes the call manifest of the function to the runner in."""
 
-    Args:
-        entrypoint: The module path to the script within the container to execute. "package.submodule:function"
-        template_inputs_list: A list of dicts with "name" and "value" keys, to be mapped to the kwargs of the function.
+_CALL_MANIFEST_VERSION = 1
 
-    Returns:
-        The result of the function or `None` if the outputs are to be saved.
+
+def _is_input_class_annotation(annotation: Any) -> bool:
+    """Tells whether the annotation is an `Input` class, which may be wrapped in `Annotated`."""
+    if not is_subscripted(annotation):
+        return isinstance(annotation, type) and issubclass(annotation, InputMixin)
+    return (
+        is_annotated(annotation)
+        and inspect.isclass(unwrap_annotation(annotation))
+        and issubclass(unwrap_annotation(annotation), InputMixin)
+    )
+
+
+def build_call_manifest(function: Callable) -> Optional[Dict[str, Any]]:
+    """Return the call manifest of the function, which describes how the runner maps template inputs to its kwargs.
+
+    The manifest lists the parameters of the function, with what the runner reads from their annotations: the kind of
+    input or output they are, the name of the template input or output they are mapped to, the path and loader of
+    artifacts, whether their value is loaded from JSON, and whether they have a `loads` or `loadb` function, which the
+    runner gets from the annotation. `None` is returned for functions taking `**kwargs`, to which the template inputs
+    are passed as-is, and for functions taking positional-only or variadic positional parameters.
+    """
+    if _contains_var_kwarg(function):
+        return None
+
+    params: List[Dict[str, Any]] = []
+    for name, func_param in inspect.signature(function).parameters.items():
+        if func_param.kind not in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY):
+            return None
+
+        param: Dict[str, Any] = {"name": name}
+        annotation = get_workflow_annotation(func_param.annotation)
+        if isinstance(annotation, Parameter):
+            param["kind"] = "output_parameter" if annotation.output else "parameter"
+            if annotation.name:
+                param["key"] = annotation.name
+            if annotation.value_from and annotation.value_from.path:
+                param["path"] = annotation.value_from.path
+            if annotation.loads is not None:
+                param["loads"] = True
+        elif isinstance(annotation, Artifact):
+            param["kind"] = "output_artifact" if annotation.output else "artifact"
+            if annotation.output:
+                if annotation.name:
+                    param["key"] = annotation.name
+                if annotation.path:
+                    param["path"] = annotation.path
+            else:
+                param["key"] = annotation.name or name
+                param["path"] = (
+                    annotation.path or dataclasses.replace(annotation, name=param["key"])._get_default_inputs_path()
+                )
+                if annotation.optional:
+                    param["optional"] = True
+                if annotation.loads is not None or annotation.loadb is not None:
+                    param["loads"] = True
+                elif annotation.loader is not None:
+                    param["loader"] = ArtifactLoader(annotation.loader).value
+        elif _is_input_class_annotation(func_param.annotation):
+            param["kind"] = "input"
+        else:
+            param["kind"] = "value"
+
+        if param["kind"] != "input" and not (
+            _is_str_kwarg_of(name, function) or _is_artifact_loaded(name, function) or _is_output_kwarg(name, function)
+        ):
+            param["json"] = True
+        params.append(param)
+
+    return {"version": _CALL_MANIFEST_VERSION, "params": params}
+
+
+def _load_call_manifest(function: Callable) -> Optional[List[Dict[str, Any]]]:
+    """Return the parameters of the call manifest passed to the runner, if they are the parameters of the function.
+
+    A manifest built for another version of the function, for instance if the image was rebuilt after the template, is
+    ignored, and the function is inspected instead.
+    """
+    manifest = os.environ.get(CALL_MANIFEST_ENV)
+    if not manifest:
+        return None
+    loaded = json.loads(manifest)
+    if loaded.get("version") != _CALL_MANIFEST_VERSION:
+        return None
+
+    code = getattr(function, "__code__", None)
+    if code is None or code.co_posonlyargcount or code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS):
+        return None
+    names = code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+    params = loaded["params"]
+    if [param["name"] for param in params] != list(names):
+        return None
+    return params
+
+
+def _manifest_annotation(param: Dict[str, Any], annotations: Dict[str, Any]) -> Union[Parameter, Artifact]:
+    """Return the annotation of the parameter in the manifest, rebuilt from it unless it has a loader function."""
+    if param.get("loads"):
+        return cast(Union[Parameter, Artifact], get_workflow_annotation(annotations[param["name"]]))
+
+    output = param["kind"].startswith("output_")
+    if param["kind"].endswith("parameter"):
+        value_from = ValueFrom(path=param["path"]) if "path" in param else None
+        return Parameter(name=param.get("key"), value_from=value_from, output=output)
+    loader = ArtifactLoader(param["loader"]) if "loader" in param else None
+    return Artifact(
+        name=param.get("key"),
+        path=param.get("path"),
+        loader=loader,
+        optional=param.get("optional", False),
+        output=output,
+    )
+
+
+def _map_manifest_kwargs(
+    params: List[Dict[str, Any]],
+    function: Callable,
+    template_inputs: Dict[str, str],
+) -> Dict[str, Any]:
+    """Map the template inputs to the kwargs of the function as described by the parameters of its call manifest.
+
+    The kwargs are the ones `_map_function_annotations` and `_ignore_unmatched_kwargs` give, without inspecting the
+    signature of the function for each kwarg. Its annotations are only read for the types of the kwargs loaded from
+    JSON, the `Input` classes, and the `loads` and `loadb` functions.
     """
-    # import the module and get the function
+    annotations = getattr(function, "__annotations__", {})
+    function_kwargs: Dict[str, Any] = {}
+    for param in params:
+        name, kind = param["name"], param["kind"]
+        if kind == "input":
+            value = map_runner_input(unwrap_annotation(annotations[name]), template_inputs)
+        elif kind == "value":
+            value = template_inputs[name]
+        else:
+            annotation = _manifest_annotation(param, annotations)
+            if kind == "parameter":
+                assert isinstance(annotation, Parameter)
+                value = load_param_input(
+                    get_annotated_input_param(name, annotation, template_inputs), annotation.loads
+                )
+            elif kind == "output_parameter":
+                assert isinstance(annotation, Parameter)
+                value = get_annotated_output_param(annotation)
+            else:
+                assert isinstance(annotation, Artifact)
+                value = get_annotated_artifact_value(name, annotation)
+
+        if param.get("json"):
+            type_ = unwrap_annotation(annotations[name]) if name in annotations else None
+            value = _load_json_value(value, type_)
+        function_kwargs[name] = value
+    return function_kwargs
+
+
+@functools.lru_cache(maxsize=None)
+def _validated(function: Callable, pydantic_mode: int) -> Callable:
+    """Return the function validating its arguments, which is built once per process for each function."""
+    # The imported validate_arguments uses smart union by default just in case clients do not rely on it. This means
+    # that if a function uses a union type for any of its inputs, then this will at least try to map those types
+    # correctly if the input object is not a pydantic model with smart_union enabled
+    if pydantic_mode == 2:
+        from pydantic import ConfigDict, validate_call  # type: ignore
+
+        return validate_call(config=ConfigDict(arbitrary_types_allowed=True))(function)
+
+    from pydantic.v1 import validate_arguments
+
+    return validate_arguments(config=dict(smart_union=True, arbitrary_types_allowed=True))(function)
+
+
+async def _collect(items: AsyncIterator) -> List:
+    return [item async for item in items]
+
+
+def _event_loop() -> ModuleType:
+    """Return the module of the event loop to run async functions in.
+
+    The event loop is the `asyncio` one, or the `uvloop` one if the `hera__event_loop` environment variable is
+    `uvloop`.
+    """
+    event_loop = os.environ.get("hera__event_loop", "asyncio")
+    if event_loop == "uvloop":
+        try:
+            import uvloop
+        except ImportError:
+            raise ImportError("`uvloop` is not installed. Install it in the image to run functions on its event loop")
+        return uvloop
+    if event_loop != "asyncio":
+        raise ValueError(f"Unknown event loop {event_loop!r}, expected 'asyncio' or 'uvloop'")
+
+    # asyncio is imported when it is used, so sync functions are run without importing it
+    import asyncio
+
+    return asyncio
+
+
+def _iterate(items: AsyncIterator) -> Iterator:
+    """Iterate over the items of the async generator, running it in an event loop until each item is yielded."""
+    loop = _event_loop().new_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(items.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+def _await(result: Any, stream: bool = False) -> Any:
+    """Return the result of an async function, running it in an event loop, or the result of a sync function as-is.
+
+    The items of an async generator are collected in a list, or streamed by an iterator if `stream` is set.
+    """
+    if inspect.isasyncgen(result):
+        if stream:
+            return _iterate(result)
+        result = _collect(result)
+    elif not inspect.iscoroutine(result):
+        return result
+
+    try:
+        event_loop = _event_loop()
+    except (ImportError, ValueError):
+        result.close()
+        raise
+    return event_loop.run(result)
+
+
+BATCH_PARAMETER = "hera-batch"
+"""The input parameter of a batched script, mapping its inputs taking the items of the batch to their key in an item."""
+
+BATCH_PROCESSES_ENV = "hera__batch_processes"
+"""The environment variable giving the number of processes the runner runs the items of a batch in."""
+
+
+class _BatchOutput(NamedTuple):
+    """The result and exit code of the `Output` objects returned for the items of a batch."""
+
+    result: List
+    exit_code: int
+
+
+def _split_batch(template_inputs: Dict[str, str]) -> Optional[List[Dict[str, str]]]:
+    """Return the template inputs of each item of the batch run by the pod, or `None` if it runs a single item.
+
+    The inputs of a batched script taking the items are all the JSON list of the items of the batch, and they are
+    mapped by the `hera-batch` input to the key of their value in an item, or to `null` for the item itself. Each item
+    gets the value Argo would have passed to the pod running it alone: strings are passed as-is, and other values as
+    JSON.
+    """
+    batch = json.loads(template_inputs.pop(BATCH_PARAMETER, "") or "{}")
+    if not batch:
+        return None
+
+    items = json.loads(template_inputs[next(iter(batch))])
+    items_inputs = []
+    for item in items:
+        item_inputs = dict(template_inputs)
+        for name, key in batch.items():
+            value = item if key is None else item[key]
+            item_inputs[name] = value if isinstance(value, str) else json.dumps(value)
+        items_inputs.append(item_inputs)
+    return items_inputs
+
+
+def _load_function(entrypoint: str) -> Callable:
+    """Import the function defined by the entrypoint, unwrapping it if it is decorated with `@script`."""
     module, function_name = entrypoint.split(":")
     function: Callable = getattr(importlib.import_module(module), function_name)
     # if the function is wrapped, unwrap it
     # this may happen if the function is decorated with @script
     if hasattr(function, "wrapped_function"):
         function = getattr(function, "wrapped_function")
+    return function
+
+
+def _call(function: Callable, template_inputs: Dict[str, str], stream: bool = False) -> Any:
+    """Call the function with the template inputs mapped to its kwargs, returning its result.
+
+    The items of a generator are collected in a list, unless `stream` is set, for them to be written as they are
+    yielded.
+    """
+    _pydantic_mode = int(os.environ.get("hera__pydantic_mode", _PYDANTIC_VERSION))
+    manifest_params = _load_call_manifest(function)
+    if manifest_params is not None:
+        function_kwargs = _map_manifest_kwargs(manifest_params, function, template_inputs)
+        function = _validated(function, _pydantic_mode)
+    else:
+        function_kwargs = _map_function_annotations(function, template_inputs)
+        function = _ignore_unmatched_kwargs(_validated(function, _pydantic_mode))
+    result = _await(function(**function_kwargs), stream)
+    if not stream and inspect.isgenerator(result):
+        return list(result)
+    return result
+
+
+def _call_entrypoint(entrypoint: str, template_inputs: Dict[str, str]) -> Any:
+    return _call(_load_function(entrypoint), template_inputs)
+
+
+def _call_batch(entrypoint: str, function: Callable, items_inputs: List[Dict[str, str]]) -> List:
+    """Call the function for each item of the batch, returning their results.
+
+    The items are run one after the other, or in a pool of processes if the `hera__batch_processes` environment
+    variable is more than 1, in which each process imports the function.
+    """
+    processes = min(int(os.environ.get(BATCH_PROCESSES_ENV) or 1), len(items_inputs))
+    if processes <= 1:
+        return [_call(function, item_inputs) for item_inputs in items_inputs]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(executor.map(_call_entrypoint, itertools.repeat(entrypoint), items_inputs))
+
+
+def _runner(entrypoint: str, template_inputs_list: List) -> Any:
+    """Run the function defined by the entrypoint with the given list of kwargs.
+
+    For a batched script, the function is run for each item of the batch, and the outputs returned for the items are
+    saved as the JSON lists of their values.
+
+    Args:
+        entrypoint: The module path to the script within the container to execute. "package.submodule:function"
+        template_inputs_list: A list of dicts with "name" and "value" keys, to be mapped to the kwargs of the function.
+
+    Returns:
+        The result of the function, the list of the results of the items of a batch, or `None` if the outputs are to
+        be saved.
+    """
+    function = _load_function(entrypoint)
 
     # convert the template inputs list to a dict
     template_inputs: Dict[str, str] = {}
@@ -234,23 +572,7 @@ def _runner(entrypoint: str, template_inputs_list: List) -> Any:
         key = cast(str, serialize(kwarg["name"]))
         value = kwarg["value"]
         template_inputs[key] = value
-
-    function_kwargs = _map_function_annotations(function, template_inputs)
-
-    # The imported validate_arguments uses smart union by default just in case clients do not rely on it. This means that if a function uses a union
-    # type for any of its inputs, then this will at least try to map those types correctly if the input object is
-    # not a pydantic model with smart_union enabled
-    _pydantic_mode = int(os.environ.get("hera__pydantic_mode", _PYDANTIC_VERSION))
-    if _pydantic_mode == 2:
-        from pydantic import ConfigDict, validate_call  # type: ignore
-
-        function = validate_call(config=ConfigDict(arbitrary_types_allowed=True))(function)
-    else:
-        from pydantic.v1 import validate_arguments
-
-        function = validate_arguments(config=dict(smart_union=True, arbitrary_types_allowed=True))(function)
-
-    function = _ignore_unmatched_kwargs(function)
+    items_inputs = _split_batch(template_inputs)
 
     output_annotations = _extract_return_annotation_output(function)
 
@@ -258,13 +580,27 @@ def _runner(entrypoint: str, template_inputs_list: List) -> Any:
         # This will save outputs returned from the function only. Any function parameters/artifacts marked as
         # outputs should be written to within the function itself.
         try:
-            output = _save_annotated_return_outputs(function(**function_kwargs), output_annotations)
+            if items_inputs is None:
+                output = _save_annotated_return_outputs(
+                    _call(function, template_inputs, stream=True), output_annotations
+                )
+                return output or None
+            outputs = _save_batched_return_outputs(_call_batch(entrypoint, function, items_inputs), output_annotations)
         except Exception as e:
             _save_dummy_outputs(output_annotations)
             raise e
-        return output or None
+        if not any(outputs):
+            return None
+        # the `Output` of either pydantic version
+        returned = [cast("OutputV2", output) for output in outputs if output is not None]
+        return _BatchOutput(
+            result=[output.result for output in returned],
+            exit_code=next((output.exit_code for output in returned if output.exit_code), 0),
+        )
 
-    return function(**function_kwargs)
+    if items_inputs is None:
+        return _call(function, template_inputs)
+    return _call_batch(entrypoint, function, items_inputs)
 
 
 def _parse_args() -> argparse.Namespace:
@@ -294,9 +630,11 @@ def _run() -> None:
     if not result:
         return
 
-    if isinstance(result, (OutputV1, OutputV2)):
-        print(serialize(result.result))
-        exit(result.exit_code)
+    if isinstance(result, (OutputMixin, _BatchOutput)):
+        # the `Output` of either pydantic version, or the results of the `Output`s of a batch
+        output = cast("Union[OutputV2, _BatchOutput]", result)
+        print(serialize(output.result))
+        exit(output.exit_code)
 
     print(serialize(result))
 
@@ -6,11 +6,19 @@ Tip:
 
 from __future__ import annotations
 
+import gzip
+import importlib
+import json
 import logging
+import mmap
+import os
+import struct
 from copy import deepcopy
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, List, Optional, Union, cast
+from pathlib import Path
+from types import ModuleType
+from typing import IO, Any, BinaryIO, Callable, Iterator, List, Literal, Optional, Union, cast
 
 from hera.workflows.archive import ArchiveStrategy
 from hera.workflows.models import (
@@ -54,6 +62,141 @@ class ArtifactLoader(Enum):
     file = "file"
     """Read the contents of the Artifact file directly as a string (the target variable must be a `str` type)."""
 
+    mmap = "mmap"
+    """Memory-map the Artifact file read-only, as a `memoryview` of its bytes (the target variable must be a
+    `memoryview` type). The file is not read into memory, its pages are read when used, and slices are zero-copy."""
+
+    jsonl = "jsonl"
+    """Lazily deserialize the JSON Lines Artifact file, as an iterator of the Python objects of its lines (the target
+    variable must be an `Iterable` type, whose items are validated as they are iterated over). A line is read at a
+    time."""
+
+    numpy = "numpy"
+    """Memory-map the NumPy `.npy` Artifact file read-only, as a `numpy.memmap` array (the target variable must be a
+    `numpy.ndarray` type). NumPy must be installed in the image."""
+
+    arrow = "arrow"
+    """Memory-map the Arrow IPC file (or Feather) Artifact file, as a `pyarrow.Table` whose uncompressed buffers are
+    not copied (the target variable must be a `pyarrow.Table` type). PyArrow must be installed in the image."""
+
+    records = "records"
+    """Lazily read the records of bytes of an Artifact file written by the Hera Runner for an output iterator of bytes,
+    each prefixed with its length as a 4-byte big-endian unsigned integer, as an iterator of bytes (the target variable
+    must be an `Iterable[bytes]` type). A record is read at a time."""
+
+
+_RECORD_LENGTH = struct.Struct(">I")
+"""The length prefix of the records of an Artifact file of the `records` loader: a 4-byte big-endian unsigned integer."""
+
+# The loaders mapping the Artifact file into memory, which cannot load a compressed file
+_MAPPED_LOADERS = (ArtifactLoader.mmap, ArtifactLoader.numpy, ArtifactLoader.arrow)
+
+
+def _import_loader_module(name: str, loader: ArtifactLoader) -> ModuleType:
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise ImportError(
+            f"`{name.split('.')[0]}` is not installed. Install it in the image to load artifacts with the "
+            f"`{loader.value}` loader"
+        ) from None
+
+
+def _open_artifact_file(file: Union[Path, BinaryIO], mode: str, compression: Optional[str]) -> IO:
+    """Open the artifact file (a path or a binary file object), (de)compressing what is read or written to it."""
+    if compression is None:
+        return file.open(mode) if isinstance(file, Path) else file
+    if compression == "gzip":
+        return cast(IO, gzip.open(file, mode))
+    if compression == "zstd":
+        try:
+            # Python 3.14 and later
+            from compression import zstd  # type: ignore
+
+            return zstd.open(file, mode)
+        except ImportError:
+            pass
+        try:
+            import zstandard  # type: ignore
+        except ImportError:
+            raise ImportError(
+                "`zstandard` is not installed. Install it in the image to use artifacts compressed with zstd"
+            ) from None
+        return zstandard.open(file, mode)
+    raise ValueError(f"Unknown compression {compression!r}, expected 'gzip' or 'zstd'")
+
+
+def _read_exactly(f: IO, size: int) -> bytes:
+    data = f.read(size)
+    # decompressing readers may return fewer bytes than requested before the end of the file
+    while len(data) < size and (chunk := f.read(size - len(data))):
+        data += chunk
+    return data
+
+
+def _map_file(path: Path) -> memoryview:
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # an empty file cannot be mapped
+            return memoryview(b"")
+        # the map stays open while the view of it is used, after the file is closed
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def _iter_json_lines(path: Path, compression: Optional[str]) -> Iterator[Any]:
+    with _open_artifact_file(path, "rt", compression) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _iter_records(path: Path, compression: Optional[str]) -> Iterator[bytes]:
+    with _open_artifact_file(path, "rb", compression) as f:
+        while prefix := _read_exactly(f, _RECORD_LENGTH.size):
+            if len(prefix) < _RECORD_LENGTH.size:
+                raise ValueError(f"The last record of the artifact file {path} is truncated")
+            (length,) = _RECORD_LENGTH.unpack(prefix)
+            record = _read_exactly(f, length)
+            if len(record) < length:
+                raise ValueError(f"The last record of the artifact file {path} is truncated")
+            yield record
+
+
+def load_artifact_file(path: Path, loader: ArtifactLoader, compression: Optional[str] = None) -> Any:
+    """Load the artifact file at the path with the loader, decompressing it with the compression if given.
+
+    The `mmap`, `numpy` and `arrow` loaders map the file into memory instead of reading it, so its pages are only read
+    when they are used, and can be dropped by the OS rather than swapped. The `jsonl` and `records` loaders read a
+    line or a record at a time.
+    """
+    if compression is not None and loader in _MAPPED_LOADERS:
+        raise ValueError(f"The `{loader.value}` loader maps the artifact file into memory, so it cannot be compressed")
+
+    if loader == ArtifactLoader.json:
+        with _open_artifact_file(path, "rt", compression) as f:
+            return json.load(f)
+
+    if loader == ArtifactLoader.file:
+        with _open_artifact_file(path, "rt", compression) as f:
+            return f.read()
+
+    if loader == ArtifactLoader.mmap:
+        return _map_file(path)
+
+    if loader == ArtifactLoader.jsonl:
+        return _iter_json_lines(path, compression)
+
+    if loader == ArtifactLoader.records:
+        return _iter_records(path, compression)
+
+    if loader == ArtifactLoader.numpy:
+        return _import_loader_module("numpy", loader).load(path, mmap_mode="r")
+
+    if loader == ArtifactLoader.arrow:
+        return _import_loader_module("pyarrow.feather", loader).read_table(str(path), memory_map=True)
+
+    raise RuntimeError(f"Unknown artifact loader {loader}")
+
 
 @dataclass(kw_only=True)
 class Artifact:
@@ -112,6 +255,12 @@ class Artifact:
     dumps: Optional[Callable[[Any], str]] = None
     """used to specify a dumper function to serialise the Artifact value as a string for Annotated Artifact function parameters"""
 
+    compression: Optional[Literal["gzip", "zstd"]] = None
+    """used to compress an output Artifact of a function with gzip or zstd as it is written by the Hera Runner, and to
+    decompress an input Artifact as it is loaded (zstd needs Python 3.14, or `zstandard` installed in the image). Argo
+    archives output artifacts in a gzipped tarball by default, so the `archive` can be set to `NoneArchiveStrategy()`
+    to not compress them twice."""
+
     optional: Optional[bool] = None
     """whether the Artifact is optional. For an input Artifact, this means it may possibly not
     exist at the specified path during the template's runtime. For an output Artifact, it may
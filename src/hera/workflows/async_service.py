@@ -2,11 +2,15 @@
 
 # [DO NOT MODIFY] Auto-generated by `hera/scripts/async_service.py`
 import os
-from typing import TYPE_CHECKING, Optional, Tuple, cast
+from typing import TYPE_CHECKING, AsyncGenerator, BinaryIO, Optional, Tuple, Union, cast
 from urllib.parse import urljoin
 
 from hera.exceptions import exception_from_server_response
-from hera.shared import global_config
+from hera.shared import TransportConfig, global_config
+from hera.shared._download import DEFAULT_CHUNK_SIZE, DEFAULT_MAX_RETRIES, aiter_download, async_download
+from hera.shared._pagination import paginated_fields
+from hera.shared._responses import build_model, parse_response
+from hera.shared._stream import aiter_log_results, aiter_watch_results
 from hera.workflows.models import (
     ArchivedWorkflowDeletedResponse,
     ClusterWorkflowTemplate,
@@ -54,6 +58,7 @@ from hera.workflows.models import (
     WorkflowTemplateList,
     WorkflowTemplateUpdateRequest,
     WorkflowTerminateRequest,
+    WorkflowWatchEvent,
 )
 
 if TYPE_CHECKING:
@@ -76,9 +81,11 @@ class AsyncWorkflowsService:
         client_certs: Optional[Tuple[str, str]] = None,
         namespace: Optional[str] = None,
         session: Optional["httpx.AsyncClient"] = None,
+        transport_config: Optional[TransportConfig] = None,
+        validate_responses: Optional[bool] = None,
     ) -> None:
         """AsyncWorkflows service constructor."""
-        import httpx
+        from hera.shared._async_transport import build_async_client
 
         self.host = cast(str, host or global_config.host)
         self.verify_ssl = verify_ssl if verify_ssl is not None else global_config.verify_ssl
@@ -104,7 +111,14 @@ class AsyncWorkflowsService:
         else:
             self.token = None
 
-        self.session = session or httpx.AsyncClient(verify=self.verify_ssl, cert=self.client_certs)
+        # unvalidated responses are returned as lazy models, whose fields are only validated when first accessed
+        self.validate_responses = (
+            validate_responses if validate_responses is not None else global_config.validate_responses
+        )
+        self.transport_config = transport_config or global_config.transport_config
+        self.session = session or build_async_client(
+            self.transport_config, verify=self.verify_ssl, cert=self.client_certs
+        )
 
         self.namespace = namespace or global_config.namespace
 
@@ -169,7 +183,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return WorkflowList(**resp.json())
+            return parse_response(WorkflowList, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -185,7 +199,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return LabelKeys(**resp.json())
+            return parse_response(LabelKeys, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -230,7 +244,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return LabelValues(**resp.json())
+            return parse_response(LabelValues, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -248,7 +262,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -282,7 +296,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -298,7 +312,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -341,7 +355,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return ClusterWorkflowTemplateList(**resp.json())
+            return parse_response(ClusterWorkflowTemplateList, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -359,7 +373,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return ClusterWorkflowTemplate(**resp.json())
+            return parse_response(ClusterWorkflowTemplate, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -375,7 +389,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return ClusterWorkflowTemplate(**resp.json())
+            return parse_response(ClusterWorkflowTemplate, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -393,7 +407,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return ClusterWorkflowTemplate(**resp.json())
+            return parse_response(ClusterWorkflowTemplate, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -411,7 +425,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return ClusterWorkflowTemplate(**resp.json())
+            return parse_response(ClusterWorkflowTemplate, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -495,7 +509,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return CronWorkflowList(**resp.json())
+            return parse_response(CronWorkflowList, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -515,7 +529,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return CronWorkflow(**resp.json())
+            return parse_response(CronWorkflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -533,7 +547,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return CronWorkflow(**resp.json())
+            return parse_response(CronWorkflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -553,7 +567,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return CronWorkflow(**resp.json())
+            return parse_response(CronWorkflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -573,7 +587,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return CronWorkflow(**resp.json())
+            return parse_response(CronWorkflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -634,7 +648,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return CronWorkflow(**resp.json())
+            return parse_response(CronWorkflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -654,7 +668,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return CronWorkflow(**resp.json())
+            return parse_response(CronWorkflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -670,7 +684,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return InfoResponse(**resp.json())
+            return parse_response(InfoResponse, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -766,7 +780,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return GetUserInfoResponse(**resp.json())
+            return parse_response(GetUserInfoResponse, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -782,7 +796,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return Version(**resp.json())
+            return parse_response(Version, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -830,7 +844,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return WorkflowTemplateList(**resp.json())
+            return parse_response(WorkflowTemplateList, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -850,7 +864,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return WorkflowTemplate(**resp.json())
+            return parse_response(WorkflowTemplate, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -870,7 +884,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return WorkflowTemplate(**resp.json())
+            return parse_response(WorkflowTemplate, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -890,7 +904,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return WorkflowTemplate(**resp.json())
+            return parse_response(WorkflowTemplate, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -910,7 +924,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return WorkflowTemplate(**resp.json())
+            return parse_response(WorkflowTemplate, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1005,7 +1019,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return WorkflowList(**resp.json())
+            return parse_response(WorkflowList, resp.content, self.validate_responses and fields is None)
 
         raise exception_from_server_response(resp)
 
@@ -1023,7 +1037,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1041,7 +1055,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1059,7 +1073,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1088,7 +1102,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses and fields is None)
 
         raise exception_from_server_response(resp)
 
@@ -1186,7 +1200,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return V1alpha1LogEntry(**resp.json())
+            return parse_response(V1alpha1LogEntry, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1206,7 +1220,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1226,7 +1240,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1244,7 +1258,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1262,7 +1276,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1280,7 +1294,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1300,7 +1314,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1320,7 +1334,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1374,7 +1388,7 @@ class AsyncWorkflowsService:
         )
 
         if resp.is_success:
-            return V1alpha1LogEntry(**resp.json())
+            return parse_response(V1alpha1LogEntry, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1502,5 +1516,593 @@ class AsyncWorkflowsService:
         """Returns the link for the given cron workflow name."""
         return os.path.join(self.host, f"cron-workflows/{self.namespace}/{name}")
 
+    async def iter_archived_workflows(
+        self,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        resource_version_match: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        namespace: Optional[str] = None,
+        name_filter: Optional[str] = None,
+        limit: int = 500,
+    ) -> AsyncGenerator[Workflow, None]:
+        """Yield the archived workflows one at a time, paging through them with `list_archived_workflows`.
+
+        Pages of `limit` archived workflows are fetched as they are consumed, so only one page is held in memory at a time.
+        """
+        continue_ = None
+        while True:
+            page = await self.list_archived_workflows(
+                label_selector=label_selector,
+                field_selector=field_selector,
+                resource_version=resource_version if continue_ is None else None,
+                resource_version_match=resource_version_match if continue_ is None else None,
+                name_prefix=name_prefix,
+                namespace=namespace,
+                name_filter=name_filter,
+                limit=str(limit),
+                continue_=continue_,
+            )
+            for item in page.items or []:
+                yield item
+            continue_ = page.metadata.continue_ if page.metadata is not None else None
+            if not continue_:
+                return
+
+    async def iter_cluster_workflow_templates(
+        self,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        resource_version_match: Optional[str] = None,
+        limit: int = 500,
+    ) -> AsyncGenerator[ClusterWorkflowTemplate, None]:
+        """Yield the cluster workflow templates one at a time, paging through them with `list_cluster_workflow_templates`.
+
+        Pages of `limit` cluster workflow templates are fetched as they are consumed, so only one page is held in memory at a time.
+        """
+        continue_ = None
+        while True:
+            page = await self.list_cluster_workflow_templates(
+                label_selector=label_selector,
+                field_selector=field_selector,
+                resource_version=resource_version if continue_ is None else None,
+                resource_version_match=resource_version_match if continue_ is None else None,
+                limit=str(limit),
+                continue_=continue_,
+            )
+            for item in page.items or []:
+                yield item
+            continue_ = page.metadata.continue_ if page.metadata is not None else None
+            if not continue_:
+                return
+
+    async def iter_cron_workflows(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        resource_version_match: Optional[str] = None,
+        limit: int = 500,
+    ) -> AsyncGenerator[CronWorkflow, None]:
+        """Yield the cron workflows one at a time, paging through them with `list_cron_workflows`.
+
+        Pages of `limit` cron workflows are fetched as they are consumed, so only one page is held in memory at a time.
+        """
+        continue_ = None
+        while True:
+            page = await self.list_cron_workflows(
+                namespace=namespace,
+                label_selector=label_selector,
+                field_selector=field_selector,
+                resource_version=resource_version if continue_ is None else None,
+                resource_version_match=resource_version_match if continue_ is None else None,
+                limit=str(limit),
+                continue_=continue_,
+            )
+            for item in page.items or []:
+                yield item
+            continue_ = page.metadata.continue_ if page.metadata is not None else None
+            if not continue_:
+                return
+
+    async def iter_workflow_templates(
+        self,
+        namespace: Optional[str] = None,
+        name_pattern: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        resource_version_match: Optional[str] = None,
+        limit: int = 500,
+    ) -> AsyncGenerator[WorkflowTemplate, None]:
+        """Yield the workflow templates one at a time, paging through them with `list_workflow_templates`.
+
+        Pages of `limit` workflow templates are fetched as they are consumed, so only one page is held in memory at a time.
+        """
+        continue_ = None
+        while True:
+            page = await self.list_workflow_templates(
+                namespace=namespace,
+                name_pattern=name_pattern,
+                label_selector=label_selector,
+                field_selector=field_selector,
+                resource_version=resource_version if continue_ is None else None,
+                resource_version_match=resource_version_match if continue_ is None else None,
+                limit=str(limit),
+                continue_=continue_,
+            )
+            for item in page.items or []:
+                yield item
+            continue_ = page.metadata.continue_ if page.metadata is not None else None
+            if not continue_:
+                return
+
+    async def iter_workflows(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        resource_version_match: Optional[str] = None,
+        fields: Optional[str] = None,
+        name_filter: Optional[str] = None,
+        created_after: Optional[str] = None,
+        finished_before: Optional[str] = None,
+        limit: int = 500,
+    ) -> AsyncGenerator[Workflow, None]:
+        """Yield the workflows one at a time, paging through them with `list_workflows`.
+
+        Pages of `limit` workflows are fetched as they are consumed, so only one page is held in memory at a time.
+        If `fields` is given, the token needed to fetch the next page is added to it.
+        """
+        continue_ = None
+        while True:
+            page = await self.list_workflows(
+                namespace=namespace,
+                label_selector=label_selector,
+                field_selector=field_selector,
+                resource_version=resource_version if continue_ is None else None,
+                resource_version_match=resource_version_match if continue_ is None else None,
+                fields=paginated_fields(fields),
+                name_filter=name_filter,
+                created_after=created_after,
+                finished_before=finished_before,
+                limit=str(limit),
+                continue_=continue_,
+            )
+            for item in page.items or []:
+                yield item
+            continue_ = page.metadata.continue_ if page.metadata is not None else None
+            if not continue_:
+                return
+
+    async def stream_artifact_file(
+        self,
+        id_discriminator: str,
+        id_: str,
+        node_id: str,
+        artifact_name: str,
+        artifact_discriminator: str,
+        namespace: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> AsyncGenerator[bytes, None]:
+        """Yield the content of the artifact file in chunks of up to `chunk_size` bytes, as it is received.
+
+        Unlike `get_artifact_file`, the content is never held in memory all at once. If the connection is lost,
+        the download is resumed from the last received byte, making at most `max_retries` consecutive attempts.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        async for chunk in aiter_download(
+            self.session,
+            url=urljoin(
+                self.host,
+                "artifact-files/{namespace}/{idDiscriminator}/{id}/{nodeId}/{artifactDiscriminator}/{artifactName}",
+            ).format(
+                idDiscriminator=id_discriminator,
+                id=id_,
+                nodeId=node_id,
+                artifactName=artifact_name,
+                artifactDiscriminator=artifact_discriminator,
+                namespace=namespace if namespace is not None else self.namespace,
+            ),
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={"Authorization": self.token or ""},
+        ):
+            yield chunk
+
+    async def download_artifact_file(
+        self,
+        id_discriminator: str,
+        id_: str,
+        node_id: str,
+        artifact_name: str,
+        artifact_discriminator: str,
+        destination: Union[str, os.PathLike, BinaryIO],
+        namespace: Optional[str] = None,
+        checksum: Optional[str] = None,
+        resume: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> int:
+        """Download the artifact file to `destination`, a path or a binary file object, returning its size in bytes.
+
+        The content is written in chunks of up to `chunk_size` bytes as it is received, and the download is resumed
+        from the last received byte if the connection is lost (see `stream_artifact_file`). A path is written to
+        as `<path>.part` until the download completes. If `resume` is true, a `.part` file left by an interrupted
+        download is resumed from its end rather than downloaded again, unless the file changed since (as told by its
+        ETag or Last-Modified date), in which case it is downloaded again.
+
+        If `checksum` is given, as `algorithm:hexdigest` (e.g. `sha256:...`), the downloaded content is verified
+        against it, raising `ChecksumMismatch` if it differs.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        return await async_download(
+            self.session,
+            url=urljoin(
+                self.host,
+                "artifact-files/{namespace}/{idDiscriminator}/{id}/{nodeId}/{artifactDiscriminator}/{artifactName}",
+            ).format(
+                idDiscriminator=id_discriminator,
+                id=id_,
+                nodeId=node_id,
+                artifactName=artifact_name,
+                artifactDiscriminator=artifact_discriminator,
+                namespace=namespace if namespace is not None else self.namespace,
+            ),
+            destination=destination,
+            checksum=checksum,
+            resume=resume,
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={"Authorization": self.token or ""},
+        )
+
+    async def stream_output_artifact_by_uid(
+        self,
+        uid: str,
+        node_id: str,
+        artifact_name: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> AsyncGenerator[bytes, None]:
+        """Yield the content of the output artifact by UID in chunks of up to `chunk_size` bytes, as it is received.
+
+        Unlike `get_output_artifact_by_uid`, the content is never held in memory all at once. If the connection is lost,
+        the download is resumed from the last received byte, making at most `max_retries` consecutive attempts.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        async for chunk in aiter_download(
+            self.session,
+            url=urljoin(self.host, "artifacts-by-uid/{uid}/{nodeId}/{artifactName}").format(
+                uid=uid, nodeId=node_id, artifactName=artifact_name
+            ),
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={"Authorization": self.token or ""},
+        ):
+            yield chunk
+
+    async def download_output_artifact_by_uid(
+        self,
+        uid: str,
+        node_id: str,
+        artifact_name: str,
+        destination: Union[str, os.PathLike, BinaryIO],
+        checksum: Optional[str] = None,
+        resume: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> int:
+        """Download the output artifact by UID to `destination`, a path or a binary file object, returning its size in bytes.
+
+        The content is written in chunks of up to `chunk_size` bytes as it is received, and the download is resumed
+        from the last received byte if the connection is lost (see `stream_output_artifact_by_uid`). A path is written to
+        as `<path>.part` until the download completes. If `resume` is true, a `.part` file left by an interrupted
+        download is resumed from its end rather than downloaded again, unless the file changed since (as told by its
+        ETag or Last-Modified date), in which case it is downloaded again.
+
+        If `checksum` is given, as `algorithm:hexdigest` (e.g. `sha256:...`), the downloaded content is verified
+        against it, raising `ChecksumMismatch` if it differs.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        return await async_download(
+            self.session,
+            url=urljoin(self.host, "artifacts-by-uid/{uid}/{nodeId}/{artifactName}").format(
+                uid=uid, nodeId=node_id, artifactName=artifact_name
+            ),
+            destination=destination,
+            checksum=checksum,
+            resume=resume,
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={"Authorization": self.token or ""},
+        )
+
+    async def stream_output_artifact(
+        self,
+        name: str,
+        node_id: str,
+        artifact_name: str,
+        namespace: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> AsyncGenerator[bytes, None]:
+        """Yield the content of the output artifact in chunks of up to `chunk_size` bytes, as it is received.
+
+        Unlike `get_output_artifact`, the content is never held in memory all at once. If the connection is lost,
+        the download is resumed from the last received byte, making at most `max_retries` consecutive attempts.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        async for chunk in aiter_download(
+            self.session,
+            url=urljoin(self.host, "artifacts/{namespace}/{name}/{nodeId}/{artifactName}").format(
+                name=name,
+                nodeId=node_id,
+                artifactName=artifact_name,
+                namespace=namespace if namespace is not None else self.namespace,
+            ),
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={"Authorization": self.token or ""},
+        ):
+            yield chunk
+
+    async def download_output_artifact(
+        self,
+        name: str,
+        node_id: str,
+        artifact_name: str,
+        destination: Union[str, os.PathLike, BinaryIO],
+        namespace: Optional[str] = None,
+        checksum: Optional[str] = None,
+        resume: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> int:
+        """Download the output artifact to `destination`, a path or a binary file object, returning its size in bytes.
+
+        The content is written in chunks of up to `chunk_size` bytes as it is received, and the download is resumed
+        from the last received byte if the connection is lost (see `stream_output_artifact`). A path is written to
+        as `<path>.part` until the download completes. If `resume` is true, a `.part` file left by an interrupted
+        download is resumed from its end rather than downloaded again, unless the file changed since (as told by its
+        ETag or Last-Modified date), in which case it is downloaded again.
+
+        If `checksum` is given, as `algorithm:hexdigest` (e.g. `sha256:...`), the downloaded content is verified
+        against it, raising `ChecksumMismatch` if it differs.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        return await async_download(
+            self.session,
+            url=urljoin(self.host, "artifacts/{namespace}/{name}/{nodeId}/{artifactName}").format(
+                name=name,
+                nodeId=node_id,
+                artifactName=artifact_name,
+                namespace=namespace if namespace is not None else self.namespace,
+            ),
+            destination=destination,
+            checksum=checksum,
+            resume=resume,
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={"Authorization": self.token or ""},
+        )
+
+    async def stream_input_artifact_by_uid(
+        self,
+        uid: str,
+        node_id: str,
+        artifact_name: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> AsyncGenerator[bytes, None]:
+        """Yield the content of the input artifact by UID in chunks of up to `chunk_size` bytes, as it is received.
+
+        Unlike `get_input_artifact_by_uid`, the content is never held in memory all at once. If the connection is lost,
+        the download is resumed from the last received byte, making at most `max_retries` consecutive attempts.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        async for chunk in aiter_download(
+            self.session,
+            url=urljoin(self.host, "input-artifacts-by-uid/{uid}/{nodeId}/{artifactName}").format(
+                uid=uid, nodeId=node_id, artifactName=artifact_name
+            ),
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={"Authorization": self.token or ""},
+        ):
+            yield chunk
+
+    async def download_input_artifact_by_uid(
+        self,
+        uid: str,
+        node_id: str,
+        artifact_name: str,
+        destination: Union[str, os.PathLike, BinaryIO],
+        checksum: Optional[str] = None,
+        resume: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> int:
+        """Download the input artifact by UID to `destination`, a path or a binary file object, returning its size in bytes.
+
+        The content is written in chunks of up to `chunk_size` bytes as it is received, and the download is resumed
+        from the last received byte if the connection is lost (see `stream_input_artifact_by_uid`). A path is written to
+        as `<path>.part` until the download completes. If `resume` is true, a `.part` file left by an interrupted
+        download is resumed from its end rather than downloaded again, unless the file changed since (as told by its
+        ETag or Last-Modified date), in which case it is downloaded again.
+
+        If `checksum` is given, as `algorithm:hexdigest` (e.g. `sha256:...`), the downloaded content is verified
+        against it, raising `ChecksumMismatch` if it differs.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        return await async_download(
+            self.session,
+            url=urljoin(self.host, "input-artifacts-by-uid/{uid}/{nodeId}/{artifactName}").format(
+                uid=uid, nodeId=node_id, artifactName=artifact_name
+            ),
+            destination=destination,
+            checksum=checksum,
+            resume=resume,
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={"Authorization": self.token or ""},
+        )
+
+    async def stream_input_artifact(
+        self,
+        name: str,
+        node_id: str,
+        artifact_name: str,
+        namespace: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> AsyncGenerator[bytes, None]:
+        """Yield the content of the input artifact in chunks of up to `chunk_size` bytes, as it is received.
+
+        Unlike `get_input_artifact`, the content is never held in memory all at once. If the connection is lost,
+        the download is resumed from the last received byte, making at most `max_retries` consecutive attempts.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        async for chunk in aiter_download(
+            self.session,
+            url=urljoin(self.host, "input-artifacts/{namespace}/{name}/{nodeId}/{artifactName}").format(
+                name=name,
+                nodeId=node_id,
+                artifactName=artifact_name,
+                namespace=namespace if namespace is not None else self.namespace,
+            ),
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={"Authorization": self.token or ""},
+        ):
+            yield chunk
+
+    async def download_input_artifact(
+        self,
+        name: str,
+        node_id: str,
+        artifact_name: str,
+        destination: Union[str, os.PathLike, BinaryIO],
+        namespace: Optional[str] = None,
+        checksum: Optional[str] = None,
+        resume: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> int:
+        """Download the input artifact to `destination`, a path or a binary file object, returning its size in bytes.
+
+        The content is written in chunks of up to `chunk_size` bytes as it is received, and the download is resumed
+        from the last received byte if the connection is lost (see `stream_input_artifact`). A path is written to
+        as `<path>.part` until the download completes. If `resume` is true, a `.part` file left by an interrupted
+        download is resumed from its end rather than downloaded again, unless the file changed since (as told by its
+        ETag or Last-Modified date), in which case it is downloaded again.
+
+        If `checksum` is given, as `algorithm:hexdigest` (e.g. `sha256:...`), the downloaded content is verified
+        against it, raising `ChecksumMismatch` if it differs.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        return await async_download(
+            self.session,
+            url=urljoin(self.host, "input-artifacts/{namespace}/{name}/{nodeId}/{artifactName}").format(
+                name=name,
+                nodeId=node_id,
+                artifactName=artifact_name,
+                namespace=namespace if namespace is not None else self.namespace,
+            ),
+            destination=destination,
+            checksum=checksum,
+            resume=resume,
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={"Authorization": self.token or ""},
+        )
+
+    async def stream_workflows(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        fields: Optional[str] = None,
+        reconnect: bool = True,
+        max_reconnects: Optional[int] = None,
+    ) -> AsyncGenerator[WorkflowWatchEvent, None]:
+        """Stream the changes to the workflows of the namespace, yielding each event as soon as it is received.
+
+        If `reconnect` is true, the stream is reopened with an exponential backoff when the connection is lost or
+        closed by the server, resuming after the last received event, or after `resource_version` if given.
+        `max_reconnects` limits the number of consecutive failed attempts to reconnect.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        async for result in aiter_watch_results(
+            self.session,
+            url=urljoin(self.host, "api/v1/workflow-events/{namespace}").format(
+                namespace=namespace if namespace is not None else self.namespace
+            ),
+            params={
+                "listOptions.labelSelector": label_selector,
+                "listOptions.fieldSelector": field_selector,
+                "fields": fields,
+            },
+            resource_version=resource_version,
+            reconnect=reconnect,
+            max_reconnects=max_reconnects,
+            headers={"Authorization": self.token or ""},
+        ):
+            yield build_model(WorkflowWatchEvent, result, self.validate_responses and fields is None)
+
+    async def stream_workflow_logs(
+        self,
+        name: str,
+        namespace: Optional[str] = None,
+        pod_name: Optional[str] = None,
+        container: str = "main",
+        follow: bool = False,
+        timestamps: bool = False,
+        since_seconds: Optional[int] = None,
+        tail_lines: Optional[int] = None,
+        grep: Optional[str] = None,
+        selector: Optional[str] = None,
+        reconnect: bool = True,
+        max_reconnects: Optional[int] = None,
+    ) -> AsyncGenerator[V1alpha1LogEntry, None]:
+        """Stream the logs of the pods of the workflow, or of `pod_name`, yielding each entry as soon as it is received.
+
+        The Argo server merges the logs of all the pods of the workflow (or the ones matching the `selector` label
+        selector) into the stream. If `follow` is true, the stream continues until the workflow completes, otherwise it
+        ends with the logs written so far. Only the last `tail_lines` lines, or the lines of the last `since_seconds`
+        seconds, of each pod are streamed if given, and only the lines matching the `grep` regular expression.
+
+        If `reconnect` is true, the stream is reopened with an exponential backoff when the connection is lost,
+        resuming after the last received entries. `max_reconnects` limits the number of consecutive failed attempts to
+        reconnect.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        async for result in aiter_log_results(
+            self.session,
+            url=urljoin(self.host, "api/v1/workflows/{namespace}/{name}/log").format(
+                name=name, namespace=namespace if namespace is not None else self.namespace
+            ),
+            params={
+                "podName": pod_name,
+                "logOptions.container": container,
+                "logOptions.follow": follow,
+                "logOptions.sinceSeconds": since_seconds,
+                "logOptions.tailLines": tail_lines,
+                "grep": grep,
+                "selector": selector,
+            },
+            timestamps=timestamps,
+            reconnect=reconnect,
+            max_reconnects=max_reconnects,
+            headers={"Authorization": self.token or ""},
+        ):
+            yield build_model(V1alpha1LogEntry, result, self.validate_responses)
+
 
 __all__ = ["AsyncWorkflowsService"]
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, List, Optional, Union
 
-from hera.workflows._meta_mixins import CallableTemplateMixin, ContextMixin
+from hera.workflows._meta_mixins import BuildCacheMixin, CallableTemplateMixin, ContextMixin
 from hera.workflows._mixins import (
     ContainerMixin,
     EnvIOMixin,
@@ -28,7 +28,7 @@ from hera.workflows.models.io.k8s.apimachinery.pkg.util.intstr import IntOrStrin
 
 
 @dataclass(kw_only=True)
-class ContainerNode(ContainerMixin, VolumeMountMixin, ResourceMixin, EnvMixin, SubNodeMixin):
+class ContainerNode(ContainerMixin, VolumeMountMixin, ResourceMixin, EnvMixin, SubNodeMixin, BuildCacheMixin):
     """A regular container that can be used as part of a `hera.workflows.ContainerSet`.
 
     See Also:
@@ -159,6 +159,7 @@ class ContainerSet(
             raise InvalidType(type(node))
 
         self.containers.append(node)
+        self._adopt(node)
 
     def _build_container_set(self) -> _ModelContainerSetTemplate:
         """Builds the generated `ContainerSetTemplate`."""
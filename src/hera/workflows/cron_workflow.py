@@ -7,15 +7,13 @@ for more on CronWorkflows.
 import warnings
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Annotated, Dict, List, Optional, Type, Union, cast
+from typing import Annotated, Any, Callable, Dict, List, Optional, Type, Union, cast
 
 from hera.exceptions import NotFound
 from hera.shared._pydantic import APIBaseModel
-from hera.shared._type_util import get_annotated_metadata
 from hera.workflows._meta_mixins import (
     ModelMapperMixin,
-    _get_model_attr,
-    _set_model_attr,
+    _compile_model_getter,
 )
 from hera.workflows.async_service import AsyncWorkflowsService
 from hera.workflows.models import (
@@ -39,33 +37,11 @@ class _CronWorkflowModelMapper(_WorkflowModelMapper):
         return _ModelCronWorkflow
 
     @classmethod
-    def build_model(
-        cls, hera_class: Type[ModelMapperMixin], hera_obj: ModelMapperMixin, model: TWorkflow
-    ) -> TWorkflow:
-        assert isinstance(hera_obj, ModelMapperMixin)
-
-        for attr, annotation in hera_class._get_all_annotations().items():
-            if mappers := get_annotated_metadata(annotation, ModelMapperMixin.ModelMapper):
-                if len(mappers) != 1:
-                    raise ValueError("Expected only one ModelMapper")
-                if (
-                    not isinstance(mappers[0], _CronWorkflowModelMapper)
-                    and mappers[0].model_path
-                    and mappers[0].model_path[0] == "spec"
-                ):
-                    # Skip attributes mapped to spec by parent _WorkflowModelMapper
-                    continue
-
-                # Value comes from builder function if it exists on hera_obj, otherwise directly from the attr
-                value = (
-                    getattr(hera_obj, mappers[0].builder.__name__)()
-                    if mappers[0].builder is not None
-                    else getattr(hera_obj, attr)
-                )
-                if value is not None:
-                    _set_model_attr(model, mappers[0].model_path, value)
-
-        return model
+    def _is_built(cls, mapper: ModelMapperMixin.ModelMapper) -> bool:
+        # Skip attributes mapped to spec by parent _WorkflowModelMapper
+        if not isinstance(mapper, _CronWorkflowModelMapper) and mapper.model_path and mapper.model_path[0] == "spec":
+            return False
+        return super()._is_built(mapper)
 
 
 @dataclass(kw_only=True)
@@ -255,35 +231,28 @@ class CronWorkflow(Workflow):
         return _CronWorkflowModelMapper.build_model(CronWorkflow, self, model_cron_workflow)
 
     @classmethod
-    def _from_model(cls, model: APIBaseModel) -> ModelMapperMixin:
-        """Parse from given model to cls's type."""
-        assert isinstance(model, _ModelCronWorkflow)
-        hera_cron_workflow = cls()
-
-        for attr, annotation in cls._get_all_annotations().items():
-            if mappers := get_annotated_metadata(annotation, ModelMapperMixin.ModelMapper):
-                if len(mappers) != 1:
-                    raise ValueError("Expected only one ModelMapper")
-
-                if mappers[0].model_path:
-                    value = None
+    def _get_model_value_getter(cls, mapper: ModelMapperMixin.ModelMapper) -> Optional[Callable[[Any], Any]]:
+        """Returns the function used by `_from_model` to get the mapper's value from a model CronWorkflow."""
+        if not mapper.model_path:
+            return None
 
-                    if (
-                        isinstance(mappers[0], _CronWorkflowModelMapper)
-                        or isinstance(mappers[0], _WorkflowModelMapper)
-                        and mappers[0].model_path[0] == "metadata"
-                    ):
-                        value = _get_model_attr(model, mappers[0].model_path)
+        if isinstance(mapper, _CronWorkflowModelMapper) or (
+            isinstance(mapper, _WorkflowModelMapper) and mapper.model_path[0] == "metadata"
+        ):
+            return mapper.get_model_value
 
-                    elif isinstance(mappers[0], _WorkflowModelMapper) and mappers[0].model_path[0] == "spec":
-                        # We map "spec.workflow_spec" from the model CronWorkflow to "spec" for Hera's Workflow (used
-                        # as the parent class of Hera's CronWorkflow)
-                        value = _get_model_attr(model.spec.workflow_spec, mappers[0].model_path[1:])
+        if isinstance(mapper, _WorkflowModelMapper) and mapper.model_path[0] == "spec":
+            # We map "spec.workflow_spec" from the model CronWorkflow to "spec" for Hera's Workflow (used
+            # as the parent class of Hera's CronWorkflow)
+            return _compile_model_getter(["spec", "workflow_spec"] + mapper.model_path[1:])
 
-                    if value is not None:
-                        setattr(hera_cron_workflow, attr, value)
+        return None
 
-        return hera_cron_workflow
+    @classmethod
+    def _from_model(cls, model: APIBaseModel) -> ModelMapperMixin:
+        """Parse from given model to cls's type."""
+        assert isinstance(model, _ModelCronWorkflow)
+        return super()._from_model(model)
 
     @classmethod
     def from_dict(cls, model_dict: Dict) -> ModelMapperMixin:
@@ -1,5 +1,7 @@
 """The exceptions module provides exception types required for the Hera workflows package."""
 
+from typing import Any, List
+
 
 class WorkflowsException(Exception):
     """Base Hera workflows exception."""
@@ -31,4 +33,22 @@ class NodeNameConflict(WorkflowsException):
     ...
 
 
-__all__ = ["InvalidType", "InvalidTemplateCall", "InvalidDispatchType", "NodeNameConflict"]
+class SubmissionError(WorkflowsException):
+    """Exception raised when some of the workflows submitted together could not be created.
+
+    `results` holds the created workflow or the raised exception for each submitted workflow, in submission order, and
+    `errors` maps the index of each workflow that could not be created to its exception.
+    """
+
+    def __init__(self, results: List[Any]) -> None:
+        """Create the exception from the results of the submitted workflows, at least one of which is an exception."""
+        self.results = results
+        self.errors = {i: result for i, result in enumerate(results) if isinstance(result, Exception)}
+        first_index, first_error = next(iter(self.errors.items()))
+        super().__init__(
+            f"{len(self.errors)} of {len(results)} workflows could not be created, "
+            f"the first one (at index {first_index}) with: {first_error!r}"
+        )
+
+
+__all__ = ["InvalidType", "InvalidTemplateCall", "InvalidDispatchType", "NodeNameConflict", "SubmissionError"]
@@ -1,5 +1,5 @@
 import sys
-from typing import Iterator, List, Optional, Tuple, Type, Union, cast
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple, Type, Union, cast
 
 if sys.version_info >= (3, 11):
     from typing import Self
@@ -7,10 +7,9 @@ else:
     from typing_extensions import Self
 
 from pydantic import BaseModel as V2BaseModel
-from pydantic.v1 import BaseModel as V1BaseModel
 from pydantic_core import PydanticUndefined
 
-from hera.shared._pydantic import FieldInfo, get_field_annotations, get_fields, model_dump
+from hera.shared._pydantic import FieldInfo, get_field_annotations, get_fields, is_v1_model_class, model_dump
 from hera.shared._type_util import construct_io_from_annotation, get_workflow_annotation
 from hera.shared.serialization import MISSING, serialize
 from hera.workflows.artifact import Artifact
@@ -22,9 +21,12 @@ from hera.workflows.models import (
 )
 from hera.workflows.parameter import Parameter
 
+if TYPE_CHECKING:
+    from pydantic.v1 import BaseModel as V1BaseModel
+
 
 def _construct_io_from_fields(
-    cls: Type[V1BaseModel] | Type[V2BaseModel],
+    cls: "Type[V1BaseModel] | Type[V2BaseModel]",
 ) -> Iterator[Tuple[str, FieldInfo, Union[Parameter, Artifact]]]:
     """Constructs a Parameter or Artifact object for all Pydantic fields based on their annotations.
 
@@ -41,7 +43,7 @@ class InputMixin:
     def _get_parameters(cls, object_override: Optional[Self] = None) -> List[Parameter]:
         parameters = []
 
-        for field, field_info, param in _construct_io_from_fields(cast(Type[V1BaseModel] | Type[V2BaseModel], cls)):
+        for field, field_info, param in _construct_io_from_fields(cast("Type[V1BaseModel] | Type[V2BaseModel]", cls)):
             if isinstance(param, Parameter):
                 if param.default is not None:
                     raise ValueError(
@@ -60,7 +62,7 @@ class InputMixin:
     def _get_artifacts(cls, add_missing_path: bool = False) -> List[Artifact]:
         artifacts = []
 
-        for _, _, artifact in _construct_io_from_fields(cast(Type[V1BaseModel] | Type[V2BaseModel], cls)):
+        for _, _, artifact in _construct_io_from_fields(cast("Type[V1BaseModel] | Type[V2BaseModel]", cls)):
             if isinstance(artifact, Artifact):
                 if add_missing_path and artifact.path is None:
                     artifact.path = artifact._get_default_inputs_path()
@@ -76,12 +78,12 @@ class InputMixin:
         """Returns the Input with templated values to propagate through a DAG/Steps function."""
         object_dict = {}
 
-        for field, _, annotation in _construct_io_from_fields(cast(Type[V1BaseModel] | Type[V2BaseModel], cls)):
+        for field, _, annotation in _construct_io_from_fields(cast("Type[V1BaseModel] | Type[V2BaseModel]", cls)):
             input_type = "parameters" if isinstance(annotation, Parameter) else "artifacts"
             object_dict[field] = "{{" + f"inputs.{input_type}.{annotation.name}" + "}}"
 
-        if issubclass(cls, V1BaseModel):
-            return cast(Self, cls.construct(None, **object_dict))
+        if is_v1_model_class(cls):
+            return cast(Self, cast("Type[V1BaseModel]", cls).construct(None, **object_dict))
 
         assert issubclass(cls, V2BaseModel)
         return cast(Self, cls.model_construct(None, **object_dict))
@@ -92,7 +94,9 @@ class InputMixin:
 
         self_dict = model_dump(cast(V2BaseModel, self))
 
-        for field, _, annotation in _construct_io_from_fields(cast(Type[V1BaseModel] | Type[V2BaseModel], type(self))):
+        for field, _, annotation in _construct_io_from_fields(
+            cast("Type[V1BaseModel] | Type[V2BaseModel]", type(self))
+        ):
             # The value may be a static value (of any time) if it has a default value, so we need to serialize it
             # If it is a templated string, it will be unaffected as `"{{mystr}}" == serialize("{{mystr}}")``
             templated_value = serialize(self_dict[field])
@@ -113,7 +117,7 @@ class OutputMixin:
         outputs: List[Union[Artifact, Parameter]] = []
 
         for field, field_info, annotation in _construct_io_from_fields(
-            cast(Type[V1BaseModel] | Type[V2BaseModel], cls)
+            cast("Type[V1BaseModel] | Type[V2BaseModel]", cls)
         ):
             if field in {"exit_code", "result"}:
                 continue
@@ -133,7 +137,7 @@ class OutputMixin:
 
     @classmethod
     def _get_output(cls, field_name: str) -> Union[Artifact, Parameter]:
-        annotations = get_field_annotations(cast(Type[V1BaseModel] | Type[V2BaseModel], cls))
+        annotations = get_field_annotations(cast("Type[V1BaseModel] | Type[V2BaseModel]", cls))
         annotation = annotations[field_name]
         if output := get_workflow_annotation(annotation):
             if not output.name:
@@ -141,7 +145,7 @@ class OutputMixin:
             return output
 
         # Create a Parameter from basic type annotations
-        default = get_fields(cast(Type[V1BaseModel] | Type[V2BaseModel], cls))[field_name].default
+        default = get_fields(cast("Type[V1BaseModel] | Type[V2BaseModel]", cls))[field_name].default
         if default is None or default == PydanticUndefined:
             default = MISSING
         return Parameter(name=field_name, default=default)  # type: ignore
@@ -155,7 +159,9 @@ class OutputMixin:
 
         self_dict = model_dump(cast(V2BaseModel, self))
 
-        for field, _, annotation in _construct_io_from_fields(cast(Type[V1BaseModel] | Type[V2BaseModel], type(self))):
+        for field, _, annotation in _construct_io_from_fields(
+            cast("Type[V1BaseModel] | Type[V2BaseModel]", type(self))
+        ):
             if field in {"exit_code", "result"}:
                 continue
 
@@ -0,0 +1,245 @@
+"""The log_tailer module provides the LogTailer class, to stream the logs of many workflows at once."""
+
+import asyncio
+import copy
+import queue
+import threading
+from contextlib import aclosing, closing
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple, Union, cast
+
+from hera.workflows.async_service import AsyncWorkflowsService
+from hera.workflows.models import (
+    V1alpha1LogEntry,
+    Workflow as _ModelWorkflow,
+)
+from hera.workflows.service import WorkflowsService
+from hera.workflows.workflow import Workflow
+
+if TYPE_CHECKING:
+    import requests
+
+# How often (in seconds) the threads streaming logs check if the tailer was closed while the buffer is full
+_PUT_INTERVAL = 0.1
+
+# An item of the buffer: the name of the workflow, and either a log entry, an error, or neither once the stream ended
+_Item = Tuple[str, Optional[V1alpha1LogEntry], Optional[Exception]]
+
+
+class _TailerClosed(Exception):
+    """Raised in a thread streaming logs when it reconnects after the tailer was closed."""
+
+
+class _StreamSession:
+    """A proxy of the session of the service streaming the logs of a workflow, which can stop the stream.
+
+    The generator of a stream cannot be closed from another thread while it is blocked reading a quiet stream, so the
+    connection of its response is shut down instead, which unblocks the read. The stream then fails to reconnect.
+    """
+
+    def __init__(self, session: "requests.Session", closed: threading.Event) -> None:
+        self.session = session
+        self.closed = closed
+        self.lock = threading.Lock()
+        self.response: Optional["requests.Response"] = None
+
+    def request(self, *args: Any, **kwargs: Any) -> "requests.Response":
+        if self.closed.is_set():
+            raise _TailerClosed()
+        response = self.session.request(*args, **kwargs)
+        with self.lock:
+            self.response = response
+        if self.closed.is_set():
+            self.stop()
+        return response
+
+    def stop(self) -> None:
+        with self.lock:
+            response, self.response = self.response, None
+        if response is None:
+            return
+        # urllib3 2.3+ can shut down the socket of a response read by another thread, closing it may not unblock a read
+        shutdown = getattr(response.raw, "shutdown", None)
+        if shutdown is not None:
+            shutdown()
+        response.close()
+
+
+class LogTailer:
+    """Streams the logs of many workflows at once, yielding each log entry as soon as it is received.
+
+    The log stream of each workflow, which the Argo server merges from all the pods of the workflow, is consumed
+    concurrently (by a thread, or by a task for async services), and the entries of all the streams are handed to the
+    caller through a single buffer. The buffer holds at most `buffer_size` entries: while it is full, the streams are
+    not read any further, so the logs are never all buffered in memory when they are produced faster than consumed.
+
+    Example:
+        ```python
+        tailer = LogTailer([w.create() for w in workflows])
+        for name, entry in tailer.tail():
+            print(f"{name}/{entry.pod_name}: {entry.content}")
+        ```
+
+    Each stream resumes after its last received entries if its connection is lost (see
+    `WorkflowsService.stream_workflow_logs`). If a stream fails anyway, the others are stopped and its error is raised.
+    Closing the iterator of the entries stops all the streams, shutting down their connections even if they are idle.
+
+    Each stream holds a connection to the Argo server, so the `max_connections_per_host` of the `TransportConfig` of
+    the service should be at least the number of workflows, for the connections to be reused by later requests.
+    """
+
+    def __init__(
+        self,
+        workflows: Iterable[Union[Workflow, _ModelWorkflow, str]],
+        workflows_service: Optional[Union[WorkflowsService, AsyncWorkflowsService]] = None,
+        namespace: Optional[str] = None,
+        container: str = "main",
+        follow: bool = True,
+        timestamps: bool = False,
+        grep: Optional[str] = None,
+        buffer_size: int = 1000,
+    ) -> None:
+        """Create a tailer for the logs of the given workflows.
+
+        Args:
+            workflows: the workflows to stream the logs of, given as Hera workflows, workflow models (e.g. as returned
+                by `create_workflow`), or names. The service and namespace of the first Hera workflow are used if
+                `workflows_service` and `namespace` are not given.
+            workflows_service: the (sync or async) service used to stream the logs.
+            namespace: the namespace of the workflows. Defaults to the namespace of the service.
+            container: the container of the pods to stream the logs of.
+            follow: if true, the logs of each workflow are streamed until it completes, otherwise only the logs written
+                so far are.
+            timestamps: whether the log lines are prefixed with their timestamp.
+            grep: only stream the log lines matching this regular expression.
+            buffer_size: the maximum number of received log entries waiting to be yielded.
+        """
+        names: Dict[str, None] = {}
+        for workflow in workflows:
+            if isinstance(workflow, Workflow):
+                assert workflow.name is not None, "workflow name not defined"
+                names[workflow.name] = None
+                workflows_service = workflows_service or workflow.workflows_service
+                namespace = namespace or workflow.namespace
+            elif isinstance(workflow, _ModelWorkflow):
+                assert workflow.metadata.name is not None, "workflow name not defined"
+                names[workflow.metadata.name] = None
+                namespace = namespace or workflow.metadata.namespace
+            else:
+                names[workflow] = None
+
+        assert workflows_service is not None, "workflows service not initialized"
+        self.names: List[str] = list(names)
+        self.workflows_service = workflows_service
+        self.namespace = namespace or workflows_service.namespace
+        self.container = container
+        self.follow = follow
+        self.timestamps = timestamps
+        self.grep = grep
+        self.buffer_size = buffer_size
+
+    def tail(self) -> Iterator[Tuple[str, V1alpha1LogEntry]]:
+        """Yield each log entry, with the name of its workflow, as soon as it is received.
+
+        Returns once all the streams ended, which is once all the workflows completed if `follow` is true. Closing the
+        returned iterator stops the streams.
+        """
+        service = self.workflows_service
+        assert isinstance(service, WorkflowsService), "workflows service not initialized"
+        buffer: "queue.Queue[_Item]" = queue.Queue(maxsize=self.buffer_size)
+        closed = threading.Event()
+
+        def put(item: _Item) -> bool:
+            while not closed.is_set():
+                try:
+                    buffer.put(item, timeout=_PUT_INTERVAL)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        sessions: List[_StreamSession] = []
+
+        def stream(name: str, session: _StreamSession) -> None:
+            # each stream has its own copy of the service, to stop its own connection
+            stream_service = copy.copy(service)
+            stream_service.session = cast("requests.Session", session)
+            try:
+                entries = stream_service.stream_workflow_logs(
+                    name,
+                    namespace=self.namespace,
+                    container=self.container,
+                    follow=self.follow,
+                    timestamps=self.timestamps,
+                    grep=self.grep,
+                )
+                with closing(entries):
+                    for entry in entries:
+                        if not put((name, entry, None)):
+                            return
+                put((name, None, None))
+            except Exception as e:
+                put((name, None, e))
+
+        for name in self.names:
+            session = _StreamSession(service.session, closed)
+            sessions.append(session)
+            threading.Thread(target=stream, args=(name, session), name=f"hera-logs-{name}", daemon=True).start()
+        try:
+            streaming = len(self.names)
+            while streaming:
+                name, entry, error = buffer.get()
+                if error is not None:
+                    raise error
+                if entry is None:
+                    streaming -= 1
+                    continue
+                yield name, entry
+        finally:
+            closed.set()
+            for session in sessions:
+                session.stop()
+
+    async def async_tail(self) -> AsyncIterator[Tuple[str, V1alpha1LogEntry]]:
+        """Yield each log entry, with the name of its workflow, as soon as it is received, asynchronously.
+
+        See `tail` for the end of the iteration.
+        """
+        service = self.workflows_service
+        assert isinstance(service, AsyncWorkflowsService), "workflows service not initialized"
+        buffer: "asyncio.Queue[_Item]" = asyncio.Queue(maxsize=self.buffer_size)
+
+        async def stream(name: str) -> None:
+            try:
+                entries = service.stream_workflow_logs(
+                    name,
+                    namespace=self.namespace,
+                    container=self.container,
+                    follow=self.follow,
+                    timestamps=self.timestamps,
+                    grep=self.grep,
+                )
+                async with aclosing(entries):
+                    async for entry in entries:
+                        await buffer.put((name, entry, None))
+                await buffer.put((name, None, None))
+            except Exception as e:
+                await buffer.put((name, None, e))
+
+        tasks = [asyncio.create_task(stream(name)) for name in self.names]
+        try:
+            streaming = len(tasks)
+            while streaming:
+                name, entry, error = await buffer.get()
+                if error is not None:
+                    raise error
+                if entry is None:
+                    streaming -= 1
+                    continue
+                yield name, entry
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+__all__ = ["LogTailer"]
@@ -7,17 +7,17 @@ from typing import Annotated
 
 from pydantic import Field
 
-from hera.shared._pydantic import APIBaseModel
+from hera.shared._pydantic import DeferredAPIBaseModel
 
 from .github.com.argoproj.argo_events.pkg.apis.events import v1alpha1
 from .io.k8s.apimachinery.pkg.apis.meta import v1
 
 
-class EventSourceDeletedResponse(APIBaseModel):
+class EventSourceDeletedResponse(DeferredAPIBaseModel):
     pass
 
 
-class LogEntry(APIBaseModel):
+class LogEntry(DeferredAPIBaseModel):
     event_name: Annotated[
         str | None,
         Field(alias="eventName", title="optional - the event name (e.g. `example`)"),
@@ -36,17 +36,17 @@ class LogEntry(APIBaseModel):
     time: v1.Time | None = None
 
 
-class CreateEventSourceRequest(APIBaseModel):
+class CreateEventSourceRequest(DeferredAPIBaseModel):
     event_source: Annotated[v1alpha1.EventSource | None, Field(alias="eventSource")] = None
     namespace: str | None = None
 
 
-class EventSourceWatchEvent(APIBaseModel):
+class EventSourceWatchEvent(DeferredAPIBaseModel):
     object: v1alpha1.EventSource | None = None
     type: str | None = None
 
 
-class UpdateEventSourceRequest(APIBaseModel):
+class UpdateEventSourceRequest(DeferredAPIBaseModel):
     event_source: Annotated[v1alpha1.EventSource | None, Field(alias="eventSource")] = None
     name: str | None = None
     namespace: str | None = None
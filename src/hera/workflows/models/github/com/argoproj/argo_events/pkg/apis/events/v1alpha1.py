@@ -7,13 +7,13 @@ from typing import Annotated
 
 from pydantic import Base64Str, Field
 
-from hera.shared._pydantic import APIBaseModel
+from hera.shared._pydantic import DeferredAPIBaseModel
 
 from ........io.k8s.api.core import v1 as v1_1
 from ........io.k8s.apimachinery.pkg.apis.meta import v1
 
 
-class AMQPConsumeConfig(APIBaseModel):
+class AMQPConsumeConfig(DeferredAPIBaseModel):
     auto_ack: Annotated[
         bool | None,
         Field(
@@ -58,7 +58,7 @@ class AMQPConsumeConfig(APIBaseModel):
     ] = None
 
 
-class AMQPExchangeDeclareConfig(APIBaseModel):
+class AMQPExchangeDeclareConfig(DeferredAPIBaseModel):
     auto_delete: Annotated[
         bool | None,
         Field(
@@ -83,11 +83,11 @@ class AMQPExchangeDeclareConfig(APIBaseModel):
     ] = None
 
 
-class EventSourceFilter(APIBaseModel):
+class EventSourceFilter(DeferredAPIBaseModel):
     expression: str | None = None
 
 
-class AMQPQueueBindConfig(APIBaseModel):
+class AMQPQueueBindConfig(DeferredAPIBaseModel):
     no_wait: Annotated[
         bool | None,
         Field(
@@ -99,7 +99,7 @@ class AMQPQueueBindConfig(APIBaseModel):
     ] = None
 
 
-class AMQPQueueDeclareConfig(APIBaseModel):
+class AMQPQueueDeclareConfig(DeferredAPIBaseModel):
     arguments: Annotated[
         str | None,
         Field(
@@ -142,19 +142,19 @@ class AMQPQueueDeclareConfig(APIBaseModel):
     ] = None
 
 
-class Amount(APIBaseModel):
+class Amount(DeferredAPIBaseModel):
     value: Base64Str | None = None
 
 
-class FileArtifact(APIBaseModel):
+class FileArtifact(DeferredAPIBaseModel):
     path: str | None = None
 
 
-class K8SResource(APIBaseModel):
+class K8SResource(DeferredAPIBaseModel):
     value: Base64Str | None = None
 
 
-class URLArtifact(APIBaseModel):
+class URLArtifact(DeferredAPIBaseModel):
     path: Annotated[str | None, Field(title="Path is the complete URL")] = None
     verify_cert: Annotated[
         bool | None,
@@ -165,13 +165,13 @@ class URLArtifact(APIBaseModel):
     ] = None
 
 
-class Int64OrString(APIBaseModel):
+class Int64OrString(DeferredAPIBaseModel):
     int64_val: Annotated[str | None, Field(alias="int64Val")] = None
     str_val: Annotated[str | None, Field(alias="strVal")] = None
     type: str | None = None
 
 
-class BitbucketRepository(APIBaseModel):
+class BitbucketRepository(DeferredAPIBaseModel):
     owner: Annotated[str | None, Field(title="Owner is the owner of the repository")] = None
     repository_slug: Annotated[
         str | None,
@@ -185,7 +185,7 @@ class BitbucketRepository(APIBaseModel):
     ] = None
 
 
-class BitbucketServerRepository(APIBaseModel):
+class BitbucketServerRepository(DeferredAPIBaseModel):
     project_key: Annotated[
         str | None,
         Field(
@@ -202,7 +202,7 @@ class BitbucketServerRepository(APIBaseModel):
     ] = None
 
 
-class CatchupConfiguration(APIBaseModel):
+class CatchupConfiguration(DeferredAPIBaseModel):
     enabled: Annotated[
         bool | None,
         Field(title=("Enabled enables to triggered the missed schedule when eventsource restarts")),
@@ -213,7 +213,7 @@ class CatchupConfiguration(APIBaseModel):
     ] = None
 
 
-class ConditionsResetByTime(APIBaseModel):
+class ConditionsResetByTime(DeferredAPIBaseModel):
     cron: Annotated[
         str | None,
         Field(title=("Cron is a cron-like expression. For reference, see: https://en.wikipedia.org/wiki/Cron")),
@@ -221,7 +221,7 @@ class ConditionsResetByTime(APIBaseModel):
     timezone: Annotated[str | None, Field(title="+optional")] = None
 
 
-class ConfigMapPersistence(APIBaseModel):
+class ConfigMapPersistence(DeferredAPIBaseModel):
     create_if_not_exist: Annotated[
         bool | None,
         Field(
@@ -232,7 +232,7 @@ class ConfigMapPersistence(APIBaseModel):
     name: Annotated[str | None, Field(title="Name of the configmap")] = None
 
 
-class DataFilter(APIBaseModel):
+class DataFilter(DeferredAPIBaseModel):
     comparator: Annotated[
         str | None,
         Field(
@@ -283,7 +283,7 @@ class DataFilter(APIBaseModel):
     ] = None
 
 
-class EventDependencyTransformer(APIBaseModel):
+class EventDependencyTransformer(DeferredAPIBaseModel):
     jq: Annotated[
         str | None,
         Field(title="JQ holds the jq command applied for transformation\n+optional"),
@@ -294,7 +294,7 @@ class EventDependencyTransformer(APIBaseModel):
     ] = None
 
 
-class TimeFilter(APIBaseModel):
+class TimeFilter(DeferredAPIBaseModel):
     start: Annotated[
         str | None,
         Field(
@@ -317,7 +317,7 @@ class TimeFilter(APIBaseModel):
     ] = None
 
 
-class WatchPathConfig(APIBaseModel):
+class WatchPathConfig(DeferredAPIBaseModel):
     directory: Annotated[str | None, Field(title="Directory to watch for events")] = None
     path: Annotated[
         str | None,
@@ -332,7 +332,7 @@ class WatchPathConfig(APIBaseModel):
     ] = None
 
 
-class GitRemoteConfig(APIBaseModel):
+class GitRemoteConfig(DeferredAPIBaseModel):
     name: Annotated[str | None, Field(description="Name of the remote to fetch from.")] = None
     urls: Annotated[
         list[str] | None,
@@ -345,7 +345,7 @@ class GitRemoteConfig(APIBaseModel):
     ] = None
 
 
-class KafkaConsumerGroup(APIBaseModel):
+class KafkaConsumerGroup(DeferredAPIBaseModel):
     group_name: Annotated[
         str | None,
         Field(alias="groupName", title="The name for the consumer group to use"),
@@ -368,7 +368,7 @@ class KafkaConsumerGroup(APIBaseModel):
     ] = None
 
 
-class LogTrigger(APIBaseModel):
+class LogTrigger(DeferredAPIBaseModel):
     interval_seconds: Annotated[
         str | None,
         Field(
@@ -381,17 +381,17 @@ class LogTrigger(APIBaseModel):
     ] = None
 
 
-class Metadata(APIBaseModel):
+class Metadata(DeferredAPIBaseModel):
     annotations: dict[str, str] | None = None
     labels: dict[str, str] | None = None
 
 
-class OwnedRepositories(APIBaseModel):
+class OwnedRepositories(DeferredAPIBaseModel):
     names: Annotated[list[str] | None, Field(title="Repository names")] = None
     owner: Annotated[str | None, Field(title="Organization or user name")] = None
 
 
-class PayloadField(APIBaseModel):
+class PayloadField(DeferredAPIBaseModel):
     name: Annotated[
         str | None,
         Field(description="Name acts as key that holds the value at the path."),
@@ -411,22 +411,22 @@ class PayloadField(APIBaseModel):
     ] = None
 
 
-class RateLimit(APIBaseModel):
+class RateLimit(DeferredAPIBaseModel):
     requests_per_unit: Annotated[int | None, Field(alias="requestsPerUnit")] = None
     unit: Annotated[str | None, Field(title="Defaults to Second")] = None
 
 
-class S3Bucket(APIBaseModel):
+class S3Bucket(DeferredAPIBaseModel):
     key: str | None = None
     name: str | None = None
 
 
-class S3Filter(APIBaseModel):
+class S3Filter(DeferredAPIBaseModel):
     prefix: str | None = None
     suffix: str | None = None
 
 
-class Selector(APIBaseModel):
+class Selector(DeferredAPIBaseModel):
     key: Annotated[str | None, Field(title="Key name")] = None
     operation: Annotated[
         str | None,
@@ -441,7 +441,7 @@ class Selector(APIBaseModel):
     value: Annotated[str | None, Field(title="Value")] = None
 
 
-class SlackSender(APIBaseModel):
+class SlackSender(DeferredAPIBaseModel):
     icon: Annotated[
         str | None,
         Field(
@@ -456,7 +456,7 @@ class SlackSender(APIBaseModel):
     ] = None
 
 
-class SlackThread(APIBaseModel):
+class SlackThread(DeferredAPIBaseModel):
     broadcast_message_to_channel: Annotated[
         bool | None,
         Field(
@@ -476,16 +476,16 @@ class SlackThread(APIBaseModel):
     ] = None
 
 
-class StatusPolicy(APIBaseModel):
+class StatusPolicy(DeferredAPIBaseModel):
     allow: list[int] | None = None
 
 
-class StorageGridFilter(APIBaseModel):
+class StorageGridFilter(DeferredAPIBaseModel):
     prefix: str | None = None
     suffix: str | None = None
 
 
-class TriggerParameterSource(APIBaseModel):
+class TriggerParameterSource(DeferredAPIBaseModel):
     context_key: Annotated[
         str | None,
         Field(
@@ -585,7 +585,7 @@ class TriggerParameterSource(APIBaseModel):
     ] = None
 
 
-class Condition(APIBaseModel):
+class Condition(DeferredAPIBaseModel):
     last_transition_time: Annotated[
         v1.Time | None,
         Field(
@@ -611,7 +611,7 @@ class Condition(APIBaseModel):
     type: Annotated[str | None, Field(title="Condition type.\n+required")] = None
 
 
-class EventContext(APIBaseModel):
+class EventContext(DeferredAPIBaseModel):
     datacontenttype: Annotated[
         str | None,
         Field(description=("DataContentType - A MIME (RFC2046) string describing the media type of `data`.")),
@@ -640,7 +640,7 @@ class EventContext(APIBaseModel):
     ] = None
 
 
-class ResourceFilter(APIBaseModel):
+class ResourceFilter(DeferredAPIBaseModel):
     after_start: Annotated[
         bool | None,
         Field(
@@ -688,7 +688,7 @@ class ResourceFilter(APIBaseModel):
     ] = None
 
 
-class AzureEventsHubEventSource(APIBaseModel):
+class AzureEventsHubEventSource(DeferredAPIBaseModel):
     filter: Annotated[EventSourceFilter | None, Field(title="Filter\n+optional")] = None
     fqdn: Annotated[
         str | None,
@@ -731,7 +731,7 @@ class AzureEventsHubEventSource(APIBaseModel):
     ] = None
 
 
-class AzureQueueStorageEventSource(APIBaseModel):
+class AzureQueueStorageEventSource(DeferredAPIBaseModel):
     connection_string: Annotated[
         v1_1.SecretKeySelector | None,
         Field(
@@ -805,7 +805,7 @@ class AzureQueueStorageEventSource(APIBaseModel):
     ] = None
 
 
-class BasicAuth(APIBaseModel):
+class BasicAuth(DeferredAPIBaseModel):
     password: Annotated[
         v1_1.SecretKeySelector | None,
         Field(
@@ -820,7 +820,7 @@ class BasicAuth(APIBaseModel):
     ] = None
 
 
-class BitbucketBasicAuth(APIBaseModel):
+class BitbucketBasicAuth(DeferredAPIBaseModel):
     password: Annotated[
         v1_1.SecretKeySelector | None,
         Field(description="Password refers to the K8s secret that holds the password."),
@@ -831,7 +831,7 @@ class BitbucketBasicAuth(APIBaseModel):
     ] = None
 
 
-class GenericEventSource(APIBaseModel):
+class GenericEventSource(DeferredAPIBaseModel):
     auth_secret: Annotated[
         v1_1.SecretKeySelector | None,
         Field(
@@ -861,12 +861,12 @@ class GenericEventSource(APIBaseModel):
     ] = None
 
 
-class GitCreds(APIBaseModel):
+class GitCreds(DeferredAPIBaseModel):
     password: v1_1.SecretKeySelector | None = None
     username: v1_1.SecretKeySelector | None = None
 
 
-class GithubAppCreds(APIBaseModel):
+class GithubAppCreds(DeferredAPIBaseModel):
     app_id: Annotated[
         str | None,
         Field(
@@ -890,7 +890,7 @@ class GithubAppCreds(APIBaseModel):
     ] = None
 
 
-class PubSubEventSource(APIBaseModel):
+class PubSubEventSource(DeferredAPIBaseModel):
     credential_secret: Annotated[
         v1_1.SecretKeySelector | None,
         Field(
@@ -971,7 +971,7 @@ class PubSubEventSource(APIBaseModel):
     ] = None
 
 
-class SASLConfig(APIBaseModel):
+class SASLConfig(DeferredAPIBaseModel):
     mechanism: Annotated[
         str | None,
         Field(
@@ -996,7 +996,7 @@ class SASLConfig(APIBaseModel):
     ] = None
 
 
-class SQSEventSource(APIBaseModel):
+class SQSEventSource(DeferredAPIBaseModel):
     access_key: Annotated[
         v1_1.SecretKeySelector | None,
         Field(
@@ -1080,7 +1080,7 @@ class SQSEventSource(APIBaseModel):
     ] = None
 
 
-class TLSConfig(APIBaseModel):
+class TLSConfig(DeferredAPIBaseModel):
     ca_cert_secret: Annotated[
         v1_1.SecretKeySelector | None,
         Field(
@@ -1114,7 +1114,7 @@ class TLSConfig(APIBaseModel):
     ] = None
 
 
-class WebhookContext(APIBaseModel):
+class WebhookContext(DeferredAPIBaseModel):
     auth_secret: Annotated[
         v1_1.SecretKeySelector | None,
         Field(
@@ -1172,12 +1172,12 @@ class WebhookContext(APIBaseModel):
     url: Annotated[str | None, Field(description="URL is the url of the server.")] = None
 
 
-class ValueFromSource(APIBaseModel):
+class ValueFromSource(DeferredAPIBaseModel):
     config_map_key_ref: Annotated[v1_1.ConfigMapKeySelector | None, Field(alias="configMapKeyRef")] = None
     secret_key_ref: Annotated[v1_1.SecretKeySelector | None, Field(alias="secretKeyRef")] = None
 
 
-class Backoff(APIBaseModel):
+class Backoff(DeferredAPIBaseModel):
     duration: Annotated[
         Int64OrString | None,
         Field(title=('The initial duration in nanoseconds or strings like "1s", "3m"\n+optional')),
@@ -1193,7 +1193,7 @@ class Backoff(APIBaseModel):
     steps: Annotated[int | None, Field(title="Exit with error after this many steps\n+optional")] = None
 
 
-class ConditionsResetCriteria(APIBaseModel):
+class ConditionsResetCriteria(DeferredAPIBaseModel):
     by_time: Annotated[
         ConditionsResetByTime | None,
         Field(
@@ -1203,7 +1203,7 @@ class ConditionsResetCriteria(APIBaseModel):
     ] = None
 
 
-class EventPersistence(APIBaseModel):
+class EventPersistence(DeferredAPIBaseModel):
     catchup: Annotated[
         CatchupConfiguration | None,
         Field(title=("Catchup enables to triggered the missed schedule when eventsource restarts")),
@@ -1214,7 +1214,7 @@ class EventPersistence(APIBaseModel):
     ] = None
 
 
-class FileEventSource(APIBaseModel):
+class FileEventSource(DeferredAPIBaseModel):
     event_type: Annotated[
         str | None,
         Field(
@@ -1243,7 +1243,7 @@ class FileEventSource(APIBaseModel):
     ] = None
 
 
-class HDFSEventSource(APIBaseModel):
+class HDFSEventSource(DeferredAPIBaseModel):
     addresses: list[str] | None = None
     check_interval: Annotated[
         str | None,
@@ -1333,7 +1333,7 @@ class HDFSEventSource(APIBaseModel):
     watch_path_config: Annotated[WatchPathConfig | None, Field(alias="watchPathConfig")] = None
 
 
-class SFTPEventSource(APIBaseModel):
+class SFTPEventSource(DeferredAPIBaseModel):
     address: Annotated[v1_1.SecretKeySelector | None, Field(description="Address sftp address.")] = None
     event_type: Annotated[
         str | None,
@@ -1389,7 +1389,7 @@ class SFTPEventSource(APIBaseModel):
     ] = None
 
 
-class S3Artifact(APIBaseModel):
+class S3Artifact(DeferredAPIBaseModel):
     access_key: Annotated[v1_1.SecretKeySelector | None, Field(alias="accessKey")] = None
     bucket: S3Bucket | None = None
     ca_certificate: Annotated[v1_1.SecretKeySelector | None, Field(alias="caCertificate")] = None
@@ -1402,7 +1402,7 @@ class S3Artifact(APIBaseModel):
     secret_key: Annotated[v1_1.SecretKeySelector | None, Field(alias="secretKey")] = None
 
 
-class TriggerParameter(APIBaseModel):
+class TriggerParameter(DeferredAPIBaseModel):
     dest: Annotated[
         str | None,
         Field(
@@ -1430,7 +1430,7 @@ class TriggerParameter(APIBaseModel):
     ] = None
 
 
-class ResourceEventSource(APIBaseModel):
+class ResourceEventSource(DeferredAPIBaseModel):
     event_types: Annotated[
         list[str] | None,
         Field(
@@ -1463,7 +1463,7 @@ class ResourceEventSource(APIBaseModel):
     namespace: Annotated[str | None, Field(title="Namespace where resource is deployed")] = None
 
 
-class NATSAuth(APIBaseModel):
+class NATSAuth(DeferredAPIBaseModel):
     basic: Annotated[
         BasicAuth | None,
         Field(title="Baisc auth with username and password\n+optional"),
@@ -1476,7 +1476,7 @@ class NATSAuth(APIBaseModel):
     token: Annotated[v1_1.SecretKeySelector | None, Field(title="Token used to connect\n+optional")] = None
 
 
-class SchemaRegistryConfig(APIBaseModel):
+class SchemaRegistryConfig(DeferredAPIBaseModel):
     auth: Annotated[
         BasicAuth | None,
         Field(title="+optional\nSchemaRegistry - basic authentication"),
@@ -1485,7 +1485,7 @@ class SchemaRegistryConfig(APIBaseModel):
     url: Annotated[str | None, Field(description="Schema Registry URL.")] = None
 
 
-class BitbucketAuth(APIBaseModel):
+class BitbucketAuth(DeferredAPIBaseModel):
     basic: Annotated[
         BitbucketBasicAuth | None,
         Field(title="Basic is BasicAuth auth strategy.\n+optional"),
@@ -1499,7 +1499,7 @@ class BitbucketAuth(APIBaseModel):
     ] = None
 
 
-class GitArtifact(APIBaseModel):
+class GitArtifact(DeferredAPIBaseModel):
     branch: Annotated[str | None, Field(title="Branch to use to pull trigger resource\n+optional")] = None
     clone_directory: Annotated[
         str | None,
@@ -1551,7 +1551,7 @@ class GitArtifact(APIBaseModel):
     url: Annotated[str | None, Field(title="Git URL")] = None
 
 
-class AzureServiceBusEventSource(APIBaseModel):
+class AzureServiceBusEventSource(DeferredAPIBaseModel):
     connection_string: Annotated[
         v1_1.SecretKeySelector | None,
         Field(
@@ -1616,7 +1616,7 @@ class AzureServiceBusEventSource(APIBaseModel):
     ] = None
 
 
-class AzureServiceBusTrigger(APIBaseModel):
+class AzureServiceBusTrigger(DeferredAPIBaseModel):
     connection_string: Annotated[
         v1_1.SecretKeySelector | None,
         Field(
@@ -1668,7 +1668,7 @@ class AzureServiceBusTrigger(APIBaseModel):
     ] = None
 
 
-class RedisEventSource(APIBaseModel):
+class RedisEventSource(DeferredAPIBaseModel):
     channels: list[str] | None = None
     db: Annotated[
         int | None,
@@ -1718,7 +1718,7 @@ class RedisEventSource(APIBaseModel):
     ] = None
 
 
-class RedisStreamEventSource(APIBaseModel):
+class RedisStreamEventSource(DeferredAPIBaseModel):
     consumer_group: Annotated[
         str | None,
         Field(
@@ -1784,7 +1784,7 @@ class RedisStreamEventSource(APIBaseModel):
     ] = None
 
 
-class BitbucketServerEventSource(APIBaseModel):
+class BitbucketServerEventSource(DeferredAPIBaseModel):
     access_token: Annotated[
         v1_1.SecretKeySelector | None,
         Field(
@@ -1923,7 +1923,7 @@ class BitbucketServerEventSource(APIBaseModel):
     ] = None
 
 
-class GerritEventSource(APIBaseModel):
+class GerritEventSource(DeferredAPIBaseModel):
     auth: Annotated[
         BasicAuth | None,
         Field(title="Auth hosts secret selectors for username and password\n+optional"),
@@ -1976,7 +1976,7 @@ class GerritEventSource(APIBaseModel):
     ] = None
 
 
-class GithubEventSource(APIBaseModel):
+class GithubEventSource(DeferredAPIBaseModel):
     active: Annotated[
         bool | None,
         Field(
@@ -2100,7 +2100,7 @@ class GithubEventSource(APIBaseModel):
     ] = None
 
 
-class GitlabEventSource(APIBaseModel):
+class GitlabEventSource(DeferredAPIBaseModel):
     access_token: Annotated[
         v1_1.SecretKeySelector | None,
         Field(
@@ -2191,7 +2191,7 @@ class GitlabEventSource(APIBaseModel):
     ] = None
 
 
-class SNSEventSource(APIBaseModel):
+class SNSEventSource(DeferredAPIBaseModel):
     access_key: Annotated[
         v1_1.SecretKeySelector | None,
         Field(
@@ -2238,7 +2238,7 @@ class SNSEventSource(APIBaseModel):
     webhook: Annotated[WebhookContext | None, Field(title="Webhook configuration for http server")] = None
 
 
-class SlackEventSource(APIBaseModel):
+class SlackEventSource(DeferredAPIBaseModel):
     filter: Annotated[EventSourceFilter | None, Field(title="Filter\n+optional")] = None
     metadata: Annotated[
         dict[str, str] | None,
@@ -2260,7 +2260,7 @@ class SlackEventSource(APIBaseModel):
     ] = None
 
 
-class StorageGridEventSource(APIBaseModel):
+class StorageGridEventSource(DeferredAPIBaseModel):
     api_url: Annotated[
         str | None,
         Field(alias="apiURL", description="APIURL is the url of the storagegrid api."),
@@ -2292,7 +2292,7 @@ class StorageGridEventSource(APIBaseModel):
     ] = None
 
 
-class StripeEventSource(APIBaseModel):
+class StripeEventSource(DeferredAPIBaseModel):
     api_key: Annotated[
         v1_1.SecretKeySelector | None,
         Field(
@@ -2333,12 +2333,12 @@ class StripeEventSource(APIBaseModel):
     ] = None
 
 
-class WebhookEventSource(APIBaseModel):
+class WebhookEventSource(DeferredAPIBaseModel):
     filter: Annotated[EventSourceFilter | None, Field(title="Filter\n+optional")] = None
     webhook_context: Annotated[WebhookContext | None, Field(alias="webhookContext")] = None
 
 
-class SecureHeader(APIBaseModel):
+class SecureHeader(DeferredAPIBaseModel):
     name: str | None = None
     value_from: Annotated[
         ValueFromSource | None,
@@ -2349,7 +2349,7 @@ class SecureHeader(APIBaseModel):
     ] = None
 
 
-class AMQPEventSource(APIBaseModel):
+class AMQPEventSource(DeferredAPIBaseModel):
     auth: Annotated[
         BasicAuth | None,
         Field(title="Auth hosts secret selectors for username and password\n+optional"),
@@ -2451,7 +2451,7 @@ class AMQPEventSource(APIBaseModel):
     ] = None
 
 
-class EmitterEventSource(APIBaseModel):
+class EmitterEventSource(DeferredAPIBaseModel):
     broker: Annotated[str | None, Field(description="Broker URI to connect to.")] = None
     channel_key: Annotated[
         str | None,
@@ -2496,7 +2496,7 @@ class EmitterEventSource(APIBaseModel):
     ] = None
 
 
-class K8SResourcePolicy(APIBaseModel):
+class K8SResourcePolicy(DeferredAPIBaseModel):
     backoff: Annotated[Backoff | None, Field(title="Backoff before checking resource state")] = None
     error_on_backoff_timeout: Annotated[
         bool | None,
@@ -2515,7 +2515,7 @@ class K8SResourcePolicy(APIBaseModel):
     ] = None
 
 
-class KafkaEventSource(APIBaseModel):
+class KafkaEventSource(DeferredAPIBaseModel):
     config: Annotated[
         str | None,
         Field(
@@ -2584,7 +2584,7 @@ class KafkaEventSource(APIBaseModel):
     ] = None
 
 
-class MQTTEventSource(APIBaseModel):
+class MQTTEventSource(DeferredAPIBaseModel):
     auth: Annotated[
         BasicAuth | None,
         Field(title="Auth hosts secret selectors for username and password\n+optional"),
@@ -2619,7 +2619,7 @@ class MQTTEventSource(APIBaseModel):
     url: Annotated[str | None, Field(title="URL to connect to broker")] = None
 
 
-class NSQEventSource(APIBaseModel):
+class NSQEventSource(DeferredAPIBaseModel):
     channel: Annotated[str | None, Field(title="Channel used for subscription")] = None
     connection_backoff: Annotated[
         Backoff | None,
@@ -2656,7 +2656,7 @@ class NSQEventSource(APIBaseModel):
     topic: Annotated[str | None, Field(description="Topic to subscribe to.")] = None
 
 
-class PulsarEventSource(APIBaseModel):
+class PulsarEventSource(DeferredAPIBaseModel):
     auth_athenz_params: Annotated[
         dict[str, str] | None,
         Field(
@@ -2751,7 +2751,7 @@ class PulsarEventSource(APIBaseModel):
     ] = None
 
 
-class PulsarTrigger(APIBaseModel):
+class PulsarTrigger(DeferredAPIBaseModel):
     auth_athenz_params: Annotated[
         dict[str, str] | None,
         Field(
@@ -2838,7 +2838,7 @@ class PulsarTrigger(APIBaseModel):
     ] = None
 
 
-class CalendarEventSource(APIBaseModel):
+class CalendarEventSource(DeferredAPIBaseModel):
     exclusion_dates: Annotated[
         list[str] | None,
         Field(
@@ -2872,7 +2872,7 @@ class CalendarEventSource(APIBaseModel):
     timezone: Annotated[str | None, Field(title="Timezone in which to run the schedule\n+optional")] = None
 
 
-class NATSEventsSource(APIBaseModel):
+class NATSEventsSource(DeferredAPIBaseModel):
     auth: Annotated[NATSAuth | None, Field(title="Auth information\n+optional")] = None
     connection_backoff: Annotated[
         Backoff | None,
@@ -2916,7 +2916,7 @@ class NATSEventsSource(APIBaseModel):
     url: Annotated[str | None, Field(title="URL to connect to NATS cluster")] = None
 
 
-class NATSTrigger(APIBaseModel):
+class NATSTrigger(DeferredAPIBaseModel):
     auth: Annotated[NATSAuth | None, Field(title="AuthInformation\n+optional")] = None
     parameters: list[TriggerParameter] | None = None
     payload: list[TriggerParameter] | None = None
@@ -2928,7 +2928,7 @@ class NATSTrigger(APIBaseModel):
     url: Annotated[str | None, Field(description="URL of the NATS cluster.")] = None
 
 
-class KafkaTrigger(APIBaseModel):
+class KafkaTrigger(DeferredAPIBaseModel):
     compress: Annotated[
         bool | None,
         Field(
@@ -3022,7 +3022,7 @@ class KafkaTrigger(APIBaseModel):
     ] = None
 
 
-class BitbucketEventSource(APIBaseModel):
+class BitbucketEventSource(DeferredAPIBaseModel):
     auth: Annotated[
         BitbucketAuth | None,
         Field(description="Auth information required to connect to Bitbucket."),
@@ -3087,7 +3087,7 @@ class BitbucketEventSource(APIBaseModel):
     ] = None
 
 
-class ArtifactLocation(APIBaseModel):
+class ArtifactLocation(DeferredAPIBaseModel):
     configmap: Annotated[
         v1_1.ConfigMapKeySelector | None,
         Field(title="Configmap that stores the artifact"),
@@ -3103,7 +3103,7 @@ class ArtifactLocation(APIBaseModel):
     url: Annotated[URLArtifact | None, Field(title="URL to fetch the artifact from")] = None
 
 
-class TriggerPolicy(APIBaseModel):
+class TriggerPolicy(DeferredAPIBaseModel):
     k8s: Annotated[
         K8SResourcePolicy | None,
         Field(
@@ -3119,7 +3119,7 @@ class TriggerPolicy(APIBaseModel):
     ] = None
 
 
-class ArgoWorkflowTrigger(APIBaseModel):
+class ArgoWorkflowTrigger(DeferredAPIBaseModel):
     args: Annotated[
         list[str] | None,
         Field(title="Args is the list of arguments to pass to the argo CLI"),
@@ -3140,7 +3140,7 @@ class ArgoWorkflowTrigger(APIBaseModel):
     source: Annotated[ArtifactLocation | None, Field(title="Source of the K8s resource file(s)")] = None
 
 
-class StandardK8STrigger(APIBaseModel):
+class StandardK8STrigger(DeferredAPIBaseModel):
     live_object: Annotated[
         bool | None,
         Field(
@@ -3184,7 +3184,7 @@ class StandardK8STrigger(APIBaseModel):
     source: Annotated[ArtifactLocation | None, Field(title="Source of the K8s resource file(s)")] = None
 
 
-class Status(APIBaseModel):
+class Status(DeferredAPIBaseModel):
     conditions: Annotated[
         list[Condition] | None,
         Field(
@@ -3196,7 +3196,7 @@ class Status(APIBaseModel):
     ] = None
 
 
-class ExprFilter(APIBaseModel):
+class ExprFilter(DeferredAPIBaseModel):
     expr: Annotated[
         str | None,
         Field(description=("Expr refers to the expression that determines the outcome of the filter.")),
@@ -3207,7 +3207,7 @@ class ExprFilter(APIBaseModel):
     ] = None
 
 
-class AWSLambdaTrigger(APIBaseModel):
+class AWSLambdaTrigger(DeferredAPIBaseModel):
     access_key: Annotated[
         v1_1.SecretKeySelector | None,
         Field(
@@ -3273,7 +3273,7 @@ class AWSLambdaTrigger(APIBaseModel):
     ] = None
 
 
-class AzureEventHubsTrigger(APIBaseModel):
+class AzureEventHubsTrigger(DeferredAPIBaseModel):
     fqdn: Annotated[
         str | None,
         Field(
@@ -3323,7 +3323,7 @@ class AzureEventHubsTrigger(APIBaseModel):
     ] = None
 
 
-class CustomTrigger(APIBaseModel):
+class CustomTrigger(DeferredAPIBaseModel):
     cert_secret: Annotated[
         v1_1.SecretKeySelector | None,
         Field(
@@ -3381,7 +3381,7 @@ class CustomTrigger(APIBaseModel):
     ] = None
 
 
-class EmailTrigger(APIBaseModel):
+class EmailTrigger(DeferredAPIBaseModel):
     body: Annotated[
         str | None,
         Field(title="Body refers to the body/content of the email send.\n+optional"),
@@ -3434,7 +3434,7 @@ class EmailTrigger(APIBaseModel):
     ] = None
 
 
-class OpenWhiskTrigger(APIBaseModel):
+class OpenWhiskTrigger(DeferredAPIBaseModel):
     action_name: Annotated[
         str | None,
         Field(alias="actionName", description="Name of the action/function."),
@@ -3468,15 +3468,15 @@ class OpenWhiskTrigger(APIBaseModel):
     version: Annotated[str | None, Field(title="Version for the API.\nDefaults to v1.\n+optional")] = None
 
 
-class EventSourceStatus(APIBaseModel):
+class EventSourceStatus(DeferredAPIBaseModel):
     status: Status | None = None
 
 
-class SensorStatus(APIBaseModel):
+class SensorStatus(DeferredAPIBaseModel):
     status: Status | None = None
 
 
-class Service(APIBaseModel):
+class Service(DeferredAPIBaseModel):
     cluster_ip: Annotated[
         str | None,
         Field(
@@ -3512,7 +3512,7 @@ class Service(APIBaseModel):
     ] = None
 
 
-class SlackTrigger(APIBaseModel):
+class SlackTrigger(DeferredAPIBaseModel):
     attachments: Annotated[
         str | None,
         Field(
@@ -3573,7 +3573,7 @@ class SlackTrigger(APIBaseModel):
     ] = None
 
 
-class EventDependencyFilter(APIBaseModel):
+class EventDependencyFilter(DeferredAPIBaseModel):
     context: Annotated[EventContext | None, Field(title="Context filter constraints")] = None
     data: Annotated[list[DataFilter] | None, Field(title="Data filter constraints with escalation")] = None
     data_logical_operator: Annotated[
@@ -3614,7 +3614,7 @@ class EventDependencyFilter(APIBaseModel):
     time: Annotated[TimeFilter | None, Field(title="Time filter on the event with escalation")] = None
 
 
-class HTTPTrigger(APIBaseModel):
+class HTTPTrigger(DeferredAPIBaseModel):
     basic_auth: Annotated[
         BasicAuth | None,
         Field(
@@ -3663,7 +3663,7 @@ class HTTPTrigger(APIBaseModel):
     url: Annotated[str | None, Field(description="URL refers to the URL to send HTTP request to.")] = None
 
 
-class Container(APIBaseModel):
+class Container(DeferredAPIBaseModel):
     env: Annotated[list[v1_1.EnvVar] | None, Field(title="+optional")] = None
     env_from: Annotated[list[v1_1.EnvFromSource] | None, Field(alias="envFrom", title="+optional")] = None
     image_pull_policy: Annotated[str | None, Field(alias="imagePullPolicy", title="+optional")] = None
@@ -3672,7 +3672,7 @@ class Container(APIBaseModel):
     volume_mounts: Annotated[list[v1_1.VolumeMount] | None, Field(alias="volumeMounts", title="+optional")] = None
 
 
-class EventDependency(APIBaseModel):
+class EventDependency(DeferredAPIBaseModel):
     event_name: Annotated[str | None, Field(alias="eventName", title="EventName is the name of the event")] = None
     event_source_name: Annotated[
         str | None,
@@ -3707,7 +3707,7 @@ class EventDependency(APIBaseModel):
     ] = None
 
 
-class TriggerTemplate(APIBaseModel):
+class TriggerTemplate(DeferredAPIBaseModel):
     argo_workflow: Annotated[
         ArgoWorkflowTrigger | None,
         Field(
@@ -3818,7 +3818,7 @@ class TriggerTemplate(APIBaseModel):
     ] = None
 
 
-class Trigger(APIBaseModel):
+class Trigger(DeferredAPIBaseModel):
     at_least_once: Annotated[
         bool | None,
         Field(
@@ -3869,7 +3869,7 @@ class Trigger(APIBaseModel):
     ] = None
 
 
-class Template(APIBaseModel):
+class Template(DeferredAPIBaseModel):
     affinity: Annotated[
         v1_1.Affinity | None,
         Field(title="If specified, the pod's scheduling constraints\n+optional"),
@@ -3974,7 +3974,7 @@ class Template(APIBaseModel):
     ] = None
 
 
-class EventSourceSpec(APIBaseModel):
+class EventSourceSpec(DeferredAPIBaseModel):
     amqp: Annotated[dict[str, AMQPEventSource] | None, Field(title="AMQP event sources")] = None
     azure_events_hub: Annotated[
         dict[str, AzureEventsHubEventSource] | None,
@@ -4045,7 +4045,7 @@ class EventSourceSpec(APIBaseModel):
     webhook: Annotated[dict[str, WebhookEventSource] | None, Field(title="Webhook event sources")] = None
 
 
-class SensorSpec(APIBaseModel):
+class SensorSpec(DeferredAPIBaseModel):
     dependencies: Annotated[
         list[EventDependency] | None,
         Field(description=("Dependencies is a list of the events that this sensor is dependent on.")),
@@ -4097,26 +4097,23 @@ class SensorSpec(APIBaseModel):
     ] = None
 
 
-class EventSource(APIBaseModel):
+class EventSource(DeferredAPIBaseModel):
     metadata: v1.ObjectMeta | None = None
     spec: EventSourceSpec | None = None
     status: Annotated[EventSourceStatus | None, Field(title="+optional")] = None
 
 
-class Sensor(APIBaseModel):
+class Sensor(DeferredAPIBaseModel):
     metadata: v1.ObjectMeta | None = None
     spec: SensorSpec | None = None
     status: Annotated[SensorStatus | None, Field(title="+optional")] = None
 
 
-class EventSourceList(APIBaseModel):
+class EventSourceList(DeferredAPIBaseModel):
     items: list[EventSource] | None = None
     metadata: v1.ListMeta | None = None
 
 
-class SensorList(APIBaseModel):
+class SensorList(DeferredAPIBaseModel):
     items: list[Sensor] | None = None
     metadata: v1.ListMeta | None = None
-
-
-Trigger.model_rebuild()
@@ -5,9 +5,9 @@ from __future__ import annotations
 
 from typing import Annotated, Any
 
-from pydantic import Base64Str, Field, RootModel
+from pydantic import Base64Str, ConfigDict, Field, RootModel
 
-from hera.shared._pydantic import APIBaseModel
+from hera.shared._pydantic import DeferredAPIBaseModel
 
 from ...k8s.api.core import v1
 from ...k8s.api.policy import v1 as v1_2
@@ -16,14 +16,16 @@ from ...k8s.apimachinery.pkg.util import intstr
 
 
 class Amount(RootModel[float]):
+    model_config = ConfigDict(defer_build=True)
+
     root: Annotated[float, Field(description="Amount represent a numeric amount.")]
 
 
-class NoneStrategy(APIBaseModel):
+class NoneStrategy(DeferredAPIBaseModel):
     pass
 
 
-class TarStrategy(APIBaseModel):
+class TarStrategy(DeferredAPIBaseModel):
     compression_level: Annotated[
         int | None,
         Field(
@@ -36,15 +38,15 @@ class TarStrategy(APIBaseModel):
     ] = None
 
 
-class ZipStrategy(APIBaseModel):
+class ZipStrategy(DeferredAPIBaseModel):
     pass
 
 
-class ArchivedWorkflowDeletedResponse(APIBaseModel):
+class ArchivedWorkflowDeletedResponse(DeferredAPIBaseModel):
     pass
 
 
-class ArtGCStatus(APIBaseModel):
+class ArtGCStatus(DeferredAPIBaseModel):
     not_specified: Annotated[
         bool | None,
         Field(
@@ -74,7 +76,7 @@ class ArtGCStatus(APIBaseModel):
     ] = None
 
 
-class PluginArtifact(APIBaseModel):
+class PluginArtifact(DeferredAPIBaseModel):
     configuration: Annotated[
         str | None,
         Field(description=("Configuration is the plugin defined configuration for the artifact driver plugin")),
@@ -96,22 +98,22 @@ class PluginArtifact(APIBaseModel):
     name: Annotated[str | None, Field(description="Name is the name of the artifact driver plugin")] = None
 
 
-class RawArtifact(APIBaseModel):
+class RawArtifact(DeferredAPIBaseModel):
     data: Annotated[str, Field(description="Data is the string contents of the artifact")]
 
 
-class Metadata(APIBaseModel):
+class Metadata(DeferredAPIBaseModel):
     annotations: dict[str, str] | None = None
     labels: dict[str, str] | None = None
 
 
-class PluginArtifactRepository(APIBaseModel):
+class PluginArtifactRepository(DeferredAPIBaseModel):
     configuration: str
     key_format: Annotated[str | None, Field(alias="keyFormat")] = None
     name: str
 
 
-class ArtifactRepositoryRef(APIBaseModel):
+class ArtifactRepositoryRef(DeferredAPIBaseModel):
     config_map: Annotated[
         str | None,
         Field(
@@ -130,19 +132,19 @@ class ArtifactRepositoryRef(APIBaseModel):
     ] = None
 
 
-class ClusterWorkflowTemplateDeleteResponse(APIBaseModel):
+class ClusterWorkflowTemplateDeleteResponse(DeferredAPIBaseModel):
     pass
 
 
-class CollectEventRequest(APIBaseModel):
+class CollectEventRequest(DeferredAPIBaseModel):
     name: str | None = None
 
 
-class CollectEventResponse(APIBaseModel):
+class CollectEventResponse(DeferredAPIBaseModel):
     pass
 
 
-class Column(APIBaseModel):
+class Column(DeferredAPIBaseModel):
     key: Annotated[
         str,
         Field(description=('The key of the label or annotation, e.g., "workflows.argoproj.io/completed".')),
@@ -151,38 +153,38 @@ class Column(APIBaseModel):
     type: Annotated[str, Field(description='The type of this column, "label" or "annotation".')]
 
 
-class Condition(APIBaseModel):
+class Condition(DeferredAPIBaseModel):
     message: Annotated[str | None, Field(description="Message is the condition message")] = None
     status: Annotated[str | None, Field(description="Status is the status of the condition")] = None
     type: Annotated[str | None, Field(description="Type is the type of condition")] = None
 
 
-class ContinueOn(APIBaseModel):
+class ContinueOn(DeferredAPIBaseModel):
     error: bool | None = None
     failed: bool | None = None
 
 
-class Counter(APIBaseModel):
+class Counter(DeferredAPIBaseModel):
     value: Annotated[str, Field(description="Value is the value of the metric")]
 
 
-class CreateS3BucketOptions(APIBaseModel):
+class CreateS3BucketOptions(DeferredAPIBaseModel):
     object_locking: Annotated[
         bool | None,
         Field(alias="objectLocking", description="ObjectLocking Enable object locking"),
     ] = None
 
 
-class CronWorkflowDeletedResponse(APIBaseModel):
+class CronWorkflowDeletedResponse(DeferredAPIBaseModel):
     pass
 
 
-class CronWorkflowResumeRequest(APIBaseModel):
+class CronWorkflowResumeRequest(DeferredAPIBaseModel):
     name: str | None = None
     namespace: str | None = None
 
 
-class StopStrategy(APIBaseModel):
+class StopStrategy(DeferredAPIBaseModel):
     expression: Annotated[
         str,
         Field(
@@ -196,12 +198,12 @@ class StopStrategy(APIBaseModel):
     ]
 
 
-class CronWorkflowSuspendRequest(APIBaseModel):
+class CronWorkflowSuspendRequest(DeferredAPIBaseModel):
     name: str | None = None
     namespace: str | None = None
 
 
-class TemplateRef(APIBaseModel):
+class TemplateRef(DeferredAPIBaseModel):
     cluster_scope: Annotated[
         bool | None,
         Field(
@@ -218,7 +220,7 @@ class TemplateRef(APIBaseModel):
     ] = None
 
 
-class Event(APIBaseModel):
+class Event(DeferredAPIBaseModel):
     selector: Annotated[
         str,
         Field(
@@ -230,11 +232,11 @@ class Event(APIBaseModel):
     ]
 
 
-class EventResponse(APIBaseModel):
+class EventResponse(DeferredAPIBaseModel):
     pass
 
 
-class ExecutorConfig(APIBaseModel):
+class ExecutorConfig(DeferredAPIBaseModel):
     service_account_name: Annotated[
         str | None,
         Field(
@@ -244,7 +246,7 @@ class ExecutorConfig(APIBaseModel):
     ] = None
 
 
-class Gauge(APIBaseModel):
+class Gauge(DeferredAPIBaseModel):
     operation: Annotated[
         str | None,
         Field(description=("Operation defines the operation to apply with value and the metrics' current value")),
@@ -263,7 +265,7 @@ class Gauge(APIBaseModel):
     ]
 
 
-class GetUserInfoResponse(APIBaseModel):
+class GetUserInfoResponse(DeferredAPIBaseModel):
     email: str | None = None
     email_verified: Annotated[bool | None, Field(alias="emailVerified")] = None
     groups: list[str] | None = None
@@ -274,16 +276,16 @@ class GetUserInfoResponse(APIBaseModel):
     subject: str | None = None
 
 
-class HTTPBodySource(APIBaseModel):
+class HTTPBodySource(DeferredAPIBaseModel):
     bytes: Base64Str | None = None
 
 
-class Header(APIBaseModel):
+class Header(DeferredAPIBaseModel):
     name: Annotated[str, Field(description="Name is the header name")]
     value: Annotated[str, Field(description="Value is the literal value to use for the header")]
 
 
-class Histogram(APIBaseModel):
+class Histogram(DeferredAPIBaseModel):
     buckets: Annotated[
         list[Amount],
         Field(description="Buckets is a list of bucket divisors for the histogram"),
@@ -292,6 +294,8 @@ class Histogram(APIBaseModel):
 
 
 class Item(RootModel[Any]):
+    model_config = ConfigDict(defer_build=True)
+
     root: Annotated[
         Any,
         Field(
@@ -303,19 +307,19 @@ class Item(RootModel[Any]):
     ]
 
 
-class LabelKeys(APIBaseModel):
+class LabelKeys(DeferredAPIBaseModel):
     items: list[str] | None = None
 
 
-class LabelValueFrom(APIBaseModel):
+class LabelValueFrom(DeferredAPIBaseModel):
     expression: str
 
 
-class LabelValues(APIBaseModel):
+class LabelValues(DeferredAPIBaseModel):
     items: list[str] | None = None
 
 
-class Link(APIBaseModel):
+class Link(DeferredAPIBaseModel):
     name: Annotated[
         str,
         Field(description='The name of the link, E.g. "Workflow Logs" or "Pod Logs"'),
@@ -351,12 +355,12 @@ class Link(APIBaseModel):
     ]
 
 
-class LogEntry(APIBaseModel):
+class LogEntry(DeferredAPIBaseModel):
     content: str | None = None
     pod_name: Annotated[str | None, Field(alias="podName")] = None
 
 
-class MemoizationStatus(APIBaseModel):
+class MemoizationStatus(DeferredAPIBaseModel):
     cache_name: Annotated[
         str,
         Field(
@@ -371,12 +375,12 @@ class MemoizationStatus(APIBaseModel):
     key: Annotated[str, Field(description="Key is the name of the key used for this node's cache")]
 
 
-class MetricLabel(APIBaseModel):
+class MetricLabel(DeferredAPIBaseModel):
     key: str
     value: str
 
 
-class Mutex(APIBaseModel):
+class Mutex(DeferredAPIBaseModel):
     database: Annotated[
         bool | None,
         Field(description=("Database specifies this is database controlled if this is set true")),
@@ -388,7 +392,7 @@ class Mutex(APIBaseModel):
     ] = None
 
 
-class MutexHolding(APIBaseModel):
+class MutexHolding(DeferredAPIBaseModel):
     holder: Annotated[
         str | None,
         Field(
@@ -407,7 +411,7 @@ class MutexHolding(APIBaseModel):
     ] = None
 
 
-class MutexStatus(APIBaseModel):
+class MutexStatus(DeferredAPIBaseModel):
     holding: Annotated[
         list[MutexHolding] | None,
         Field(
@@ -423,7 +427,7 @@ class MutexStatus(APIBaseModel):
     ] = None
 
 
-class NodeFlag(APIBaseModel):
+class NodeFlag(DeferredAPIBaseModel):
     hooked: Annotated[
         bool | None,
         Field(description=("Hooked tracks whether or not this node was triggered by hook or onExit")),
@@ -434,14 +438,14 @@ class NodeFlag(APIBaseModel):
     ] = None
 
 
-class NodeSynchronizationStatus(APIBaseModel):
+class NodeSynchronizationStatus(DeferredAPIBaseModel):
     waiting: Annotated[
         str | None,
         Field(description="Waiting is the name of the lock that this node is waiting for"),
     ] = None
 
 
-class OAuth2EndpointParam(APIBaseModel):
+class OAuth2EndpointParam(DeferredAPIBaseModel):
     key: Annotated[str, Field(description="Name is the header name")]
     value: Annotated[
         str | None,
@@ -449,7 +453,7 @@ class OAuth2EndpointParam(APIBaseModel):
     ] = None
 
 
-class OSSLifecycleRule(APIBaseModel):
+class OSSLifecycleRule(DeferredAPIBaseModel):
     mark_deletion_after_days: Annotated[
         int | None,
         Field(
@@ -469,11 +473,11 @@ class OSSLifecycleRule(APIBaseModel):
     ] = None
 
 
-class Plugin(APIBaseModel):
+class Plugin(DeferredAPIBaseModel):
     pass
 
 
-class ResubmitArchivedWorkflowRequest(APIBaseModel):
+class ResubmitArchivedWorkflowRequest(DeferredAPIBaseModel):
     memoized: bool | None = None
     name: str | None = None
     namespace: str | None = None
@@ -481,11 +485,11 @@ class ResubmitArchivedWorkflowRequest(APIBaseModel):
     uid: str | None = None
 
 
-class RetryNodeAntiAffinity(APIBaseModel):
+class RetryNodeAntiAffinity(DeferredAPIBaseModel):
     pass
 
 
-class RetryArchivedWorkflowRequest(APIBaseModel):
+class RetryArchivedWorkflowRequest(DeferredAPIBaseModel):
     name: str | None = None
     namespace: str | None = None
     node_field_selector: Annotated[str | None, Field(alias="nodeFieldSelector")] = None
@@ -494,7 +498,7 @@ class RetryArchivedWorkflowRequest(APIBaseModel):
     uid: str | None = None
 
 
-class SemaphoreHolding(APIBaseModel):
+class SemaphoreHolding(DeferredAPIBaseModel):
     holders: Annotated[
         list[str] | None,
         Field(description=("Holders stores the list of current holder names in the io.argoproj.workflow.v1alpha1.")),
@@ -502,11 +506,11 @@ class SemaphoreHolding(APIBaseModel):
     semaphore: Annotated[str | None, Field(description="Semaphore stores the semaphore name.")] = None
 
 
-class SyncDatabaseRef(APIBaseModel):
+class SyncDatabaseRef(DeferredAPIBaseModel):
     key: str
 
 
-class SemaphoreStatus(APIBaseModel):
+class SemaphoreStatus(DeferredAPIBaseModel):
     holding: Annotated[
         list[SemaphoreHolding] | None,
         Field(description=("Holding stores the list of resource acquired synchronization lock for workflows.")),
@@ -517,7 +521,7 @@ class SemaphoreStatus(APIBaseModel):
     ] = None
 
 
-class WorkflowTemplateRef(APIBaseModel):
+class WorkflowTemplateRef(DeferredAPIBaseModel):
     cluster_scope: Annotated[
         bool | None,
         Field(
@@ -533,11 +537,11 @@ class WorkflowTemplateRef(APIBaseModel):
     ] = None
 
 
-class SuppliedValueFrom(APIBaseModel):
+class SuppliedValueFrom(DeferredAPIBaseModel):
     pass
 
 
-class SuspendTemplate(APIBaseModel):
+class SuspendTemplate(DeferredAPIBaseModel):
     duration: Annotated[
         str | None,
         Field(
@@ -550,7 +554,7 @@ class SuspendTemplate(APIBaseModel):
     ] = None
 
 
-class TTLStrategy(APIBaseModel):
+class TTLStrategy(DeferredAPIBaseModel):
     seconds_after_completion: Annotated[
         int | None,
         Field(
@@ -574,11 +578,11 @@ class TTLStrategy(APIBaseModel):
     ] = None
 
 
-class TransformationStep(APIBaseModel):
+class TransformationStep(DeferredAPIBaseModel):
     expression: Annotated[str, Field(description="Expression defines an expr expression to apply")]
 
 
-class Version(APIBaseModel):
+class Version(DeferredAPIBaseModel):
     build_date: Annotated[str, Field(alias="buildDate")]
     compiler: str
     git_commit: Annotated[str, Field(alias="gitCommit")]
@@ -589,7 +593,7 @@ class Version(APIBaseModel):
     version: str
 
 
-class VolumeClaimGC(APIBaseModel):
+class VolumeClaimGC(DeferredAPIBaseModel):
     strategy: Annotated[
         str | None,
         Field(
@@ -601,30 +605,30 @@ class VolumeClaimGC(APIBaseModel):
     ] = None
 
 
-class WorkflowDeleteResponse(APIBaseModel):
+class WorkflowDeleteResponse(DeferredAPIBaseModel):
     pass
 
 
-class WorkflowMetadata(APIBaseModel):
+class WorkflowMetadata(DeferredAPIBaseModel):
     annotations: dict[str, str] | None = None
     labels: dict[str, str] | None = None
     labels_from: Annotated[dict[str, LabelValueFrom] | None, Field(alias="labelsFrom")] = None
 
 
-class WorkflowResubmitRequest(APIBaseModel):
+class WorkflowResubmitRequest(DeferredAPIBaseModel):
     memoized: bool | None = None
     name: str | None = None
     namespace: str | None = None
     parameters: list[str] | None = None
 
 
-class WorkflowResumeRequest(APIBaseModel):
+class WorkflowResumeRequest(DeferredAPIBaseModel):
     name: str | None = None
     namespace: str | None = None
     node_field_selector: Annotated[str | None, Field(alias="nodeFieldSelector")] = None
 
 
-class WorkflowRetryRequest(APIBaseModel):
+class WorkflowRetryRequest(DeferredAPIBaseModel):
     name: str | None = None
     namespace: str | None = None
     node_field_selector: Annotated[str | None, Field(alias="nodeFieldSelector")] = None
@@ -632,7 +636,7 @@ class WorkflowRetryRequest(APIBaseModel):
     restart_successful: Annotated[bool | None, Field(alias="restartSuccessful")] = None
 
 
-class WorkflowSetRequest(APIBaseModel):
+class WorkflowSetRequest(DeferredAPIBaseModel):
     message: str | None = None
     name: str | None = None
     namespace: str | None = None
@@ -641,28 +645,28 @@ class WorkflowSetRequest(APIBaseModel):
     phase: str | None = None
 
 
-class WorkflowStopRequest(APIBaseModel):
+class WorkflowStopRequest(DeferredAPIBaseModel):
     message: str | None = None
     name: str | None = None
     namespace: str | None = None
     node_field_selector: Annotated[str | None, Field(alias="nodeFieldSelector")] = None
 
 
-class WorkflowSuspendRequest(APIBaseModel):
+class WorkflowSuspendRequest(DeferredAPIBaseModel):
     name: str | None = None
     namespace: str | None = None
 
 
-class WorkflowTemplateDeleteResponse(APIBaseModel):
+class WorkflowTemplateDeleteResponse(DeferredAPIBaseModel):
     pass
 
 
-class WorkflowTerminateRequest(APIBaseModel):
+class WorkflowTerminateRequest(DeferredAPIBaseModel):
     name: str | None = None
     namespace: str | None = None
 
 
-class CronWorkflowStatus(APIBaseModel):
+class CronWorkflowStatus(DeferredAPIBaseModel):
     active: Annotated[
         list[v1.ObjectReference] | None,
         Field(description=("Active is a list of active workflows stemming from this CronWorkflow")),
@@ -697,7 +701,7 @@ class CronWorkflowStatus(APIBaseModel):
     ] = None
 
 
-class ArtifactoryArtifact(APIBaseModel):
+class ArtifactoryArtifact(DeferredAPIBaseModel):
     password_secret: Annotated[
         v1.SecretKeySelector | None,
         Field(
@@ -715,7 +719,7 @@ class ArtifactoryArtifact(APIBaseModel):
     ] = None
 
 
-class ArtifactoryArtifactRepository(APIBaseModel):
+class ArtifactoryArtifactRepository(DeferredAPIBaseModel):
     key_format: Annotated[
         str | None,
         Field(
@@ -743,7 +747,7 @@ class ArtifactoryArtifactRepository(APIBaseModel):
     ] = None
 
 
-class AzureArtifact(APIBaseModel):
+class AzureArtifact(DeferredAPIBaseModel):
     account_key_secret: Annotated[
         v1.SecretKeySelector | None,
         Field(
@@ -777,7 +781,7 @@ class AzureArtifact(APIBaseModel):
     ] = None
 
 
-class AzureArtifactRepository(APIBaseModel):
+class AzureArtifactRepository(DeferredAPIBaseModel):
     account_key_secret: Annotated[
         v1.SecretKeySelector | None,
         Field(
@@ -816,7 +820,7 @@ class AzureArtifactRepository(APIBaseModel):
     ] = None
 
 
-class BasicAuth(APIBaseModel):
+class BasicAuth(DeferredAPIBaseModel):
     password_secret: Annotated[
         v1.SecretKeySelector | None,
         Field(
@@ -833,12 +837,12 @@ class BasicAuth(APIBaseModel):
     ] = None
 
 
-class ClientCertAuth(APIBaseModel):
+class ClientCertAuth(DeferredAPIBaseModel):
     client_cert_secret: Annotated[v1.SecretKeySelector | None, Field(alias="clientCertSecret")] = None
     client_key_secret: Annotated[v1.SecretKeySelector | None, Field(alias="clientKeySecret")] = None
 
 
-class GCSArtifact(APIBaseModel):
+class GCSArtifact(DeferredAPIBaseModel):
     bucket: Annotated[str | None, Field(description="Bucket is the name of the bucket")] = None
     key: Annotated[
         str,
@@ -853,7 +857,7 @@ class GCSArtifact(APIBaseModel):
     ] = None
 
 
-class GCSArtifactRepository(APIBaseModel):
+class GCSArtifactRepository(DeferredAPIBaseModel):
     bucket: Annotated[str | None, Field(description="Bucket is the name of the bucket")] = None
     key_format: Annotated[
         str | None,
@@ -871,7 +875,7 @@ class GCSArtifactRepository(APIBaseModel):
     ] = None
 
 
-class GitArtifact(APIBaseModel):
+class GitArtifact(DeferredAPIBaseModel):
     branch: Annotated[
         str | None,
         Field(description="Branch is the branch to fetch when `SingleBranch` is enabled"),
@@ -947,11 +951,11 @@ class GitArtifact(APIBaseModel):
     ] = None
 
 
-class HTTPHeaderSource(APIBaseModel):
+class HTTPHeaderSource(DeferredAPIBaseModel):
     secret_key_ref: Annotated[v1.SecretKeySelector | None, Field(alias="secretKeyRef")] = None
 
 
-class OAuth2Auth(APIBaseModel):
+class OAuth2Auth(DeferredAPIBaseModel):
     client_id_secret: Annotated[v1.SecretKeySelector | None, Field(alias="clientIDSecret")] = None
     client_secret_secret: Annotated[v1.SecretKeySelector | None, Field(alias="clientSecretSecret")] = None
     endpoint_params: Annotated[list[OAuth2EndpointParam] | None, Field(alias="endpointParams")] = None
@@ -959,7 +963,7 @@ class OAuth2Auth(APIBaseModel):
     token_url_secret: Annotated[v1.SecretKeySelector | None, Field(alias="tokenURLSecret")] = None
 
 
-class S3EncryptionOptions(APIBaseModel):
+class S3EncryptionOptions(DeferredAPIBaseModel):
     enable_encryption: Annotated[
         bool | None,
         Field(
@@ -1002,7 +1006,7 @@ class S3EncryptionOptions(APIBaseModel):
     ] = None
 
 
-class HDFSArtifact(APIBaseModel):
+class HDFSArtifact(DeferredAPIBaseModel):
     addresses: Annotated[
         list[str] | None,
         Field(description="Addresses is accessible addresses of HDFS name nodes"),
@@ -1087,7 +1091,7 @@ class HDFSArtifact(APIBaseModel):
     path: Annotated[str, Field(description="Path is a file path in HDFS")]
 
 
-class HDFSArtifactRepository(APIBaseModel):
+class HDFSArtifactRepository(DeferredAPIBaseModel):
     addresses: Annotated[
         list[str] | None,
         Field(description="Addresses is accessible addresses of HDFS name nodes"),
@@ -1178,13 +1182,13 @@ class HDFSArtifactRepository(APIBaseModel):
     ] = None
 
 
-class ArchiveStrategy(APIBaseModel):
+class ArchiveStrategy(DeferredAPIBaseModel):
     none: NoneStrategy | None = None
     tar: TarStrategy | None = None
     zip: ZipStrategy | None = None
 
 
-class ArtifactGC(APIBaseModel):
+class ArtifactGC(DeferredAPIBaseModel):
     pod_metadata: Annotated[
         Metadata | None,
         Field(
@@ -1208,7 +1212,7 @@ class ArtifactGC(APIBaseModel):
     strategy: Annotated[str | None, Field(description="Strategy is the strategy to use.")] = None
 
 
-class WorkflowLevelArtifactGC(APIBaseModel):
+class WorkflowLevelArtifactGC(DeferredAPIBaseModel):
     force_finalizer_removal: Annotated[
         bool | None,
         Field(
@@ -1249,7 +1253,7 @@ class WorkflowLevelArtifactGC(APIBaseModel):
     strategy: Annotated[str | None, Field(description="Strategy is the strategy to use.")] = None
 
 
-class Backoff(APIBaseModel):
+class Backoff(DeferredAPIBaseModel):
     cap: Annotated[
         str | None,
         Field(
@@ -1290,7 +1294,7 @@ class Backoff(APIBaseModel):
     ] = None
 
 
-class ContainerSetRetryStrategy(APIBaseModel):
+class ContainerSetRetryStrategy(DeferredAPIBaseModel):
     duration: Annotated[
         str | None,
         Field(
@@ -1313,7 +1317,7 @@ class ContainerSetRetryStrategy(APIBaseModel):
     ]
 
 
-class Sequence(APIBaseModel):
+class Sequence(DeferredAPIBaseModel):
     count: Annotated[
         intstr.IntOrString | None,
         Field(description=("Count is number of elements in the sequence (default: 0). Not to be used with end")),
@@ -1332,14 +1336,14 @@ class Sequence(APIBaseModel):
     ] = None
 
 
-class Cache(APIBaseModel):
+class Cache(DeferredAPIBaseModel):
     config_map: Annotated[
         v1.LocalObjectReference,
         Field(alias="configMap", description="ConfigMap sets a ConfigMap-based cache"),
     ]
 
 
-class Prometheus(APIBaseModel):
+class Prometheus(DeferredAPIBaseModel):
     counter: Annotated[Counter | None, Field(description="Counter is a counter metric")] = None
     gauge: Annotated[Gauge | None, Field(description="Gauge is a gauge metric")] = None
     help: Annotated[str, Field(description="Help is a string that describes the metric")]
@@ -1352,7 +1356,7 @@ class Prometheus(APIBaseModel):
     ] = None
 
 
-class OSSArtifact(APIBaseModel):
+class OSSArtifact(DeferredAPIBaseModel):
     access_key_secret: Annotated[
         v1.SecretKeySelector | None,
         Field(
@@ -1410,7 +1414,7 @@ class OSSArtifact(APIBaseModel):
     ] = None
 
 
-class OSSArtifactRepository(APIBaseModel):
+class OSSArtifactRepository(DeferredAPIBaseModel):
     access_key_secret: Annotated[
         v1.SecretKeySelector | None,
         Field(
@@ -1471,11 +1475,11 @@ class OSSArtifactRepository(APIBaseModel):
     ] = None
 
 
-class RetryAffinity(APIBaseModel):
+class RetryAffinity(DeferredAPIBaseModel):
     node_anti_affinity: Annotated[RetryNodeAntiAffinity | None, Field(alias="nodeAntiAffinity")] = None
 
 
-class SemaphoreRef(APIBaseModel):
+class SemaphoreRef(DeferredAPIBaseModel):
     config_map_key_ref: Annotated[
         v1.ConfigMapKeySelector | None,
         Field(
@@ -1493,7 +1497,7 @@ class SemaphoreRef(APIBaseModel):
     ] = None
 
 
-class SynchronizationStatus(APIBaseModel):
+class SynchronizationStatus(DeferredAPIBaseModel):
     mutex: Annotated[
         MutexStatus | None,
         Field(description="Mutex stores this workflow's mutex holder details"),
@@ -1504,7 +1508,7 @@ class SynchronizationStatus(APIBaseModel):
     ] = None
 
 
-class SubmitOpts(APIBaseModel):
+class SubmitOpts(DeferredAPIBaseModel):
     annotations: Annotated[str | None, Field(description="Annotations adds to metadata.labels")] = None
     dry_run: Annotated[
         bool | None,
@@ -1573,7 +1577,7 @@ class SubmitOpts(APIBaseModel):
     ] = None
 
 
-class ValueFrom(APIBaseModel):
+class ValueFrom(DeferredAPIBaseModel):
     config_map_key_ref: Annotated[
         v1.ConfigMapKeySelector | None,
         Field(
@@ -1635,19 +1639,19 @@ class ValueFrom(APIBaseModel):
     ] = None
 
 
-class HTTPHeader(APIBaseModel):
+class HTTPHeader(DeferredAPIBaseModel):
     name: str
     value: str | None = None
     value_from: Annotated[HTTPHeaderSource | None, Field(alias="valueFrom")] = None
 
 
-class HTTPAuth(APIBaseModel):
+class HTTPAuth(DeferredAPIBaseModel):
     basic_auth: Annotated[BasicAuth | None, Field(alias="basicAuth")] = None
     client_cert: Annotated[ClientCertAuth | None, Field(alias="clientCert")] = None
     oauth2: OAuth2Auth | None = None
 
 
-class S3Artifact(APIBaseModel):
+class S3Artifact(DeferredAPIBaseModel):
     access_key_secret: Annotated[
         v1.SecretKeySelector | None,
         Field(
@@ -1715,7 +1719,7 @@ class S3Artifact(APIBaseModel):
     ] = None
 
 
-class S3ArtifactRepository(APIBaseModel):
+class S3ArtifactRepository(DeferredAPIBaseModel):
     access_key_secret: Annotated[
         v1.SecretKeySelector | None,
         Field(
@@ -1796,7 +1800,7 @@ class S3ArtifactRepository(APIBaseModel):
     ] = None
 
 
-class Memoize(APIBaseModel):
+class Memoize(DeferredAPIBaseModel):
     cache: Annotated[Cache, Field(description="Cache sets and configures the kind of cache")]
     key: Annotated[str, Field(description="Key is the key to use as the caching key")]
     max_age: Annotated[
@@ -1812,7 +1816,7 @@ class Memoize(APIBaseModel):
     ]
 
 
-class RetryStrategy(APIBaseModel):
+class RetryStrategy(DeferredAPIBaseModel):
     affinity: Annotated[
         RetryAffinity | None,
         Field(description="Affinity prevents running workflow's step on the same host"),
@@ -1847,14 +1851,14 @@ class RetryStrategy(APIBaseModel):
     ] = None
 
 
-class WorkflowSubmitRequest(APIBaseModel):
+class WorkflowSubmitRequest(DeferredAPIBaseModel):
     namespace: str | None = None
     resource_kind: Annotated[str | None, Field(alias="resourceKind")] = None
     resource_name: Annotated[str | None, Field(alias="resourceName")] = None
     submit_options: Annotated[SubmitOpts | None, Field(alias="submitOptions")] = None
 
 
-class Parameter(APIBaseModel):
+class Parameter(DeferredAPIBaseModel):
     default: Annotated[
         str | None,
         Field(description=("Default is the default value to use for an input parameter if a value was not supplied")),
@@ -1898,7 +1902,7 @@ class Parameter(APIBaseModel):
     ] = None
 
 
-class HTTPArtifact(APIBaseModel):
+class HTTPArtifact(DeferredAPIBaseModel):
     auth: Annotated[
         HTTPAuth | None,
         Field(description="Auth contains information for client authentication"),
@@ -1910,7 +1914,7 @@ class HTTPArtifact(APIBaseModel):
     url: Annotated[str, Field(description="URL of the artifact")]
 
 
-class ArtifactRepository(APIBaseModel):
+class ArtifactRepository(DeferredAPIBaseModel):
     archive_logs: Annotated[
         bool | None,
         Field(alias="archiveLogs", description="ArchiveLogs enables log archiving"),
@@ -1945,7 +1949,7 @@ class ArtifactRepository(APIBaseModel):
     ] = None
 
 
-class Artifact(APIBaseModel):
+class Artifact(DeferredAPIBaseModel):
     archive: Annotated[
         ArchiveStrategy | None,
         Field(description=("Archive controls how the artifact will be saved to the artifact repository.")),
@@ -2067,7 +2071,7 @@ class Artifact(APIBaseModel):
     ] = None
 
 
-class ArtifactLocation(APIBaseModel):
+class ArtifactLocation(DeferredAPIBaseModel):
     archive_logs: Annotated[
         bool | None,
         Field(
@@ -2114,7 +2118,7 @@ class ArtifactLocation(APIBaseModel):
     s3: Annotated[S3Artifact | None, Field(description="S3 contains S3 artifact location details")] = None
 
 
-class ArtifactPaths(APIBaseModel):
+class ArtifactPaths(DeferredAPIBaseModel):
     archive: Annotated[
         ArchiveStrategy | None,
         Field(description=("Archive controls how the artifact will be saved to the artifact repository.")),
@@ -2236,7 +2240,7 @@ class ArtifactPaths(APIBaseModel):
     ] = None
 
 
-class ArtifactRepositoryRefStatus(APIBaseModel):
+class ArtifactRepositoryRefStatus(DeferredAPIBaseModel):
     artifact_repository: Annotated[
         ArtifactRepository | None,
         Field(
@@ -2275,11 +2279,11 @@ class ArtifactRepositoryRefStatus(APIBaseModel):
     ] = None
 
 
-class ManifestFrom(APIBaseModel):
+class ManifestFrom(DeferredAPIBaseModel):
     artifact: Annotated[Artifact, Field(description="Artifact contains the artifact to use")]
 
 
-class DataSource(APIBaseModel):
+class DataSource(DeferredAPIBaseModel):
     artifact_paths: Annotated[
         ArtifactPaths | None,
         Field(
@@ -2289,7 +2293,7 @@ class DataSource(APIBaseModel):
     ] = None
 
 
-class ResourceTemplate(APIBaseModel):
+class ResourceTemplate(DeferredAPIBaseModel):
     action: Annotated[
         str,
         Field(
@@ -2360,7 +2364,7 @@ class ResourceTemplate(APIBaseModel):
     ] = None
 
 
-class Data(APIBaseModel):
+class Data(DeferredAPIBaseModel):
     source: Annotated[
         DataSource,
         Field(description="Source sources external data into a data template"),
@@ -2371,7 +2375,7 @@ class Data(APIBaseModel):
     ]
 
 
-class Arguments(APIBaseModel):
+class Arguments(DeferredAPIBaseModel):
     artifacts: Annotated[
         list[Artifact] | None,
         Field(description=("Artifacts is the list of artifacts to pass to the template or workflow")),
@@ -2382,7 +2386,7 @@ class Arguments(APIBaseModel):
     ] = None
 
 
-class InfoResponse(APIBaseModel):
+class InfoResponse(DeferredAPIBaseModel):
     columns: list[Column] | None = None
     links: list[Link] | None = None
     managed_namespace: Annotated[str | None, Field(alias="managedNamespace")] = None
@@ -2390,7 +2394,7 @@ class InfoResponse(APIBaseModel):
     nav_color: Annotated[str | None, Field(alias="navColor")] = None
 
 
-class Inputs(APIBaseModel):
+class Inputs(DeferredAPIBaseModel):
     artifacts: Annotated[
         list[Artifact] | None,
         Field(description="Artifact are a list of artifacts passed as inputs"),
@@ -2407,7 +2411,7 @@ class Inputs(APIBaseModel):
     ] = None
 
 
-class Metrics(APIBaseModel):
+class Metrics(DeferredAPIBaseModel):
     prometheus: Annotated[
         list[Prometheus] | None,
         Field(
@@ -2420,7 +2424,7 @@ class Metrics(APIBaseModel):
     ] = None
 
 
-class Outputs(APIBaseModel):
+class Outputs(DeferredAPIBaseModel):
     artifacts: Annotated[
         list[Artifact] | None,
         Field(description=("Artifacts holds the list of output artifacts produced by a step")),
@@ -2447,7 +2451,7 @@ class Outputs(APIBaseModel):
     ] = None
 
 
-class Synchronization(APIBaseModel):
+class Synchronization(DeferredAPIBaseModel):
     mutexes: Annotated[
         list[Mutex] | None,
         Field(description="v3.6 and after: Mutexes holds the list of Mutex lock details"),
@@ -2458,7 +2462,7 @@ class Synchronization(APIBaseModel):
     ] = None
 
 
-class LifecycleHook(APIBaseModel):
+class LifecycleHook(DeferredAPIBaseModel):
     arguments: Annotated[Arguments | None, Field(description="Arguments hold arguments to the template")] = None
     expression: Annotated[
         str | None,
@@ -2483,7 +2487,7 @@ class LifecycleHook(APIBaseModel):
     ] = None
 
 
-class HTTP(APIBaseModel):
+class HTTP(DeferredAPIBaseModel):
     body: Annotated[str | None, Field(description="Body is content of the HTTP Request")] = None
     body_from: Annotated[
         HTTPBodySource | None,
@@ -2523,7 +2527,7 @@ class HTTP(APIBaseModel):
     url: Annotated[str, Field(description="URL of the HTTP Request")]
 
 
-class NodeStatus(APIBaseModel):
+class NodeStatus(DeferredAPIBaseModel):
     boundary_id: Annotated[
         str | None,
         Field(
@@ -2735,7 +2739,7 @@ class NodeStatus(APIBaseModel):
     type: Annotated[str, Field(description="Type indicates type of node")]
 
 
-class PodGC(APIBaseModel):
+class PodGC(DeferredAPIBaseModel):
     delete_delay_duration: Annotated[
         str | None,
         Field(
@@ -2765,7 +2769,7 @@ class PodGC(APIBaseModel):
     ] = None
 
 
-class Submit(APIBaseModel):
+class Submit(DeferredAPIBaseModel):
     arguments: Annotated[
         Arguments | None,
         Field(description=("Arguments extracted from the event and then set as arguments to the workflow created.")),
@@ -2783,12 +2787,12 @@ class Submit(APIBaseModel):
     ]
 
 
-class WorkflowEventBindingSpec(APIBaseModel):
+class WorkflowEventBindingSpec(DeferredAPIBaseModel):
     event: Annotated[Event, Field(description="Event is the event to bind to")]
     submit: Annotated[Submit | None, Field(description="Submit is the workflow template to submit")] = None
 
 
-class WorkflowEventBinding(APIBaseModel):
+class WorkflowEventBinding(DeferredAPIBaseModel):
     api_version: Annotated[
         str | None,
         Field(
@@ -2816,7 +2820,7 @@ class WorkflowEventBinding(APIBaseModel):
     spec: WorkflowEventBindingSpec
 
 
-class ContainerNode(APIBaseModel):
+class ContainerNode(DeferredAPIBaseModel):
     args: Annotated[
         list[str] | None,
         Field(
@@ -3110,7 +3114,7 @@ class ContainerNode(APIBaseModel):
     ] = None
 
 
-class ScriptTemplate(APIBaseModel):
+class ScriptTemplate(DeferredAPIBaseModel):
     args: Annotated[
         list[str] | None,
         Field(
@@ -3407,7 +3411,7 @@ class ScriptTemplate(APIBaseModel):
     ] = None
 
 
-class UserContainer(APIBaseModel):
+class UserContainer(DeferredAPIBaseModel):
     args: Annotated[
         list[str] | None,
         Field(
@@ -3713,7 +3717,7 @@ class UserContainer(APIBaseModel):
     ] = None
 
 
-class WorkflowEventBindingList(APIBaseModel):
+class WorkflowEventBindingList(DeferredAPIBaseModel):
     api_version: Annotated[
         str | None,
         Field(
@@ -3741,7 +3745,7 @@ class WorkflowEventBindingList(APIBaseModel):
     metadata: v1_1.ListMeta
 
 
-class ContainerSetTemplate(APIBaseModel):
+class ContainerSetTemplate(DeferredAPIBaseModel):
     containers: list[ContainerNode]
     retry_strategy: Annotated[
         ContainerSetRetryStrategy | None,
@@ -3758,7 +3762,7 @@ class ContainerSetTemplate(APIBaseModel):
     volume_mounts: Annotated[list[v1.VolumeMount] | None, Field(alias="volumeMounts")] = None
 
 
-class DAGTemplate(APIBaseModel):
+class DAGTemplate(DeferredAPIBaseModel):
     fail_fast: Annotated[
         bool | None,
         Field(
@@ -3791,7 +3795,7 @@ class DAGTemplate(APIBaseModel):
     ]
 
 
-class ClusterWorkflowTemplateList(APIBaseModel):
+class ClusterWorkflowTemplateList(DeferredAPIBaseModel):
     api_version: Annotated[
         str | None,
         Field(
@@ -3819,7 +3823,7 @@ class ClusterWorkflowTemplateList(APIBaseModel):
     metadata: v1_1.ListMeta
 
 
-class CronWorkflowList(APIBaseModel):
+class CronWorkflowList(DeferredAPIBaseModel):
     api_version: Annotated[
         str | None,
         Field(
@@ -3847,7 +3851,7 @@ class CronWorkflowList(APIBaseModel):
     metadata: v1_1.ListMeta
 
 
-class WorkflowList(APIBaseModel):
+class WorkflowList(DeferredAPIBaseModel):
     api_version: Annotated[
         str | None,
         Field(
@@ -3875,7 +3879,7 @@ class WorkflowList(APIBaseModel):
     metadata: v1_1.ListMeta
 
 
-class WorkflowTemplateList(APIBaseModel):
+class WorkflowTemplateList(DeferredAPIBaseModel):
     api_version: Annotated[
         str | None,
         Field(
@@ -3903,7 +3907,7 @@ class WorkflowTemplateList(APIBaseModel):
     metadata: v1_1.ListMeta
 
 
-class Template(APIBaseModel):
+class Template(DeferredAPIBaseModel):
     active_deadline_seconds: Annotated[
         intstr.IntOrString | None,
         Field(
@@ -4163,7 +4167,7 @@ class Template(APIBaseModel):
     ] = None
 
 
-class DAGTask(APIBaseModel):
+class DAGTask(DeferredAPIBaseModel):
     arguments: Annotated[
         Arguments | None,
         Field(description=("Arguments are the parameter and artifact arguments to the template")),
@@ -4263,7 +4267,7 @@ class DAGTask(APIBaseModel):
     ] = None
 
 
-class WorkflowSpec(APIBaseModel):
+class WorkflowSpec(DeferredAPIBaseModel):
     active_deadline_seconds: Annotated[
         int | None,
         Field(
@@ -4622,7 +4626,7 @@ class WorkflowSpec(APIBaseModel):
     ] = None
 
 
-class WorkflowStep(APIBaseModel):
+class WorkflowStep(DeferredAPIBaseModel):
     arguments: Annotated[Arguments | None, Field(description="Arguments hold arguments to the template")] = None
     continue_on: Annotated[
         ContinueOn | None,
@@ -4715,7 +4719,7 @@ class WorkflowStep(APIBaseModel):
     ] = None
 
 
-class ClusterWorkflowTemplate(APIBaseModel):
+class ClusterWorkflowTemplate(DeferredAPIBaseModel):
     api_version: Annotated[
         str | None,
         Field(
@@ -4743,7 +4747,7 @@ class ClusterWorkflowTemplate(APIBaseModel):
     spec: WorkflowSpec
 
 
-class CronWorkflowSpec(APIBaseModel):
+class CronWorkflowSpec(DeferredAPIBaseModel):
     concurrency_policy: Annotated[
         str | None,
         Field(
@@ -4822,7 +4826,7 @@ class CronWorkflowSpec(APIBaseModel):
     ]
 
 
-class WorkflowStatus(APIBaseModel):
+class WorkflowStatus(DeferredAPIBaseModel):
     artifact_gc_status: Annotated[
         ArtGCStatus | None,
         Field(
@@ -4953,7 +4957,7 @@ class WorkflowStatus(APIBaseModel):
     ] = None
 
 
-class WorkflowTemplate(APIBaseModel):
+class WorkflowTemplate(DeferredAPIBaseModel):
     api_version: Annotated[
         str | None,
         Field(
@@ -4981,22 +4985,22 @@ class WorkflowTemplate(APIBaseModel):
     spec: WorkflowSpec
 
 
-class ClusterWorkflowTemplateCreateRequest(APIBaseModel):
+class ClusterWorkflowTemplateCreateRequest(DeferredAPIBaseModel):
     create_options: Annotated[v1_1.CreateOptions | None, Field(alias="createOptions")] = None
     template: ClusterWorkflowTemplate | None = None
 
 
-class ClusterWorkflowTemplateLintRequest(APIBaseModel):
+class ClusterWorkflowTemplateLintRequest(DeferredAPIBaseModel):
     create_options: Annotated[v1_1.CreateOptions | None, Field(alias="createOptions")] = None
     template: ClusterWorkflowTemplate | None = None
 
 
-class ClusterWorkflowTemplateUpdateRequest(APIBaseModel):
+class ClusterWorkflowTemplateUpdateRequest(DeferredAPIBaseModel):
     name: Annotated[str | None, Field(description="DEPRECATED: This field is ignored.")] = None
     template: ClusterWorkflowTemplate | None = None
 
 
-class CronWorkflow(APIBaseModel):
+class CronWorkflow(DeferredAPIBaseModel):
     api_version: Annotated[
         str | None,
         Field(
@@ -5025,7 +5029,7 @@ class CronWorkflow(APIBaseModel):
     status: CronWorkflowStatus | None = None
 
 
-class Workflow(APIBaseModel):
+class Workflow(DeferredAPIBaseModel):
     api_version: Annotated[
         str | None,
         Field(
@@ -5054,42 +5058,42 @@ class Workflow(APIBaseModel):
     status: WorkflowStatus | None = None
 
 
-class WorkflowTemplateCreateRequest(APIBaseModel):
+class WorkflowTemplateCreateRequest(DeferredAPIBaseModel):
     create_options: Annotated[v1_1.CreateOptions | None, Field(alias="createOptions")] = None
     namespace: str | None = None
     template: WorkflowTemplate | None = None
 
 
-class WorkflowTemplateLintRequest(APIBaseModel):
+class WorkflowTemplateLintRequest(DeferredAPIBaseModel):
     create_options: Annotated[v1_1.CreateOptions | None, Field(alias="createOptions")] = None
     namespace: str | None = None
     template: WorkflowTemplate | None = None
 
 
-class WorkflowTemplateUpdateRequest(APIBaseModel):
+class WorkflowTemplateUpdateRequest(DeferredAPIBaseModel):
     name: Annotated[str | None, Field(description="DEPRECATED: This field is ignored.")] = None
     namespace: str | None = None
     template: WorkflowTemplate | None = None
 
 
-class CreateCronWorkflowRequest(APIBaseModel):
+class CreateCronWorkflowRequest(DeferredAPIBaseModel):
     create_options: Annotated[v1_1.CreateOptions | None, Field(alias="createOptions")] = None
     cron_workflow: Annotated[CronWorkflow | None, Field(alias="cronWorkflow")] = None
     namespace: str | None = None
 
 
-class LintCronWorkflowRequest(APIBaseModel):
+class LintCronWorkflowRequest(DeferredAPIBaseModel):
     cron_workflow: Annotated[CronWorkflow | None, Field(alias="cronWorkflow")] = None
     namespace: str | None = None
 
 
-class UpdateCronWorkflowRequest(APIBaseModel):
+class UpdateCronWorkflowRequest(DeferredAPIBaseModel):
     cron_workflow: Annotated[CronWorkflow | None, Field(alias="cronWorkflow")] = None
     name: Annotated[str | None, Field(description="DEPRECATED: This field is ignored.")] = None
     namespace: str | None = None
 
 
-class WorkflowCreateRequest(APIBaseModel):
+class WorkflowCreateRequest(DeferredAPIBaseModel):
     create_options: Annotated[v1_1.CreateOptions | None, Field(alias="createOptions")] = None
     instance_id: Annotated[
         str | None,
@@ -5100,23 +5104,17 @@ class WorkflowCreateRequest(APIBaseModel):
     workflow: Workflow | None = None
 
 
-class WorkflowLintRequest(APIBaseModel):
+class WorkflowLintRequest(DeferredAPIBaseModel):
     namespace: str | None = None
     workflow: Workflow | None = None
 
 
-class WorkflowWatchEvent(APIBaseModel):
+class WorkflowWatchEvent(DeferredAPIBaseModel):
     object: Annotated[Workflow | None, Field(title="the workflow")] = None
     type: Annotated[str | None, Field(title="the type of change")] = None
 
 
 class ParallelSteps(RootModel[list[WorkflowStep]]):
-    root: list[WorkflowStep]
+    model_config = ConfigDict(defer_build=True)
 
-
-DAGTemplate.model_rebuild()
-ClusterWorkflowTemplateList.model_rebuild()
-CronWorkflowList.model_rebuild()
-WorkflowList.model_rebuild()
-WorkflowTemplateList.model_rebuild()
-Template.model_rebuild()
+    root: list[WorkflowStep]
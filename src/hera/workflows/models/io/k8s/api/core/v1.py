@@ -8,14 +8,14 @@ from typing import Annotated
 
 from pydantic import Field
 
-from hera.shared._pydantic import APIBaseModel
+from hera.shared._pydantic import DeferredAPIBaseModel
 
 from ...apimachinery.pkg.api import resource as resource_1
 from ...apimachinery.pkg.apis.meta import v1
 from ...apimachinery.pkg.util import intstr
 
 
-class SecretKeySelector(APIBaseModel):
+class SecretKeySelector(DeferredAPIBaseModel):
     key: Annotated[
         str,
         Field(description=("The key of the secret to select from.  Must be a valid secret key.")),
@@ -37,7 +37,7 @@ class SecretKeySelector(APIBaseModel):
     ] = None
 
 
-class ConfigMapKeySelector(APIBaseModel):
+class ConfigMapKeySelector(DeferredAPIBaseModel):
     key: Annotated[str, Field(description="The key to select.")]
     name: Annotated[
         str | None,
@@ -56,7 +56,7 @@ class ConfigMapKeySelector(APIBaseModel):
     ] = None
 
 
-class LocalObjectReference(APIBaseModel):
+class LocalObjectReference(DeferredAPIBaseModel):
     name: Annotated[
         str | None,
         Field(
@@ -70,7 +70,7 @@ class LocalObjectReference(APIBaseModel):
     ] = None
 
 
-class AWSElasticBlockStoreVolumeSource(APIBaseModel):
+class AWSElasticBlockStoreVolumeSource(DeferredAPIBaseModel):
     fs_type: Annotated[
         str | None,
         Field(
@@ -119,7 +119,7 @@ class AWSElasticBlockStoreVolumeSource(APIBaseModel):
     ]
 
 
-class AppArmorProfile(APIBaseModel):
+class AppArmorProfile(DeferredAPIBaseModel):
     localhost_profile: Annotated[
         str | None,
         Field(
@@ -145,7 +145,7 @@ class AppArmorProfile(APIBaseModel):
     ]
 
 
-class AzureDiskVolumeSource(APIBaseModel):
+class AzureDiskVolumeSource(DeferredAPIBaseModel):
     caching_mode: Annotated[
         str | None,
         Field(
@@ -201,7 +201,7 @@ class AzureDiskVolumeSource(APIBaseModel):
     ] = None
 
 
-class AzureFileVolumeSource(APIBaseModel):
+class AzureFileVolumeSource(DeferredAPIBaseModel):
     read_only: Annotated[
         bool | None,
         Field(
@@ -222,12 +222,12 @@ class AzureFileVolumeSource(APIBaseModel):
     share_name: Annotated[str, Field(alias="shareName", description="shareName is the azure share Name")]
 
 
-class Capabilities(APIBaseModel):
+class Capabilities(DeferredAPIBaseModel):
     add: Annotated[list[str] | None, Field(description="Added capabilities")] = None
     drop: Annotated[list[str] | None, Field(description="Removed capabilities")] = None
 
 
-class ConfigMapEnvSource(APIBaseModel):
+class ConfigMapEnvSource(DeferredAPIBaseModel):
     name: Annotated[
         str | None,
         Field(
@@ -242,7 +242,7 @@ class ConfigMapEnvSource(APIBaseModel):
     optional: Annotated[bool | None, Field(description="Specify whether the ConfigMap must be defined")] = None
 
 
-class ContainerPort(APIBaseModel):
+class ContainerPort(DeferredAPIBaseModel):
     container_port: Annotated[
         int,
         Field(
@@ -283,7 +283,7 @@ class ContainerPort(APIBaseModel):
     ] = None
 
 
-class ContainerResizePolicy(APIBaseModel):
+class ContainerResizePolicy(DeferredAPIBaseModel):
     resource_name: Annotated[
         str,
         Field(
@@ -305,7 +305,7 @@ class ContainerResizePolicy(APIBaseModel):
     ]
 
 
-class ObjectFieldSelector(APIBaseModel):
+class ObjectFieldSelector(DeferredAPIBaseModel):
     api_version: Annotated[
         str | None,
         Field(
@@ -322,7 +322,7 @@ class ObjectFieldSelector(APIBaseModel):
     ]
 
 
-class SecretEnvSource(APIBaseModel):
+class SecretEnvSource(DeferredAPIBaseModel):
     name: Annotated[
         str | None,
         Field(
@@ -337,7 +337,7 @@ class SecretEnvSource(APIBaseModel):
     optional: Annotated[bool | None, Field(description="Specify whether the Secret must be defined")] = None
 
 
-class ObjectReference(APIBaseModel):
+class ObjectReference(DeferredAPIBaseModel):
     api_version: Annotated[
         str | None,
         Field(alias="apiVersion", description="API version of the referent."),
@@ -408,12 +408,12 @@ class ObjectReference(APIBaseModel):
     ] = None
 
 
-class EventSource(APIBaseModel):
+class EventSource(DeferredAPIBaseModel):
     component: Annotated[str | None, Field(description="Component from which the event is generated.")] = None
     host: Annotated[str | None, Field(description="Node name on which the event is generated.")] = None
 
 
-class ExecAction(APIBaseModel):
+class ExecAction(DeferredAPIBaseModel):
     command: Annotated[
         list[str] | None,
         Field(
@@ -429,7 +429,7 @@ class ExecAction(APIBaseModel):
     ] = None
 
 
-class FCVolumeSource(APIBaseModel):
+class FCVolumeSource(DeferredAPIBaseModel):
     fs_type: Annotated[
         str | None,
         Field(
@@ -471,7 +471,7 @@ class FCVolumeSource(APIBaseModel):
     ] = None
 
 
-class FlockerVolumeSource(APIBaseModel):
+class FlockerVolumeSource(DeferredAPIBaseModel):
     dataset_name: Annotated[
         str | None,
         Field(
@@ -491,7 +491,7 @@ class FlockerVolumeSource(APIBaseModel):
     ] = None
 
 
-class GCEPersistentDiskVolumeSource(APIBaseModel):
+class GCEPersistentDiskVolumeSource(DeferredAPIBaseModel):
     fs_type: Annotated[
         str | None,
         Field(
@@ -542,7 +542,7 @@ class GCEPersistentDiskVolumeSource(APIBaseModel):
     ] = None
 
 
-class GRPCAction(APIBaseModel):
+class GRPCAction(DeferredAPIBaseModel):
     port: Annotated[
         int,
         Field(description=("Port number of the gRPC service. Number must be in the range 1 to 65535.")),
@@ -560,7 +560,7 @@ class GRPCAction(APIBaseModel):
     ] = None
 
 
-class GitRepoVolumeSource(APIBaseModel):
+class GitRepoVolumeSource(DeferredAPIBaseModel):
     directory: Annotated[
         str | None,
         Field(
@@ -579,7 +579,7 @@ class GitRepoVolumeSource(APIBaseModel):
     ] = None
 
 
-class GlusterfsVolumeSource(APIBaseModel):
+class GlusterfsVolumeSource(DeferredAPIBaseModel):
     endpoints: Annotated[
         str,
         Field(
@@ -612,7 +612,7 @@ class GlusterfsVolumeSource(APIBaseModel):
     ] = None
 
 
-class HTTPHeader(APIBaseModel):
+class HTTPHeader(DeferredAPIBaseModel):
     name: Annotated[
         str,
         Field(
@@ -625,12 +625,12 @@ class HTTPHeader(APIBaseModel):
     value: Annotated[str, Field(description="The header field value")]
 
 
-class HostAlias(APIBaseModel):
+class HostAlias(DeferredAPIBaseModel):
     hostnames: Annotated[list[str] | None, Field(description="Hostnames for the above IP address.")] = None
     ip: Annotated[str, Field(description="IP address of the host file entry.")]
 
 
-class HostPathVolumeSource(APIBaseModel):
+class HostPathVolumeSource(DeferredAPIBaseModel):
     path: Annotated[
         str,
         Field(
@@ -652,7 +652,7 @@ class HostPathVolumeSource(APIBaseModel):
     ] = None
 
 
-class ImageVolumeSource(APIBaseModel):
+class ImageVolumeSource(DeferredAPIBaseModel):
     pull_policy: Annotated[
         str | None,
         Field(
@@ -687,7 +687,7 @@ class ImageVolumeSource(APIBaseModel):
     ] = None
 
 
-class KeyToPath(APIBaseModel):
+class KeyToPath(DeferredAPIBaseModel):
     key: Annotated[str, Field(description="key is the key to project.")]
     mode: Annotated[
         int | None,
@@ -715,11 +715,11 @@ class KeyToPath(APIBaseModel):
     ]
 
 
-class SleepAction(APIBaseModel):
+class SleepAction(DeferredAPIBaseModel):
     seconds: Annotated[int, Field(description="Seconds is the number of seconds to sleep.")]
 
 
-class ModifyVolumeStatus(APIBaseModel):
+class ModifyVolumeStatus(DeferredAPIBaseModel):
     status: Annotated[
         str,
         Field(
@@ -749,7 +749,7 @@ class ModifyVolumeStatus(APIBaseModel):
     ] = None
 
 
-class NFSVolumeSource(APIBaseModel):
+class NFSVolumeSource(DeferredAPIBaseModel):
     path: Annotated[
         str,
         Field(
@@ -781,7 +781,7 @@ class NFSVolumeSource(APIBaseModel):
     ]
 
 
-class NodeSelectorRequirement(APIBaseModel):
+class NodeSelectorRequirement(DeferredAPIBaseModel):
     key: Annotated[str, Field(description="The label key that the selector applies to.")]
     operator: Annotated[
         str,
@@ -806,7 +806,7 @@ class NodeSelectorRequirement(APIBaseModel):
     ] = None
 
 
-class NodeSelectorTerm(APIBaseModel):
+class NodeSelectorTerm(DeferredAPIBaseModel):
     match_expressions: Annotated[
         list[NodeSelectorRequirement] | None,
         Field(
@@ -823,7 +823,7 @@ class NodeSelectorTerm(APIBaseModel):
     ] = None
 
 
-class TypedLocalObjectReference(APIBaseModel):
+class TypedLocalObjectReference(DeferredAPIBaseModel):
     api_group: Annotated[
         str | None,
         Field(
@@ -839,7 +839,7 @@ class TypedLocalObjectReference(APIBaseModel):
     name: Annotated[str, Field(description="Name is the name of resource being referenced")]
 
 
-class TypedObjectReference(APIBaseModel):
+class TypedObjectReference(DeferredAPIBaseModel):
     api_group: Annotated[
         str | None,
         Field(
@@ -868,7 +868,7 @@ class TypedObjectReference(APIBaseModel):
     ] = None
 
 
-class VolumeResourceRequirements(APIBaseModel):
+class VolumeResourceRequirements(DeferredAPIBaseModel):
     limits: Annotated[
         dict[str, resource_1.Quantity] | None,
         Field(
@@ -893,7 +893,7 @@ class VolumeResourceRequirements(APIBaseModel):
     ] = None
 
 
-class PersistentVolumeClaimVolumeSource(APIBaseModel):
+class PersistentVolumeClaimVolumeSource(DeferredAPIBaseModel):
     claim_name: Annotated[
         str,
         Field(
@@ -914,7 +914,7 @@ class PersistentVolumeClaimVolumeSource(APIBaseModel):
     ] = None
 
 
-class PhotonPersistentDiskVolumeSource(APIBaseModel):
+class PhotonPersistentDiskVolumeSource(DeferredAPIBaseModel):
     fs_type: Annotated[
         str | None,
         Field(
@@ -935,7 +935,7 @@ class PhotonPersistentDiskVolumeSource(APIBaseModel):
     ]
 
 
-class PodDNSConfigOption(APIBaseModel):
+class PodDNSConfigOption(DeferredAPIBaseModel):
     name: Annotated[
         str | None,
         Field(description="Name is this DNS resolver option's name. Required."),
@@ -943,7 +943,7 @@ class PodDNSConfigOption(APIBaseModel):
     value: Annotated[str | None, Field(description="Value is this DNS resolver option's value.")] = None
 
 
-class SELinuxOptions(APIBaseModel):
+class SELinuxOptions(DeferredAPIBaseModel):
     level: Annotated[
         str | None,
         Field(description="Level is SELinux level label that applies to the container."),
@@ -962,7 +962,7 @@ class SELinuxOptions(APIBaseModel):
     ] = None
 
 
-class SeccompProfile(APIBaseModel):
+class SeccompProfile(DeferredAPIBaseModel):
     localhost_profile: Annotated[
         str | None,
         Field(
@@ -989,7 +989,7 @@ class SeccompProfile(APIBaseModel):
     ]
 
 
-class WindowsSecurityContextOptions(APIBaseModel):
+class WindowsSecurityContextOptions(DeferredAPIBaseModel):
     gmsa_credential_spec: Annotated[
         str | None,
         Field(
@@ -1037,7 +1037,7 @@ class WindowsSecurityContextOptions(APIBaseModel):
     ] = None
 
 
-class PortworxVolumeSource(APIBaseModel):
+class PortworxVolumeSource(DeferredAPIBaseModel):
     fs_type: Annotated[
         str | None,
         Field(
@@ -1068,7 +1068,7 @@ class PortworxVolumeSource(APIBaseModel):
     ]
 
 
-class QuobyteVolumeSource(APIBaseModel):
+class QuobyteVolumeSource(DeferredAPIBaseModel):
     group: Annotated[
         str | None,
         Field(description="group to map volume access to Default is no group"),
@@ -1112,7 +1112,7 @@ class QuobyteVolumeSource(APIBaseModel):
     ]
 
 
-class ResourceClaim(APIBaseModel):
+class ResourceClaim(DeferredAPIBaseModel):
     name: Annotated[
         str,
         Field(
@@ -1135,7 +1135,7 @@ class ResourceClaim(APIBaseModel):
     ] = None
 
 
-class SecretProjection(APIBaseModel):
+class SecretProjection(DeferredAPIBaseModel):
     items: Annotated[
         list[KeyToPath] | None,
         Field(
@@ -1168,7 +1168,7 @@ class SecretProjection(APIBaseModel):
     ] = None
 
 
-class SecretVolumeSource(APIBaseModel):
+class SecretVolumeSource(DeferredAPIBaseModel):
     default_mode: Annotated[
         int | None,
         Field(
@@ -1215,7 +1215,7 @@ class SecretVolumeSource(APIBaseModel):
     ] = None
 
 
-class ServiceAccountTokenProjection(APIBaseModel):
+class ServiceAccountTokenProjection(DeferredAPIBaseModel):
     audience: Annotated[
         str | None,
         Field(
@@ -1247,12 +1247,12 @@ class ServiceAccountTokenProjection(APIBaseModel):
     ]
 
 
-class Sysctl(APIBaseModel):
+class Sysctl(DeferredAPIBaseModel):
     name: Annotated[str, Field(description="Name of a property to set")]
     value: Annotated[str, Field(description="Value of a property to set")]
 
 
-class Toleration(APIBaseModel):
+class Toleration(DeferredAPIBaseModel):
     effect: Annotated[
         str | None,
         Field(
@@ -1308,7 +1308,7 @@ class Toleration(APIBaseModel):
     ] = None
 
 
-class VsphereVirtualDiskVolumeSource(APIBaseModel):
+class VsphereVirtualDiskVolumeSource(DeferredAPIBaseModel):
     fs_type: Annotated[
         str | None,
         Field(
@@ -1346,7 +1346,7 @@ class VsphereVirtualDiskVolumeSource(APIBaseModel):
     ]
 
 
-class VolumeDevice(APIBaseModel):
+class VolumeDevice(DeferredAPIBaseModel):
     device_path: Annotated[
         str,
         Field(
@@ -1360,7 +1360,7 @@ class VolumeDevice(APIBaseModel):
     ]
 
 
-class VolumeMount(APIBaseModel):
+class VolumeMount(DeferredAPIBaseModel):
     mount_path: Annotated[
         str,
         Field(
@@ -1441,7 +1441,7 @@ class ImagePullPolicy(Enum):
     if_not_present = "IfNotPresent"
 
 
-class PersistentVolumeClaimCondition(APIBaseModel):
+class PersistentVolumeClaimCondition(DeferredAPIBaseModel):
     last_probe_time: Annotated[
         v1.Time | None,
         Field(
@@ -1492,7 +1492,7 @@ class PersistentVolumeClaimCondition(APIBaseModel):
     ]
 
 
-class ServicePort(APIBaseModel):
+class ServicePort(DeferredAPIBaseModel):
     app_protocol: Annotated[
         str | None,
         Field(
@@ -1568,7 +1568,7 @@ class ServicePort(APIBaseModel):
     ] = None
 
 
-class TCPSocketAction(APIBaseModel):
+class TCPSocketAction(DeferredAPIBaseModel):
     host: Annotated[
         str | None,
         Field(description="Optional: Host name to connect to, defaults to the pod IP."),
@@ -1584,7 +1584,7 @@ class TCPSocketAction(APIBaseModel):
     ]
 
 
-class CSIVolumeSource(APIBaseModel):
+class CSIVolumeSource(DeferredAPIBaseModel):
     driver: Annotated[
         str,
         Field(
@@ -1641,7 +1641,7 @@ class CSIVolumeSource(APIBaseModel):
     ] = None
 
 
-class CephFSVolumeSource(APIBaseModel):
+class CephFSVolumeSource(DeferredAPIBaseModel):
     monitors: Annotated[
         list[str],
         Field(
@@ -1701,7 +1701,7 @@ class CephFSVolumeSource(APIBaseModel):
     ] = None
 
 
-class CinderVolumeSource(APIBaseModel):
+class CinderVolumeSource(DeferredAPIBaseModel):
     fs_type: Annotated[
         str | None,
         Field(
@@ -1746,7 +1746,7 @@ class CinderVolumeSource(APIBaseModel):
     ]
 
 
-class FlexVolumeSource(APIBaseModel):
+class FlexVolumeSource(DeferredAPIBaseModel):
     driver: Annotated[
         str,
         Field(description="driver is the name of the driver to use for this volume."),
@@ -1791,7 +1791,7 @@ class FlexVolumeSource(APIBaseModel):
     ] = None
 
 
-class ISCSIVolumeSource(APIBaseModel):
+class ISCSIVolumeSource(DeferredAPIBaseModel):
     chap_auth_discovery: Annotated[
         bool | None,
         Field(
@@ -1878,7 +1878,7 @@ class ISCSIVolumeSource(APIBaseModel):
     ]
 
 
-class RBDVolumeSource(APIBaseModel):
+class RBDVolumeSource(DeferredAPIBaseModel):
     fs_type: Annotated[
         str | None,
         Field(
@@ -1961,7 +1961,7 @@ class RBDVolumeSource(APIBaseModel):
     ] = None
 
 
-class ScaleIOVolumeSource(APIBaseModel):
+class ScaleIOVolumeSource(DeferredAPIBaseModel):
     fs_type: Annotated[
         str | None,
         Field(
@@ -2045,7 +2045,7 @@ class ScaleIOVolumeSource(APIBaseModel):
     ] = None
 
 
-class StorageOSVolumeSource(APIBaseModel):
+class StorageOSVolumeSource(DeferredAPIBaseModel):
     fs_type: Annotated[
         str | None,
         Field(
@@ -2104,7 +2104,7 @@ class StorageOSVolumeSource(APIBaseModel):
     ] = None
 
 
-class EmptyDirVolumeSource(APIBaseModel):
+class EmptyDirVolumeSource(DeferredAPIBaseModel):
     medium: Annotated[
         str | None,
         Field(
@@ -2133,7 +2133,7 @@ class EmptyDirVolumeSource(APIBaseModel):
     ] = None
 
 
-class ResourceFieldSelector(APIBaseModel):
+class ResourceFieldSelector(DeferredAPIBaseModel):
     container_name: Annotated[
         str | None,
         Field(
@@ -2148,7 +2148,7 @@ class ResourceFieldSelector(APIBaseModel):
     resource: Annotated[str, Field(description="Required: resource to select")]
 
 
-class EnvFromSource(APIBaseModel):
+class EnvFromSource(DeferredAPIBaseModel):
     config_map_ref: Annotated[
         ConfigMapEnvSource | None,
         Field(alias="configMapRef", description="The ConfigMap to select from"),
@@ -2165,7 +2165,7 @@ class EnvFromSource(APIBaseModel):
     ] = None
 
 
-class EventSeries(APIBaseModel):
+class EventSeries(DeferredAPIBaseModel):
     count: Annotated[
         int | None,
         Field(description=("Number of occurrences in this series up to the last heartbeat time")),
@@ -2176,7 +2176,7 @@ class EventSeries(APIBaseModel):
     ] = None
 
 
-class PersistentVolumeClaimStatus(APIBaseModel):
+class PersistentVolumeClaimStatus(DeferredAPIBaseModel):
     access_modes: Annotated[
         list[str] | None,
         Field(
@@ -2307,7 +2307,7 @@ class PersistentVolumeClaimStatus(APIBaseModel):
     ] = None
 
 
-class PreferredSchedulingTerm(APIBaseModel):
+class PreferredSchedulingTerm(DeferredAPIBaseModel):
     preference: Annotated[
         NodeSelectorTerm,
         Field(description=("A node selector term, associated with the corresponding weight.")),
@@ -2318,7 +2318,7 @@ class PreferredSchedulingTerm(APIBaseModel):
     ]
 
 
-class PodSecurityContext(APIBaseModel):
+class PodSecurityContext(DeferredAPIBaseModel):
     app_armor_profile: Annotated[
         AppArmorProfile | None,
         Field(
@@ -2517,7 +2517,7 @@ class PodSecurityContext(APIBaseModel):
     ] = None
 
 
-class SecurityContext(APIBaseModel):
+class SecurityContext(DeferredAPIBaseModel):
     allow_privilege_escalation: Annotated[
         bool | None,
         Field(
@@ -2670,7 +2670,7 @@ class SecurityContext(APIBaseModel):
     ] = None
 
 
-class DownwardAPIVolumeFile(APIBaseModel):
+class DownwardAPIVolumeFile(DeferredAPIBaseModel):
     field_ref: Annotated[
         ObjectFieldSelector | None,
         Field(
@@ -2718,7 +2718,7 @@ class DownwardAPIVolumeFile(APIBaseModel):
     ] = None
 
 
-class EnvVarSource(APIBaseModel):
+class EnvVarSource(DeferredAPIBaseModel):
     config_map_key_ref: Annotated[
         ConfigMapKeySelector | None,
         Field(alias="configMapKeyRef", description="Selects a key of a ConfigMap."),
@@ -2756,7 +2756,7 @@ class EnvVarSource(APIBaseModel):
     ] = None
 
 
-class EnvVar(APIBaseModel):
+class EnvVar(DeferredAPIBaseModel):
     name: Annotated[
         str,
         Field(description="Name of the environment variable. Must be a C_IDENTIFIER."),
@@ -2785,7 +2785,7 @@ class EnvVar(APIBaseModel):
     ] = None
 
 
-class ResourceRequirements(APIBaseModel):
+class ResourceRequirements(DeferredAPIBaseModel):
     claims: Annotated[
         list[ResourceClaim] | None,
         Field(
@@ -2821,7 +2821,7 @@ class ResourceRequirements(APIBaseModel):
     ] = None
 
 
-class PodDNSConfig(APIBaseModel):
+class PodDNSConfig(DeferredAPIBaseModel):
     nameservers: Annotated[
         list[str] | None,
         Field(
@@ -2855,7 +2855,7 @@ class PodDNSConfig(APIBaseModel):
     ] = None
 
 
-class ConfigMapProjection(APIBaseModel):
+class ConfigMapProjection(DeferredAPIBaseModel):
     items: Annotated[
         list[KeyToPath] | None,
         Field(
@@ -2888,7 +2888,7 @@ class ConfigMapProjection(APIBaseModel):
     ] = None
 
 
-class ConfigMapVolumeSource(APIBaseModel):
+class ConfigMapVolumeSource(DeferredAPIBaseModel):
     default_mode: Annotated[
         int | None,
         Field(
@@ -2936,14 +2936,14 @@ class ConfigMapVolumeSource(APIBaseModel):
     ] = None
 
 
-class DownwardAPIProjection(APIBaseModel):
+class DownwardAPIProjection(DeferredAPIBaseModel):
     items: Annotated[
         list[DownwardAPIVolumeFile] | None,
         Field(description="Items is a list of DownwardAPIVolume file"),
     ] = None
 
 
-class DownwardAPIVolumeSource(APIBaseModel):
+class DownwardAPIVolumeSource(DeferredAPIBaseModel):
     default_mode: Annotated[
         int | None,
         Field(
@@ -2966,7 +2966,7 @@ class DownwardAPIVolumeSource(APIBaseModel):
     ] = None
 
 
-class HTTPGetAction(APIBaseModel):
+class HTTPGetAction(DeferredAPIBaseModel):
     host: Annotated[
         str | None,
         Field(
@@ -2999,7 +2999,7 @@ class HTTPGetAction(APIBaseModel):
     ] = None
 
 
-class NodeSelector(APIBaseModel):
+class NodeSelector(DeferredAPIBaseModel):
     node_selector_terms: Annotated[
         list[NodeSelectorTerm],
         Field(
@@ -3009,7 +3009,7 @@ class NodeSelector(APIBaseModel):
     ]
 
 
-class ClusterTrustBundleProjection(APIBaseModel):
+class ClusterTrustBundleProjection(DeferredAPIBaseModel):
     label_selector: Annotated[
         v1.LabelSelector | None,
         Field(
@@ -3060,7 +3060,7 @@ class ClusterTrustBundleProjection(APIBaseModel):
     ] = None
 
 
-class PodAffinityTerm(APIBaseModel):
+class PodAffinityTerm(DeferredAPIBaseModel):
     label_selector: Annotated[
         v1.LabelSelector | None,
         Field(
@@ -3147,7 +3147,7 @@ class PodAffinityTerm(APIBaseModel):
     ]
 
 
-class NodeAffinity(APIBaseModel):
+class NodeAffinity(DeferredAPIBaseModel):
     preferred_during_scheduling_ignored_during_execution: Annotated[
         list[PreferredSchedulingTerm] | None,
         Field(
@@ -3181,7 +3181,7 @@ class NodeAffinity(APIBaseModel):
     ] = None
 
 
-class PersistentVolumeClaimSpec(APIBaseModel):
+class PersistentVolumeClaimSpec(DeferredAPIBaseModel):
     access_modes: Annotated[
         list[str] | None,
         Field(
@@ -3315,7 +3315,7 @@ class PersistentVolumeClaimSpec(APIBaseModel):
     ] = None
 
 
-class LifecycleHandler(APIBaseModel):
+class LifecycleHandler(DeferredAPIBaseModel):
     exec: Annotated[
         ExecAction | None,
         Field(description="Exec specifies a command to execute in the container."),
@@ -3344,7 +3344,7 @@ class LifecycleHandler(APIBaseModel):
     ] = None
 
 
-class Probe(APIBaseModel):
+class Probe(DeferredAPIBaseModel):
     exec: Annotated[
         ExecAction | None,
         Field(description="Exec specifies a command to execute in the container."),
@@ -3440,7 +3440,7 @@ class Probe(APIBaseModel):
     ] = None
 
 
-class VolumeProjection(APIBaseModel):
+class VolumeProjection(DeferredAPIBaseModel):
     cluster_trust_bundle: Annotated[
         ClusterTrustBundleProjection | None,
         Field(
@@ -3486,7 +3486,7 @@ class VolumeProjection(APIBaseModel):
     ] = None
 
 
-class WeightedPodAffinityTerm(APIBaseModel):
+class WeightedPodAffinityTerm(DeferredAPIBaseModel):
     pod_affinity_term: Annotated[
         PodAffinityTerm,
         Field(
@@ -3500,7 +3500,7 @@ class WeightedPodAffinityTerm(APIBaseModel):
     ]
 
 
-class Event(APIBaseModel):
+class Event(DeferredAPIBaseModel):
     action: Annotated[
         str | None,
         Field(description=("What action was taken/failed regarding to the Regarding object.")),
@@ -3605,7 +3605,7 @@ class Event(APIBaseModel):
     ] = None
 
 
-class PersistentVolumeClaim(APIBaseModel):
+class PersistentVolumeClaim(DeferredAPIBaseModel):
     api_version: Annotated[
         str | None,
         Field(
@@ -3660,7 +3660,7 @@ class PersistentVolumeClaim(APIBaseModel):
     ] = None
 
 
-class PersistentVolumeClaimTemplate(APIBaseModel):
+class PersistentVolumeClaimTemplate(DeferredAPIBaseModel):
     metadata: Annotated[
         v1.ObjectMeta | None,
         Field(
@@ -3683,7 +3683,7 @@ class PersistentVolumeClaimTemplate(APIBaseModel):
     ]
 
 
-class Lifecycle(APIBaseModel):
+class Lifecycle(DeferredAPIBaseModel):
     post_start: Annotated[
         LifecycleHandler | None,
         Field(
@@ -3730,7 +3730,7 @@ class Lifecycle(APIBaseModel):
     ] = None
 
 
-class EphemeralVolumeSource(APIBaseModel):
+class EphemeralVolumeSource(DeferredAPIBaseModel):
     volume_claim_template: Annotated[
         PersistentVolumeClaimTemplate | None,
         Field(
@@ -3757,7 +3757,7 @@ class EphemeralVolumeSource(APIBaseModel):
     ] = None
 
 
-class Container(APIBaseModel):
+class Container(DeferredAPIBaseModel):
     args: Annotated[
         list[str] | None,
         Field(
@@ -4050,7 +4050,7 @@ class Container(APIBaseModel):
     ] = None
 
 
-class PodAffinity(APIBaseModel):
+class PodAffinity(DeferredAPIBaseModel):
     preferred_during_scheduling_ignored_during_execution: Annotated[
         list[WeightedPodAffinityTerm] | None,
         Field(
@@ -4087,7 +4087,7 @@ class PodAffinity(APIBaseModel):
     ] = None
 
 
-class PodAntiAffinity(APIBaseModel):
+class PodAntiAffinity(DeferredAPIBaseModel):
     preferred_during_scheduling_ignored_during_execution: Annotated[
         list[WeightedPodAffinityTerm] | None,
         Field(
@@ -4124,7 +4124,7 @@ class PodAntiAffinity(APIBaseModel):
     ] = None
 
 
-class ProjectedVolumeSource(APIBaseModel):
+class ProjectedVolumeSource(DeferredAPIBaseModel):
     default_mode: Annotated[
         int | None,
         Field(
@@ -4146,7 +4146,7 @@ class ProjectedVolumeSource(APIBaseModel):
     ] = None
 
 
-class Affinity(APIBaseModel):
+class Affinity(DeferredAPIBaseModel):
     node_affinity: Annotated[
         NodeAffinity | None,
         Field(
@@ -4176,7 +4176,7 @@ class Affinity(APIBaseModel):
     ] = None
 
 
-class Volume(APIBaseModel):
+class Volume(DeferredAPIBaseModel):
     aws_elastic_block_store: Annotated[
         AWSElasticBlockStoreVolumeSource | None,
         Field(
@@ -5,10 +5,12 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from pydantic import Field, RootModel
+from pydantic import ConfigDict, Field, RootModel
 
 
 class Quantity(RootModel[str]):
+    model_config = ConfigDict(defer_build=True)
+
     root: Annotated[
         str,
         Field(
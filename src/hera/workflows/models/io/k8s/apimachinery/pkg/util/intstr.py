@@ -3,8 +3,10 @@
 
 from __future__ import annotations
 
-from pydantic import RootModel
+from pydantic import ConfigDict, RootModel
 
 
 class IntOrString(RootModel[str | int]):
+    model_config = ConfigDict(defer_build=True)
+
     root: str | int
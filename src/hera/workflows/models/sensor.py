@@ -7,17 +7,17 @@ from typing import Annotated
 
 from pydantic import Field
 
-from hera.shared._pydantic import APIBaseModel
+from hera.shared._pydantic import DeferredAPIBaseModel
 
 from .github.com.argoproj.argo_events.pkg.apis.events import v1alpha1
 from .io.k8s.apimachinery.pkg.apis.meta import v1
 
 
-class DeleteSensorResponse(APIBaseModel):
+class DeleteSensorResponse(DeferredAPIBaseModel):
     pass
 
 
-class LogEntry(APIBaseModel):
+class LogEntry(DeferredAPIBaseModel):
     dependency_name: Annotated[
         str | None,
         Field(alias="dependencyName", title="optional - trigger dependency name"),
@@ -31,18 +31,18 @@ class LogEntry(APIBaseModel):
     trigger_name: Annotated[str | None, Field(alias="triggerName", title="optional - any trigger name")] = None
 
 
-class CreateSensorRequest(APIBaseModel):
+class CreateSensorRequest(DeferredAPIBaseModel):
     create_options: Annotated[v1.CreateOptions | None, Field(alias="createOptions")] = None
     namespace: str | None = None
     sensor: v1alpha1.Sensor | None = None
 
 
-class SensorWatchEvent(APIBaseModel):
+class SensorWatchEvent(DeferredAPIBaseModel):
     object: v1alpha1.Sensor | None = None
     type: str | None = None
 
 
-class UpdateSensorRequest(APIBaseModel):
+class UpdateSensorRequest(DeferredAPIBaseModel):
     name: str | None = None
     namespace: str | None = None
     sensor: v1alpha1.Sensor | None = None
@@ -7,7 +7,7 @@ for more on scripts in Argo Workflows.
 import ast
 import copy
 import inspect
-import sys
+import json
 import textwrap
 from abc import abstractmethod
 from dataclasses import dataclass
@@ -25,7 +25,6 @@ from typing import (
     Protocol,
     Sequence,
     Tuple,
-    Type,
     TypeVar,
     Union,
     cast,
@@ -57,13 +56,12 @@ from hera.workflows._mixins import (
     TemplateMixin,
     VolumeMountMixin,
 )
+from hera.workflows._runner.script_annotations_util import _extract_return_annotation_output
 from hera.workflows.artifact import (
     Artifact,
 )
-from hera.workflows.io.v2 import (
-    Input as InputV2,
-    Output as OutputV2,
-)
+from hera.workflows.env import ResourceEnv
+from hera.workflows.io._io_mixins import InputMixin, OutputMixin
 from hera.workflows.models import (
     ContinueOn,
     EnvVar,
@@ -85,17 +83,6 @@ from hera.workflows.steps import Step
 from hera.workflows.task import Task
 from hera.workflows.volume import _BaseVolume
 
-if sys.version_info >= (3, 14):
-    from hera.workflows.io.v2 import (
-        Input as InputV1,
-        Output as OutputV1,
-    )
-else:
-    from hera.workflows.io.v1 import (
-        Input as InputV1,
-        Output as OutputV1,
-    )
-
 
 class ScriptConstructor(BaseMixin):
     """A ScriptConstructor is responsible for generating the source code for a Script given a python callable.
@@ -150,6 +137,10 @@ class Script(
     working_dir: Optional[str] = None
     add_cwd_to_sys_path: Optional[bool] = None
     constructor: str | ScriptConstructor | None = None
+    batch_size: Optional[int] = None
+    """The number of items of a `with_items` or `with_param` list run by each pod, for a function run by the runner.
+    The items are grouped in batches when the template is called, and the runner runs the function for each item of
+    the batch, saving each returned output as the JSON list of its values for the items."""
 
     def __post_init__(self):
         """Perform post init validation."""
@@ -157,6 +148,12 @@ class Script(
 
         self.constructor = self._set_constructor(self.constructor)
 
+        if self.batch_size is not None:
+            if self.batch_size < 1:
+                raise ValueError("batch_size must be at least 1")
+            if not callable(self.source) or not isinstance(self.constructor, RunnerScriptConstructor):
+                raise ValueError("batch_size can only be used for a function run by the runner")
+
         self.command = self.command or global_config.script_command
 
         if self.add_cwd_to_sys_path is None:
@@ -273,6 +270,11 @@ class Script(
         func_artifacts: List[Artifact] = []
         if callable(self.source):
             func_parameters, func_artifacts = _get_inputs_from_callable(self.source)
+        if self.batch_size is not None:
+            from hera.workflows._runner.util import BATCH_PARAMETER
+
+            # the inputs taking the items of a batch, which is empty when the template is not called in a loop
+            func_parameters.append(Parameter(name=BATCH_PARAMETER, default="{}"))
 
         return cast(Optional[ModelInputs], self._aggregate_callable_io(inputs, func_parameters, func_artifacts, False))
 
@@ -375,12 +377,12 @@ def _get_outputs_from_return_annotation(
         append_annotation(param_or_artifact)
     elif get_origin(return_annotation) is tuple:
         for annotation in get_args(return_annotation):
-            if isinstance(annotation, type) and issubclass(annotation, (OutputV1, OutputV2)):
+            if isinstance(annotation, type) and issubclass(annotation, OutputMixin):
                 raise ValueError("Output cannot be part of a tuple output")
 
             if param_or_artifact := get_workflow_annotation(annotation):
                 append_annotation(param_or_artifact)
-    elif isinstance(return_annotation, type) and issubclass(return_annotation, (OutputV1, OutputV2)):
+    elif isinstance(return_annotation, type) and issubclass(return_annotation, OutputMixin):
         output_class = return_annotation
         for output in output_class._get_outputs():
             append_annotation(output)
@@ -433,10 +435,10 @@ def _get_inputs_from_callable(source: Callable) -> Tuple[List[Parameter], List[A
         # `Annotated[Literal[...]]` will raise an exception as `typing.Literal` is not a class (but an object).
         if (
             not is_subscripted(func_param.annotation)
-            and issubclass(func_param.annotation, (InputV1, InputV2))
+            and issubclass(func_param.annotation, InputMixin)
             or is_annotated(func_param.annotation)
             and inspect.isclass(unwrap_annotation(func_param.annotation))
-            and issubclass(unwrap_annotation(func_param.annotation), (InputV1, InputV2))
+            and issubclass(unwrap_annotation(func_param.annotation), InputMixin)
         ):
             if len(inspect.signature(source).parameters) != 1:
                 raise SyntaxError("Only one function parameter can be specified when using an Input.")
@@ -478,39 +480,6 @@ def _get_inputs_from_callable(source: Callable) -> Tuple[List[Parameter], List[A
     return parameters, artifacts
 
 
-def _extract_return_annotation_output(source: Callable) -> List:
-    """Extract the output annotations from the return annotation of the function signature."""
-    output: List[Union[Tuple[type, Union[Parameter, Artifact]], Type[Union[OutputV1, OutputV2]]]] = []
-
-    return_annotation = inspect.signature(source).return_annotation
-    origin_type = get_origin(return_annotation)
-    annotation_args = get_args(return_annotation)
-    if get_workflow_annotation(return_annotation):
-        output.append(annotation_args)
-    elif origin_type is tuple:
-        workflow_args = [
-            get_args(annotated_type) for annotated_type in annotation_args if get_workflow_annotation(annotated_type)
-        ]
-
-        # If all tuple elements are annotated as Parameter/Artifact
-        if len(workflow_args) == len(annotation_args):
-            output.extend(workflow_args)
-        # Only some tuple elements are annotated as Parameter/Artifact
-        elif workflow_args:
-            raise ValueError(
-                f"Function '{source.__name__}' output has partially annotated tuple return type. "
-                "Tuple elements must be all Annotated as Parameter/Artifact, or contain no Parameter/Artifact annotations for a raw tuple return type."
-            )
-    elif (
-        origin_type is None
-        and isinstance(return_annotation, type)
-        and issubclass(return_annotation, (OutputV1, OutputV2))
-    ):
-        output.append(return_annotation)
-
-    return output
-
-
 def _extract_all_output_annotations(source: Callable) -> List:
     """Extract the output annotations out of the function signature.
 
@@ -789,6 +758,10 @@ class InlineScriptConstructor(ScriptConstructor):
         # in order to have consistent looking functions and getting rid of any comments
         # parsing issues.
         # See https://github.com/argoproj-labs/hera/issues/572
+        if inspect.iscoroutinefunction(instance.source):
+            script += self._get_async_function_script(instance.source)
+            return textwrap.dedent(script)
+
         content = self._roundtrip(textwrap.dedent(inspect.getsource(instance.source))).splitlines()
         for i, line in enumerate(content):
             if line.startswith("def") or line.startswith("async def"):
@@ -798,6 +771,31 @@ class InlineScriptConstructor(ScriptConstructor):
         script += textwrap.dedent(s)
         return textwrap.dedent(script)
 
+    @staticmethod
+    def _get_async_function_script(source: Callable) -> str:
+        """Returns a script defining the async function and running it with the loaded parameters.
+
+        The body of an async function may await, which is not possible at the top level of a script, so the function
+        is defined, without its decorators, annotations and defaults, which may use names the script does not import,
+        and run with `asyncio.run`.
+        """
+        function = ast.parse(textwrap.dedent(inspect.getsource(source))).body[0]
+        assert isinstance(function, ast.AsyncFunctionDef)
+        function.decorator_list = []
+        function.returns = None
+        arguments = function.args
+        # the parameters are passed by name
+        arguments.args = arguments.posonlyargs + arguments.args
+        arguments.posonlyargs = []
+        for argument in arguments.args + arguments.kwonlyargs:
+            argument.annotation = None
+        arguments.defaults = []
+        arguments.kw_defaults = [None] * len(arguments.kwonlyargs)
+
+        names = [argument.arg for argument in arguments.args + arguments.kwonlyargs]
+        call = f"{function.name}({', '.join(f'{name}={name}' for name in names)})"
+        return f"import asyncio\n{ast.unparse(function)}\nasyncio.run({call})"
+
 
 @dataclass(kw_only=True)
 class RunnerScriptConstructor(ScriptConstructor):
@@ -825,6 +823,19 @@ class RunnerScriptConstructor(ScriptConstructor):
     Allows for using pydantic.v1 BaseModels with pydantic v2.
     Defaults to the installed version of Pydantic."""
 
+    event_loop: Optional[Literal["asyncio", "uvloop"]] = None
+    """The event loop async functions are run on: the `asyncio` one by default, or the `uvloop` one, which must be
+    installed in the image."""
+
+    call_manifest: bool = False
+    """Pass the runner a manifest of how to call the function, so the runner does not inspect its signature and
+    annotations in every pod. The manifest is built from the function when the template is built, and is ignored by the
+    runner if the parameters of the function in the image differ."""
+
+    batch_in_processes: bool = False
+    """Run the items of the batches of a script with a `batch_size` in a pool of processes, with a process for each
+    CPU requested by the container, rounded up. The function must be importable by the processes."""
+
     def __post_init__(self):
         """Perform post init validation."""
         super().__post_init__()
@@ -867,6 +878,18 @@ class RunnerScriptConstructor(ScriptConstructor):
             script_env.append(EnvVar(name="hera__outputs_directory", value=self.outputs_directory))
         if self.pydantic_mode:
             script_env.append(EnvVar(name="hera__pydantic_mode", value=str(self.pydantic_mode)))
+        if self.event_loop:
+            script_env.append(EnvVar(name="hera__event_loop", value=self.event_loop))
+        if self.call_manifest and callable(instance.source):
+            from hera.workflows._runner.util import CALL_MANIFEST_ENV, build_call_manifest
+
+            if (manifest := build_call_manifest(instance.source)) is not None:
+                script_env.append(EnvVar(name=CALL_MANIFEST_ENV, value=json.dumps(manifest, separators=(",", ":"))))
+        if self.batch_in_processes and instance.batch_size is not None:
+            from hera.workflows._runner.util import BATCH_PROCESSES_ENV
+
+            # the CPU request of the container, rounded up to whole CPUs by Kubernetes
+            script_env.append(ResourceEnv(name=BATCH_PROCESSES_ENV, resource="requests.cpu").build())
 
         if script_env:
             if not script.env:
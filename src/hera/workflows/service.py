@@ -2,13 +2,18 @@
 
 # [DO NOT MODIFY] Auto-generated by `hera/scripts/service.py`
 import os
-from typing import Optional, Tuple, cast
+from typing import BinaryIO, Generator, Optional, Tuple, Union, cast
 from urllib.parse import urljoin
 
 import requests
 
 from hera.exceptions import exception_from_server_response
-from hera.shared import global_config
+from hera.shared import TransportConfig, global_config
+from hera.shared._download import DEFAULT_CHUNK_SIZE, DEFAULT_MAX_RETRIES, download, iter_download
+from hera.shared._pagination import paginated_fields
+from hera.shared._responses import build_model, parse_response
+from hera.shared._stream import iter_log_results, iter_watch_results
+from hera.shared._transport import build_session
 from hera.workflows.models import (
     ArchivedWorkflowDeletedResponse,
     ClusterWorkflowTemplate,
@@ -56,6 +61,7 @@ from hera.workflows.models import (
     WorkflowTemplateList,
     WorkflowTemplateUpdateRequest,
     WorkflowTerminateRequest,
+    WorkflowWatchEvent,
 )
 
 
@@ -75,6 +81,8 @@ class WorkflowsService:
         client_certs: Optional[Tuple[str, str]] = None,
         namespace: Optional[str] = None,
         session: Optional[requests.Session] = None,
+        transport_config: Optional[TransportConfig] = None,
+        validate_responses: Optional[bool] = None,
     ) -> None:
         """Workflows service constructor."""
         self.host = cast(str, host or global_config.host)
@@ -101,13 +109,18 @@ class WorkflowsService:
         else:
             self.token = None
 
-        self.session = session or requests.Session()
+        # unvalidated responses are returned as lazy models, whose fields are only validated when first accessed
+        self.validate_responses = (
+            validate_responses if validate_responses is not None else global_config.validate_responses
+        )
+        self.transport_config = transport_config or global_config.transport_config
+        self.session = session or build_session(self.transport_config)
 
         self.namespace = namespace or global_config.namespace
 
     def _request(self, method, **kwargs):
         """Make a request using the session if enabled."""
-        return self.session.request(method, **kwargs)
+        return self.session.request(method, timeout=self.transport_config.timeout, **kwargs)
 
     def close(self):
         """Close the service session."""
@@ -164,7 +177,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return WorkflowList(**resp.json())
+            return parse_response(WorkflowList, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -182,7 +195,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return LabelKeys(**resp.json())
+            return parse_response(LabelKeys, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -225,7 +238,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return LabelValues(**resp.json())
+            return parse_response(LabelValues, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -243,7 +256,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -279,7 +292,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -297,7 +310,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -338,7 +351,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return ClusterWorkflowTemplateList(**resp.json())
+            return parse_response(ClusterWorkflowTemplateList, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -356,7 +369,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return ClusterWorkflowTemplate(**resp.json())
+            return parse_response(ClusterWorkflowTemplate, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -374,7 +387,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return ClusterWorkflowTemplate(**resp.json())
+            return parse_response(ClusterWorkflowTemplate, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -394,7 +407,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return ClusterWorkflowTemplate(**resp.json())
+            return parse_response(ClusterWorkflowTemplate, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -414,7 +427,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return ClusterWorkflowTemplate(**resp.json())
+            return parse_response(ClusterWorkflowTemplate, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -494,7 +507,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return CronWorkflowList(**resp.json())
+            return parse_response(CronWorkflowList, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -514,7 +527,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return CronWorkflow(**resp.json())
+            return parse_response(CronWorkflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -534,7 +547,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return CronWorkflow(**resp.json())
+            return parse_response(CronWorkflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -556,7 +569,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return CronWorkflow(**resp.json())
+            return parse_response(CronWorkflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -578,7 +591,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return CronWorkflow(**resp.json())
+            return parse_response(CronWorkflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -639,7 +652,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return CronWorkflow(**resp.json())
+            return parse_response(CronWorkflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -661,7 +674,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return CronWorkflow(**resp.json())
+            return parse_response(CronWorkflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -679,7 +692,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return InfoResponse(**resp.json())
+            return parse_response(InfoResponse, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -783,7 +796,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return GetUserInfoResponse(**resp.json())
+            return parse_response(GetUserInfoResponse, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -801,7 +814,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return Version(**resp.json())
+            return parse_response(Version, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -847,7 +860,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return WorkflowTemplateList(**resp.json())
+            return parse_response(WorkflowTemplateList, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -869,7 +882,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return WorkflowTemplate(**resp.json())
+            return parse_response(WorkflowTemplate, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -891,7 +904,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return WorkflowTemplate(**resp.json())
+            return parse_response(WorkflowTemplate, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -913,7 +926,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return WorkflowTemplate(**resp.json())
+            return parse_response(WorkflowTemplate, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -935,7 +948,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return WorkflowTemplate(**resp.json())
+            return parse_response(WorkflowTemplate, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1026,7 +1039,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return WorkflowList(**resp.json())
+            return parse_response(WorkflowList, resp.content, self.validate_responses and fields is None)
 
         raise exception_from_server_response(resp)
 
@@ -1046,7 +1059,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1066,7 +1079,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1086,7 +1099,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1113,7 +1126,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses and fields is None)
 
         raise exception_from_server_response(resp)
 
@@ -1207,7 +1220,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return V1alpha1LogEntry(**resp.json())
+            return parse_response(V1alpha1LogEntry, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1227,7 +1240,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1247,7 +1260,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1267,7 +1280,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1287,7 +1300,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1307,7 +1320,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1327,7 +1340,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1349,7 +1362,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return Workflow(**resp.json())
+            return parse_response(Workflow, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1401,7 +1414,7 @@ class WorkflowsService:
         )
 
         if resp.ok:
-            return V1alpha1LogEntry(**resp.json())
+            return parse_response(V1alpha1LogEntry, resp.content, self.validate_responses)
 
         raise exception_from_server_response(resp)
 
@@ -1535,5 +1548,617 @@ class WorkflowsService:
         """Returns the link for the given cron workflow name."""
         return os.path.join(self.host, f"cron-workflows/{self.namespace}/{name}")
 
+    def iter_archived_workflows(
+        self,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        resource_version_match: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        namespace: Optional[str] = None,
+        name_filter: Optional[str] = None,
+        limit: int = 500,
+    ) -> Generator[Workflow, None, None]:
+        """Yield the archived workflows one at a time, paging through them with `list_archived_workflows`.
+
+        Pages of `limit` archived workflows are fetched as they are consumed, so only one page is held in memory at a time.
+        """
+        continue_ = None
+        while True:
+            page = self.list_archived_workflows(
+                label_selector=label_selector,
+                field_selector=field_selector,
+                resource_version=resource_version if continue_ is None else None,
+                resource_version_match=resource_version_match if continue_ is None else None,
+                name_prefix=name_prefix,
+                namespace=namespace,
+                name_filter=name_filter,
+                limit=str(limit),
+                continue_=continue_,
+            )
+            yield from page.items or []
+            continue_ = page.metadata.continue_ if page.metadata is not None else None
+            if not continue_:
+                return
+
+    def iter_cluster_workflow_templates(
+        self,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        resource_version_match: Optional[str] = None,
+        limit: int = 500,
+    ) -> Generator[ClusterWorkflowTemplate, None, None]:
+        """Yield the cluster workflow templates one at a time, paging through them with `list_cluster_workflow_templates`.
+
+        Pages of `limit` cluster workflow templates are fetched as they are consumed, so only one page is held in memory at a time.
+        """
+        continue_ = None
+        while True:
+            page = self.list_cluster_workflow_templates(
+                label_selector=label_selector,
+                field_selector=field_selector,
+                resource_version=resource_version if continue_ is None else None,
+                resource_version_match=resource_version_match if continue_ is None else None,
+                limit=str(limit),
+                continue_=continue_,
+            )
+            yield from page.items or []
+            continue_ = page.metadata.continue_ if page.metadata is not None else None
+            if not continue_:
+                return
+
+    def iter_cron_workflows(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        resource_version_match: Optional[str] = None,
+        limit: int = 500,
+    ) -> Generator[CronWorkflow, None, None]:
+        """Yield the cron workflows one at a time, paging through them with `list_cron_workflows`.
+
+        Pages of `limit` cron workflows are fetched as they are consumed, so only one page is held in memory at a time.
+        """
+        continue_ = None
+        while True:
+            page = self.list_cron_workflows(
+                namespace=namespace,
+                label_selector=label_selector,
+                field_selector=field_selector,
+                resource_version=resource_version if continue_ is None else None,
+                resource_version_match=resource_version_match if continue_ is None else None,
+                limit=str(limit),
+                continue_=continue_,
+            )
+            yield from page.items or []
+            continue_ = page.metadata.continue_ if page.metadata is not None else None
+            if not continue_:
+                return
+
+    def iter_workflow_templates(
+        self,
+        namespace: Optional[str] = None,
+        name_pattern: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        resource_version_match: Optional[str] = None,
+        limit: int = 500,
+    ) -> Generator[WorkflowTemplate, None, None]:
+        """Yield the workflow templates one at a time, paging through them with `list_workflow_templates`.
+
+        Pages of `limit` workflow templates are fetched as they are consumed, so only one page is held in memory at a time.
+        """
+        continue_ = None
+        while True:
+            page = self.list_workflow_templates(
+                namespace=namespace,
+                name_pattern=name_pattern,
+                label_selector=label_selector,
+                field_selector=field_selector,
+                resource_version=resource_version if continue_ is None else None,
+                resource_version_match=resource_version_match if continue_ is None else None,
+                limit=str(limit),
+                continue_=continue_,
+            )
+            yield from page.items or []
+            continue_ = page.metadata.continue_ if page.metadata is not None else None
+            if not continue_:
+                return
+
+    def iter_workflows(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        resource_version_match: Optional[str] = None,
+        fields: Optional[str] = None,
+        name_filter: Optional[str] = None,
+        created_after: Optional[str] = None,
+        finished_before: Optional[str] = None,
+        limit: int = 500,
+    ) -> Generator[Workflow, None, None]:
+        """Yield the workflows one at a time, paging through them with `list_workflows`.
+
+        Pages of `limit` workflows are fetched as they are consumed, so only one page is held in memory at a time.
+        If `fields` is given, the token needed to fetch the next page is added to it.
+        """
+        continue_ = None
+        while True:
+            page = self.list_workflows(
+                namespace=namespace,
+                label_selector=label_selector,
+                field_selector=field_selector,
+                resource_version=resource_version if continue_ is None else None,
+                resource_version_match=resource_version_match if continue_ is None else None,
+                fields=paginated_fields(fields),
+                name_filter=name_filter,
+                created_after=created_after,
+                finished_before=finished_before,
+                limit=str(limit),
+                continue_=continue_,
+            )
+            yield from page.items or []
+            continue_ = page.metadata.continue_ if page.metadata is not None else None
+            if not continue_:
+                return
+
+    def stream_artifact_file(
+        self,
+        id_discriminator: str,
+        id_: str,
+        node_id: str,
+        artifact_name: str,
+        artifact_discriminator: str,
+        namespace: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> Generator[bytes, None, None]:
+        """Yield the content of the artifact file in chunks of up to `chunk_size` bytes, as it is received.
+
+        Unlike `get_artifact_file`, the content is never held in memory all at once. If the connection is lost,
+        the download is resumed from the last received byte, making at most `max_retries` consecutive attempts.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        yield from iter_download(
+            self.session,
+            url=urljoin(
+                self.host,
+                "artifact-files/{namespace}/{idDiscriminator}/{id}/{nodeId}/{artifactDiscriminator}/{artifactName}",
+            ).format(
+                idDiscriminator=id_discriminator,
+                id=id_,
+                nodeId=node_id,
+                artifactName=artifact_name,
+                artifactDiscriminator=artifact_discriminator,
+                namespace=namespace if namespace is not None else self.namespace,
+            ),
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={"Authorization": self.token},
+            timeout=self.transport_config.timeout,
+            verify=self.verify_ssl,
+            cert=self.client_certs,
+        )
+
+    def download_artifact_file(
+        self,
+        id_discriminator: str,
+        id_: str,
+        node_id: str,
+        artifact_name: str,
+        artifact_discriminator: str,
+        destination: Union[str, os.PathLike, BinaryIO],
+        namespace: Optional[str] = None,
+        checksum: Optional[str] = None,
+        resume: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> int:
+        """Download the artifact file to `destination`, a path or a binary file object, returning its size in bytes.
+
+        The content is written in chunks of up to `chunk_size` bytes as it is received, and the download is resumed
+        from the last received byte if the connection is lost (see `stream_artifact_file`). A path is written to
+        as `<path>.part` until the download completes. If `resume` is true, a `.part` file left by an interrupted
+        download is resumed from its end rather than downloaded again, unless the file changed since (as told by its
+        ETag or Last-Modified date), in which case it is downloaded again.
+
+        If `checksum` is given, as `algorithm:hexdigest` (e.g. `sha256:...`), the downloaded content is verified
+        against it, raising `ChecksumMismatch` if it differs.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        return download(
+            self.session,
+            url=urljoin(
+                self.host,
+                "artifact-files/{namespace}/{idDiscriminator}/{id}/{nodeId}/{artifactDiscriminator}/{artifactName}",
+            ).format(
+                idDiscriminator=id_discriminator,
+                id=id_,
+                nodeId=node_id,
+                artifactName=artifact_name,
+                artifactDiscriminator=artifact_discriminator,
+                namespace=namespace if namespace is not None else self.namespace,
+            ),
+            destination=destination,
+            checksum=checksum,
+            resume=resume,
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={"Authorization": self.token},
+            timeout=self.transport_config.timeout,
+            verify=self.verify_ssl,
+            cert=self.client_certs,
+        )
+
+    def stream_output_artifact_by_uid(
+        self,
+        uid: str,
+        node_id: str,
+        artifact_name: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> Generator[bytes, None, None]:
+        """Yield the content of the output artifact by UID in chunks of up to `chunk_size` bytes, as it is received.
+
+        Unlike `get_output_artifact_by_uid`, the content is never held in memory all at once. If the connection is lost,
+        the download is resumed from the last received byte, making at most `max_retries` consecutive attempts.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        yield from iter_download(
+            self.session,
+            url=urljoin(self.host, "artifacts-by-uid/{uid}/{nodeId}/{artifactName}").format(
+                uid=uid, nodeId=node_id, artifactName=artifact_name
+            ),
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={"Authorization": self.token},
+            timeout=self.transport_config.timeout,
+            verify=self.verify_ssl,
+            cert=self.client_certs,
+        )
+
+    def download_output_artifact_by_uid(
+        self,
+        uid: str,
+        node_id: str,
+        artifact_name: str,
+        destination: Union[str, os.PathLike, BinaryIO],
+        checksum: Optional[str] = None,
+        resume: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> int:
+        """Download the output artifact by UID to `destination`, a path or a binary file object, returning its size in bytes.
+
+        The content is written in chunks of up to `chunk_size` bytes as it is received, and the download is resumed
+        from the last received byte if the connection is lost (see `stream_output_artifact_by_uid`). A path is written to
+        as `<path>.part` until the download completes. If `resume` is true, a `.part` file left by an interrupted
+        download is resumed from its end rather than downloaded again, unless the file changed since (as told by its
+        ETag or Last-Modified date), in which case it is downloaded again.
+
+        If `checksum` is given, as `algorithm:hexdigest` (e.g. `sha256:...`), the downloaded content is verified
+        against it, raising `ChecksumMismatch` if it differs.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        return download(
+            self.session,
+            url=urljoin(self.host, "artifacts-by-uid/{uid}/{nodeId}/{artifactName}").format(
+                uid=uid, nodeId=node_id, artifactName=artifact_name
+            ),
+            destination=destination,
+            checksum=checksum,
+            resume=resume,
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={"Authorization": self.token},
+            timeout=self.transport_config.timeout,
+            verify=self.verify_ssl,
+            cert=self.client_certs,
+        )
+
+    def stream_output_artifact(
+        self,
+        name: str,
+        node_id: str,
+        artifact_name: str,
+        namespace: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> Generator[bytes, None, None]:
+        """Yield the content of the output artifact in chunks of up to `chunk_size` bytes, as it is received.
+
+        Unlike `get_output_artifact`, the content is never held in memory all at once. If the connection is lost,
+        the download is resumed from the last received byte, making at most `max_retries` consecutive attempts.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        yield from iter_download(
+            self.session,
+            url=urljoin(self.host, "artifacts/{namespace}/{name}/{nodeId}/{artifactName}").format(
+                name=name,
+                nodeId=node_id,
+                artifactName=artifact_name,
+                namespace=namespace if namespace is not None else self.namespace,
+            ),
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={"Authorization": self.token},
+            timeout=self.transport_config.timeout,
+            verify=self.verify_ssl,
+            cert=self.client_certs,
+        )
+
+    def download_output_artifact(
+        self,
+        name: str,
+        node_id: str,
+        artifact_name: str,
+        destination: Union[str, os.PathLike, BinaryIO],
+        namespace: Optional[str] = None,
+        checksum: Optional[str] = None,
+        resume: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> int:
+        """Download the output artifact to `destination`, a path or a binary file object, returning its size in bytes.
+
+        The content is written in chunks of up to `chunk_size` bytes as it is received, and the download is resumed
+        from the last received byte if the connection is lost (see `stream_output_artifact`). A path is written to
+        as `<path>.part` until the download completes. If `resume` is true, a `.part` file left by an interrupted
+        download is resumed from its end rather than downloaded again, unless the file changed since (as told by its
+        ETag or Last-Modified date), in which case it is downloaded again.
+
+        If `checksum` is given, as `algorithm:hexdigest` (e.g. `sha256:...`), the downloaded content is verified
+        against it, raising `ChecksumMismatch` if it differs.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        return download(
+            self.session,
+            url=urljoin(self.host, "artifacts/{namespace}/{name}/{nodeId}/{artifactName}").format(
+                name=name,
+                nodeId=node_id,
+                artifactName=artifact_name,
+                namespace=namespace if namespace is not None else self.namespace,
+            ),
+            destination=destination,
+            checksum=checksum,
+            resume=resume,
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={"Authorization": self.token},
+            timeout=self.transport_config.timeout,
+            verify=self.verify_ssl,
+            cert=self.client_certs,
+        )
+
+    def stream_input_artifact_by_uid(
+        self,
+        uid: str,
+        node_id: str,
+        artifact_name: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> Generator[bytes, None, None]:
+        """Yield the content of the input artifact by UID in chunks of up to `chunk_size` bytes, as it is received.
+
+        Unlike `get_input_artifact_by_uid`, the content is never held in memory all at once. If the connection is lost,
+        the download is resumed from the last received byte, making at most `max_retries` consecutive attempts.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        yield from iter_download(
+            self.session,
+            url=urljoin(self.host, "input-artifacts-by-uid/{uid}/{nodeId}/{artifactName}").format(
+                uid=uid, nodeId=node_id, artifactName=artifact_name
+            ),
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={"Authorization": self.token},
+            timeout=self.transport_config.timeout,
+            verify=self.verify_ssl,
+            cert=self.client_certs,
+        )
+
+    def download_input_artifact_by_uid(
+        self,
+        uid: str,
+        node_id: str,
+        artifact_name: str,
+        destination: Union[str, os.PathLike, BinaryIO],
+        checksum: Optional[str] = None,
+        resume: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> int:
+        """Download the input artifact by UID to `destination`, a path or a binary file object, returning its size in bytes.
+
+        The content is written in chunks of up to `chunk_size` bytes as it is received, and the download is resumed
+        from the last received byte if the connection is lost (see `stream_input_artifact_by_uid`). A path is written to
+        as `<path>.part` until the download completes. If `resume` is true, a `.part` file left by an interrupted
+        download is resumed from its end rather than downloaded again, unless the file changed since (as told by its
+        ETag or Last-Modified date), in which case it is downloaded again.
+
+        If `checksum` is given, as `algorithm:hexdigest` (e.g. `sha256:...`), the downloaded content is verified
+        against it, raising `ChecksumMismatch` if it differs.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        return download(
+            self.session,
+            url=urljoin(self.host, "input-artifacts-by-uid/{uid}/{nodeId}/{artifactName}").format(
+                uid=uid, nodeId=node_id, artifactName=artifact_name
+            ),
+            destination=destination,
+            checksum=checksum,
+            resume=resume,
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={"Authorization": self.token},
+            timeout=self.transport_config.timeout,
+            verify=self.verify_ssl,
+            cert=self.client_certs,
+        )
+
+    def stream_input_artifact(
+        self,
+        name: str,
+        node_id: str,
+        artifact_name: str,
+        namespace: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> Generator[bytes, None, None]:
+        """Yield the content of the input artifact in chunks of up to `chunk_size` bytes, as it is received.
+
+        Unlike `get_input_artifact`, the content is never held in memory all at once. If the connection is lost,
+        the download is resumed from the last received byte, making at most `max_retries` consecutive attempts.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        yield from iter_download(
+            self.session,
+            url=urljoin(self.host, "input-artifacts/{namespace}/{name}/{nodeId}/{artifactName}").format(
+                name=name,
+                nodeId=node_id,
+                artifactName=artifact_name,
+                namespace=namespace if namespace is not None else self.namespace,
+            ),
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={"Authorization": self.token},
+            timeout=self.transport_config.timeout,
+            verify=self.verify_ssl,
+            cert=self.client_certs,
+        )
+
+    def download_input_artifact(
+        self,
+        name: str,
+        node_id: str,
+        artifact_name: str,
+        destination: Union[str, os.PathLike, BinaryIO],
+        namespace: Optional[str] = None,
+        checksum: Optional[str] = None,
+        resume: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> int:
+        """Download the input artifact to `destination`, a path or a binary file object, returning its size in bytes.
+
+        The content is written in chunks of up to `chunk_size` bytes as it is received, and the download is resumed
+        from the last received byte if the connection is lost (see `stream_input_artifact`). A path is written to
+        as `<path>.part` until the download completes. If `resume` is true, a `.part` file left by an interrupted
+        download is resumed from its end rather than downloaded again, unless the file changed since (as told by its
+        ETag or Last-Modified date), in which case it is downloaded again.
+
+        If `checksum` is given, as `algorithm:hexdigest` (e.g. `sha256:...`), the downloaded content is verified
+        against it, raising `ChecksumMismatch` if it differs.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        return download(
+            self.session,
+            url=urljoin(self.host, "input-artifacts/{namespace}/{name}/{nodeId}/{artifactName}").format(
+                name=name,
+                nodeId=node_id,
+                artifactName=artifact_name,
+                namespace=namespace if namespace is not None else self.namespace,
+            ),
+            destination=destination,
+            checksum=checksum,
+            resume=resume,
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            headers={"Authorization": self.token},
+            timeout=self.transport_config.timeout,
+            verify=self.verify_ssl,
+            cert=self.client_certs,
+        )
+
+    def stream_workflows(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        fields: Optional[str] = None,
+        reconnect: bool = True,
+        max_reconnects: Optional[int] = None,
+    ) -> Generator[WorkflowWatchEvent, None, None]:
+        """Stream the changes to the workflows of the namespace, yielding each event as soon as it is received.
+
+        If `reconnect` is true, the stream is reopened with an exponential backoff when the connection is lost or
+        closed by the server, resuming after the last received event, or after `resource_version` if given.
+        `max_reconnects` limits the number of consecutive failed attempts to reconnect.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        for result in iter_watch_results(
+            self.session,
+            url=urljoin(self.host, "api/v1/workflow-events/{namespace}").format(
+                namespace=namespace if namespace is not None else self.namespace
+            ),
+            params={
+                "listOptions.labelSelector": label_selector,
+                "listOptions.fieldSelector": field_selector,
+                "fields": fields,
+            },
+            resource_version=resource_version,
+            reconnect=reconnect,
+            max_reconnects=max_reconnects,
+            headers={"Authorization": self.token},
+            verify=self.verify_ssl,
+            cert=self.client_certs,
+        ):
+            yield build_model(WorkflowWatchEvent, result, self.validate_responses and fields is None)
+
+    def stream_workflow_logs(
+        self,
+        name: str,
+        namespace: Optional[str] = None,
+        pod_name: Optional[str] = None,
+        container: str = "main",
+        follow: bool = False,
+        timestamps: bool = False,
+        since_seconds: Optional[int] = None,
+        tail_lines: Optional[int] = None,
+        grep: Optional[str] = None,
+        selector: Optional[str] = None,
+        reconnect: bool = True,
+        max_reconnects: Optional[int] = None,
+    ) -> Generator[V1alpha1LogEntry, None, None]:
+        """Stream the logs of the pods of the workflow, or of `pod_name`, yielding each entry as soon as it is received.
+
+        The Argo server merges the logs of all the pods of the workflow (or the ones matching the `selector` label
+        selector) into the stream. If `follow` is true, the stream continues until the workflow completes, otherwise it
+        ends with the logs written so far. Only the last `tail_lines` lines, or the lines of the last `since_seconds`
+        seconds, of each pod are streamed if given, and only the lines matching the `grep` regular expression.
+
+        If `reconnect` is true, the stream is reopened with an exponential backoff when the connection is lost,
+        resuming after the last received entries. `max_reconnects` limits the number of consecutive failed attempts to
+        reconnect.
+        """
+        assert valid_host_scheme(self.host), "The host scheme is required for service usage"
+        for result in iter_log_results(
+            self.session,
+            url=urljoin(self.host, "api/v1/workflows/{namespace}/{name}/log").format(
+                name=name, namespace=namespace if namespace is not None else self.namespace
+            ),
+            params={
+                "podName": pod_name,
+                "logOptions.container": container,
+                "logOptions.follow": follow,
+                "logOptions.sinceSeconds": since_seconds,
+                "logOptions.tailLines": tail_lines,
+                "grep": grep,
+                "selector": selector,
+            },
+            timestamps=timestamps,
+            reconnect=reconnect,
+            max_reconnects=max_reconnects,
+            headers={"Authorization": self.token},
+            verify=self.verify_ssl,
+            cert=self.client_certs,
+        ):
+            yield build_model(V1alpha1LogEntry, result, self.validate_responses)
+
 
 __all__ = ["WorkflowsService"]
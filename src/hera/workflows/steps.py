@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from typing import Any, List, Optional, Set, Union
 
 from hera.workflows._context import _context
-from hera.workflows._meta_mixins import CallableTemplateMixin, ContextMixin
+from hera.workflows._meta_mixins import BuildCacheMixin, CallableTemplateMixin, ContextMixin
 from hera.workflows._mixins import (
     ArgumentsMixin,
     IOMixin,
@@ -101,6 +101,7 @@ class Step(
 class Parallel(
     SubNodeMixin,
     ContextMixin,
+    BuildCacheMixin,
 ):
     """Parallel is a context manager used to create a list of steps to run in parallel.
 
@@ -127,6 +128,7 @@ class Parallel(
             raise NodeNameConflict(f"Found multiple Steps named: {node.name}")
         self._node_names.add(node.name)
         self.sub_steps.append(node)
+        self._adopt(node)
 
     def _build_step(self) -> List[_ModelWorkflowStep]:
         steps = []
@@ -209,6 +211,7 @@ class Steps(
         if isinstance(node, Parallel):
             node._node_names = self._node_names
         self.sub_steps.append(node)
+        self._adopt(node)
 
     def parallel(self) -> Parallel:
         """Returns a Parallel object which can be used in a sub-context manager."""
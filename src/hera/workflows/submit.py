@@ -0,0 +1,263 @@
+"""The submit module provides functions to create many workflows concurrently on the Argo server."""
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
+from functools import partial
+from typing import Any, Awaitable, Callable, Deque, Iterable, List, Optional, Tuple, TypeVar, Union, cast
+
+import requests
+from requests.adapters import DEFAULT_POOLSIZE
+
+from hera.exceptions import HeraException
+from hera.shared import global_config
+from hera.shared._stream import _REQUESTS_CONNECTION_ERRORS, RETRYABLE_STATUS_CODES, backoff_delay
+from hera.workflows.async_service import AsyncWorkflowsService
+from hera.workflows.exceptions import SubmissionError
+from hera.workflows.models import (
+    Workflow as _ModelWorkflow,
+    WorkflowCreateRequest,
+)
+from hera.workflows.service import WorkflowsService
+from hera.workflows.workflow import Workflow
+
+T = TypeVar("T")
+
+_logger = logging.getLogger(__name__)
+
+_DEFAULT_CONCURRENCY = 8
+_DEFAULT_MAX_RETRIES = 3
+
+
+def _create_request(workflow: Union[Workflow, _ModelWorkflow]) -> Tuple[WorkflowCreateRequest, Optional[str]]:
+    """Return the request creating the given workflow, and the namespace to create it in."""
+    if isinstance(workflow, Workflow):
+        assert workflow.namespace, "workflow namespace not defined"
+        return WorkflowCreateRequest(workflow=workflow.build()), workflow.namespace  # type: ignore
+    return WorkflowCreateRequest(workflow=workflow), workflow.metadata.namespace
+
+
+def _set_name(workflow: Union[Workflow, _ModelWorkflow], created: _ModelWorkflow) -> None:
+    # set the workflow name to the name returned by the API, as `Workflow.create` does, which covers workflows
+    # relying on `generate_name`
+    if isinstance(workflow, Workflow):
+        workflow.name = created.metadata.name
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, HeraException):
+        return getattr(error, "status_code", None) in RETRYABLE_STATUS_CODES
+    return isinstance(error, _REQUESTS_CONNECTION_ERRORS)
+
+
+def _cap_concurrency(service: Union[WorkflowsService, AsyncWorkflowsService], concurrency: int) -> int:
+    """Return `concurrency` capped to the connections of the service, as set by its `TransportConfig`.
+
+    A sync service keeps up to `max_connections_per_host` connections open for reuse (10 by default), so threads beyond
+    it would open (with a new TLS handshake) a connection closed again after each request. An async service opens up
+    to `max_connections_per_host` connections at once (100 by default), so requests beyond it would only wait for one.
+    """
+    limit = service.transport_config.max_connections_per_host
+    if limit is None:
+        if isinstance(service, WorkflowsService):
+            limit = DEFAULT_POOLSIZE
+        else:
+            from hera.shared._async_transport import _DEFAULT_LIMITS
+
+            limit = cast(int, _DEFAULT_LIMITS.max_connections)
+    if concurrency > limit:
+        _logger.warning(
+            "Capping the concurrency of %d to the %d connections of the workflows service, "
+            "set `TransportConfig.max_connections_per_host` to raise it",
+            concurrency,
+            limit,
+        )
+        return limit
+    return concurrency
+
+
+def _default_service(concurrency: int) -> WorkflowsService:
+    """Return a service configured by `global_config`, keeping `concurrency` connections open unless configured."""
+    transport_config = global_config.transport_config
+    if transport_config.max_connections_per_host is None:
+        transport_config = replace(transport_config, max_connections_per_host=concurrency)
+    return WorkflowsService(transport_config=transport_config)
+
+
+def _async_service(service: Optional[Union[WorkflowsService, AsyncWorkflowsService]]) -> AsyncWorkflowsService:
+    """Return an async service connecting to the Argo server as the given sync service does, or as configured."""
+    if service is None:
+        return AsyncWorkflowsService()
+    if not isinstance(service, WorkflowsService):
+        raise TypeError(f"Expected a WorkflowsService or an AsyncWorkflowsService, got {type(service).__name__}")
+    return AsyncWorkflowsService(
+        host=service.host,
+        verify_ssl=service.verify_ssl,
+        client_certs=service.client_certs,
+        token=service.token,
+        namespace=service.namespace,
+        validate_responses=service.validate_responses,
+        transport_config=service.transport_config,
+    )
+
+
+def _with_retries(create: Callable[[], T], max_retries: int) -> T:
+    attempt = 0
+    while True:
+        try:
+            return create()
+        except (HeraException, requests.RequestException) as e:
+            if attempt >= max_retries or not _is_retryable(e):
+                raise
+        time.sleep(backoff_delay(attempt))
+        attempt += 1
+
+
+async def _async_with_retries(create: Callable[[], Awaitable[T]], max_retries: int) -> T:
+    import httpx
+
+    attempt = 0
+    while True:
+        try:
+            return await create()
+        except (HeraException, httpx.TransportError) as e:
+            if attempt >= max_retries or not (isinstance(e, httpx.TransportError) or _is_retryable(e)):
+                raise
+        await asyncio.sleep(backoff_delay(attempt))
+        attempt += 1
+
+
+def submit_many(
+    workflows: Iterable[Union[Workflow, _ModelWorkflow]],
+    concurrency: int = _DEFAULT_CONCURRENCY,
+    workflows_service: Optional[WorkflowsService] = None,
+    max_retries: int = _DEFAULT_MAX_RETRIES,
+) -> List[_ModelWorkflow]:
+    """Create the given workflows on the Argo server, sending up to `concurrency` requests at once.
+
+    The requests are sent from a pool of threads sharing the connections of a single session, the one of
+    `workflows_service`, or of the first Hera workflow if not given. The session is used as is, so `concurrency` is
+    capped (with a logged warning) to the number of connections it keeps open, set with the
+    `TransportConfig.max_connections_per_host` of the service (10 by default). If there is no service, one is created
+    with the global configuration, keeping `concurrency` connections open unless `max_connections_per_host` is set,
+    and closed once the workflows are created. Workflows are built while earlier ones are being created, so only a
+    few more than `concurrency` of them are built but not created yet at any time.
+
+    Each creation is retried up to `max_retries` times, with an exponential backoff, if the server responds with a
+    429 or 5xx status code or the connection fails. Note that a workflow using `generate_name` may be created twice if
+    the server created it but failed to respond.
+
+    Returns:
+        The created workflows, in the order of `workflows`. The names of the given Hera workflows are set to the names
+        of the created workflows, as `Workflow.create` does.
+
+    Raises:
+        TypeError: if the service is not a `WorkflowsService`.
+        SubmissionError: if some workflows could not be created, after all the others were. Its `results` hold the
+            created workflows and the exceptions raised for the others, in the order of `workflows`.
+    """
+    workflows = iter(workflows)
+    first = next(workflows, None)
+    if first is None:
+        return []
+    service: Optional[Union[WorkflowsService, AsyncWorkflowsService]] = workflows_service
+    if service is None and isinstance(first, Workflow):
+        service = first.workflows_service
+    if service is None:
+        # the service is only created to submit the workflows, so it is closed once they are
+        with _default_service(concurrency) as default_service:
+            return submit_many(itertools.chain([first], workflows), concurrency, default_service, max_retries)
+    if not isinstance(service, WorkflowsService):
+        raise TypeError(f"Expected a WorkflowsService, got {type(service).__name__}, use `async_submit_many` instead")
+    concurrency = _cap_concurrency(service, concurrency)
+
+    results: List[Any] = []
+    in_flight: Deque[Tuple[int, Future]] = deque()
+
+    def collect(index: int, future: Future) -> None:
+        try:
+            results[index] = future.result()
+        except Exception as e:
+            results[index] = e
+
+    def submit(workflow: Union[Workflow, _ModelWorkflow], request: WorkflowCreateRequest, namespace: Optional[str]):
+        assert isinstance(service, WorkflowsService)
+        created = _with_retries(partial(service.create_workflow, request, namespace=namespace), max_retries)
+        _set_name(workflow, created)
+        return created
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for index, workflow in enumerate(itertools.chain([first], workflows)):
+            results.append(None)
+            try:
+                request, namespace = _create_request(workflow)
+            except Exception as e:
+                results[index] = e
+                continue
+            in_flight.append((index, executor.submit(submit, workflow, request, namespace)))
+            # bound the number of built workflows waiting to be created
+            while len(in_flight) >= 2 * concurrency:
+                collect(*in_flight.popleft())
+        while in_flight:
+            collect(*in_flight.popleft())
+
+    if any(isinstance(result, Exception) for result in results):
+        raise SubmissionError(results)
+    return results
+
+
+async def async_submit_many(
+    workflows: Iterable[Union[Workflow, _ModelWorkflow]],
+    concurrency: int = _DEFAULT_CONCURRENCY,
+    workflows_service: Optional[AsyncWorkflowsService] = None,
+    max_retries: int = _DEFAULT_MAX_RETRIES,
+) -> List[_ModelWorkflow]:
+    """Create the given workflows on the Argo server, sending up to `concurrency` requests at once, asynchronously.
+
+    The requests share the client of `workflows_service`, or of the first Hera workflow if not given, and
+    `concurrency` is capped to the connections it opens at once, set with `TransportConfig.max_connections_per_host`
+    (100 by default). As Hera workflows hold a sync `WorkflowsService`, an async service connecting to the same
+    server is created from it, or from the global configuration if there is none, and closed once the workflows are
+    created. See `submit_many` for the retries and the results.
+
+    Raises:
+        TypeError: if `workflows_service` is not an `AsyncWorkflowsService`.
+        SubmissionError: if some workflows could not be created, see `submit_many`.
+    """
+    workflows = list(workflows)
+    if not workflows:
+        return []
+    service: Optional[Union[WorkflowsService, AsyncWorkflowsService]] = workflows_service
+    if service is None and isinstance(workflows[0], Workflow):
+        service = workflows[0].workflows_service
+    if not isinstance(service, AsyncWorkflowsService):
+        if workflows_service is not None:
+            raise TypeError(
+                f"Expected an AsyncWorkflowsService, got {type(workflows_service).__name__}, use `submit_many` instead"
+            )
+        # the service is only created to submit the workflows, so it is closed once they are
+        async with _async_service(service) as async_service:
+            return await async_submit_many(workflows, concurrency, async_service, max_retries)
+    semaphore = asyncio.Semaphore(_cap_concurrency(service, concurrency))
+
+    async def submit(workflow: Union[Workflow, _ModelWorkflow]) -> _ModelWorkflow:
+        assert isinstance(service, AsyncWorkflowsService)
+        async with semaphore:
+            request, namespace = _create_request(workflow)
+            created = await _async_with_retries(
+                partial(service.create_workflow, request, namespace=namespace), max_retries
+            )
+        _set_name(workflow, created)
+        return created
+
+    results: List[Any] = await asyncio.gather(*(submit(workflow) for workflow in workflows), return_exceptions=True)
+    if any(isinstance(result, Exception) for result in results):
+        raise SubmissionError(results)
+    return results
+
+
+__all__ = ["async_submit_many", "submit_many"]
@@ -5,17 +5,21 @@ for more on Workflows.
 """
 
 import asyncio
+import random
 import time
+from contextlib import aclosing, closing
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Annotated, Any, Dict, List, Optional, Type, TypeVar, Union
 
+import requests
 from typing_extensions import ParamSpec
 
 from hera import _yaml
+from hera.exceptions import HeraException, NotFound
 from hera.shared import global_config
 from hera.shared._pydantic import APIBaseModel
-from hera.workflows._meta_mixins import ContextMixin, HookMixin, ModelMapperMixin
+from hera.workflows._meta_mixins import BuildCacheMixin, ContextMixin, HookMixin, ModelMapperMixin
 from hera.workflows._mixins import (
     ArgumentsMixin,
     ArgumentsT,
@@ -72,6 +76,28 @@ NAME_LIMIT = 63
 T = TypeVar("T")
 P = ParamSpec("P")
 
+# Waiting for a workflow only needs its phase, so the status of its nodes (which can be large) is not transferred
+_WAIT_FIELDS = "metadata.name,metadata.resourceVersion,status.phase"
+_WATCH_WAIT_FIELDS = ",".join(["result.type"] + [f"result.object.{field}" for field in _WAIT_FIELDS.split(",")])
+# The number of consecutive failed attempts to reconnect to the watch stream before falling back to polling
+_WATCH_MAX_RECONNECTS = 5
+# The interval in seconds before the first poll, which then doubles on each poll
+_INITIAL_POLL_INTERVAL = 0.5
+
+
+def _is_completed(workflow: Optional[_ModelWorkflow]) -> bool:
+    """Return whether the given workflow has completed, i.e. has a phase other than pending or running."""
+    phase = workflow.status.phase if workflow is not None and workflow.status is not None else None
+    if not phase:
+        return False
+    return WorkflowStatus.from_argo_status(phase) not in (WorkflowStatus.pending, WorkflowStatus.running)
+
+
+def _poll_delay(attempt: int, poll_interval: float) -> float:
+    """Return the delay before the given (0-based) poll, growing exponentially up to `poll_interval`, with jitter."""
+    delay = min(poll_interval, _INITIAL_POLL_INTERVAL * 2**attempt)
+    return random.uniform(delay / 2, delay)
+
 
 class _WorkflowModelMapper(ModelMapperMixin.ModelMapper):
     @classmethod
@@ -123,7 +149,9 @@ class Workflow(
             if isinstance(template, HookMixin):
                 template = template._dispatch_hooks()
 
-            if isinstance(template, Templatable):
+            if isinstance(template, BuildCacheMixin):
+                templates.append(template._build_template_cached())
+            elif isinstance(template, Templatable):
                 templates.append(template._build_template())
             elif isinstance(template, _ModelTemplate):
                 templates.append(template)
@@ -411,41 +439,65 @@ class Workflow(
             return self.wait(poll_interval=poll_interval)
         return wf
 
-    def wait(self, poll_interval: int = 5) -> TWorkflow:
+    def wait(self, poll_interval: int = 5, watch: bool = True) -> TWorkflow:
         """Waits for the Workflow to complete execution.
 
+        Only the phase of the workflow is transferred until it completes, then the whole workflow is fetched once.
+
         Parameters
         ----------
         poll_interval: int = 5
-            The interval in seconds to poll the workflow status.
+            The maximum interval in seconds between two polls of the workflow status, when polling.
+        watch: bool = True
+            If true, the workflow is watched through the Argo server's event stream, falling back to polling if the
+            stream is not available. If false, the workflow status is polled at intervals growing exponentially (with
+            jitter) up to `poll_interval`.
         """
         assert isinstance(self.workflows_service, WorkflowsService), "workflows service not initialized"
         assert self.namespace is not None, "workflow namespace not defined"
         assert self.name is not None, "workflow name not defined"
 
-        # here we use the sleep interval to wait for the workflow post creation. This is to address a potential
-        # race conditions such as:
-        # 1. Argo server says "workflow was accepted" but the workflow is not yet created
-        # 2. Hera wants to verify the status of the workflow, but it's not yet defined because it's not created
-        # 3. Argo finally creates the workflow
-        # 4. Hera throws an `AssertionError` because the phase assertion fails
-        time.sleep(poll_interval)
-        wf = self.workflows_service.get_workflow(self.name, namespace=self.namespace)
-        assert wf.metadata.name is not None, f"workflow name not defined for workflow {self.name}"
-
-        assert wf.status is not None, f"workflow status not defined for workflow {wf.metadata.name}"
-        assert wf.status.phase is not None, f"workflow phase not defined for workflow status {wf.status}"
-        status = WorkflowStatus.from_argo_status(wf.status.phase)
-
-        # keep polling for workflow status until completed, at the interval dictated by the user
-        while status == WorkflowStatus.running:
-            time.sleep(poll_interval)
-            wf = self.workflows_service.get_workflow(wf.metadata.name, namespace=self.namespace)
-            assert wf.metadata.name is not None
-            assert wf.status is not None, f"workflow status not defined for workflow {wf.metadata.name}"
-            assert wf.status.phase is not None, f"workflow phase not defined for workflow status {wf.status}"
-            status = WorkflowStatus.from_argo_status(wf.status.phase)
-        return wf
+        if watch:
+            try:
+                self._watch_until_completed()
+            except (HeraException, requests.RequestException):
+                # the stream may not be available, e.g. when a proxy in front of the Argo server does not support it
+                self._poll_until_completed(poll_interval)
+        else:
+            self._poll_until_completed(poll_interval)
+        return self.workflows_service.get_workflow(self.name, namespace=self.namespace)
+
+    def _watch_until_completed(self) -> None:
+        assert isinstance(self.workflows_service, WorkflowsService)
+        events = self.workflows_service.stream_workflows(
+            namespace=self.namespace,
+            field_selector=f"metadata.name={self.name}",
+            fields=_WATCH_WAIT_FIELDS,
+            max_reconnects=_WATCH_MAX_RECONNECTS,
+        )
+        with closing(events):
+            for event in events:
+                # a deleted workflow will never complete, which is reported when fetching it
+                if event.type == "DELETED" or _is_completed(event.object):
+                    return
+
+    def _poll_until_completed(self, poll_interval: int) -> None:
+        assert isinstance(self.workflows_service, WorkflowsService)
+        assert self.name is not None
+        attempt = 0
+        while True:
+            time.sleep(_poll_delay(attempt, poll_interval))
+            try:
+                wf = self.workflows_service.get_workflow(self.name, namespace=self.namespace, fields=_WAIT_FIELDS)
+            except NotFound:
+                # the Argo server may accept the workflow before it can be fetched, so it is allowed not to be found
+                # until the interval between polls reaches `poll_interval`
+                if _INITIAL_POLL_INTERVAL * 2**attempt >= poll_interval:
+                    raise
+            else:
+                if _is_completed(wf):
+                    return
+            attempt += 1
 
     def lint(self) -> TWorkflow:
         """Lints the Workflow using the Argo cluster."""
@@ -482,41 +534,69 @@ class Workflow(
             return await self.async_wait(poll_interval=poll_interval)
         return wf
 
-    async def async_wait(self, poll_interval: int = 5) -> TWorkflow:
+    async def async_wait(self, poll_interval: int = 5, watch: bool = True) -> TWorkflow:
         """Waits for the Workflow to complete execution.
 
+        Only the phase of the workflow is transferred until it completes, then the whole workflow is fetched once.
+
         Parameters
         ----------
         poll_interval: int = 5
-            The interval in seconds to poll the workflow status.
+            The maximum interval in seconds between two polls of the workflow status, when polling.
+        watch: bool = True
+            If true, the workflow is watched through the Argo server's event stream, falling back to polling if the
+            stream is not available. If false, the workflow status is polled at intervals growing exponentially (with
+            jitter) up to `poll_interval`.
         """
+        import httpx
+
         assert isinstance(self.workflows_service, AsyncWorkflowsService), "workflows service not initialized"
         assert self.namespace is not None, "workflow namespace not defined"
         assert self.name is not None, "workflow name not defined"
 
-        # here we use the sleep interval to wait for the workflow post creation. This is to address a potential
-        # race conditions such as:
-        # 1. Argo server says "workflow was accepted" but the workflow is not yet created
-        # 2. Hera wants to verify the status of the workflow, but it's not yet defined because it's not created
-        # 3. Argo finally creates the workflow
-        # 4. Hera throws an `AssertionError` because the phase assertion fails
-        await asyncio.sleep(poll_interval)
-        wf = await self.workflows_service.get_workflow(self.name, namespace=self.namespace)
-        assert wf.metadata.name is not None, f"workflow name not defined for workflow {self.name}"
-
-        assert wf.status is not None, f"workflow status not defined for workflow {wf.metadata.name}"
-        assert wf.status.phase is not None, f"workflow phase not defined for workflow status {wf.status}"
-        status = WorkflowStatus.from_argo_status(wf.status.phase)
-
-        # keep polling for workflow status until completed, at the interval dictated by the user
-        while status == WorkflowStatus.running:
-            await asyncio.sleep(poll_interval)
-            wf = await self.workflows_service.get_workflow(wf.metadata.name, namespace=self.namespace)
-            assert wf.metadata.name is not None
-            assert wf.status is not None, f"workflow status not defined for workflow {wf.metadata.name}"
-            assert wf.status.phase is not None, f"workflow phase not defined for workflow status {wf.status}"
-            status = WorkflowStatus.from_argo_status(wf.status.phase)
-        return wf
+        if watch:
+            try:
+                await self._async_watch_until_completed()
+            except (HeraException, httpx.HTTPError):
+                # the stream may not be available, e.g. when a proxy in front of the Argo server does not support it
+                await self._async_poll_until_completed(poll_interval)
+        else:
+            await self._async_poll_until_completed(poll_interval)
+        return await self.workflows_service.get_workflow(self.name, namespace=self.namespace)
+
+    async def _async_watch_until_completed(self) -> None:
+        assert isinstance(self.workflows_service, AsyncWorkflowsService)
+        events = self.workflows_service.stream_workflows(
+            namespace=self.namespace,
+            field_selector=f"metadata.name={self.name}",
+            fields=_WATCH_WAIT_FIELDS,
+            max_reconnects=_WATCH_MAX_RECONNECTS,
+        )
+        async with aclosing(events):
+            async for event in events:
+                # a deleted workflow will never complete, which is reported when fetching it
+                if event.type == "DELETED" or _is_completed(event.object):
+                    return
+
+    async def _async_poll_until_completed(self, poll_interval: int) -> None:
+        assert isinstance(self.workflows_service, AsyncWorkflowsService)
+        assert self.name is not None
+        attempt = 0
+        while True:
+            await asyncio.sleep(_poll_delay(attempt, poll_interval))
+            try:
+                wf = await self.workflows_service.get_workflow(
+                    self.name, namespace=self.namespace, fields=_WAIT_FIELDS
+                )
+            except NotFound:
+                # the Argo server may accept the workflow before it can be fetched, so it is allowed not to be found
+                # until the interval between polls reaches `poll_interval`
+                if _INITIAL_POLL_INTERVAL * 2**attempt >= poll_interval:
+                    raise
+            else:
+                if _is_completed(wf):
+                    return
+            attempt += 1
 
     async def async_lint(self) -> TWorkflow:
         """Lints the Workflow using the Argo cluster."""
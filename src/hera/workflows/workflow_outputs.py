@@ -0,0 +1,307 @@
+"""The workflow_outputs module provides functions to get the outputs of a completed workflow as `Output` models."""
+
+import asyncio
+import io
+import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import NoneType
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple, Type, TypeVar, Union, cast
+
+from pydantic import BaseModel as V2BaseModel
+
+from hera.shared._pydantic import get_field_annotations, get_fields, is_v1_model_class
+from hera.shared._type_util import origin_type_issubtype, unwrap_annotation
+from hera.workflows.artifact import Artifact, ArtifactLoader, _open_artifact_file, load_artifact_file
+from hera.workflows.async_service import AsyncWorkflowsService
+from hera.workflows.io._io_mixins import OutputMixin
+from hera.workflows.models import (
+    NodeStatus,
+    Workflow as _ModelWorkflow,
+)
+from hera.workflows.service import WorkflowsService
+from hera.workflows.submit import _DEFAULT_CONCURRENCY, _cap_concurrency
+from hera.workflows.workflow import Workflow
+
+if TYPE_CHECKING:
+    from pydantic.v1 import BaseModel as V1BaseModel
+
+OutputT = TypeVar("OutputT", bound=OutputMixin)
+
+# Only the nodes of the workflow are needed, so its spec and the rest of its status are not transferred
+_OUTPUTS_FIELDS = "metadata.name,metadata.namespace,status.phase,status.nodes"
+
+# The loaders mapping or iterating over the artifact file, which is downloaded rather than loaded in memory
+_FILE_LOADERS = (
+    ArtifactLoader.mmap,
+    ArtifactLoader.jsonl,
+    ArtifactLoader.records,
+    ArtifactLoader.numpy,
+    ArtifactLoader.arrow,
+)
+
+# An artifact to fetch: the name of the task or step, the field of its `Output` model, the node, and the annotation
+_ArtifactFetch = Tuple[str, str, NodeStatus, Artifact]
+
+
+def _workflow_name(
+    workflow: Union[Workflow, _ModelWorkflow, str],
+    workflows_service: Optional[Union[WorkflowsService, AsyncWorkflowsService]],
+    namespace: Optional[str],
+) -> Tuple[str, Union[WorkflowsService, AsyncWorkflowsService], Optional[str]]:
+    """Return the name of the given workflow, and the service and namespace to get it with."""
+    if isinstance(workflow, Workflow):
+        assert workflow.name is not None, "workflow name not defined"
+        name = workflow.name
+        workflows_service = workflows_service or workflow.workflows_service
+        namespace = namespace or workflow.namespace
+    elif isinstance(workflow, _ModelWorkflow):
+        assert workflow.metadata.name is not None, "workflow name not defined"
+        name = workflow.metadata.name
+        namespace = namespace or workflow.metadata.namespace
+    else:
+        name = workflow
+    assert workflows_service is not None, "workflows service not initialized"
+    return name, workflows_service, namespace
+
+
+def _find_node(workflow: _ModelWorkflow, name: str) -> NodeStatus:
+    """Return the node of the task or step called `name`, which may also be given as a node ID."""
+    nodes = workflow.status.nodes if workflow.status is not None and workflow.status.nodes is not None else {}
+    if name in nodes:
+        return nodes[name]
+    matches = [node for node in nodes.values() if node.display_name == name]
+    if not matches:
+        raise ValueError(f"Workflow {workflow.metadata.name} has no task or step named {name!r}")
+    if len(matches) > 1:
+        raise ValueError(
+            f"Workflow {workflow.metadata.name} has {len(matches)} nodes named {name!r}, use the ID of one of them: "
+            + ", ".join(node.id for node in matches)
+        )
+    return matches[0]
+
+
+def _load_parameter(value: str, annotation: Any, loads: Optional[Any] = None) -> Any:
+    """Load the value of an output parameter for the given field annotation, as the runner loads inputs."""
+    if origin_type_issubtype(unwrap_annotation(annotation), (str, NoneType)):
+        return value
+    if loads is not None:
+        return loads(value)
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        return value
+
+
+def _load_artifact(artifact: Artifact, content: bytes) -> Any:
+    """Load the content of an output artifact according to its annotation, as the runner loads input artifacts."""
+    if artifact.compression is not None:
+        with _open_artifact_file(io.BytesIO(content), "rb", artifact.compression) as f:
+            content = f.read()
+    if artifact.loads is not None:
+        return artifact.loads(content.decode())
+    if artifact.loadb is not None:
+        return artifact.loadb(content)
+    if artifact.loader == ArtifactLoader.json:
+        return json.loads(content)
+    return content.decode()
+
+
+def _map_node_outputs(
+    name: str,
+    node: NodeStatus,
+    output_class: Type[OutputMixin],
+) -> Tuple[Dict[str, Any], List[_ArtifactFetch]]:
+    """Map the outputs of the node to the fields of `output_class`, returning the artifacts to fetch separately.
+
+    Outputs missing from the node are left out, so their fields get their default value.
+    """
+    values: Dict[str, Any] = {}
+    fetches: List[_ArtifactFetch] = []
+    outputs = node.outputs
+    if outputs is None:
+        return values, fetches
+
+    model_class = cast("Union[Type[V1BaseModel], Type[V2BaseModel]]", output_class)
+    annotations = get_field_annotations(model_class)
+    parameters = {parameter.name: parameter.value for parameter in outputs.parameters or []}
+    artifacts = {artifact.name for artifact in outputs.artifacts or []}
+    for field in get_fields(model_class):
+        if field == "exit_code":
+            if outputs.exit_code is not None:
+                values[field] = outputs.exit_code
+            continue
+        if field == "result":
+            if outputs.result is not None:
+                values[field] = _load_parameter(outputs.result, annotations[field])
+            continue
+
+        output = output_class._get_output(field)
+        if isinstance(output, Artifact):
+            if output.name in artifacts:
+                fetches.append((name, field, node, output))
+            elif output.optional:
+                values[field] = None
+        elif (value := parameters.get(cast(str, output.name))) is not None:
+            values[field] = _load_parameter(value, annotations[field], output.loads)
+    return values, fetches
+
+
+def _build_output(output_class: Type[OutputT], values: Dict[str, Any]) -> OutputT:
+    if is_v1_model_class(output_class):
+        return cast(OutputT, cast("Type[V1BaseModel]", output_class).parse_obj(values))
+    assert issubclass(output_class, V2BaseModel)
+    return cast(OutputT, output_class.model_validate(values))
+
+
+def _is_downloaded(artifact: Artifact) -> bool:
+    """Return whether the artifact is downloaded to a file, rather than loaded, as it has no loader or a file loader."""
+    return (
+        artifact.loads is None
+        and artifact.loadb is None
+        and (artifact.loader is None or ArtifactLoader(artifact.loader) in _FILE_LOADERS)
+    )
+
+
+def _load_downloaded(artifact: Artifact, path: Path) -> Any:
+    """Return the path the artifact is downloaded to, or the artifact loaded from it with its file loader."""
+    return (
+        path
+        if artifact.loader is None
+        else load_artifact_file(path, ArtifactLoader(artifact.loader), artifact.compression)
+    )
+
+
+def _download_directory(download_directory: Optional[Union[str, Path]], fetches: List[_ArtifactFetch]) -> Path:
+    if download_directory is not None:
+        return Path(download_directory)
+    if any(_is_downloaded(artifact) for _, _, _, artifact in fetches):
+        return Path(tempfile.mkdtemp(prefix="hera-outputs-"))
+    return Path()
+
+
+def _artifact_path(download_directory: Path, fetch: _ArtifactFetch) -> Path:
+    name, _, _, artifact = fetch
+    path = download_directory / name / str(artifact.name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def get_workflow_outputs(
+    workflow: Union[Workflow, _ModelWorkflow, str],
+    outputs: Mapping[str, Type[OutputT]],
+    workflows_service: Optional[WorkflowsService] = None,
+    namespace: Optional[str] = None,
+    concurrency: int = _DEFAULT_CONCURRENCY,
+    download_directory: Optional[Union[str, Path]] = None,
+) -> Dict[str, OutputT]:
+    """Get the outputs of the tasks or steps of a completed workflow, as instances of their `Output` classes.
+
+    The workflow is fetched once, without its spec, and the output parameters and the exit code and result of each
+    task or step are read from its node. The output artifacts are then fetched concurrently, with up to `concurrency`
+    downloads at once, and loaded as the runner loads input artifacts: with the `loads` or `loadb` function of their
+    annotation, or their `loader`. Artifacts without a loader are downloaded to `download_directory` (a temporary
+    directory if not given), in a directory per task or step, and their field is set to their path. Artifacts with the
+    `mmap`, `jsonl`, `numpy` or `arrow` loader are downloaded there too, and loaded from their file.
+
+    Example:
+        ```python
+        outputs = get_workflow_outputs(workflow, {"train": TrainOutput, "evaluate": EvaluateOutput})
+        print(outputs["evaluate"].accuracy)
+        ```
+
+    Args:
+        workflow: the workflow, given as a Hera workflow, a workflow model, or a name. The service and namespace of a
+            Hera workflow are used if `workflows_service` and `namespace` are not given.
+        outputs: the `Output` class (of `hera.workflows.io.v1` or `v2`) of each task or step, by name. A node ID can be
+            given instead of a name, e.g. for a task or step whose name is used by several nodes.
+        workflows_service: the service used to get the workflow and its artifacts.
+        namespace: the namespace of the workflow. Defaults to the namespace of the service.
+        concurrency: the maximum number of artifacts downloaded at once, capped to the number of connections the
+            session of the service keeps open (`TransportConfig.max_connections_per_host`, 10 by default), or that the
+            client of an async service opens at once (100 by default).
+        download_directory: the directory to download the artifacts without a loader, or with a file loader, to.
+
+    Returns:
+        The output of each task or step, by the names given in `outputs`.
+
+    Raises:
+        ValueError: if the workflow has no node, or more than one node, with a name of `outputs`.
+    """
+    name, service, namespace = _workflow_name(workflow, workflows_service, namespace)
+    assert isinstance(service, WorkflowsService), "workflows service not initialized"
+    model = service.get_workflow(name, namespace=namespace, fields=_OUTPUTS_FIELDS)
+
+    values: Dict[str, Dict[str, Any]] = {}
+    fetches: List[_ArtifactFetch] = []
+    for task_name, output_class in outputs.items():
+        values[task_name], node_fetches = _map_node_outputs(task_name, _find_node(model, task_name), output_class)
+        fetches.extend(node_fetches)
+
+    directory = _download_directory(download_directory, fetches)
+
+    def fetch(fetch: _ArtifactFetch) -> Any:
+        _, _, node, artifact = fetch
+        if _is_downloaded(artifact):
+            path = _artifact_path(directory, fetch)
+            service.download_output_artifact(name, node.id, str(artifact.name), path, namespace=namespace)
+            return _load_downloaded(artifact, path)
+        content = b"".join(service.stream_output_artifact(name, node.id, str(artifact.name), namespace=namespace))
+        return _load_artifact(artifact, content)
+
+    if fetches:
+        with ThreadPoolExecutor(max_workers=_cap_concurrency(service, concurrency)) as executor:
+            for (task_name, field, _, _), value in zip(fetches, executor.map(fetch, fetches)):
+                values[task_name][field] = value
+
+    return {task_name: _build_output(output_class, values[task_name]) for task_name, output_class in outputs.items()}
+
+
+async def async_get_workflow_outputs(
+    workflow: Union[Workflow, _ModelWorkflow, str],
+    outputs: Mapping[str, Type[OutputT]],
+    workflows_service: Optional[AsyncWorkflowsService] = None,
+    namespace: Optional[str] = None,
+    concurrency: int = _DEFAULT_CONCURRENCY,
+    download_directory: Optional[Union[str, Path]] = None,
+) -> Dict[str, OutputT]:
+    """Get the outputs of the tasks or steps of a completed workflow as `Output` instances, asynchronously.
+
+    See `get_workflow_outputs` for the arguments.
+    """
+    name, service, namespace = _workflow_name(workflow, workflows_service, namespace)
+    assert isinstance(service, AsyncWorkflowsService), "workflows service not initialized"
+    model = await service.get_workflow(name, namespace=namespace, fields=_OUTPUTS_FIELDS)
+
+    values: Dict[str, Dict[str, Any]] = {}
+    fetches: List[_ArtifactFetch] = []
+    for task_name, output_class in outputs.items():
+        values[task_name], node_fetches = _map_node_outputs(task_name, _find_node(model, task_name), output_class)
+        fetches.extend(node_fetches)
+
+    directory = _download_directory(download_directory, fetches)
+    semaphore = asyncio.Semaphore(_cap_concurrency(service, concurrency))
+
+    async def fetch(fetch: _ArtifactFetch) -> Any:
+        _, _, node, artifact = fetch
+        async with semaphore:
+            if _is_downloaded(artifact):
+                path = _artifact_path(directory, fetch)
+                await service.download_output_artifact(name, node.id, str(artifact.name), path, namespace=namespace)
+                return _load_downloaded(artifact, path)
+            chunks = [
+                chunk
+                async for chunk in service.stream_output_artifact(
+                    name, node.id, str(artifact.name), namespace=namespace
+                )
+            ]
+        return _load_artifact(artifact, b"".join(chunks))
+
+    for (task_name, field, _, _), value in zip(fetches, await asyncio.gather(*(fetch(f) for f in fetches))):
+        values[task_name][field] = value
+
+    return {task_name: _build_output(output_class, values[task_name]) for task_name, output_class in outputs.items()}
+
+
+__all__ = ["async_get_workflow_outputs", "get_workflow_outputs"]
@@ -0,0 +1,218 @@
+"""The workflow_waiter module provides the WorkflowWaiter class, to wait for many workflows at once."""
+
+import asyncio
+import time
+from contextlib import aclosing, closing
+from typing import AsyncIterator, Dict, Iterable, Iterator, Optional, Set, Union
+
+import requests
+
+from hera.exceptions import HeraException, NotFound
+from hera.workflows.async_service import AsyncWorkflowsService
+from hera.workflows.models import Workflow as _ModelWorkflow
+from hera.workflows.service import WorkflowsService
+from hera.workflows.workflow import _WATCH_MAX_RECONNECTS, Workflow, _is_completed, _poll_delay
+
+# Only the outcome of the workflows is transferred, rather than the status of all their nodes
+_WAITER_FIELDS = [
+    "metadata.name",
+    "metadata.namespace",
+    "metadata.resourceVersion",
+    "status.phase",
+    "status.startedAt",
+    "status.finishedAt",
+    "status.message",
+]
+_WATCH_WAITER_FIELDS = ",".join(["result.type"] + [f"result.object.{field}" for field in _WAITER_FIELDS])
+_LIST_WAITER_FIELDS = ",".join(["metadata.resourceVersion"] + [f"items.{field}" for field in _WAITER_FIELDS])
+
+
+def _deleted(name: str) -> NotFound:
+    return NotFound(f"Workflow {name} was deleted before it completed")
+
+
+class WorkflowWaiter:
+    """Waits for many workflows of a namespace at once, yielding each of them as soon as it completes.
+
+    Rather than polling each workflow separately (as `Workflow.wait` does), the waiter watches all the workflows of the
+    namespace through a single event stream of the Argo server. If the stream is not available, or `watch` is false,
+    all the workflows are polled with a single `list_workflows` call per poll instead. Either way, only the name,
+    phase, start and finish times, and message of the workflows are transferred, so the yielded workflows only
+    contain these fields; use `WorkflowsService.get_workflow` to fetch the whole workflow.
+
+    A `label_selector` restricts the watched or listed workflows to the ones matching it (e.g. the labels shared by a
+    batch of submitted workflows), which reduces the load on the Argo server when the namespace has many workflows.
+
+    Example:
+        ```python
+        waiter = WorkflowWaiter([w.create() for w in workflows], label_selector="batch=nightly")
+        for workflow in waiter.as_completed():
+            print(workflow.metadata.name, workflow.status.phase)
+        ```
+
+    To wait for workflows of several namespaces, use one waiter per namespace.
+    """
+
+    def __init__(
+        self,
+        workflows: Iterable[Union[Workflow, _ModelWorkflow, str]],
+        workflows_service: Optional[Union[WorkflowsService, AsyncWorkflowsService]] = None,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        poll_interval: int = 5,
+        watch: bool = True,
+    ) -> None:
+        """Create a waiter for the given workflows.
+
+        Args:
+            workflows: the workflows to wait for, given as Hera workflows, workflow models (e.g. as returned by
+                `create_workflow`), or names. The service and namespace of the first Hera workflow are used if
+                `workflows_service` and `namespace` are not given.
+            workflows_service: the (sync or async) service used to watch or list the workflows.
+            namespace: the namespace of the workflows. Defaults to the namespace of the service.
+            label_selector: only watch or list the workflows matching this label selector.
+            poll_interval: the maximum interval in seconds between two polls of the workflows, when polling.
+            watch: if true, the workflows are watched through the Argo server's event stream, falling back to polling
+                if the stream is not available. If false, the workflows are polled at intervals growing exponentially
+                (with jitter) up to `poll_interval`.
+        """
+        self.names: Set[str] = set()
+        for workflow in workflows:
+            if isinstance(workflow, Workflow):
+                assert workflow.name is not None, "workflow name not defined"
+                self.names.add(workflow.name)
+                workflows_service = workflows_service or workflow.workflows_service
+                namespace = namespace or workflow.namespace
+            elif isinstance(workflow, _ModelWorkflow):
+                assert workflow.metadata.name is not None, "workflow name not defined"
+                self.names.add(workflow.metadata.name)
+                namespace = namespace or workflow.metadata.namespace
+            else:
+                self.names.add(workflow)
+
+        assert workflows_service is not None, "workflows service not initialized"
+        self.workflows_service = workflows_service
+        self.namespace = namespace or workflows_service.namespace
+        self.label_selector = label_selector
+        self.poll_interval = poll_interval
+        self.watch = watch
+
+    def as_completed(self) -> Iterator[_ModelWorkflow]:
+        """Yield each workflow as soon as it completes, until all of them have completed.
+
+        Raises `NotFound` if a workflow is deleted before it completes.
+        """
+        assert isinstance(self.workflows_service, WorkflowsService), "workflows service not initialized"
+        pending = set(self.names)
+        if self.watch and pending:
+            deleted: Optional[str] = None
+            try:
+                events = self.workflows_service.stream_workflows(
+                    namespace=self.namespace,
+                    label_selector=self.label_selector,
+                    fields=_WATCH_WAITER_FIELDS,
+                    max_reconnects=_WATCH_MAX_RECONNECTS,
+                )
+                with closing(events):
+                    for event in events:
+                        workflow = event.object
+                        if workflow is None or workflow.metadata.name not in pending:
+                            continue
+                        if event.type == "DELETED":
+                            deleted = workflow.metadata.name
+                            break
+                        if _is_completed(workflow):
+                            pending.discard(workflow.metadata.name)
+                            yield workflow
+                            if not pending:
+                                return
+            except (HeraException, requests.RequestException):
+                # the stream may not be available, e.g. when a proxy in front of the Argo server does not support it
+                pass
+            if deleted is not None:
+                raise _deleted(deleted)
+
+        attempt = 0
+        seen: Set[str] = set()
+        while pending:
+            time.sleep(_poll_delay(attempt, self.poll_interval))
+            attempt += 1
+            workflows = self.workflows_service.list_workflows(
+                namespace=self.namespace,
+                label_selector=self.label_selector,
+                fields=_LIST_WAITER_FIELDS,
+            )
+            for workflow in self._completed(workflows.items or [], pending, seen):
+                yield workflow
+
+    async def async_as_completed(self) -> AsyncIterator[_ModelWorkflow]:
+        """Yield each workflow as soon as it completes, until all of them have completed, asynchronously.
+
+        Raises `NotFound` if a workflow is deleted before it completes.
+        """
+        import httpx
+
+        assert isinstance(self.workflows_service, AsyncWorkflowsService), "workflows service not initialized"
+        pending = set(self.names)
+        if self.watch and pending:
+            deleted: Optional[str] = None
+            try:
+                events = self.workflows_service.stream_workflows(
+                    namespace=self.namespace,
+                    label_selector=self.label_selector,
+                    fields=_WATCH_WAITER_FIELDS,
+                    max_reconnects=_WATCH_MAX_RECONNECTS,
+                )
+                async with aclosing(events):
+                    async for event in events:
+                        workflow = event.object
+                        if workflow is None or workflow.metadata.name not in pending:
+                            continue
+                        if event.type == "DELETED":
+                            deleted = workflow.metadata.name
+                            break
+                        if _is_completed(workflow):
+                            pending.discard(workflow.metadata.name)
+                            yield workflow
+                            if not pending:
+                                return
+            except (HeraException, httpx.HTTPError):
+                # the stream may not be available, e.g. when a proxy in front of the Argo server does not support it
+                pass
+            if deleted is not None:
+                raise _deleted(deleted)
+
+        attempt = 0
+        seen: Set[str] = set()
+        while pending:
+            await asyncio.sleep(_poll_delay(attempt, self.poll_interval))
+            attempt += 1
+            workflows = await self.workflows_service.list_workflows(
+                namespace=self.namespace,
+                label_selector=self.label_selector,
+                fields=_LIST_WAITER_FIELDS,
+            )
+            for workflow in self._completed(workflows.items or [], pending, seen):
+                yield workflow
+
+    @staticmethod
+    def _completed(listed: Iterable[_ModelWorkflow], pending: Set[str], seen: Set[str]) -> Iterator[_ModelWorkflow]:
+        """Yield the pending workflows that completed among the listed ones, removing them from `pending`.
+
+        Workflows may be accepted by the Argo server before they are listed, so a pending workflow is only considered
+        deleted if it is missing from the list after having been `seen` in a previous one.
+        """
+        listed_pending: Dict[str, _ModelWorkflow] = {
+            workflow.metadata.name: workflow for workflow in listed if workflow.metadata.name in pending
+        }
+        for name in pending - listed_pending.keys():
+            if name in seen:
+                raise _deleted(name)
+        seen.update(listed_pending)
+        for name, workflow in listed_pending.items():
+            if _is_completed(workflow):
+                pending.discard(name)
+                yield workflow
+
+
+__all__ = ["WorkflowWaiter"]
@@ -1,3 +1,4 @@
+import os
 import shutil
 import sys
 from pathlib import Path
@@ -8,6 +9,8 @@ import pytest
 from cappa.testing import CommandRunner
 
 from hera._cli.base import Hera
+from hera._cli.generate.cache import OutputCache
+from hera._cli.generate.util import YAML_EXTENSIONS, write_output
 
 
 def get_stdout(capsys):
@@ -302,6 +305,63 @@ def test_recursive_flatten_source_folder_to_output_folder_with_name_clash_append
     assert (output_folder / "single_workflow.yaml").read_text() == "---\n".join([single_workflow_output] * 2)
 
 
+@pytest.mark.cli
+def test_recursive_flatten_name_clash_groups_outputs_of_same_file(capsys, tmp_path: Path):
+    input_folder = tmp_path / "inputs"
+    (input_folder / "folder_1").mkdir(parents=True)
+    (input_folder / "folder_2").mkdir(parents=True)
+    shutil.copy("tests/cli/examples/single_workflow.py", input_folder / "folder_1")
+    shutil.copy("tests/cli/examples/single_workflow.py", input_folder / "folder_2")
+    shutil.copy("tests/cli/examples/multiple_workflow.py", input_folder / "folder_2" / "another_workflow.py")
+
+    runner.invoke(str(input_folder), "--recursive", "--flatten")
+
+    # The outputs flattened into the same file are grouped together, as when writing to a folder
+    assert get_stdout(capsys) == join_output(single_workflow_output, single_workflow_output, multiple_workflow_output)
+
+
+@pytest.mark.cli
+def test_write_output_writes_each_document_as_it_is_produced(capsys, tmp_path: Path):
+    written = []
+
+    def documents():
+        for i in range(3):
+            written.append(capsys.readouterr().out)
+            yield "single_workflow.py", f"document: {i}\n"
+
+    write_output(None, documents(), YAML_EXTENSIONS, ".yaml", "---\n")
+
+    # the documents are spooled until they have all been produced
+    assert written == ["", "", ""]
+    assert capsys.readouterr().out == "document: 0\n---\ndocument: 1\n---\ndocument: 2\n"
+
+    write_output(
+        tmp_path, iter([("a.py", "a: 0\n"), ("a.py", "a: 1\n"), ("b.py", "b: 0\n")]), YAML_EXTENSIONS, ".yaml", "---\n"
+    )
+    assert (tmp_path / "a.yaml").read_text() == "a: 0\n---\na: 1\n"
+    assert (tmp_path / "b.yaml").read_text() == "b: 0\n"
+
+
+@pytest.mark.cli
+@pytest.mark.parametrize("to", [None, "out.yaml", "out"], ids=["stdout", "file", "folder"])
+def test_failed_conversion_leaves_the_output_untouched(capsys, tmp_path: Path, to: str):
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "a.py").write_text('from hera.workflows import Workflow\n\nw = Workflow(name="a")\n')
+    (source / "b.py").write_text('raise RuntimeError("b is broken")\n')
+    (tmp_path / "out.yaml").write_text("previous: 0\n")
+    (tmp_path / "out").mkdir()
+    (tmp_path / "out" / "a.yaml").write_text("previous: 0\n")
+
+    with pytest.raises(RuntimeError, match="b is broken"):
+        runner.invoke(str(source), *(["--to", str(tmp_path / to)] if to else []))
+
+    assert get_stdout(capsys) == ""
+    assert (tmp_path / "out.yaml").read_text() == "previous: 0\n"
+    assert [path.name for path in (tmp_path / "out").iterdir()] == ["a.yaml"]
+    assert (tmp_path / "out" / "a.yaml").read_text() == "previous: 0\n"
+
+
 @pytest.mark.cli
 def test_relative_imports(capsys):
     runner.invoke("tests/cli/examples/relative_imports")
@@ -375,3 +435,132 @@ def test_include_and_exclude(capsys):
 
     output = get_stdout(capsys)
     assert output == workflow_template_output
+
+
+@pytest.mark.cli
+@pytest.mark.parametrize("jobs", ["2", "0"])
+def test_scan_folder_with_jobs(capsys, jobs):
+    runner.invoke("tests/cli/examples", "--jobs", jobs)
+
+    output = get_stdout(capsys)
+    assert output == whole_folder_output
+
+
+@pytest.mark.cli
+def test_recursive_source_folder_to_output_folder_with_jobs(tmp_path: Path):
+    input_python = Path("tests/cli/examples/single_workflow.py").read_text()
+    input_folder = tmp_path / "inputs"
+    for folder in [input_folder / "folder_1", input_folder / "folder_2"]:
+        folder.mkdir(parents=True)
+        (folder / "single_workflow.py").write_text(input_python)
+
+    output_folder = tmp_path / "outputs"
+    runner.invoke(str(input_folder), "--recursive", "-j", "2", "--to", str(output_folder))
+
+    assert (output_folder / "folder_1/single_workflow.yaml").read_text() == single_workflow_output
+    assert (output_folder / "folder_2/single_workflow.yaml").read_text() == single_workflow_output
+
+
+@pytest.mark.cli
+def test_jobs_reports_failing_paths(tmp_path: Path):
+    shutil.copy("tests/cli/examples/single_workflow.py", tmp_path)
+    broken = tmp_path / "broken.py"
+    broken.write_text("raise ValueError('oops')\n")
+
+    with pytest.raises(RuntimeError) as e:
+        runner.invoke(str(tmp_path), "--jobs", "2")
+
+    assert f"{broken}: ValueError: oops" in str(e.value)
+    assert "single_workflow" not in str(e.value)
+
+
+@pytest.mark.cli
+def test_cache_dir_reuses_output_of_unchanged_files(capsys, tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+    runner.invoke("tests/cli/examples", "--cache-dir", str(cache_dir))
+    assert get_stdout(capsys) == whole_folder_output
+    assert len(list(cache_dir.glob("*.json"))) == 5
+
+    with patch(
+        "hera._cli.generate.yaml.load_workflows_from_module", side_effect=AssertionError("not cached")
+    ), patch.object(OutputCache, "get", autospec=True, side_effect=OutputCache.get) as mock_get:
+        runner.invoke("tests/cli/examples", "--cache-dir", str(cache_dir))
+
+    assert get_stdout(capsys) == whole_folder_output
+    # each entry is only read once
+    assert mock_get.call_count == 5
+
+
+@pytest.mark.cli
+def test_cache_dir_reloads_files_when_local_import_changes(capsys, tmp_path: Path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    input_folder = tmp_path / "inputs"
+    input_folder.mkdir()
+    (tmp_path / "cache_helper.py").write_text('NAME = "one"\n')
+    (input_folder / "workflow.py").write_text(
+        dedent(
+            """\
+            from cache_helper import NAME
+
+            from hera.workflows import Workflow
+
+            w = Workflow(name=NAME)
+            """
+        )
+    )
+    (input_folder / "other_workflow.py").write_text(
+        'from hera.workflows import Workflow\n\nw = Workflow(name="other")\n'
+    )
+    cache_dir = tmp_path / "cache"
+
+    runner.invoke(str(input_folder), "--cache-dir", str(cache_dir))
+    assert "name: one" in get_stdout(capsys)
+
+    (tmp_path / "cache_helper.py").write_text('NAME = "two"\n')
+    sys.modules.pop("cache_helper")
+
+    from hera._cli.generate.yaml import load_workflows_from_module
+
+    loaded = []
+
+    def load(path):
+        loaded.append(path.name)
+        return load_workflows_from_module(path)
+
+    with patch("hera._cli.generate.yaml.load_workflows_from_module", side_effect=load):
+        runner.invoke(str(input_folder), "--cache-dir", str(cache_dir))
+
+    output = get_stdout(capsys)
+    assert "name: two" in output
+    assert "name: other" in output
+    assert loaded == ["workflow.py"]
+
+
+@pytest.mark.cli
+def test_changed_only_does_not_rewrite_unchanged_files(tmp_path: Path):
+    runner.invoke("tests/cli/examples", "--to", str(tmp_path))
+    single_workflow = tmp_path / "single_workflow.yaml"
+    multiple_workflow = tmp_path / "multiple_workflow.yaml"
+    os.utime(single_workflow, (0, 0))
+    multiple_workflow.write_text("outdated")
+    os.utime(multiple_workflow, (0, 0))
+
+    runner.invoke("tests/cli/examples", "--to", str(tmp_path), "--changed-only")
+
+    assert single_workflow.stat().st_mtime == 0
+    assert single_workflow.read_text() == single_workflow_output
+    assert multiple_workflow.stat().st_mtime != 0
+    assert multiple_workflow.read_text() == multiple_workflow_output
+
+
+@pytest.mark.cli
+def test_find_local_dependencies_follows_relative_imports():
+    from hera._cli.generate.cache import find_local_dependencies
+
+    folder = Path("tests/cli/examples/relative_imports").resolve()
+
+    dependencies = find_local_dependencies(folder / "file2.py")
+
+    assert folder / "file1.py" in dependencies
+    assert folder / "file2.py" in dependencies
+    assert all(not p.is_relative_to(Path(sys.prefix).resolve()) for p in dependencies)
@@ -1 +1,93 @@
+import io
+import json
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import httpx
+from requests import PreparedRequest, Response, Session
+from requests.adapters import BaseAdapter
+
 ARTIFACT_PATH = "/tmp/file"
+
+
+def project(data: Any, fields: Optional[str]) -> Any:
+    """Keep only the given comma-separated paths of the data, as the Argo server does for the `fields` parameter."""
+    if not fields:
+        return data
+    return _project(data, fields.split(","))
+
+
+def _project(data: Any, paths: List[str]) -> Any:
+    if isinstance(data, list):
+        return [_project(item, paths) for item in data]
+    if not isinstance(data, dict) or "" in paths:
+        return data
+    grouped: Dict[str, List[str]] = {}
+    for path in paths:
+        key, _, rest = path.partition(".")
+        grouped.setdefault(key, []).append(rest)
+    return {key: _project(data[key], rest) for key, rest in grouped.items() if key in data}
+
+
+class FakeArgoServer:
+    """A fake Argo server for the workflows of a namespace, answering the requests of the services over HTTP.
+
+    The responses are projected with the `fields` parameter of the requests, as the Argo server does. The watch stream
+    sends the given `events` once, and fails the test if it is reopened after that.
+    """
+
+    def __init__(self, workflows: List[Dict[str, Any]], events: Optional[List[Dict[str, Any]]] = None) -> None:
+        self.workflows = {workflow["metadata"]["name"]: workflow for workflow in workflows}
+        self.events = events
+        self.requests: List[Tuple[str, Dict[str, str]]] = []
+
+    def handle(self, url: str) -> Tuple[int, bytes]:
+        split_url = urlsplit(url)
+        params = dict(parse_qsl(split_url.query))
+        self.requests.append((split_url.path, params))
+        fields = params.get("fields")
+        path = split_url.path.split("/")[3:]
+        if path[:2] == ["workflow-events", "argo"]:
+            if self.events is None:
+                return 501, json.dumps({"message": "watch not supported"}).encode()
+            events = self.events
+            self.events = []
+            assert events, "the watch stream was reopened"
+            return 200, "\n".join(json.dumps(project({"result": event}, fields)) for event in events).encode()
+        if path == ["workflows", "argo"]:
+            return 200, json.dumps(project({"metadata": {}, "items": list(self.workflows.values())}, fields)).encode()
+        if path[:2] == ["workflows", "argo"] and path[2] in self.workflows:
+            return 200, json.dumps(project(self.workflows[path[2]], fields)).encode()
+        return 404, json.dumps({"message": "not found"}).encode()
+
+    def session(self) -> Session:
+        """Return a session sending its requests to the server."""
+        session = Session()
+        session.mount("https://", _FakeArgoServerAdapter(self))
+        return session
+
+    def client(self) -> httpx.AsyncClient:
+        """Return an async client sending its requests to the server."""
+        return httpx.AsyncClient(transport=httpx.MockTransport(self._handle_httpx))
+
+    def _handle_httpx(self, request: httpx.Request) -> httpx.Response:
+        status_code, content = self.handle(str(request.url))
+        return httpx.Response(status_code, content=content)
+
+
+class _FakeArgoServerAdapter(BaseAdapter):
+    def __init__(self, server: FakeArgoServer) -> None:
+        super().__init__()
+        self.server = server
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:  # type: ignore[override]
+        assert request.url is not None
+        response = Response()
+        response.status_code, content = self.server.handle(request.url)
+        response.raw = io.BytesIO(content)
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Iterable
 
 from pydantic import BaseModel
 from tests.helper import ARTIFACT_PATH
@@ -54,3 +54,19 @@ def file_loader_default_path(
     an_artifact: Annotated[str, Artifact(loader=ArtifactLoader.file)],
 ) -> str:
     return an_artifact
+
+
+@script(constructor="runner")
+def mmap_loader(
+    an_artifact: Annotated[memoryview, Artifact(name="my-artifact", path=ARTIFACT_PATH, loader=ArtifactLoader.mmap)],
+) -> str:
+    return bytes(an_artifact[:5]).decode()
+
+
+@script(constructor="runner")
+def jsonl_loader(
+    an_artifact: Annotated[
+        Iterable[MyArtifact], Artifact(name="my-artifact", path=ARTIFACT_PATH, loader=ArtifactLoader.jsonl)
+    ],
+) -> str:
+    return "".join(line.a + line.b for line in an_artifact)
@@ -0,0 +1,50 @@
+"""Test the runner with async functions and async generators."""
+
+import asyncio
+from typing import Annotated, AsyncIterator, List
+
+from hera.workflows import Artifact, Parameter, script
+from hera.workflows.io.v2 import Output
+
+
+class SumOutput(Output):
+    total: Annotated[int, Parameter(name="total")]
+
+
+@script(constructor="runner")
+async def async_sum(numbers: List[int]) -> int:
+    # the numbers are fetched concurrently
+    values = await asyncio.gather(*(asyncio.sleep(0, result=number) for number in numbers))
+    return sum(values)
+
+
+@script(constructor="runner")
+async def async_sum_param(numbers: List[int]) -> Annotated[int, Parameter(name="total")]:
+    await asyncio.sleep(0)
+    return sum(numbers)
+
+
+@script(constructor="runner")
+async def async_sum_output(numbers: List[int]) -> SumOutput:
+    await asyncio.sleep(0)
+    return SumOutput(total=sum(numbers), result="done")
+
+
+@script(constructor="runner")
+async def async_squares(count: int) -> AsyncIterator[int]:
+    for i in range(count):
+        await asyncio.sleep(0)
+        yield i * i
+
+
+@script(constructor="runner")
+async def async_squares_artifact(count: int) -> Annotated[AsyncIterator[int], Artifact(name="squares")]:
+    for i in range(count):
+        await asyncio.sleep(0)
+        yield i * i
+
+
+@script(constructor="runner")
+async def async_raises(numbers: List[int]) -> Annotated[int, Parameter(name="total")]:
+    await asyncio.sleep(0)
+    raise ValueError("no total")
@@ -0,0 +1,27 @@
+"""Test the runner with batches of items."""
+
+from typing import Annotated
+
+from hera.workflows import Parameter, script
+from hera.workflows.io.v2 import Output
+
+
+class DivideOutput(Output):
+    quotient: Annotated[float, Parameter(name="quotient")]
+
+
+@script(constructor="runner", batch_size=2)
+def add(a: int, b: int, c: int = 0) -> int:
+    return a + b + c
+
+
+@script(constructor="runner", batch_size=2)
+def greet(name: str) -> Annotated[str, Parameter(name="greeting")]:
+    return f"Hello {name}"
+
+
+@script(constructor="runner", batch_size=2)
+def divide(a: float, b: float) -> DivideOutput:
+    if b == 0:
+        return DivideOutput(quotient=0, exit_code=1, result="division by zero")
+    return DivideOutput(quotient=a / b, result="divided")
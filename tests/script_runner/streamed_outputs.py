@@ -0,0 +1,70 @@
+"""Test the runner with generators streamed to output artifacts."""
+
+import asyncio
+import sys
+from typing import Annotated, AsyncIterator, Iterator
+
+from hera.workflows import Artifact, ArtifactLoader, Parameter, script
+from hera.workflows.io.v2 import Output as OutputV2
+
+if sys.version_info >= (3, 14):
+    from hera.workflows.io.v2 import Output as OutputV1
+else:
+    from hera.workflows.io.v1 import Output as OutputV1
+
+
+class RecordsOutputV1(OutputV1):
+    count: Annotated[int, Parameter(name="count")]
+    records: Annotated[Iterator[dict], Artifact(name="records", loader=ArtifactLoader.jsonl)]
+
+
+class RecordsOutputV2(OutputV2):
+    count: Annotated[int, Parameter(name="count")]
+    records: Annotated[Iterator[dict], Artifact(name="records", loader=ArtifactLoader.jsonl)]
+
+
+@script(constructor="runner")
+def numbers(count: int) -> Iterator[int]:
+    yield from range(count)
+
+
+@script(constructor="runner")
+def records(count: int) -> Annotated[Iterator[dict], Artifact(name="records", loader=ArtifactLoader.jsonl)]:
+    for i in range(count):
+        yield {"i": i}
+
+
+@script(constructor="runner")
+def gzipped_records(count: int) -> Annotated[Iterator[dict], Artifact(name="records", compression="gzip")]:
+    return ({"i": i} for i in range(count))
+
+
+@script(constructor="runner")
+def blobs(count: int) -> Annotated[Iterator[bytes], Artifact(name="blobs", loader=ArtifactLoader.records)]:
+    for i in range(count):
+        yield b"x" * i
+
+
+@script(constructor="runner")
+def squares_as_parameter(count: int) -> Annotated[Iterator[int], Parameter(name="squares")]:
+    for i in range(count):
+        yield i * i
+
+
+@script(constructor="runner")
+async def async_records(
+    count: int,
+) -> Annotated[AsyncIterator[dict], Artifact(name="records", loader=ArtifactLoader.jsonl, compression="gzip")]:
+    for i in range(count):
+        await asyncio.sleep(0)
+        yield {"i": i}
+
+
+@script(constructor="runner")
+def records_output_v1(count: int) -> RecordsOutputV1:
+    return RecordsOutputV1(count=count, records=({"i": i} for i in range(count)))
+
+
+@script(constructor="runner")
+def records_output_v2(count: int) -> RecordsOutputV2:
+    return RecordsOutputV2(count=count, records=({"i": i} for i in range(count)))
@@ -9,8 +9,11 @@ can be done through monkeypatch.setenv. This is because the runner code acts as
 is running on Argo, where the global_config will not contain the experimental features.
 """
 
+import gzip
 import importlib
 import json
+import os
+import subprocess
 import sys
 from pathlib import Path
 from typing import Any, Dict, List, Literal
@@ -18,10 +21,20 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+import hera.workflows._runner.util as runner_util
 import hera.workflows.artifact as artifact_module
 import tests.helper as test_module
 from hera.shared.serialization import serialize
-from hera.workflows._runner.util import _run, _runner, create_module_string
+from hera.workflows._runner.util import (
+    BATCH_PARAMETER,
+    BATCH_PROCESSES_ENV,
+    CALL_MANIFEST_ENV,
+    _BatchOutput,
+    _run,
+    _runner,
+    build_call_manifest,
+    create_module_string,
+)
 from hera.workflows.io.v2 import Output as OutputV2
 
 if sys.version_info >= (3, 14):
@@ -30,6 +43,20 @@ else:
     from hera.workflows.io.v1 import Output as OutputV1
 
 
+@pytest.fixture(autouse=True, params=[False, True], ids=["introspection", "call-manifest"])
+def call_manifest(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
+    """Run the functions as mapped by introspecting them, and as mapped by their call manifest."""
+    load_call_manifest = runner_util._load_call_manifest
+
+    def load_built_call_manifest(function):
+        if CALL_MANIFEST_ENV in os.environ:
+            return load_call_manifest(function)
+        return (build_call_manifest(function) or {}).get("params")
+
+    if request.param:
+        monkeypatch.setattr(runner_util, "_load_call_manifest", load_built_call_manifest)
+
+
 @pytest.mark.parametrize(
     "entrypoint,kwargs_list,expected_output",
     (
@@ -476,6 +503,21 @@ def test_script_annotations_outputs_exceptions(
             "/this/file/contains/a/path",  # A file containing a path as a string (we should not do any further processing)
             "/this/file/contains/a/path",
         ),
+        (
+            "mmap_loader",
+            "Hello there!",
+            "Hello",
+        ),
+        (
+            "mmap_loader",
+            "",
+            "",
+        ),
+        (
+            "jsonl_loader",
+            """{"a": "Hello ", "b": "there"}\n\n{"a": "!", "b": "!"}\n""",
+            "Hello there!!",
+        ),
     ],
 )
 def test_script_annotations_artifact_inputs(
@@ -1199,3 +1241,305 @@ def test_symlinked_sys_path(tmp_path, monkeypatch):
     monkeypatch.setattr(sys, "path", [str(symlink_path)])
 
     assert create_module_string(file_path) == "wf"
+
+
+def test_runner_imports_only_what_the_function_needs(tmp_path: Path):
+    # the runner starts in every script pod, so it does not import the template classes, the HTTP client of the
+    # services, or pydantic v1 for a function using pydantic v2 `Input`s
+    (tmp_path / "v2_function.py").write_text(
+        "from typing import Annotated\n"
+        "from hera.workflows import Parameter\n"
+        "from hera.workflows.io.v2 import Input\n"
+        "class MyInput(Input):\n"
+        "    count: Annotated[int, Parameter(name='repeat')]\n"
+        "def double(my_input: MyInput) -> int:\n"
+        "    return my_input.count * 2\n"
+    )
+    args_path = tmp_path / "args.json"
+    args_path.write_text(json.dumps([{"name": "repeat", "value": "21"}]))
+    code = (
+        "import json, sys;"
+        f"sys.argv = ['runner', '-e', 'v2_function:double', {str(args_path)!r}];"
+        "from hera.workflows._runner.util import _run; _run();"
+        "print(json.dumps(list(sys.modules)))"
+    )
+
+    result, modules = subprocess.run(
+        [sys.executable, "-c", code], cwd=tmp_path, check=True, capture_output=True, text=True
+    ).stdout.splitlines()
+
+    assert result == "42"
+    assert "pydantic.v1" not in json.loads(modules)
+    assert "hera.workflows.io.v1" not in json.loads(modules)
+    assert "hera.workflows.script" not in json.loads(modules)
+    assert "requests" not in json.loads(modules)
+
+
+def test_runner_uses_the_call_manifest(monkeypatch: pytest.MonkeyPatch):
+    from tests.script_runner.parameter_inputs import annotated_basic_types
+
+    manifest = build_call_manifest(annotated_basic_types)
+    assert manifest == {
+        "version": 1,
+        "params": [
+            {"name": "a_but_kebab", "kind": "parameter", "key": "a-but-kebab", "json": True},
+            {"name": "b_but_kebab", "kind": "parameter", "key": "b-but-kebab"},
+        ],
+    }
+    monkeypatch.setenv(CALL_MANIFEST_ENV, json.dumps(manifest))
+    monkeypatch.setattr(runner_util, "_map_function_annotations", MagicMock(side_effect=AssertionError))
+
+    output = _runner(
+        "tests.script_runner.parameter_inputs:annotated_basic_types",
+        [{"name": "a-but-kebab", "value": "3"}, {"name": "b-but-kebab", "value": "1"}],
+    )
+
+    assert serialize(output) == '{"output": [{"a": 3, "b": "1"}]}'
+
+
+def test_runner_ignores_the_call_manifest_of_other_parameters(monkeypatch: pytest.MonkeyPatch):
+    from tests.script_runner.parameter_inputs import annotated_basic_types
+
+    manifest = build_call_manifest(annotated_basic_types)
+    assert manifest is not None
+    # the manifest of a previous version of the function, with a parameter since renamed
+    manifest["params"][0]["name"] = "a"
+    monkeypatch.setenv(CALL_MANIFEST_ENV, json.dumps(manifest))
+
+    output = _runner(
+        "tests.script_runner.parameter_inputs:annotated_basic_types",
+        [{"name": "a-but-kebab", "value": "3"}, {"name": "b-but-kebab", "value": "1"}],
+    )
+
+    assert serialize(output) == '{"output": [{"a": 3, "b": "1"}]}'
+
+
+@pytest.mark.parametrize(
+    "function_name,kwargs_list,expected_output",
+    [
+        pytest.param("async_sum", [{"name": "numbers", "value": "[1, 2, 3]"}], 6, id="coroutine"),
+        pytest.param("async_squares", [{"name": "count", "value": "4"}], [0, 1, 4, 9], id="async-generator"),
+    ],
+)
+def test_runner_async_functions(function_name: str, kwargs_list: List[Dict[str, str]], expected_output: Any):
+    output = _runner(f"tests.script_runner.async_functions:{function_name}", kwargs_list)
+
+    assert output == expected_output
+
+
+@pytest.mark.parametrize(
+    "function_name,expected_files",
+    [
+        pytest.param("async_sum_param", {"parameters/total": "6"}, id="parameter"),
+        pytest.param("async_squares_artifact", {"artifacts/squares": "[0, 1, 4]"}, id="async-generator-artifact"),
+    ],
+)
+def test_runner_async_function_outputs(
+    function_name: str,
+    expected_files: Dict[str, str],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("hera__outputs_directory", str(tmp_path))
+
+    output = _runner(
+        f"tests.script_runner.async_functions:{function_name}",
+        [{"name": "numbers", "value": "[1, 2, 3]"}, {"name": "count", "value": "3"}],
+    )
+
+    assert output is None
+    for subpath, value in expected_files.items():
+        assert (tmp_path / subpath).read_text() == value
+
+
+def test_runner_async_function_pydantic_output(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("hera__outputs_directory", str(tmp_path))
+
+    output = _runner("tests.script_runner.async_functions:async_sum_output", [{"name": "numbers", "value": "[1, 2]"}])
+
+    assert isinstance(output, OutputV2)
+    assert output.result == "done"
+    assert (tmp_path / "parameters/total").read_text() == "3"
+
+
+def test_runner_async_function_raising_error_still_outputs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("hera__outputs_directory", str(tmp_path))
+
+    with pytest.raises(ValueError, match="no total"):
+        _runner("tests.script_runner.async_functions:async_raises", [{"name": "numbers", "value": "[1]"}])
+
+    assert (tmp_path / "parameters/total").read_text() == ""
+
+
+def test_runner_async_function_on_uvloop(monkeypatch: pytest.MonkeyPatch):
+    import asyncio
+
+    uvloop = MagicMock(run=MagicMock(side_effect=asyncio.run))
+    monkeypatch.setitem(sys.modules, "uvloop", uvloop)
+    monkeypatch.setenv("hera__event_loop", "uvloop")
+
+    output = _runner("tests.script_runner.async_functions:async_sum", [{"name": "numbers", "value": "[1, 2]"}])
+
+    assert output == 3
+    uvloop.run.assert_called_once()
+
+
+def test_runner_async_function_unknown_event_loop(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("hera__event_loop", "trio")
+
+    with pytest.raises(ValueError, match="Unknown event loop 'trio'"):
+        _runner("tests.script_runner.async_functions:async_sum", [{"name": "numbers", "value": "[1, 2]"}])
+
+
+_ADD_BATCH = json.dumps([{"a": 1, "b": 2}, {"a": 3, "b": 4}])
+
+
+@pytest.mark.parametrize("processes", [None, "2"])
+def test_runner_batch(processes, monkeypatch: pytest.MonkeyPatch):
+    if processes:
+        monkeypatch.setenv(BATCH_PROCESSES_ENV, processes)
+
+    output = _runner(
+        "tests.script_runner.batched_functions:add",
+        [
+            {"name": "a", "value": _ADD_BATCH},
+            {"name": "b", "value": _ADD_BATCH},
+            {"name": "c", "value": "1"},
+            {"name": BATCH_PARAMETER, "value": json.dumps({"a": "a", "b": "b"})},
+        ],
+    )
+
+    assert output == [4, 8]
+
+
+def test_runner_batch_parameter_default_runs_a_single_item():
+    output = _runner(
+        "tests.script_runner.batched_functions:add",
+        [
+            {"name": "a", "value": "1"},
+            {"name": "b", "value": "2"},
+            {"name": "c", "value": "0"},
+            {"name": BATCH_PARAMETER, "value": "{}"},
+        ],
+    )
+
+    assert output == 3
+
+
+def test_runner_batch_saves_the_list_of_outputs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("hera__outputs_directory", str(tmp_path))
+
+    output = _runner(
+        "tests.script_runner.batched_functions:greet",
+        [
+            {"name": "name", "value": json.dumps(["Ann", "Bob"])},
+            {"name": BATCH_PARAMETER, "value": json.dumps({"name": None})},
+        ],
+    )
+
+    assert output is None
+    assert json.loads((tmp_path / "parameters/greeting").read_text()) == ["Hello Ann", "Hello Bob"]
+
+
+def test_runner_batch_pydantic_outputs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("hera__outputs_directory", str(tmp_path))
+    batch = json.dumps([{"a": 1, "b": 2}, {"a": 1, "b": 0}])
+
+    output = _runner(
+        "tests.script_runner.batched_functions:divide",
+        [
+            {"name": "a", "value": batch},
+            {"name": "b", "value": batch},
+            {"name": BATCH_PARAMETER, "value": json.dumps({"a": "a", "b": "b"})},
+        ],
+    )
+
+    assert output == _BatchOutput(result=["divided", "division by zero"], exit_code=1)
+    assert json.loads((tmp_path / "parameters/quotient").read_text()) == [0.5, 0]
+
+
+@patch("hera.workflows._runner.util._parse_args")
+def test_run_batch_exits_with_the_exit_code_of_a_failed_item(
+    mock_parse_args,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+):
+    monkeypatch.setenv("hera__outputs_directory", str(tmp_path))
+    batch = json.dumps([{"a": 1, "b": 0}])
+    args_path = tmp_path / "args.json"
+    args_path.write_text(
+        json.dumps(
+            [
+                {"name": "a", "value": batch},
+                {"name": "b", "value": batch},
+                {"name": BATCH_PARAMETER, "value": json.dumps({"a": "a", "b": "b"})},
+            ]
+        )
+    )
+    mock_parse_args.return_value = MagicMock(
+        entrypoint="tests.script_runner.batched_functions:divide", args_path=args_path
+    )
+
+    with pytest.raises(SystemExit) as e:
+        _run()
+
+    assert e.value.code == 1
+    assert json.loads(capsys.readouterr().out) == ["division by zero"]
+
+
+@pytest.mark.parametrize(
+    "function_name,expected_files",
+    [
+        pytest.param("records", {"artifacts/records": b'{"i": 0}\n{"i": 1}\n'}, id="generator"),
+        pytest.param("blobs", {"artifacts/blobs": b"\0\0\0\0\0\0\0\1x"}, id="bytes"),
+        pytest.param("squares_as_parameter", {"parameters/squares": b"[0, 1]"}, id="parameter"),
+        pytest.param(
+            "records_output_v1",
+            {"parameters/count": b"2", "artifacts/records": b'{"i": 0}\n{"i": 1}\n'},
+            id="output-v1",
+        ),
+        pytest.param(
+            "records_output_v2",
+            {"parameters/count": b"2", "artifacts/records": b'{"i": 0}\n{"i": 1}\n'},
+            id="output-v2",
+        ),
+    ],
+)
+def test_runner_streamed_outputs(
+    function_name: str,
+    expected_files: Dict[str, bytes],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("hera__outputs_directory", str(tmp_path))
+
+    _runner(f"tests.script_runner.streamed_outputs:{function_name}", [{"name": "count", "value": "2"}])
+
+    for subpath, value in expected_files.items():
+        assert (tmp_path / subpath).read_bytes() == value
+
+
+@pytest.mark.parametrize(
+    "function_name,expected",
+    [
+        pytest.param("gzipped_records", b'[{"i": 0}, {"i": 1}]', id="json"),
+        pytest.param("async_records", b'{"i": 0}\n{"i": 1}\n', id="jsonl"),
+    ],
+)
+def test_runner_streamed_outputs_compressed(
+    function_name: str,
+    expected: bytes,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("hera__outputs_directory", str(tmp_path))
+
+    _runner(f"tests.script_runner.streamed_outputs:{function_name}", [{"name": "count", "value": "2"}])
+
+    assert gzip.decompress((tmp_path / "artifacts/records").read_bytes()) == expected
+
+
+def test_runner_generator_result_is_collected():
+    assert _runner("tests.script_runner.async_functions:async_squares", [{"name": "count", "value": "3"}]) == [0, 1, 4]
+    assert _runner("tests.script_runner.streamed_outputs:numbers", [{"name": "count", "value": "3"}]) == [0, 1, 2]
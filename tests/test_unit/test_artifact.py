@@ -1,8 +1,12 @@
-"""The unit tests of the Artifact class, covering the name: Optional[str] behaviour."""
+"""The unit tests of the Artifact class, covering the name: Optional[str] behaviour, and of the artifact loaders."""
+
+import gzip
+import sys
+from pathlib import Path
 
 import pytest
 
-from hera.workflows.artifact import Artifact, PluginArtifact
+from hera.workflows.artifact import Artifact, ArtifactLoader, PluginArtifact, load_artifact_file
 
 
 def test_artifact_no_name_can_be_created():
@@ -59,3 +63,67 @@ def test_plugin_artifact_input_attributes_extend_base():
         assert base_attr in attrs
     for extra in ("configuration", "connection_timeout_seconds", "key", "plugin_name"):
         assert extra in attrs
+
+
+def test_load_artifact_file_numpy(tmp_path: Path):
+    numpy = pytest.importorskip("numpy")
+    file_path = tmp_path / "array.npy"
+    numpy.save(file_path, numpy.arange(6).reshape(2, 3))
+
+    array = load_artifact_file(file_path, ArtifactLoader.numpy)
+
+    assert isinstance(array, numpy.memmap)
+    assert array.tolist() == [[0, 1, 2], [3, 4, 5]]
+
+
+def test_load_artifact_file_arrow(tmp_path: Path):
+    pyarrow = pytest.importorskip("pyarrow")
+    from pyarrow import feather
+
+    file_path = tmp_path / "table.arrow"
+    feather.write_feather(pyarrow.table({"a": [1, 2]}), str(file_path), compression="uncompressed")
+
+    table = load_artifact_file(file_path, ArtifactLoader.arrow)
+
+    assert isinstance(table, pyarrow.Table)
+    assert table.to_pydict() == {"a": [1, 2]}
+
+
+@pytest.mark.parametrize(
+    "loader,content,expected",
+    [
+        pytest.param(ArtifactLoader.json, b'{"a": 1}', {"a": 1}, id="json"),
+        pytest.param(ArtifactLoader.file, b"text", "text", id="file"),
+        pytest.param(ArtifactLoader.jsonl, b'{"a": 1}\n2\n', [{"a": 1}, 2], id="jsonl"),
+        pytest.param(ArtifactLoader.records, b"\0\0\0\1a\0\0\0\0", [b"a", b""], id="records"),
+    ],
+)
+def test_load_artifact_file_gzip(tmp_path: Path, loader: ArtifactLoader, content: bytes, expected: object):
+    file_path = tmp_path / "file.gz"
+    file_path.write_bytes(gzip.compress(content))
+
+    loaded = load_artifact_file(file_path, loader, "gzip")
+
+    assert (list(loaded) if loader in (ArtifactLoader.jsonl, ArtifactLoader.records) else loaded) == expected
+
+
+def test_load_artifact_file_truncated_record(tmp_path: Path):
+    file_path = tmp_path / "records"
+    file_path.write_bytes(b"\0\0\0\2a")
+
+    with pytest.raises(ValueError, match="The last record of the artifact file .* is truncated"):
+        list(load_artifact_file(file_path, ArtifactLoader.records))
+
+
+def test_load_artifact_file_compressed_mapped(tmp_path: Path):
+    with pytest.raises(ValueError, match="The `mmap` loader maps the artifact file into memory"):
+        load_artifact_file(tmp_path / "file", ArtifactLoader.mmap, "gzip")
+
+
+def test_load_artifact_file_missing_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setitem(sys.modules, "pyarrow.feather", None)
+
+    with pytest.raises(
+        ImportError, match="`pyarrow` is not installed. Install it in the image to load artifacts with"
+    ):
+        load_artifact_file(tmp_path / "table.arrow", ArtifactLoader.arrow)
@@ -0,0 +1,150 @@
+import base64
+import json
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from hera.auth import CachedTokenGenerator, FileTokenGenerator, _jwt_expiry
+from hera.shared import global_config
+from hera.workflows import WorkflowsService
+
+
+def _jwt(exp: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"sub": "hera", "exp": exp}).encode()).rstrip(b"=").decode()
+    return f"eyJhbGciOiJSUzI1NiJ9.{payload}.signature"
+
+
+def test_jwt_expiry():
+    assert _jwt_expiry(_jwt(1700000000)) == 1700000000
+    assert _jwt_expiry("Bearer " + _jwt(1700000000)) == 1700000000
+    assert _jwt_expiry("abc-123") is None
+    assert _jwt_expiry("a.not-base64!.c") is None
+
+
+@patch("hera.auth.time.time")
+def test_cached_token_generator_caches_until_ttl(mock_time):
+    mock_time.return_value = 1000.0
+    generator = MagicMock(side_effect=["token-1", "token-2"])
+    cached = CachedTokenGenerator(generator, ttl=60, refresh_ahead=0)
+
+    assert cached() == "token-1"
+    mock_time.return_value = 1059.0
+    assert cached() == "token-1"
+    mock_time.return_value = 1060.0
+    assert cached() == "token-2"
+    assert generator.call_count == 2
+
+
+@patch("hera.auth.time.time")
+def test_cached_token_generator_expires_jwt_before_ttl(mock_time):
+    mock_time.return_value = 1000.0
+    generator = MagicMock(side_effect=[_jwt(1030), "token-2"])
+    cached = CachedTokenGenerator(generator, ttl=300, refresh_ahead=0)
+
+    assert cached() == _jwt(1030)
+    # JWTs expire a few seconds before their `exp` claim
+    mock_time.return_value = 1025.0
+    assert cached() == "token-2"
+
+
+def test_cached_token_generator_refreshes_ahead_in_background():
+    refreshed = threading.Event()
+    tokens = iter(["token-1", "token-2"])
+
+    def generate():
+        token = next(tokens)
+        if token == "token-2":
+            refreshed.set()
+        return token
+
+    cached = CachedTokenGenerator(generate, ttl=60, refresh_ahead=30)
+    with patch("hera.auth.time.time", return_value=1000.0):
+        assert cached() == "token-1"
+
+    with patch("hera.auth.time.time", return_value=1040.0):
+        # the cached token is returned while a new one is generated
+        assert cached() == "token-1"
+        assert refreshed.wait(5)
+        for _ in range(100):
+            if cached() == "token-2":
+                break
+            time.sleep(0.01)
+        assert cached() == "token-2"
+
+
+def test_cached_token_generator_generates_once_for_concurrent_callers():
+    calls = 0
+
+    def generate():
+        nonlocal calls
+        calls += 1
+        time.sleep(0.05)
+        return "token"
+
+    cached = CachedTokenGenerator(generate)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cached())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["token"] * 8
+    assert calls == 1
+
+
+def test_cached_token_generator_discards_refresh_started_before_invalidate():
+    generating = threading.Event()
+    release = threading.Event()
+    tokens = iter(["token-1", "token-2", "token-3"])
+
+    def generate():
+        token = next(tokens)
+        if token == "token-2":
+            generating.set()
+            release.wait(5)
+        return token
+
+    cached = CachedTokenGenerator(generate, ttl=60, refresh_ahead=30)
+    with patch("hera.auth.time.time", return_value=1000.0):
+        assert cached() == "token-1"
+
+    with patch("hera.auth.time.time", return_value=1040.0):
+        assert cached() == "token-1"
+        assert generating.wait(5)
+        cached.invalidate()
+        release.set()
+        for _ in range(100):
+            if not cached._refreshing:
+                break
+            time.sleep(0.01)
+        # the token generated before the invalidation is not cached
+        assert cached() == "token-3"
+
+
+def test_file_token_generator_reads_file_once_modified(tmp_path):
+    path = tmp_path / "token"
+    path.write_text("token-1\n")
+    generator = FileTokenGenerator(path)
+
+    with patch("builtins.open", wraps=open) as mock_open:
+        assert generator() == "token-1"
+        assert generator() == "token-1"
+    assert mock_open.call_count == 1
+
+    path.write_text("token-2\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert generator() == "token-2"
+
+
+@patch("hera.auth.time.time", return_value=1000.0)
+def test_services_use_cached_global_token(mock_time, global_config_fixture):
+    generator = MagicMock(return_value="abc-123")
+    global_config.token = CachedTokenGenerator(generator)
+
+    services = [WorkflowsService(host="https://localhost:2746") for _ in range(3)]
+
+    assert [service.token for service in services] == ["Bearer abc-123"] * 3
+    generator.assert_called_once()
@@ -0,0 +1,155 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+
+from hera.exceptions import NotFound
+from hera.workflows import AsyncWorkflowsService, LogTailer, Workflow, WorkflowsService
+from hera.workflows.models import V1alpha1LogEntry
+
+
+def _entries(name, count):
+    return [V1alpha1LogEntry(pod_name=f"{name}-pod", content=f"line {i}") for i in range(count)]
+
+
+def test_tail_multiplexes_the_logs_of_the_workflows():
+    ws = WorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+    ws.stream_workflow_logs = MagicMock(side_effect=lambda name, **kwargs: (entry for entry in _entries(name, 3)))
+    workflows = [Workflow(name=f"w-{i}", namespace="other-namespace", workflows_service=ws) for i in range(4)]
+
+    entries = list(LogTailer(workflows, grep="line").tail())
+
+    assert sorted((name, entry.content) for name, entry in entries) == [
+        (f"w-{i}", f"line {j}") for i in range(4) for j in range(3)
+    ]
+    # the entries of each workflow are yielded in order
+    assert [entry.content for name, entry in entries if name == "w-2"] == ["line 0", "line 1", "line 2"]
+    assert ws.stream_workflow_logs.call_count == 4
+    assert ws.stream_workflow_logs.call_args.kwargs == {
+        "namespace": "other-namespace",
+        "container": "main",
+        "follow": True,
+        "timestamps": False,
+        "grep": "line",
+    }
+
+
+def test_tail_bounds_the_buffered_entries():
+    ws = WorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+    produced = []
+    stream_closed = threading.Event()
+
+    def stream_workflow_logs(name, **kwargs):
+        try:
+            for entry in _entries(name, 100):
+                produced.append(entry)
+                yield entry
+        finally:
+            stream_closed.set()
+
+    ws.stream_workflow_logs = stream_workflow_logs
+    tail = LogTailer(["w"], workflows_service=ws, buffer_size=5).tail()
+
+    next(tail)
+    for _ in range(100):
+        if len(produced) >= 7:
+            break
+        time.sleep(0.01)
+    # the yielded entry, the buffered ones, and the one waiting to be buffered
+    assert len(produced) == 7
+
+    tail.close()
+    assert stream_closed.wait(5)
+
+
+def test_tail_raises_stream_errors():
+    ws = WorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+
+    def stream_workflow_logs(name, **kwargs):
+        if name == "missing":
+            raise NotFound("workflow not found")
+        yield from _entries(name, 1)
+
+    ws.stream_workflow_logs = stream_workflow_logs
+
+    with pytest.raises(NotFound):
+        list(LogTailer(["missing", "w"], workflows_service=ws).tail())
+
+
+class _IdleLogHandler(BaseHTTPRequestHandler):
+    """Sends a log entry for workflow `a`, and then keeps its stream open without sending anything."""
+
+    protocol_version = "HTTP/1.1"
+    stop = threading.Event()
+    connections = 0
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        type(self).connections += 1
+        if "/a/" in self.path:
+            line = json.dumps({"result": {"podName": "a-pod", "content": "line 0"}}).encode() + b"\n"
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+            self.wfile.flush()
+        # an idle stream, which is never ended
+        self.stop.wait(30)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_tail_close_stops_idle_follow_streams():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _IdleLogHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    ws = WorkflowsService(host=f"http://127.0.0.1:{server.server_port}", namespace="argo")
+    try:
+        tail = LogTailer(["a", "b"], workflows_service=ws).tail()
+
+        name, entry = next(tail)
+        tail.close()
+
+        assert (name, entry.content) == ("a", "line 0")
+        for _ in range(100):
+            if not any(thread.name.startswith("hera-logs-") for thread in threading.enumerate()):
+                break
+            time.sleep(0.05)
+        assert not any(thread.name.startswith("hera-logs-") for thread in threading.enumerate())
+        # the streams are not reopened once the tailer is closed
+        assert _IdleLogHandler.connections == 2
+    finally:
+        _IdleLogHandler.stop.set()
+        server.shutdown()
+        server.server_close()
+
+
+async def test_async_tail_multiplexes_the_logs_of_the_workflows():
+    ws = AsyncWorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+
+    async def stream_workflow_logs(name, **kwargs):
+        for entry in _entries(name, 3):
+            yield entry
+
+    ws.stream_workflow_logs = stream_workflow_logs
+
+    entries = [(name, entry.content) async for name, entry in LogTailer(["a", "b"], workflows_service=ws).async_tail()]
+
+    assert sorted(entries) == [(name, f"line {i}") for name in "ab" for i in range(3)]
+
+
+async def test_async_tail_raises_stream_errors():
+    ws = AsyncWorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+
+    async def stream_workflow_logs(name, **kwargs):
+        raise NotFound("workflow not found")
+        yield
+
+    ws.stream_workflow_logs = stream_workflow_logs
+
+    with pytest.raises(NotFound):
+        async for _ in LogTailer(["a"], workflows_service=ws, buffer_size=1).async_tail():
+            pass
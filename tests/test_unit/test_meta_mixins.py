@@ -241,3 +241,29 @@ def test_callable_script_mixed_types_raises(with_items_list):
                     name="print-message-loop-with-items-dict",
                     with_items=with_items_list,
                 )
+
+
+def test_model_mappings_are_computed_once_per_class():
+    from hera.workflows import CronWorkflow
+    from hera.workflows.cron_workflow import _CronWorkflowModelMapper
+    from hera.workflows.workflow import _WorkflowModelMapper
+
+    assert Workflow._get_model_mappings() is Workflow._get_model_mappings()
+    assert _WorkflowModelMapper._get_build_plan(Workflow) is _WorkflowModelMapper._get_build_plan(Workflow)
+
+    cron_plan = _CronWorkflowModelMapper._get_build_plan(CronWorkflow)
+    # Workflow spec fields are built into the cron workflow's `workflow_spec` by `Workflow.build`
+    assert "templates" not in {mapping.attr for mapping in cron_plan}
+    assert {"name", "schedules", "cron_suspend"} <= {mapping.attr for mapping in cron_plan}
+
+
+def test_from_model_uses_model_mappings():
+    from hera.workflows import CronWorkflow
+
+    cron_workflow = CronWorkflow(name="cron", schedules=["* * * * *"], entrypoint="main", cron_suspend=True)
+
+    parsed = CronWorkflow.from_dict(cron_workflow.to_dict())
+
+    assert parsed.to_dict() == cron_workflow.to_dict()
+    assert parsed.entrypoint == "main"
+    assert parsed.cron_suspend is True
@@ -0,0 +1,136 @@
+import copy
+import json
+import pickle
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import ValidationError
+from requests import Response
+
+from hera.shared import global_config
+from hera.shared._responses import loads, parse_response
+from hera.workflows import WorkflowsService
+from hera.workflows.models import NodeStatus, Workflow, WorkflowCreateRequest, WorkflowStatus
+
+WORKFLOW = {
+    "metadata": {"name": "w", "namespace": "argo", "creationTimestamp": "2024-01-01T00:00:00Z"},
+    "spec": {"entrypoint": "main", "templates": [{"name": "main", "container": {"image": "alpine"}}]},
+    "status": {
+        "phase": "Succeeded",
+        "startedAt": "2024-01-01T00:00:00Z",
+        "nodes": {
+            f"w-{i}": {
+                "id": f"w-{i}",
+                "name": f"w.step-{i}",
+                "type": "Pod",
+                "phase": "Succeeded",
+                "outputs": {"parameters": [{"name": "result", "value": str(i)}]},
+            }
+            for i in range(3)
+        },
+    },
+}
+CONTENT = json.dumps(WORKFLOW).encode()
+
+
+def test_loads():
+    assert loads(CONTENT) == WORKFLOW
+    assert loads(CONTENT.decode()) == WORKFLOW
+
+
+def test_lazy_model_validates_fields_on_access():
+    workflow = parse_response(Workflow, CONTENT, validate=False)
+
+    assert isinstance(workflow, Workflow)
+    assert isinstance(workflow.status, WorkflowStatus)
+    assert workflow.status.phase == "Succeeded"
+    assert workflow.status.started_at.root.year == 2024
+    node = workflow.status.nodes["w-1"]
+    assert isinstance(node, NodeStatus)
+    assert node.outputs.parameters[0].value == "1"
+    assert workflow.spec.templates[0].container.image == "alpine"
+    assert workflow.status.message is None
+
+
+def test_lazy_model_only_validates_accessed_fields():
+    workflow = parse_response(
+        Workflow, json.dumps({"metadata": {"name": "w"}, "spec": {"templates": "invalid"}}), False
+    )
+
+    assert workflow.metadata.name == "w"
+    with pytest.raises(ValidationError):
+        workflow.spec.templates
+
+
+def test_lazy_model_is_equal_to_validated_model():
+    validated = parse_response(Workflow, CONTENT)
+    lazy = parse_response(Workflow, CONTENT, validate=False)
+    # partially accessed models are validated entirely when compared
+    assert lazy.status.nodes["w-0"].phase == "Succeeded"
+
+    assert lazy == validated
+    assert type(lazy) is Workflow
+    assert type(lazy.status.nodes["w-0"]) is NodeStatus
+    assert lazy.model_dump(by_alias=True) == validated.model_dump(by_alias=True)
+
+
+def test_lazy_model_is_serialized_as_a_field():
+    validated = parse_response(Workflow, CONTENT)
+    lazy = parse_response(Workflow, CONTENT, validate=False)
+    assert lazy.metadata.name == "w"
+
+    # the fields are serialized in the order of the model, not in the order they were accessed in
+    assert WorkflowCreateRequest(workflow=lazy).model_dump_json(by_alias=True, exclude_none=True) == (
+        WorkflowCreateRequest(workflow=validated).model_dump_json(by_alias=True, exclude_none=True)
+    )
+
+
+def test_lazy_model_keeps_assigned_and_unset_fields():
+    lazy = parse_response(Workflow, CONTENT, validate=False)
+    lazy.metadata.name = "renamed"
+
+    dumped = lazy.model_dump(by_alias=True, exclude_unset=True)
+
+    expected = parse_response(Workflow, CONTENT).model_dump(by_alias=True, exclude_unset=True)
+    expected["metadata"]["name"] = "renamed"
+    assert dumped == expected
+
+
+def test_lazy_model_can_be_copied_and_pickled():
+    validated = parse_response(Workflow, CONTENT)
+
+    assert copy.deepcopy(parse_response(Workflow, CONTENT, validate=False)) == validated
+    assert pickle.loads(pickle.dumps(parse_response(Workflow, CONTENT, validate=False))) == validated
+    assert repr(parse_response(Workflow, CONTENT, validate=False)) == repr(validated)
+
+
+def test_service_returns_lazy_models_if_responses_are_not_validated():
+    response = MagicMock(spec=Response, ok=True, content=CONTENT)
+
+    with patch("requests.Session.request", return_value=response):
+        lazy = WorkflowsService(host="https://localhost:2746", validate_responses=False).get_workflow("w", "argo")
+        validated = WorkflowsService(host="https://localhost:2746").get_workflow("w", "argo")
+
+    assert type(lazy) is not Workflow
+    assert type(validated) is Workflow
+    assert lazy == validated
+
+
+def test_service_does_not_validate_projected_responses():
+    content = json.dumps({"metadata": {"name": "w"}, "status": {"phase": "Succeeded"}}).encode()
+    response = MagicMock(spec=Response, ok=True, content=content)
+
+    with patch("requests.Session.request", return_value=response):
+        workflow = WorkflowsService(host="https://localhost:2746").get_workflow("w", "argo", fields="status.phase")
+
+    assert workflow.status.phase == "Succeeded"
+    # the required fields projected out of the response are not set, as for `model_construct`
+    assert not hasattr(workflow, "spec")
+    assert workflow.model_dump(exclude_none=True) == {"metadata": {"name": "w"}, "status": {"phase": "Succeeded"}}
+
+
+def test_services_use_global_validate_responses(global_config_fixture):
+    global_config.validate_responses = False
+
+    assert not WorkflowsService(host="https://localhost:2746").validate_responses
+    assert WorkflowsService(host="https://localhost:2746", validate_responses=True).validate_responses
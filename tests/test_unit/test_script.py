@@ -1,3 +1,4 @@
+import asyncio
 import sys
 from pathlib import Path
 from typing import Annotated, Dict, List, Optional, Union, cast
@@ -6,10 +7,16 @@ import pytest
 
 from hera.workflows._mixins import EnvT
 from hera.workflows.artifact import Artifact
+from hera.workflows.dag import DAG
 from hera.workflows.env import Env
 from hera.workflows.io import Output
 from hera.workflows.models import (
+    DAGTask,
     EnvVar as ModelEnvVar,
+    EnvVarSource,
+    Item,
+    Parameter as ModelParameter,
+    ResourceFieldSelector,
     ScriptTemplate,
     Workflow as ModelWorkflow,
 )
@@ -37,6 +44,34 @@ def test_script_function_original_is_usable_with_args_and_kwargs():
     assert my_function(1, b=2) == 3  # args and kwargs
 
 
+async def test_async_script_function_original_is_usable():
+    @script()
+    async def my_function(a: int, b: int):
+        return a + b
+
+    assert await my_function(1, b=2) == 3
+
+
+def test_inline_async_script_runs_the_function():
+    @script()
+    async def my_function(a: Annotated[int, Parameter(description="an int")], b: int = 2) -> None:
+        await asyncio.sleep(0)
+        print(a + b)
+
+    with Workflow(name="test") as w:
+        my_function(arguments={"a": 1})
+
+    source = cast(ScriptTemplate, cast(ModelWorkflow, w.build()).spec.templates[0].script).source
+    # the function is defined without its decorator, annotations and defaults, and run with the loaded parameters
+    assert source is not None and source.endswith(
+        "import asyncio\n"
+        "async def my_function(a, b):\n"
+        "    await asyncio.sleep(0)\n"
+        "    print(a + b)\n"
+        "asyncio.run(my_function(a=a, b=b))"
+    )
+
+
 def test_get_inputs_from_callable_simple_params():
     # GIVEN
     def my_function(a: int, b: int):
@@ -427,3 +462,98 @@ class TestRunnerScriptEnv:
         script_template = cast(ScriptTemplate, built_workflow.spec.templates[0].script)
         assert script_template is not None
         assert script_template.env == expected_env
+
+    def test_runner_script_event_loop_env_var(self):
+        built_workflow = self.build_workflow(None, RunnerScriptConstructor(event_loop="uvloop"))
+
+        script_template = cast(ScriptTemplate, built_workflow.spec.templates[0].script)
+        assert script_template.env == [ModelEnvVar(name="hera__event_loop", value="uvloop")]
+
+    def test_runner_script_call_manifest_env_var(self):
+        @script(constructor=RunnerScriptConstructor(call_manifest=True))
+        def my_script(a: int, b: Annotated[str, Parameter(name="my-b")]):
+            pass
+
+        with Workflow(name="test") as w:
+            my_script()
+
+        script_template = cast(ScriptTemplate, cast(ModelWorkflow, w.build()).spec.templates[0].script)
+        assert script_template.env == [
+            ModelEnvVar(
+                name="hera__call_manifest",
+                value='{"version":1,"params":[{"name":"a","kind":"value","json":true},'
+                '{"name":"b","kind":"parameter","key":"my-b"}]}',
+            )
+        ]
+
+    def test_runner_script_batch_processes_env_var(self):
+        @script(constructor=RunnerScriptConstructor(batch_in_processes=True), batch_size=10)
+        def my_script(a: int):
+            pass
+
+        with Workflow(name="test") as w:
+            my_script()
+
+        script_template = cast(ScriptTemplate, cast(ModelWorkflow, w.build()).spec.templates[0].script)
+        assert script_template.env == [
+            ModelEnvVar(
+                name="hera__batch_processes",
+                value_from=EnvVarSource(resource_field_ref=ResourceFieldSelector(resource="requests.cpu")),
+            )
+        ]
+
+
+@script(constructor="runner", batch_size=2)
+def add(a: int, b: int, c: int = 0) -> int:
+    return a + b + c
+
+
+def test_batched_script_call_groups_the_items():
+    with Workflow(name="w", entrypoint="d") as w:
+        with DAG(name="d"):
+            add(with_items=[{"a": 1, "b": 2}, {"a": 3, "b": 4}, {"a": 5, "b": 6}], arguments={"c": 1})
+            add(name="add-each", with_items=[1, 2, 3], arguments={"a": "{{item}}", "b": 1})
+
+    templates = cast(ModelWorkflow, w.build()).spec.templates
+    tasks = cast(List[DAGTask], templates[0].dag.tasks)  # type: ignore
+    assert tasks[0].with_items == [
+        Item(root='[{"a": 1, "b": 2}, {"a": 3, "b": 4}]'),
+        Item(root='[{"a": 5, "b": 6}]'),
+    ]
+    assert tasks[0].arguments.parameters == [  # type: ignore
+        ModelParameter(name="c", value="1"),
+        ModelParameter(name="a", value="{{item}}"),
+        ModelParameter(name="b", value="{{item}}"),
+        ModelParameter(name="hera-batch", value='{"a": "a", "b": "b"}'),
+    ]
+    assert tasks[1].with_items == [Item(root="[1, 2]"), Item(root="[3]")]
+    assert tasks[1].arguments.parameters == [  # type: ignore
+        ModelParameter(name="a", value="{{item}}"),
+        ModelParameter(name="b", value="1"),
+        ModelParameter(name="hera-batch", value='{"a": null}'),
+    ]
+    assert templates[1].inputs.parameters[-1] == ModelParameter(name="hera-batch", default="{}")  # type: ignore
+
+
+def test_batched_script_call_does_not_group_items_known_by_argo():
+    with Workflow(name="w", entrypoint="d") as w:
+        with DAG(name="d"):
+            add(with_param="{{tasks.list.outputs.result}}")
+
+    task = cast(List[DAGTask], cast(ModelWorkflow, w.build()).spec.templates[0].dag.tasks)[0]  # type: ignore
+    assert task.with_param == "{{tasks.list.outputs.result}}"
+    assert [parameter.name for parameter in task.arguments.parameters] == ["a", "b"]  # type: ignore
+
+
+def test_batched_script_call_with_a_templated_item_argument_raises():
+    with Workflow(name="w", entrypoint="d"):
+        with DAG(name="d"):
+            with pytest.raises(ValueError, match="must be the item or a key of the item"):
+                add(with_items=[1, 2], arguments={"a": "{{item}}0", "b": 1})
+
+
+def test_batch_size_needs_a_function_run_by_the_runner():
+    with pytest.raises(ValueError, match="batch_size can only be used for a function run by the runner"):
+        Script(name="s", source="print(1)", batch_size=2)
+    with pytest.raises(ValueError, match="batch_size must be at least 1"):
+        Script(name="s", source=add, constructor="runner", batch_size=0)
@@ -1,19 +1,23 @@
+import gzip
 import json
 import os
+import sys
 from pathlib import Path
-from typing import Annotated, Any, Callable, Optional, Union
+from typing import Annotated, Any, Callable, List, Optional, Union
 
 import pytest
 
+from hera.shared.serialization import serialize
 from hera.workflows._runner.script_annotations_util import (
     _get_outputs_path,
+    _write_artifact,
     get_annotated_artifact_value,
     get_annotated_input_param,
     get_annotated_output_param,
     load_param_input,
     map_runner_input,
 )
-from hera.workflows.artifact import Artifact, ArtifactLoader
+from hera.workflows.artifact import Artifact, ArtifactLoader, load_artifact_file
 from hera.workflows.io import Input
 from hera.workflows.models import ValueFrom
 from hera.workflows.parameter import Parameter
@@ -145,6 +149,21 @@ def test_get_annotated_artifact_value_inputs_with_loaders(
     assert get_annotated_artifact_value("param_name", artifact) == expected_return
 
 
+@pytest.mark.parametrize(
+    "artifact,expected_return",
+    [
+        pytest.param(Artifact(loader=ArtifactLoader.json, compression="gzip"), {"a": 1}, id="json-load"),
+        pytest.param(Artifact(loads=json.loads, compression="gzip"), {"a": 1}, id="loads"),
+        pytest.param(Artifact(loadb=bytes, compression="gzip"), b'{"a": 1}', id="loadb"),
+    ],
+)
+def test_get_annotated_artifact_value_decompresses_inputs(artifact: Artifact, expected_return: Any, tmp_path: Path):
+    file_path = tmp_path / "contents.gz"
+    file_path.write_bytes(gzip.compress(b'{"a": 1}'))
+    artifact.path = str(file_path)
+    assert get_annotated_artifact_value("param_name", artifact) == expected_return
+
+
 def test_get_annotated_artifact_value_optional_artifact_missing(tmp_path: Path):
     artifact = Artifact(optional=True, loader=ArtifactLoader.json)
     file_path = tmp_path / "contents.txt"
@@ -291,3 +310,77 @@ def test_map_runner_input_annotated_parameter_noname():
 
     kwargs = {"foo": "hello"}
     assert map_runner_input(Foo, kwargs) == Foo(foo="hello")
+
+
+def test_write_artifact_compresses_a_value(tmp_path: Path):
+    _write_artifact(tmp_path / "out", {"a": 1}, Artifact(name="out", compression="gzip"))
+
+    assert gzip.decompress((tmp_path / "out").read_bytes()) == b'{"a": 1}'
+
+
+def test_write_artifact_streams_items_as_a_json_array(tmp_path: Path):
+    _write_artifact(tmp_path / "out", iter([0, {"a": 1}]), Artifact(name="out"))
+
+    assert (tmp_path / "out").read_bytes() == serialize([0, {"a": 1}]).encode()
+    assert load_artifact_file(tmp_path / "out", ArtifactLoader.json) == [0, {"a": 1}]
+
+
+def test_write_artifact_collects_items_for_the_dumper(tmp_path: Path):
+    _write_artifact(tmp_path / "out", iter([1, 2]), Artifact(name="out", dumpb=bytes))
+
+    assert (tmp_path / "out").read_bytes() == b"\1\2"
+
+
+def test_write_artifact_streams_items_with_the_dumper(tmp_path: Path):
+    artifact = Artifact(name="out", loader=ArtifactLoader.records, dumpb=lambda item: bytes([item]))
+    _write_artifact(tmp_path / "out", iter([1, 2]), artifact)
+
+    assert (tmp_path / "out").read_bytes() == b"\0\0\0\1\1\0\0\0\1\2"
+    assert list(load_artifact_file(tmp_path / "out", ArtifactLoader.records)) == [b"\1", b"\2"]
+
+
+@pytest.mark.parametrize(
+    "loader,value,expected",
+    [
+        pytest.param(ArtifactLoader.jsonl, iter([{"a": 1}, 2]), [{"a": 1}, 2], id="jsonl"),
+        pytest.param(ArtifactLoader.jsonl, [{"a": 1}, 2], [{"a": 1}, 2], id="jsonl-list"),
+        pytest.param(ArtifactLoader.records, iter([b"a", b"", b"bc"]), [b"a", b"", b"bc"], id="records"),
+        pytest.param(ArtifactLoader.json, iter([{"a": 1}, 2]), [{"a": 1}, 2], id="json"),
+    ],
+)
+def test_write_artifact_compressed_is_loaded_back(tmp_path: Path, loader: ArtifactLoader, value: Any, expected: Any):
+    artifact = Artifact(name="out", loader=loader, compression="gzip")
+    _write_artifact(tmp_path / "out", value, artifact)
+
+    loaded = load_artifact_file(tmp_path / "out", loader, artifact.compression)
+
+    assert (list(loaded) if loader != ArtifactLoader.json else loaded) == expected
+
+
+def test_write_artifact_item_dumped_to_more_than_one_line(tmp_path: Path):
+    with pytest.raises(ValueError, match="An item of output `out` was dumped to more than one line"):
+        _write_artifact(tmp_path / "out", iter(["a\nb"]), Artifact(name="out", loader=ArtifactLoader.jsonl, dumps=str))
+
+
+@pytest.mark.parametrize(
+    "loader,items,message",
+    [
+        pytest.param(ArtifactLoader.jsonl, [b"a"], "dumped to bytes, expected a str", id="jsonl"),
+        pytest.param(ArtifactLoader.records, [b"a", "b"], "dumped to str, expected bytes", id="records"),
+    ],
+)
+def test_write_artifact_item_dumped_to_the_wrong_type(
+    tmp_path: Path, loader: ArtifactLoader, items: List[Any], message: str
+):
+    artifact = Artifact(name="out", loader=loader, dumps=lambda item: item)
+
+    with pytest.raises(TypeError, match=f"An item of output `out` was {message}"):
+        _write_artifact(tmp_path / "out", iter(items), artifact)
+
+
+def test_write_artifact_zstd_missing_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setitem(sys.modules, "compression", None)
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+
+    with pytest.raises(ImportError, match="`zstandard` is not installed"):
+        _write_artifact(tmp_path / "out", iter([1]), Artifact(name="out", compression="zstd"))
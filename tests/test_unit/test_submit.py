@@ -0,0 +1,213 @@
+import logging
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import requests
+
+from hera.exceptions import BadRequest, exception_from_status_code
+from hera.shared import TransportConfig
+from hera.workflows import AsyncWorkflowsService, Workflow, WorkflowsService, async_submit_many, submit_many
+from hera.workflows.exceptions import SubmissionError
+from hera.workflows.models import (
+    ObjectMeta,
+    Workflow as ModelWorkflow,
+    WorkflowCreateRequest,
+    WorkflowSpec,
+)
+
+
+def _created(req: WorkflowCreateRequest, namespace=None) -> ModelWorkflow:
+    return ModelWorkflow(
+        metadata=ObjectMeta(name=req.workflow.metadata.generate_name + "abcde", namespace=namespace),
+        spec=WorkflowSpec(),
+    )
+
+
+def _failing_then_created(*errors):
+    outcomes = list(errors)
+
+    def create_workflow(req, namespace=None):
+        if outcomes:
+            raise outcomes.pop(0)
+        return _created(req, namespace)
+
+    return create_workflow
+
+
+def _workflows(ws, n):
+    return [Workflow(generate_name=f"w-{i}-", namespace="my-namespace", workflows_service=ws) for i in range(n)]
+
+
+def test_submit_many_creates_workflows_concurrently_in_order():
+    ws = WorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def create_workflow(req, namespace=None):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return _created(req, namespace)
+
+    ws.create_workflow = MagicMock(side_effect=create_workflow)
+    workflows = _workflows(ws, 20)
+
+    results = submit_many(workflows, concurrency=4)
+
+    assert [result.metadata.name for result in results] == [f"w-{i}-abcde" for i in range(20)]
+    # the names of the Hera workflows are set, as `Workflow.create` does
+    assert [workflow.name for workflow in workflows] == [f"w-{i}-abcde" for i in range(20)]
+    assert 1 < max_running <= 4
+    assert all(call.kwargs["namespace"] == "my-namespace" for call in ws.create_workflow.call_args_list)
+
+
+def test_submit_many_caps_concurrency_to_connection_pool(caplog):
+    ws = WorkflowsService(
+        host="https://localhost:2746",
+        namespace="my-namespace",
+        transport_config=TransportConfig(max_connections_per_host=2),
+    )
+    adapter = ws.session.get_adapter("https://localhost:2746")
+    threads = set()
+
+    def create_workflow(req, namespace=None):
+        threads.add(threading.get_ident())
+        time.sleep(0.01)
+        return _created(req, namespace)
+
+    ws.create_workflow = MagicMock(side_effect=create_workflow)
+
+    with caplog.at_level(logging.WARNING, logger="hera.workflows.submit"):
+        submit_many(_workflows(ws, 10), concurrency=32)
+
+    assert len(threads) <= 2
+    assert "Capping the concurrency of 32 to the 2 connections of the workflows service" in caplog.text
+    # the session of the service is not changed
+    assert ws.session.get_adapter("https://localhost:2746") is adapter
+
+
+@patch.object(WorkflowsService, "close", autospec=True)
+def test_submit_many_sizes_connection_pool_of_default_service(mock_close, global_config_fixture):
+    global_config_fixture.host = "https://localhost:2746"
+    workflows = [ModelWorkflow(metadata=ObjectMeta(generate_name="w-", namespace="argo"), spec=WorkflowSpec())]
+
+    with patch.object(
+        WorkflowsService, "create_workflow", autospec=True, side_effect=lambda _, req, namespace: _created(req)
+    ) as mock_create:
+        submit_many(workflows, concurrency=32)
+
+    service = mock_create.call_args.args[0]
+    assert service.session.get_adapter("https://localhost:2746")._pool_maxsize == 32
+    # the service created to submit the workflows is closed
+    mock_close.assert_called_once_with(service)
+
+
+def test_submit_many_rejects_async_service():
+    ws = AsyncWorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+
+    with pytest.raises(TypeError, match="Expected a WorkflowsService, got AsyncWorkflowsService"):
+        submit_many(_workflows(ws, 1))
+
+
+@patch("hera.workflows.submit.time.sleep")
+def test_submit_many_retries_retryable_errors(mock_sleep):
+    ws = WorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+    ws.create_workflow = MagicMock(
+        side_effect=_failing_then_created(
+            exception_from_status_code(503, "unavailable"), requests.ConnectionError("connection reset")
+        )
+    )
+
+    results = submit_many(_workflows(ws, 1))
+
+    assert results[0].metadata.name == "w-0-abcde"
+    assert ws.create_workflow.call_count == 3
+    assert mock_sleep.call_count == 2
+
+
+@patch("hera.workflows.submit.time.sleep")
+def test_submit_many_reports_partial_failures(mock_sleep):
+    ws = WorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+
+    def create_workflow(req, namespace=None):
+        if req.workflow.metadata.generate_name == "w-1-":
+            raise BadRequest("invalid workflow")
+        if req.workflow.metadata.generate_name == "w-3-":
+            raise exception_from_status_code(429, "too many requests")
+        return _created(req, namespace)
+
+    ws.create_workflow = MagicMock(side_effect=create_workflow)
+
+    with pytest.raises(SubmissionError, match="2 of 4 workflows could not be created") as e:
+        submit_many(_workflows(ws, 4), max_retries=2)
+
+    assert [type(result).__name__ for result in e.value.results] == [
+        "Workflow",
+        "BadRequest",
+        "Workflow",
+        "HeraException",
+    ]
+    assert sorted(e.value.errors) == [1, 3]
+    # the bad request is not retried, the rate limited request is retried `max_retries` times
+    assert ws.create_workflow.call_count == 1 + 1 + 1 + 3
+
+
+async def test_async_submit_many_creates_workflows_in_order():
+    ws = AsyncWorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+    ws.create_workflow = AsyncMock(side_effect=_failing_then_created(exception_from_status_code(502, "bad gateway")))
+    workflows = _workflows(ws, 5)
+
+    with patch("hera.workflows.submit.asyncio.sleep") as mock_sleep:
+        results = await async_submit_many(workflows, concurrency=2)
+
+    assert [result.metadata.name for result in results] == [f"w-{i}-abcde" for i in range(5)]
+    assert [workflow.name for workflow in workflows] == [f"w-{i}-abcde" for i in range(5)]
+    assert ws.create_workflow.await_count == 6
+    assert mock_sleep.await_count == 1
+
+
+async def test_async_submit_many_reports_partial_failures():
+    ws = AsyncWorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+    ws.create_workflow = AsyncMock(side_effect=_failing_then_created(BadRequest("invalid workflow")))
+
+    with pytest.raises(SubmissionError) as e:
+        await async_submit_many(_workflows(ws, 2), concurrency=1)
+
+    assert isinstance(e.value.results[0], BadRequest)
+    assert e.value.results[1].metadata.name == "w-1-abcde"
+
+
+@patch.object(AsyncWorkflowsService, "close", autospec=True)
+async def test_async_submit_many_creates_plain_hera_workflows(mock_close, global_config_fixture):
+    global_config_fixture.host = "https://localhost:2746"
+    global_config_fixture.token = "my-token"
+    workflows = [Workflow(generate_name=f"w-{i}-", namespace="my-namespace") for i in range(3)]
+
+    async def create_workflow(self, req, namespace=None):
+        return _created(req, namespace)
+
+    with patch.object(
+        AsyncWorkflowsService, "create_workflow", autospec=True, side_effect=create_workflow
+    ) as mock_create:
+        results = await async_submit_many(workflows)
+
+    assert [result.metadata.name for result in results] == [f"w-{i}-abcde" for i in range(3)]
+    # an async service is created from the sync service of the workflows, and closed once they are created
+    service = mock_create.call_args.args[0]
+    assert service.host == "https://localhost:2746"
+    assert service.token == "Bearer my-token"
+    mock_close.assert_awaited_once_with(service)
+
+
+async def test_async_submit_many_rejects_sync_service():
+    ws = WorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+
+    with pytest.raises(TypeError, match="Expected an AsyncWorkflowsService, got WorkflowsService"):
+        await async_submit_many(_workflows(ws, 1), workflows_service=ws)
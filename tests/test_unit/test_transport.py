@@ -0,0 +1,128 @@
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from hera.shared import TransportConfig, global_config
+from hera.shared._async_transport import build_async_client
+from hera.shared._transport import build_session, retry_delay
+from hera.workflows import AsyncWorkflowsService, WorkflowsService
+
+
+@pytest.fixture
+def flaky_server():
+    """A server responding to POST requests with 429 (asking to retry after 0 seconds) twice, then with 200."""
+    statuses = [429, 429, 200]
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            received.append(self.rfile.read(int(self.headers["Content-Length"])))
+            status = statuses.pop(0)
+            self.send_response(status)
+            if status == 429:
+                self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/", received
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize(
+    "attempt,retry_after,expected",
+    [
+        (0, None, 0),
+        (1, None, 1),
+        (3, None, 4),
+        (20, None, 120),
+        (3, "7", 7),
+        (0, "not a delay", 0),
+    ],
+)
+def test_retry_delay(attempt, retry_after, expected):
+    assert retry_delay(TransportConfig(backoff_factor=0.5), attempt, retry_after) == expected
+
+
+def test_retry_delay_respects_retry_after_date():
+    assert 8 <= retry_delay(TransportConfig(), 0, formatdate(time() + 10, usegmt=True)) <= 10
+
+
+def test_build_session_configures_pool_and_retries():
+    session = build_session(TransportConfig(max_connections_per_host=32, max_retries=3))
+
+    adapter = session.get_adapter("https://localhost:2746/api/v1/workflows")
+    assert adapter._pool_maxsize == 32
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.status_forcelist == (429, 503)
+
+
+def test_session_retries_rate_limited_requests(flaky_server):
+    url, received = flaky_server
+    session = build_session(TransportConfig(max_retries=2))
+
+    response = session.post(url, data="body")
+
+    assert response.status_code == 200
+    assert received == [b"body"] * 3
+
+
+def test_session_returns_response_once_retries_are_exhausted(flaky_server):
+    url, received = flaky_server
+    session = build_session(TransportConfig(max_retries=1))
+
+    assert session.post(url, data="body").status_code == 429
+    assert len(received) == 2
+
+
+async def test_async_client_retries_rate_limited_requests(flaky_server):
+    url, received = flaky_server
+    client = build_async_client(TransportConfig(max_retries=2), verify=True, cert=None)
+
+    async with client:
+        response = await client.post(url, content="body")
+
+    assert response.status_code == 200
+    assert received == [b"body"] * 3
+
+
+def test_async_client_configures_limits_and_timeout():
+    client = build_async_client(
+        TransportConfig(
+            max_connections_per_host=16, max_keepalive_connections=8, keepalive_expiry=30, timeout=(2, 60)
+        ),
+        verify=True,
+        cert=None,
+    )
+
+    pool = client._transport._pool
+    assert pool._max_connections == 16
+    assert pool._max_keepalive_connections == 8
+    assert pool._keepalive_expiry == 30
+    assert client.timeout == httpx.Timeout(60, connect=2)
+
+
+@pytest.mark.usefixtures("global_config_fixture")
+def test_services_use_global_transport_config():
+    global_config.transport_config = TransportConfig(max_connections_per_host=4, timeout=12)
+
+    ws = WorkflowsService(host="https://localhost:2746")
+    assert ws.session.get_adapter("https://localhost:2746")._pool_maxsize == 4
+    with patch.object(ws.session, "request") as request:
+        ws._request("get", url="https://localhost:2746")
+    assert request.call_args.kwargs["timeout"] == 12
+
+    aws = AsyncWorkflowsService(host="https://localhost:2746", transport_config=TransportConfig(timeout=3))
+    assert aws.session.timeout == httpx.Timeout(3)
@@ -1,21 +1,30 @@
 import importlib
 from pathlib import Path
-from unittest.mock import MagicMock
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from hera.exceptions import NotFound, NotImplemented
+from hera.workflows.async_service import AsyncWorkflowsService
 from hera.workflows.container import Container
 from hera.workflows.exceptions import InvalidTemplateCall
 from hera.workflows.models import (
     ImagePullPolicy,
+    ObjectMeta,
     Parameter as ModelParameter,
+    Workflow as ModelWorkflow,
     WorkflowCreateRequest,
+    WorkflowSpec,
+    WorkflowStatus as ModelWorkflowStatus,
+    WorkflowWatchEvent,
 )
 from hera.workflows.parameter import Parameter
 from hera.workflows.script import script
 from hera.workflows.service import WorkflowsService
 from hera.workflows.workflow import NAME_LIMIT, Workflow
 from hera.workflows.workflow_status import WorkflowStatus
+from tests.helper import FakeArgoServer
 
 
 def test_workflow_name_validators():
@@ -219,3 +228,240 @@ def test_workflow_template_defaults_validation():
     assert parsed_wf.template_defaults.script.env is not None
     assert parsed_wf.template_defaults.script.env[0].name == "BAZ"
     assert parsed_wf.template_defaults.script.env[0].value == "QUX"
+
+
+def test_workflow_cache_builds_reuses_unchanged_templates(global_config_fixture):
+    global_config_fixture.cache_builds = True
+    from hera.workflows import DAG
+
+    with Workflow(name="w", entrypoint="d") as w:
+        a = Container(name="a", image="alpine")
+        b = Container(name="b", image="alpine")
+        with DAG(name="d") as d:
+            task_a = a(name="task-a")
+            task_b = b(name="task-b")
+
+    with patch.object(Container, "_build_template", autospec=True, side_effect=Container._build_template) as (
+        build_container
+    ), patch.object(DAG, "_build_template", autospec=True, side_effect=DAG._build_template) as build_dag:
+        first = w.build()
+        second = w.build()
+
+        assert second == first
+        assert [call.args[0] for call in build_container.call_args_list] == [a, b]
+        assert build_dag.call_count == 1
+
+        # Setting a field of a template only rebuilds that template and its ancestors (the DAG calling it)
+        b.image = "busybox"
+        third = w.build()
+        assert third.spec.templates[1].container.image == "busybox"
+        assert [call.args[0] for call in build_container.call_args_list] == [a, b, b]
+        assert build_dag.call_count == 2
+
+        # Setting a field of a task rebuilds the DAG containing it
+        task_a >> task_b
+        fourth = w.build()
+        assert fourth.spec.templates[2].dag.tasks[1].depends == "task-a"
+        assert build_container.call_count == 3
+        assert build_dag.call_count == 3
+        assert d.tasks[1] is task_b
+
+
+def test_workflow_cache_builds_returns_copies(global_config_fixture):
+    global_config_fixture.cache_builds = True
+
+    with Workflow(name="w", entrypoint="a") as w:
+        Container(name="a", image="alpine")
+
+    first = w.build()
+    first.spec.templates[0].container.image = "MUTATED"
+
+    assert w.build().spec.templates[0].container.image == "alpine"
+
+
+def test_workflow_cache_builds_disabled_by_default(global_config_fixture):
+    with Workflow(name="w", entrypoint="a") as w:
+        Container(name="a", image="alpine")
+
+    assert w.build().spec.templates[0] is not w.build().spec.templates[0]
+
+
+def _model_workflow(phase: Optional[str]) -> ModelWorkflow:
+    return ModelWorkflow(
+        metadata=ObjectMeta(name="w"),
+        spec=WorkflowSpec(),
+        status=ModelWorkflowStatus(phase=phase) if phase else None,
+    )
+
+
+def test_workflow_wait_watches_workflow_until_completed():
+    ws = WorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+    events = [
+        WorkflowWatchEvent(type="ADDED", object=_model_workflow(None)),
+        WorkflowWatchEvent(type="MODIFIED", object=_model_workflow("Running")),
+        WorkflowWatchEvent(type="MODIFIED", object=_model_workflow("Succeeded")),
+    ]
+    ws.stream_workflows = MagicMock(return_value=(event for event in events))
+    ws.get_workflow = MagicMock(return_value=_model_workflow("Succeeded"))
+
+    result = Workflow(name="w", namespace="my-namespace", workflows_service=ws).wait()
+
+    assert result == ws.get_workflow.return_value
+    assert ws.stream_workflows.call_args.kwargs["field_selector"] == "metadata.name=w"
+    assert "result.object.status.phase" in ws.stream_workflows.call_args.kwargs["fields"]
+    # the whole workflow is only fetched once it completed
+    ws.get_workflow.assert_called_once_with("w", namespace="my-namespace")
+
+
+@patch("hera.workflows.workflow.time.sleep")
+def test_workflow_wait_falls_back_to_polling_phase(mock_sleep):
+    ws = WorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+    ws.stream_workflows = MagicMock(side_effect=NotImplemented("streaming not supported"))
+    full_workflow = _model_workflow("Failed")
+    ws.get_workflow = MagicMock(
+        side_effect=[
+            NotFound("not created yet"),
+            _model_workflow("Pending"),
+            _model_workflow("Running"),
+            _model_workflow("Failed"),
+            full_workflow,
+        ]
+    )
+
+    result = Workflow(name="w", namespace="my-namespace", workflows_service=ws).wait(poll_interval=2)
+
+    assert result is full_workflow
+    assert [call.kwargs.get("fields") for call in ws.get_workflow.call_args_list] == [
+        "metadata.name,metadata.resourceVersion,status.phase"
+    ] * 4 + [None]
+    # the intervals grow exponentially with jitter, up to `poll_interval`
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert 0.25 <= delays[0] <= 0.5
+    assert 0.5 <= delays[1] <= 1
+    assert 1 <= delays[2] <= 2
+    assert 1 <= delays[3] <= 2
+
+
+@patch("hera.workflows.workflow.time.sleep")
+def test_workflow_wait_polling_raises_if_workflow_is_never_found(mock_sleep):
+    ws = WorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+    ws.get_workflow = MagicMock(side_effect=NotFound("not found"))
+
+    with pytest.raises(NotFound):
+        Workflow(name="w", namespace="my-namespace", workflows_service=ws).wait(poll_interval=2, watch=False)
+
+    assert ws.get_workflow.call_count == 3
+
+
+async def test_workflow_async_wait_watches_workflow_until_completed():
+    async def events(**kwargs):
+        yield WorkflowWatchEvent(type="MODIFIED", object=_model_workflow("Running"))
+        yield WorkflowWatchEvent(type="MODIFIED", object=_model_workflow("Error"))
+
+    ws = AsyncWorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+    ws.stream_workflows = MagicMock(side_effect=events)
+    ws.get_workflow = AsyncMock(return_value=_model_workflow("Error"))
+
+    result = await Workflow(name="w", namespace="my-namespace", workflows_service=ws).async_wait()
+
+    assert result == ws.get_workflow.return_value
+    ws.get_workflow.assert_awaited_once_with("w", namespace="my-namespace")
+
+
+@patch("hera.workflows.workflow.asyncio.sleep")
+async def test_workflow_async_wait_polls_phase(mock_sleep):
+    ws = AsyncWorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+    ws.get_workflow = AsyncMock(side_effect=[_model_workflow("Running"), _model_workflow("Succeeded"), "full"])
+
+    result = await Workflow(name="w", namespace="my-namespace", workflows_service=ws).async_wait(watch=False)
+
+    assert result == "full"
+    assert mock_sleep.await_count == 2
+
+
+def _workflow_data(phase: str) -> dict:
+    return {
+        "metadata": {"name": "w", "namespace": "argo", "resourceVersion": "2"},
+        "spec": {"entrypoint": "main"},
+        "status": {"phase": phase},
+    }
+
+
+@patch("hera.shared._stream.time.sleep")
+def test_workflow_wait_reads_projected_watch_events(mock_sleep):
+    server = FakeArgoServer(
+        [_workflow_data("Succeeded")],
+        events=[
+            {"type": "MODIFIED", "object": _workflow_data("Running")},
+            {"type": "MODIFIED", "object": _workflow_data("Succeeded")},
+        ],
+    )
+    ws = WorkflowsService(host="https://localhost:2746", namespace="argo", session=server.session())
+
+    result = Workflow(name="w", namespace="argo", workflows_service=ws).wait()
+
+    assert result.spec.entrypoint == "main"
+    assert [path for path, _ in server.requests] == ["/api/v1/workflow-events/argo", "/api/v1/workflows/argo/w"]
+
+
+@patch("hera.shared._stream.time.sleep")
+def test_workflow_wait_stops_when_workflow_is_deleted(mock_sleep):
+    server = FakeArgoServer(
+        [],
+        events=[
+            {"type": "MODIFIED", "object": _workflow_data("Running")},
+            {"type": "DELETED", "object": _workflow_data("Running")},
+        ],
+    )
+    ws = WorkflowsService(host="https://localhost:2746", namespace="argo", session=server.session())
+
+    with pytest.raises(NotFound):
+        Workflow(name="w", namespace="argo", workflows_service=ws).wait()
+
+    assert "result.type" in server.requests[0][1]["fields"].split(",")
+
+
+@patch("hera.workflows.workflow.time.sleep")
+def test_workflow_wait_reads_projected_polled_workflows(mock_sleep):
+    server = FakeArgoServer([_workflow_data("Failed")])
+    ws = WorkflowsService(host="https://localhost:2746", namespace="argo", session=server.session())
+
+    result = Workflow(name="w", namespace="argo", workflows_service=ws).wait()
+
+    assert result.status.phase == "Failed"
+    assert [params.get("fields") for _, params in server.requests[1:]] == [
+        "metadata.name,metadata.resourceVersion,status.phase",
+        None,
+    ]
+
+
+async def test_workflow_async_wait_reads_projected_watch_events():
+    server = FakeArgoServer(
+        [_workflow_data("Error")], events=[{"type": "MODIFIED", "object": _workflow_data("Error")}]
+    )
+    ws = AsyncWorkflowsService(host="https://localhost:2746", namespace="argo", session=server.client())
+
+    result = await Workflow(name="w", namespace="argo", workflows_service=ws).async_wait()
+
+    assert result.spec.entrypoint == "main"
+    assert len(server.requests) == 2
+
+
+@patch("hera.shared._stream.asyncio.sleep")
+async def test_workflow_async_wait_stops_when_workflow_is_deleted(mock_sleep):
+    server = FakeArgoServer([], events=[{"type": "DELETED", "object": _workflow_data("Pending")}])
+    ws = AsyncWorkflowsService(host="https://localhost:2746", namespace="argo", session=server.client())
+
+    with pytest.raises(NotFound):
+        await Workflow(name="w", namespace="argo", workflows_service=ws).async_wait()
+
+
+@patch("hera.workflows.workflow.asyncio.sleep")
+async def test_workflow_async_wait_reads_projected_polled_workflows(mock_sleep):
+    server = FakeArgoServer([_workflow_data("Succeeded")])
+    ws = AsyncWorkflowsService(host="https://localhost:2746", namespace="argo", session=server.client())
+
+    result = await Workflow(name="w", namespace="argo", workflows_service=ws).async_wait()
+
+    assert result.status.phase == "Succeeded"
+    assert server.requests[1][1]["fields"] == "metadata.name,metadata.resourceVersion,status.phase"
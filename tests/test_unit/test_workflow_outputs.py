@@ -0,0 +1,264 @@
+import asyncio
+import gzip
+import json
+from pathlib import Path
+from typing import Annotated, Any, Dict, Iterable, List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from hera.shared import TransportConfig
+from hera.workflows import (
+    Artifact,
+    ArtifactLoader,
+    AsyncWorkflowsService,
+    Parameter,
+    Workflow,
+    WorkflowsService,
+    async_get_workflow_outputs,
+    get_workflow_outputs,
+)
+from hera.workflows.io.v1 import Output as OutputV1
+from hera.workflows.io.v2 import Output as OutputV2
+from hera.workflows.models import (
+    Artifact as ModelArtifact,
+    NodeStatus,
+    ObjectMeta,
+    Outputs,
+    Parameter as ModelParameter,
+    Workflow as ModelWorkflow,
+    WorkflowSpec,
+    WorkflowStatus,
+)
+
+
+class TrainOutput(OutputV2):
+    accuracy: Annotated[float, Parameter(name="model-accuracy")]
+    model_name: str
+    metrics: Annotated[Dict[str, Any], Artifact(name="metrics", loader=ArtifactLoader.json)]
+    model: Annotated[Path, Artifact(name="model")]
+    report: Annotated[Optional[str], Artifact(name="report", loader=ArtifactLoader.file, optional=True)] = None
+
+
+class CountOutput(OutputV1):
+    count: int = 0
+    names: Annotated[List[str], Artifact(loads=lambda content: content.splitlines())]
+
+
+class LinesOutput(OutputV2):
+    names: Annotated[Iterable[str], Artifact(loader=ArtifactLoader.jsonl)]
+
+
+class CompressedOutput(OutputV2):
+    count: int = 0
+    names: Annotated[List[str], Artifact(loader=ArtifactLoader.json, compression="gzip")]
+
+
+class CompressedLinesOutput(OutputV2):
+    names: Annotated[Iterable[str], Artifact(loader=ArtifactLoader.jsonl, compression="gzip")]
+
+
+def _node(node_id: str, display_name: str, outputs: Optional[Outputs] = None) -> NodeStatus:
+    return NodeStatus(id=node_id, name=f"w.{display_name}", display_name=display_name, type="Pod", outputs=outputs)
+
+
+def _workflow() -> ModelWorkflow:
+    nodes = [
+        _node("w", "w"),
+        _node(
+            "w-1",
+            "train",
+            Outputs(
+                parameters=[
+                    ModelParameter(name="model-accuracy", value="0.93"),
+                    ModelParameter(name="model_name", value="resnet"),
+                ],
+                artifacts=[ModelArtifact(name="metrics"), ModelArtifact(name="model")],
+                exit_code="0",
+            ),
+        ),
+        _node(
+            "w-2",
+            "count",
+            Outputs(parameters=[ModelParameter(name="count", value="2")], artifacts=[ModelArtifact(name="names")]),
+        ),
+        _node("w-3", "loop"),
+        _node("w-4", "loop"),
+    ]
+    return ModelWorkflow(
+        metadata=ObjectMeta(name="w", namespace="argo"),
+        spec=WorkflowSpec(),
+        status=WorkflowStatus(phase="Succeeded", nodes={node.id: node for node in nodes}),
+    )
+
+
+_ARTIFACTS = {
+    ("w-1", "metrics"): json.dumps({"loss": 0.1}).encode(),
+    ("w-1", "model"): b"model-weights",
+    ("w-2", "names"): b"a\nb",
+}
+
+
+def test_get_workflow_outputs(tmp_path: Path):
+    ws = WorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+    ws.get_workflow = MagicMock(return_value=_workflow())
+    ws.stream_output_artifact = MagicMock(
+        side_effect=lambda name, node_id, artifact_name, namespace: iter([_ARTIFACTS[(node_id, artifact_name)]])
+    )
+
+    def download_output_artifact(name, node_id, artifact_name, destination, namespace):
+        destination.write_bytes(_ARTIFACTS[(node_id, artifact_name)])
+        return len(_ARTIFACTS[(node_id, artifact_name)])
+
+    ws.download_output_artifact = MagicMock(side_effect=download_output_artifact)
+    workflow = Workflow(name="w", namespace="argo", workflows_service=ws)
+
+    outputs = get_workflow_outputs(
+        workflow, {"train": TrainOutput, "count": CountOutput}, concurrency=2, download_directory=tmp_path
+    )
+
+    train = outputs["train"]
+    assert isinstance(train, TrainOutput)
+    assert train.accuracy == 0.93
+    assert train.model_name == "resnet"
+    assert train.metrics == {"loss": 0.1}
+    assert train.model == tmp_path / "train" / "model"
+    assert train.model.read_bytes() == b"model-weights"
+    assert train.report is None
+    assert train.exit_code == 0
+    assert outputs["count"] == CountOutput(count=2, names=["a", "b"])
+
+    # a single request for the workflow, without its spec
+    ws.get_workflow.assert_called_once_with(
+        "w", namespace="argo", fields="metadata.name,metadata.namespace,status.phase,status.nodes"
+    )
+    assert ws.stream_output_artifact.call_count == 2
+    assert ws.download_output_artifact.call_count == 1
+
+
+def test_get_workflow_outputs_by_node_id():
+    ws = WorkflowsService(host="https://localhost:2746", namespace="argo")
+    ws.get_workflow = MagicMock(return_value=_workflow())
+    ws.stream_output_artifact = MagicMock(return_value=iter([b"c"]))
+
+    outputs = get_workflow_outputs("w", {"w-2": CountOutput}, workflows_service=ws)
+
+    assert outputs["w-2"] == CountOutput(count=2, names=["c"])
+    assert ws.get_workflow.call_args.kwargs["namespace"] is None
+
+
+def test_get_workflow_outputs_loads_artifacts_with_file_loaders_from_their_file(tmp_path: Path):
+    ws = WorkflowsService(host="https://localhost:2746", namespace="argo")
+    ws.get_workflow = MagicMock(return_value=_workflow())
+    ws.stream_output_artifact = MagicMock()
+
+    def download_output_artifact(name, node_id, artifact_name, destination, namespace):
+        destination.write_text('"a"\n"b"\n')
+
+    ws.download_output_artifact = MagicMock(side_effect=download_output_artifact)
+
+    outputs = get_workflow_outputs("w", {"count": LinesOutput}, workflows_service=ws, download_directory=tmp_path)
+
+    assert list(outputs["count"].names) == ["a", "b"]
+    ws.stream_output_artifact.assert_not_called()
+    assert ws.download_output_artifact.call_args.args[3] == tmp_path / "count" / "names"
+
+
+def test_get_workflow_outputs_decompresses_artifacts(tmp_path: Path):
+    ws = WorkflowsService(host="https://localhost:2746", namespace="argo")
+    ws.get_workflow = MagicMock(return_value=_workflow())
+    ws.stream_output_artifact = MagicMock(return_value=iter([gzip.compress(b'["a", "b"]')]))
+
+    def download_output_artifact(name, node_id, artifact_name, destination, namespace):
+        destination.write_bytes(gzip.compress(b'"c"\n"d"\n'))
+
+    ws.download_output_artifact = MagicMock(side_effect=download_output_artifact)
+
+    loaded = get_workflow_outputs("w", {"count": CompressedOutput}, workflows_service=ws)
+    downloaded = get_workflow_outputs(
+        "w", {"count": CompressedLinesOutput}, workflows_service=ws, download_directory=tmp_path
+    )
+
+    assert loaded["count"].names == ["a", "b"]
+    assert list(downloaded["count"].names) == ["c", "d"]
+
+
+@pytest.mark.parametrize(
+    "name, error",
+    [
+        ("missing", "no task or step named 'missing'"),
+        ("loop", "2 nodes named 'loop', use the ID of one of them: w-3, w-4"),
+    ],
+)
+def test_get_workflow_outputs_unknown_node(name, error):
+    ws = WorkflowsService(host="https://localhost:2746", namespace="argo")
+    ws.get_workflow = MagicMock(return_value=_workflow())
+
+    with pytest.raises(ValueError, match=error):
+        get_workflow_outputs("w", {name: CountOutput}, workflows_service=ws)
+
+
+async def test_async_get_workflow_outputs(tmp_path: Path):
+    ws = AsyncWorkflowsService(host="https://localhost:2746", namespace="argo")
+
+    async def get_workflow(name, namespace, fields):
+        return _workflow()
+
+    async def stream_output_artifact(name, node_id, artifact_name, namespace):
+        yield _ARTIFACTS[(node_id, artifact_name)]
+
+    async def download_output_artifact(name, node_id, artifact_name, destination, namespace):
+        destination.write_bytes(_ARTIFACTS[(node_id, artifact_name)])
+
+    ws.get_workflow = get_workflow
+    ws.stream_output_artifact = stream_output_artifact
+    ws.download_output_artifact = download_output_artifact
+
+    outputs = await async_get_workflow_outputs(
+        "w", {"train": TrainOutput, "count": CountOutput}, workflows_service=ws, download_directory=tmp_path
+    )
+
+    assert outputs["train"].metrics == {"loss": 0.1}
+    assert outputs["train"].model.read_bytes() == b"model-weights"
+    assert outputs["count"].names == ["a", "b"]
+
+
+async def test_async_get_workflow_outputs_caps_concurrency_to_connections(tmp_path: Path):
+    ws = AsyncWorkflowsService(
+        host="https://localhost:2746", namespace="argo", transport_config=TransportConfig(max_connections_per_host=1)
+    )
+    streaming = 0
+    max_streaming = 0
+
+    async def get_workflow(name, namespace, fields):
+        return _workflow()
+
+    async def fetch(node_id, artifact_name):
+        nonlocal streaming, max_streaming
+        streaming += 1
+        max_streaming = max(max_streaming, streaming)
+        await asyncio.sleep(0.01)
+        streaming -= 1
+        return _ARTIFACTS[(node_id, artifact_name)]
+
+    async def stream_output_artifact(name, node_id, artifact_name, namespace):
+        yield await fetch(node_id, artifact_name)
+
+    async def download_output_artifact(name, node_id, artifact_name, destination, namespace):
+        destination.write_bytes(await fetch(node_id, artifact_name))
+
+    ws.get_workflow = get_workflow
+    ws.stream_output_artifact = stream_output_artifact
+    ws.download_output_artifact = download_output_artifact
+
+    outputs = await async_get_workflow_outputs(
+        "w",
+        {"train": TrainOutput, "count": CountOutput},
+        workflows_service=ws,
+        concurrency=8,
+        download_directory=tmp_path,
+    )
+
+    assert outputs["count"].names == ["a", "b"]
+    # as for `get_workflow_outputs`, the downloads are capped to the connections of the service
+    assert max_streaming == 1
@@ -0,0 +1,179 @@
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from hera.exceptions import NotFound, NotImplemented
+from hera.workflows import AsyncWorkflowsService, Workflow, WorkflowsService, WorkflowWaiter
+from hera.workflows.models import (
+    ListMeta,
+    ObjectMeta,
+    Workflow as ModelWorkflow,
+    WorkflowList,
+    WorkflowSpec,
+    WorkflowStatus as ModelWorkflowStatus,
+    WorkflowWatchEvent,
+)
+from tests.helper import FakeArgoServer
+
+
+def _model_workflow(name: str, phase: Optional[str]) -> ModelWorkflow:
+    return ModelWorkflow(
+        metadata=ObjectMeta(name=name),
+        spec=WorkflowSpec(),
+        status=ModelWorkflowStatus(phase=phase) if phase else None,
+    )
+
+
+def _workflow_list(*workflows: ModelWorkflow) -> WorkflowList:
+    return WorkflowList(metadata=ListMeta(), items=list(workflows))
+
+
+def test_as_completed_watches_namespace_and_yields_workflows_as_they_complete():
+    ws = WorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+    events = [
+        WorkflowWatchEvent(type="ADDED", object=_model_workflow("a", "Running")),
+        WorkflowWatchEvent(type="ADDED", object=_model_workflow("b", "Running")),
+        WorkflowWatchEvent(type="ADDED", object=_model_workflow("other", "Succeeded")),
+        WorkflowWatchEvent(type="MODIFIED", object=_model_workflow("b", "Failed")),
+        WorkflowWatchEvent(type="MODIFIED", object=_model_workflow("a", "Succeeded")),
+    ]
+    ws.stream_workflows = MagicMock(return_value=(event for event in events))
+
+    waiter = WorkflowWaiter(["a", "b"], workflows_service=ws, label_selector="batch=1")
+    completed = [(w.metadata.name, w.status.phase) for w in waiter.as_completed()]
+
+    assert completed == [("b", "Failed"), ("a", "Succeeded")]
+    # a single stream is opened for all the workflows of the namespace
+    ws.stream_workflows.assert_called_once()
+    assert ws.stream_workflows.call_args.kwargs["namespace"] == "my-namespace"
+    assert ws.stream_workflows.call_args.kwargs["label_selector"] == "batch=1"
+    assert "result.object.status.phase" in ws.stream_workflows.call_args.kwargs["fields"]
+
+
+def test_waiter_takes_service_and_namespace_from_workflows():
+    ws = WorkflowsService(host="https://localhost:2746", namespace="default")
+    waiter = WorkflowWaiter([Workflow(name="a", namespace="my-namespace", workflows_service=ws)])
+
+    assert waiter.workflows_service is ws
+    assert waiter.namespace == "my-namespace"
+    assert waiter.names == {"a"}
+
+
+def test_as_completed_raises_if_workflow_is_deleted():
+    ws = WorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+    events = [WorkflowWatchEvent(type="DELETED", object=_model_workflow("a", "Running"))]
+    ws.stream_workflows = MagicMock(return_value=(event for event in events))
+    ws.list_workflows = MagicMock()
+
+    with pytest.raises(NotFound, match="Workflow a was deleted"):
+        list(WorkflowWaiter(["a"], workflows_service=ws).as_completed())
+    ws.list_workflows.assert_not_called()
+
+
+@patch("hera.workflows.workflow_waiter.time.sleep")
+def test_as_completed_falls_back_to_listing_workflows(mock_sleep):
+    ws = WorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+    ws.stream_workflows = MagicMock(side_effect=NotImplemented("streaming not supported"))
+    ws.list_workflows = MagicMock(
+        side_effect=[
+            # "b" is not listed yet, as it was just created
+            _workflow_list(_model_workflow("a", "Running")),
+            _workflow_list(_model_workflow("a", "Succeeded"), _model_workflow("b", "Running")),
+            _workflow_list(_model_workflow("b", "Error")),
+        ]
+    )
+
+    completed = [w.metadata.name for w in WorkflowWaiter(["a", "b"], workflows_service=ws).as_completed()]
+
+    assert completed == ["a", "b"]
+    assert ws.list_workflows.call_count == 3
+    assert "items.status.phase" in ws.list_workflows.call_args.kwargs["fields"]
+    assert mock_sleep.call_count == 3
+
+
+@patch("hera.workflows.workflow_waiter.time.sleep")
+def test_as_completed_polling_raises_if_listed_workflow_disappears(mock_sleep):
+    ws = WorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+    ws.list_workflows = MagicMock(side_effect=[_workflow_list(_model_workflow("a", "Running")), _workflow_list()])
+
+    with pytest.raises(NotFound):
+        list(WorkflowWaiter(["a"], workflows_service=ws, watch=False).as_completed())
+
+
+async def test_async_as_completed_watches_namespace():
+    async def events(**kwargs):
+        yield WorkflowWatchEvent(type="MODIFIED", object=_model_workflow("a", "Error"))
+        yield WorkflowWatchEvent(type="MODIFIED", object=_model_workflow("b", "Succeeded"))
+
+    ws = AsyncWorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+    ws.stream_workflows = MagicMock(side_effect=events)
+
+    completed = [w.metadata.name async for w in WorkflowWaiter(["a", "b"], workflows_service=ws).async_as_completed()]
+
+    assert completed == ["a", "b"]
+
+
+@patch("hera.workflows.workflow_waiter.asyncio.sleep")
+async def test_async_as_completed_polls_workflows(mock_sleep):
+    ws = AsyncWorkflowsService(host="https://localhost:2746", namespace="my-namespace")
+    ws.list_workflows = AsyncMock(
+        side_effect=[_workflow_list(_model_workflow("a", "Running")), _workflow_list(_model_workflow("a", "Failed"))]
+    )
+
+    waiter = WorkflowWaiter(["a"], workflows_service=ws, watch=False)
+    completed = [w.status.phase async for w in waiter.async_as_completed()]
+
+    assert completed == ["Failed"]
+    assert mock_sleep.await_count == 2
+
+
+def _workflow_data(name: str, phase: str) -> dict:
+    return {
+        "metadata": {"name": name, "namespace": "argo", "resourceVersion": "2"},
+        "spec": {"entrypoint": "main"},
+        "status": {"phase": phase, "nodes": {name: {"id": name, "name": name, "type": "Pod"}}},
+    }
+
+
+@patch("hera.shared._stream.time.sleep")
+def test_as_completed_reads_projected_watch_events(mock_sleep):
+    server = FakeArgoServer(
+        [],
+        events=[
+            {"type": "MODIFIED", "object": _workflow_data("a", "Succeeded")},
+            {"type": "DELETED", "object": _workflow_data("b", "Running")},
+        ],
+    )
+    ws = WorkflowsService(host="https://localhost:2746", namespace="argo", session=server.session())
+
+    completed = WorkflowWaiter(["a", "b"], workflows_service=ws).as_completed()
+
+    workflow = next(completed)
+    assert workflow.metadata.name == "a"
+    assert workflow.status.phase == "Succeeded"
+    # only the outcome of the workflow is transferred
+    assert workflow.status.nodes is None
+    with pytest.raises(NotFound, match="Workflow b was deleted"):
+        next(completed)
+
+
+@patch("hera.workflows.workflow_waiter.time.sleep")
+def test_as_completed_reads_projected_workflow_lists(mock_sleep):
+    server = FakeArgoServer([_workflow_data("a", "Succeeded"), _workflow_data("b", "Error")])
+    ws = WorkflowsService(host="https://localhost:2746", namespace="argo", session=server.session())
+
+    completed = list(WorkflowWaiter(["a", "b"], workflows_service=ws).as_completed())
+
+    assert sorted((w.metadata.name, w.status.phase) for w in completed) == [("a", "Succeeded"), ("b", "Error")]
+    assert server.requests[1][1]["fields"].startswith("metadata.resourceVersion,items.metadata.name")
+
+
+@patch("hera.shared._stream.asyncio.sleep")
+async def test_async_as_completed_reads_projected_watch_events(mock_sleep):
+    server = FakeArgoServer([], events=[{"type": "DELETED", "object": _workflow_data("a", "Pending")}])
+    ws = AsyncWorkflowsService(host="https://localhost:2746", namespace="argo", session=server.client())
+
+    with pytest.raises(NotFound, match="Workflow a was deleted"):
+        async for _ in WorkflowWaiter(["a"], workflows_service=ws).async_as_completed():
+            pass
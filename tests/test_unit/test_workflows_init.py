@@ -0,0 +1,69 @@
+import importlib
+import json
+import subprocess
+import sys
+
+import hera.workflows
+
+# The cumulative time (in microseconds) `import hera.workflows` may take. It takes a few milliseconds, as no submodule
+# is imported, while importing all the submodules (and so the models) takes more than a second.
+_IMPORT_TIME_BUDGET = 250_000
+
+
+def _run(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+
+
+def test_import_loads_no_submodule():
+    modules = json.loads(_run("import json, sys; import hera.workflows; print(json.dumps(list(sys.modules)))"))
+
+    assert sorted(module for module in modules if module.startswith("hera.")) == ["hera._version", "hera.workflows"]
+    assert "pydantic" not in modules
+
+
+def test_import_time_budget():
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import hera.workflows"], check=True, capture_output=True, text=True
+    ).stderr
+    # each line is `import time: <self us> | <cumulative us> | <module>`
+    cumulative = next(int(line.split("|")[1]) for line in stderr.splitlines() if line.endswith("| hera.workflows"))
+
+    assert cumulative < _IMPORT_TIME_BUDGET
+
+
+def test_import_of_an_object_only_loads_its_module():
+    modules = json.loads(
+        _run("import json, sys; from hera.workflows import Parameter; print(json.dumps(list(sys.modules)))")
+    )
+
+    assert "hera.workflows.parameter" in modules
+    assert "hera.workflows.service" not in modules
+    assert "hera.workflows.async_service" not in modules
+
+
+def test_exports_are_loaded_lazily():
+    for name in hera.workflows.__all__:
+        module = importlib.import_module(hera.workflows._EXPORTS[name])
+        assert getattr(hera.workflows, name) is getattr(module, name)
+    assert set(hera.workflows.__all__) <= set(dir(hera.workflows))
+
+
+def test_submodules_do_not_shadow_exports():
+    import hera.workflows.script
+
+    # the `script` decorator is exported by the `script` module, which is also an attribute of `hera.workflows` once
+    # imported
+    assert callable(hera.workflows.script)
+    assert hera.workflows.script.__module__ == "hera.workflows.script"
+    assert sys.modules["hera.workflows.script"].Script is hera.workflows.Script
+
+
+def test_models_build_their_validators_when_first_used():
+    code = (
+        "import json; from hera.workflows.models import Workflow, WorkflowSpec;"
+        "before = Workflow.__pydantic_complete__;"
+        "Workflow(metadata={'name': 'w'}, spec=WorkflowSpec(templates=[{'name': 'a', 'steps': [[{'name': 's'}]]}]));"
+        "print(json.dumps([before, Workflow.__pydantic_complete__]))"
+    )
+
+    assert json.loads(_run(code)) == [False, True]
@@ -1,11 +1,19 @@
 import asyncio
+import itertools
+import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httpx
+import pytest
 from httpx import AsyncClient
-from requests import Session
+from requests import Response, Session
+from requests.exceptions import ChunkedEncodingError, ConnectionError
 
+from hera.exceptions import ChecksumMismatch, ContentChanged, Forbidden, NotFound
+from hera.shared._pagination import paginated_fields
 from hera.workflows.async_service import AsyncWorkflowsService
+from hera.workflows.models import WorkflowWatchEvent
 from hera.workflows.service import WorkflowsService
 
 
@@ -84,7 +92,7 @@ class TestWorkflowsService:
     def test_service_request_with_custom_session(self):
         with patch("requests.request") as mock_request, patch(f"{__name__}.CustomSession.request") as mock_session:
             mock_session.return_value.ok = True
-            mock_session.return_value.json.return_value = {"items": [], "metadata": {"resourceVersion": "42"}}
+            mock_session.return_value.content = json.dumps({"items": [], "metadata": {"resourceVersion": "42"}})
 
             session = CustomSession()
             with WorkflowsService(host="https://localhost:2746", session=session) as ws:
@@ -98,7 +106,7 @@ class TestWorkflowsService:
 
         with patch("requests.request") as mock_request, patch("requests.Session.request") as mock_session:
             mock_session.return_value.ok = True
-            mock_session.return_value.json.return_value = {"items": [], "metadata": {"resourceVersion": "42"}}
+            mock_session.return_value.content = json.dumps({"items": [], "metadata": {"resourceVersion": "42"}})
             service.list_workflows("argo")
 
         mock_session.assert_called_once()
@@ -200,9 +208,7 @@ class TestAsyncWorkflowsService:
             f"{__name__}.CustomAsyncClient.request"
         ) as mock_session:
             mock_session.return_value.is_success = True
-            mock_session.return_value.json = MagicMock(
-                return_value={"items": [], "metadata": {"resourceVersion": "42"}}
-            )
+            mock_session.return_value.content = json.dumps({"items": [], "metadata": {"resourceVersion": "42"}})
 
             session = CustomAsyncClient()
             async with AsyncWorkflowsService(host="https://localhost:2746", session=session) as ws:
@@ -216,9 +222,7 @@ class TestAsyncWorkflowsService:
 
         with patch("requests.request") as mock_request, patch("httpx.AsyncClient.request") as mock_session:
             mock_session.return_value.is_success = True
-            mock_session.return_value.json = MagicMock(
-                return_value={"items": [], "metadata": {"resourceVersion": "42"}}
-            )
+            mock_session.return_value.content = json.dumps({"items": [], "metadata": {"resourceVersion": "42"}})
             await service.list_workflows("argo")
 
         mock_session.assert_called_once()
@@ -230,3 +234,466 @@ class TestAsyncWorkflowsService:
                 pass
 
         mock_close.assert_called_once()
+
+
+def _watch_event_line(name: str, resource_version: str) -> str:
+    return json.dumps(
+        {
+            "result": {
+                "type": "MODIFIED",
+                "object": {"metadata": {"name": name, "resourceVersion": resource_version}, "spec": {}},
+            }
+        }
+    )
+
+
+class TestStreamWorkflows:
+    def test_stream_workflows_yields_events_and_resumes_after_reconnect(self):
+        first_response = MagicMock(ok=True)
+        first_response.__enter__.return_value = first_response
+
+        def first_lines(chunk_size):
+            yield _watch_event_line("w1", "1").encode()
+            yield b""
+            yield ("data: " + _watch_event_line("w2", "2")).encode()
+            raise ChunkedEncodingError("connection lost")
+
+        first_response.iter_lines.side_effect = first_lines
+        second_response = MagicMock(ok=True)
+        second_response.__enter__.return_value = second_response
+        second_response.iter_lines.return_value = iter([_watch_event_line("w3", "3").encode()])
+
+        service = WorkflowsService(host="https://localhost:2746", namespace="argo")
+        with patch("requests.Session.request", side_effect=[first_response, second_response]) as mock_request, patch(
+            "hera.shared._stream.time.sleep"
+        ) as mock_sleep:
+            events = list(itertools.islice(service.stream_workflows(label_selector="team=a"), 3))
+
+        assert [event.object.metadata.name for event in events] == ["w1", "w2", "w3"]
+        assert all(isinstance(event, WorkflowWatchEvent) for event in events)
+        assert mock_request.call_args_list[0].args == ("get", "https://localhost:2746/api/v1/workflow-events/argo")
+        assert mock_request.call_args_list[0].kwargs["params"]["listOptions.resourceVersion"] is None
+        assert mock_request.call_args_list[0].kwargs["params"]["listOptions.labelSelector"] == "team=a"
+        assert mock_request.call_args_list[0].kwargs["stream"] is True
+        assert mock_request.call_args_list[1].kwargs["params"]["listOptions.resourceVersion"] == "2"
+        mock_sleep.assert_called_once()
+
+    def test_stream_workflows_raises_on_non_retryable_status(self):
+        response = MagicMock(spec=Response, ok=False, status_code=403)
+        response.__enter__.return_value = response
+        response.json.return_value = {"message": "forbidden"}
+
+        service = WorkflowsService(host="https://localhost:2746", namespace="argo")
+        with patch("requests.Session.request", return_value=response):
+            with pytest.raises(Forbidden):
+                next(service.stream_workflows())
+
+    def test_stream_workflows_gives_up_after_max_reconnects(self):
+        service = WorkflowsService(host="https://localhost:2746", namespace="argo")
+        with patch("requests.Session.request", side_effect=ConnectionError("refused")) as mock_request, patch(
+            "hera.shared._stream.time.sleep"
+        ):
+            with pytest.raises(ConnectionError):
+                next(service.stream_workflows(max_reconnects=2))
+
+        assert mock_request.call_count == 3
+
+    def test_stream_workflows_raises_errors_sent_in_the_stream(self):
+        response = MagicMock(ok=True)
+        response.__enter__.return_value = response
+        response.iter_lines.return_value = iter([b'{"error": {"code": 5, "message": "not found"}}'])
+
+        service = WorkflowsService(host="https://localhost:2746", namespace="argo")
+        with patch("requests.Session.request", return_value=response):
+            with pytest.raises(NotFound, match="not found"):
+                next(service.stream_workflows())
+
+    async def test_async_stream_workflows_yields_events_and_resumes_after_reconnect(self):
+        requests_params = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests_params.append(dict(request.url.params))
+            if len(requests_params) == 1:
+                return httpx.Response(503, json={"message": "unavailable"})
+            if len(requests_params) == 2:
+                lines = [_watch_event_line("w1", "1"), "", _watch_event_line("w2", "2")]
+            else:
+                lines = [_watch_event_line("w3", "3")]
+            return httpx.Response(200, content="\n".join(lines).encode())
+
+        session = AsyncClient(transport=httpx.MockTransport(handler))
+        service = AsyncWorkflowsService(host="https://localhost:2746", namespace="argo", session=session)
+        events = []
+        with patch("hera.shared._stream.asyncio.sleep") as mock_sleep:
+            async for event in service.stream_workflows(resource_version="0"):
+                events.append(event)
+                if len(events) == 3:
+                    break
+
+        assert [event.object.metadata.name for event in events] == ["w1", "w2", "w3"]
+        assert [params.get("listOptions.resourceVersion") for params in requests_params] == ["0", "0", "2"]
+        assert mock_sleep.call_count == 2
+
+
+def _log_line(pod_name: str, content: str) -> bytes:
+    return json.dumps({"result": {"podName": pod_name, "content": content}}).encode()
+
+
+class TestStreamWorkflowLogs:
+    def test_stream_workflow_logs_resumes_after_last_entries(self):
+        first_response = MagicMock(ok=True)
+        first_response.__enter__.return_value = first_response
+
+        def first_lines(chunk_size):
+            yield _log_line("w-1", "2024-01-01T00:00:01.5Z first")
+            yield _log_line("w-2", "2024-01-01T00:00:02Z second")
+            raise ChunkedEncodingError("connection lost")
+
+        first_response.iter_lines.side_effect = first_lines
+        second_response = MagicMock(ok=True)
+        second_response.__enter__.return_value = second_response
+        # the stream resumes from the second of the oldest last entry, so the received entries are sent again
+        second_response.iter_lines.return_value = iter(
+            [
+                _log_line("w-1", "2024-01-01T00:00:01.5Z first"),
+                _log_line("w-2", "2024-01-01T00:00:02Z second"),
+                _log_line("w-1", "2024-01-01T00:00:03Z third"),
+            ]
+        )
+
+        service = WorkflowsService(host="https://localhost:2746", namespace="argo")
+        with patch("requests.Session.request", side_effect=[first_response, second_response]) as mock_request, patch(
+            "hera.shared._stream.time.sleep"
+        ):
+            entries = list(service.stream_workflow_logs("w", follow=True, tail_lines=10))
+
+        assert [(entry.pod_name, entry.content) for entry in entries] == [
+            ("w-1", "first"),
+            ("w-2", "second"),
+            ("w-1", "third"),
+        ]
+        assert mock_request.call_args_list[0].args == ("get", "https://localhost:2746/api/v1/workflows/argo/w/log")
+        first_params, second_params = (call.kwargs["params"] for call in mock_request.call_args_list)
+        assert first_params["logOptions.follow"] is True
+        assert first_params["logOptions.timestamps"] is True
+        assert first_params["logOptions.tailLines"] == 10
+        assert second_params["logOptions.sinceTime.seconds"] == "1704067201"
+        assert second_params["logOptions.tailLines"] is None
+
+    def test_stream_workflow_logs_ends_with_the_stream(self):
+        response = MagicMock(ok=True)
+        response.__enter__.return_value = response
+        response.iter_lines.return_value = iter([_log_line("w-1", "2024-01-01T00:00:01Z done")])
+
+        service = WorkflowsService(host="https://localhost:2746", namespace="argo")
+        with patch("requests.Session.request", return_value=response) as mock_request:
+            entries = list(service.stream_workflow_logs("w", timestamps=True))
+
+        assert [entry.content for entry in entries] == ["2024-01-01T00:00:01Z done"]
+        mock_request.assert_called_once()
+
+    async def test_async_stream_workflow_logs(self):
+        requests_params = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests_params.append(dict(request.url.params))
+            if len(requests_params) == 1:
+                return httpx.Response(503, json={"message": "unavailable"})
+            lines = [_log_line("w-1", "2024-01-01T00:00:01Z first"), b"", _log_line("w-2", "2024-01-01T00:00:02Z x")]
+            return httpx.Response(200, content=b"\n".join(lines))
+
+        session = AsyncClient(transport=httpx.MockTransport(handler))
+        service = AsyncWorkflowsService(host="https://localhost:2746", namespace="argo", session=session)
+        with patch("hera.shared._stream.asyncio.sleep"):
+            entries = [entry async for entry in service.stream_workflow_logs("w", pod_name="w-1")]
+
+        assert [(entry.pod_name, entry.content) for entry in entries] == [("w-1", "first"), ("w-2", "x")]
+        assert requests_params[-1]["podName"] == "w-1"
+        assert requests_params[-1]["logOptions.timestamps"] == "true"
+
+
+def _workflow_list_page(names, continue_token=None) -> dict:
+    return {
+        "metadata": {"continue": continue_token} if continue_token else {},
+        "items": [{"metadata": {"name": name}, "spec": {}} for name in names],
+    }
+
+
+class TestIterWorkflows:
+    def test_iter_workflows_pages_through_results(self):
+        service = WorkflowsService(host="https://localhost:2746", namespace="argo")
+        pages = [_workflow_list_page(["w1", "w2"], "token-1"), _workflow_list_page(["w3"])]
+        responses = []
+        for page in pages:
+            response = MagicMock(spec=Response, ok=True)
+            response.content = json.dumps(page)
+            responses.append(response)
+
+        with patch("requests.Session.request", side_effect=responses) as mock_request:
+            workflows = service.iter_workflows(resource_version="10", fields="items.metadata.name", limit=2)
+            # pages are only fetched as the workflows are consumed
+            assert next(workflows).metadata.name == "w1"
+            assert mock_request.call_count == 1
+            names = ["w1"] + [workflow.metadata.name for workflow in workflows]
+
+        assert names == ["w1", "w2", "w3"]
+        params = [call.kwargs["params"] for call in mock_request.call_args_list]
+        assert [p["listOptions.limit"] for p in params] == ["2", "2"]
+        assert [p["listOptions.continue"] for p in params] == [None, "token-1"]
+        # the continue token already holds the resource version of the first page
+        assert [p["listOptions.resourceVersion"] for p in params] == ["10", None]
+        assert params[0]["fields"] == "items.metadata.name,metadata.continue"
+
+    @pytest.mark.parametrize(
+        "fields,expected",
+        [
+            (None, None),
+            ("items.metadata.name", "items.metadata.name,metadata.continue"),
+            ("metadata,items.metadata.name", "metadata,items.metadata.name"),
+            ("-items.status.nodes", "-items.status.nodes"),
+        ],
+    )
+    def test_paginated_fields(self, fields, expected):
+        assert paginated_fields(fields) == expected
+
+    async def test_async_iter_workflows_pages_through_results(self):
+        requests_params = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests_params.append(dict(request.url.params))
+            if len(requests_params) == 1:
+                return httpx.Response(200, json=_workflow_list_page(["w1"], "token-1"))
+            return httpx.Response(200, json=_workflow_list_page(["w2"]))
+
+        session = AsyncClient(transport=httpx.MockTransport(handler))
+        service = AsyncWorkflowsService(host="https://localhost:2746", namespace="argo", session=session)
+        names = [workflow.metadata.name async for workflow in service.iter_archived_workflows(limit=1)]
+
+        assert names == ["w1", "w2"]
+        assert [params.get("listOptions.continue") for params in requests_params] == [None, "token-1"]
+
+
+def _download_response(status_code: int, chunks, error: Exception = None, headers=None) -> MagicMock:
+    def iter_content(chunk_size):
+        yield from chunks
+        if error is not None:
+            raise error
+
+    response = MagicMock(ok=200 <= status_code < 300, status_code=status_code, headers=headers or {})
+    response.__enter__.return_value = response
+    response.iter_content.side_effect = iter_content
+    return response
+
+
+class TestDownloadArtifacts:
+    def test_stream_output_artifact_resumes_with_range_request(self):
+        responses = [
+            _download_response(200, [b"abc", b"de"], ChunkedEncodingError("connection lost")),
+            _download_response(206, [b"fgh"]),
+        ]
+        service = WorkflowsService(host="https://localhost:2746", namespace="argo", token="abc-123")
+        with patch("requests.Session.request", side_effect=responses) as mock_request, patch(
+            "hera.shared._download.time.sleep"
+        ):
+            content = b"".join(service.stream_output_artifact("w", "node-1", "data"))
+
+        assert content == b"abcdefgh"
+        first_call, second_call = mock_request.call_args_list
+        assert first_call.args == ("get", "https://localhost:2746/artifacts/argo/w/node-1/data")
+        assert "Range" not in first_call.kwargs["headers"]
+        assert second_call.kwargs["headers"]["Range"] == "bytes=5-"
+        assert second_call.kwargs["headers"]["Authorization"] == "Bearer abc-123"
+
+    def test_stream_output_artifact_skips_received_bytes_if_range_ignored(self):
+        responses = [
+            _download_response(200, [b"abc"], ChunkedEncodingError("connection lost")),
+            _download_response(200, [b"ab", b"cdef"]),
+        ]
+        service = WorkflowsService(host="https://localhost:2746", namespace="argo")
+        with patch("requests.Session.request", side_effect=responses), patch("hera.shared._download.time.sleep"):
+            content = b"".join(service.stream_output_artifact("w", "node-1", "data"))
+
+        assert content == b"abcdef"
+
+    def test_stream_output_artifact_resumes_if_unchanged(self):
+        responses = [
+            _download_response(200, [b"abc"], ChunkedEncodingError("connection lost"), headers={"ETag": '"v1"'}),
+            _download_response(200, [b"xyzxyz"], headers={"ETag": '"v2"'}),
+        ]
+        service = WorkflowsService(host="https://localhost:2746", namespace="argo")
+        with patch("requests.Session.request", side_effect=responses) as mock_request, patch(
+            "hera.shared._download.time.sleep"
+        ):
+            with pytest.raises(ContentChanged):
+                b"".join(service.stream_output_artifact("w", "node-1", "data"))
+
+        assert mock_request.call_args.kwargs["headers"]["If-Range"] == '"v1"'
+
+    def test_download_output_artifact_saves_validator(self, tmp_path: Path):
+        destination = tmp_path / "data.txt"
+        responses = [
+            _download_response(
+                200, [b"abc"], ChunkedEncodingError("connection lost"), headers={"Last-Modified": "Wed, 1 Jan 2025"}
+            ),
+        ]
+        service = WorkflowsService(host="https://localhost:2746", namespace="argo")
+        with patch("requests.Session.request", side_effect=responses), patch("hera.shared._download.time.sleep"):
+            with pytest.raises(ChunkedEncodingError):
+                service.download_output_artifact("w", "node-1", "data", destination, max_retries=0)
+
+        assert (tmp_path / "data.txt.part").read_bytes() == b"abc"
+        assert (tmp_path / "data.txt.part.validator").read_text() == "Wed, 1 Jan 2025"
+
+    def test_download_output_artifact_restarts_changed_part_file(self, tmp_path: Path):
+        destination = tmp_path / "data.txt"
+        (tmp_path / "data.txt.part").write_bytes(b"abc")
+        (tmp_path / "data.txt.part.validator").write_text('"v1"')
+        responses = [
+            # the file changed, so the server ignores the range
+            _download_response(200, [b"uvwxyz"], headers={"ETag": '"v2"'}),
+            _download_response(200, [b"uvwxyz"], headers={"ETag": '"v2"'}),
+        ]
+        service = WorkflowsService(host="https://localhost:2746", namespace="argo")
+        with patch("requests.Session.request", side_effect=responses) as mock_request:
+            size = service.download_output_artifact("w", "node-1", "data", destination)
+
+        assert size == 6
+        assert destination.read_bytes() == b"uvwxyz"
+        first_call, second_call = mock_request.call_args_list
+        assert first_call.kwargs["headers"]["Range"] == "bytes=3-"
+        assert first_call.kwargs["headers"]["If-Range"] == '"v1"'
+        assert "Range" not in second_call.kwargs["headers"]
+        assert not (tmp_path / "data.txt.part.validator").exists()
+
+    def test_download_output_artifact_restarts_part_file_without_validator(self, tmp_path: Path):
+        destination = tmp_path / "data.txt"
+        (tmp_path / "data.txt.part").write_bytes(b"abc")
+        service = WorkflowsService(host="https://localhost:2746", namespace="argo")
+        with patch("requests.Session.request", return_value=_download_response(200, [b"uvwxyz"])) as mock_request:
+            assert service.download_output_artifact("w", "node-1", "data", destination) == 6
+
+        assert destination.read_bytes() == b"uvwxyz"
+        assert "Range" not in mock_request.call_args.kwargs["headers"]
+
+    def test_download_output_artifact_resumes_part_file(self, tmp_path: Path):
+        destination = tmp_path / "data.txt"
+        (tmp_path / "data.txt.part").write_bytes(b"abc")
+        (tmp_path / "data.txt.part.validator").write_text('"v1"')
+        service = WorkflowsService(host="https://localhost:2746", namespace="argo")
+        with patch("requests.Session.request", return_value=_download_response(206, [b"def"])) as mock_request:
+            size = service.download_output_artifact(
+                "w",
+                "node-1",
+                "data",
+                destination,
+                checksum="sha256:bef57ec7f53a6d40beb640a780a639c83bc29ac8a9816f1fc6c5c6dcd93c4721",
+            )
+
+        assert size == 6
+        assert destination.read_bytes() == b"abcdef"
+        assert not (tmp_path / "data.txt.part").exists()
+        assert mock_request.call_args.kwargs["headers"]["Range"] == "bytes=3-"
+        assert mock_request.call_args.kwargs["headers"]["If-Range"] == '"v1"'
+        assert not (tmp_path / "data.txt.part.validator").exists()
+
+    def test_download_output_artifact_completed_part_file(self, tmp_path: Path):
+        destination = tmp_path / "data.txt"
+        (tmp_path / "data.txt.part").write_bytes(b"abcdef")
+        (tmp_path / "data.txt.part.validator").write_text('"v1"')
+        service = WorkflowsService(host="https://localhost:2746", namespace="argo")
+        response = _download_response(416, [], headers={"Content-Range": "bytes */6"})
+        with patch("requests.Session.request", return_value=response) as mock_request:
+            assert service.download_output_artifact("w", "node-1", "data", destination) == 6
+
+        assert destination.read_bytes() == b"abcdef"
+        assert mock_request.call_count == 1
+
+    @pytest.mark.parametrize("content_range", ["bytes */4", None], ids=["shorter", "unknown"])
+    def test_download_output_artifact_restarts_part_file_past_the_end(self, tmp_path: Path, content_range):
+        destination = tmp_path / "data.txt"
+        (tmp_path / "data.txt.part").write_bytes(b"abcdef")
+        (tmp_path / "data.txt.part.validator").write_text('"v1"')
+        responses = [
+            _download_response(416, [], headers={"Content-Range": content_range} if content_range else {}),
+            _download_response(200, [b"wxyz"], headers={"ETag": '"v2"'}),
+        ]
+        service = WorkflowsService(host="https://localhost:2746", namespace="argo")
+        with patch("requests.Session.request", side_effect=responses):
+            assert service.download_output_artifact("w", "node-1", "data", destination) == 4
+
+        assert destination.read_bytes() == b"wxyz"
+
+    def test_download_output_artifact_raises_if_changed_again(self, tmp_path: Path):
+        destination = tmp_path / "data.txt"
+        responses = [
+            _download_response(200, [b"abc"], ChunkedEncodingError("connection lost"), headers={"ETag": '"v1"'}),
+            _download_response(200, [b"uvwxyz"], headers={"ETag": '"v2"'}),
+            _download_response(200, [b"uvw"], ChunkedEncodingError("connection lost"), headers={"ETag": '"v2"'}),
+            _download_response(200, [b"012345"], headers={"ETag": '"v3"'}),
+        ]
+        service = WorkflowsService(host="https://localhost:2746", namespace="argo")
+        with patch("requests.Session.request", side_effect=responses), patch("hera.shared._download.time.sleep"):
+            with pytest.raises(ContentChanged):
+                service.download_output_artifact("w", "node-1", "data", destination)
+
+        assert not destination.exists()
+
+    def test_download_output_artifact_checksum_mismatch(self, tmp_path: Path):
+        destination = tmp_path / "data.txt"
+        service = WorkflowsService(host="https://localhost:2746", namespace="argo")
+        with patch("requests.Session.request", return_value=_download_response(200, [b"abcdef"])):
+            with pytest.raises(ChecksumMismatch):
+                service.download_output_artifact("w", "node-1", "data", destination, checksum="md5:0000")
+
+        # the corrupted download is not resumed
+        assert not destination.exists()
+        assert not (tmp_path / "data.txt.part").exists()
+
+    def test_download_output_artifact_raises_on_non_retryable_status(self, tmp_path: Path):
+        response = Response()
+        response.status_code = 404
+        response._content = json.dumps({"message": "artifact not found"}).encode()
+        service = WorkflowsService(host="https://localhost:2746", namespace="argo")
+        with patch("requests.Session.request", return_value=response):
+            with pytest.raises(NotFound, match="artifact not found"):
+                service.download_output_artifact("w", "node-1", "data", tmp_path / "data.txt")
+
+    async def test_async_download_input_artifact_resumes_with_range_request(self, tmp_path: Path):
+        ranges = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            ranges.append(request.headers.get("Range"))
+            if len(ranges) == 1:
+                return httpx.Response(503, json={"message": "unavailable"})
+            return httpx.Response(206, content=b"def")
+
+        (tmp_path / "data.txt.part").write_bytes(b"abc")
+        (tmp_path / "data.txt.part.validator").write_text('"v1"')
+        session = AsyncClient(transport=httpx.MockTransport(handler))
+        service = AsyncWorkflowsService(host="https://localhost:2746", namespace="argo", session=session)
+        with patch("hera.shared._download.asyncio.sleep"):
+            size = await service.download_input_artifact("w", "node-1", "data", tmp_path / "data.txt")
+
+        assert size == 6
+        assert (tmp_path / "data.txt").read_bytes() == b"abcdef"
+        assert ranges == ["bytes=3-", "bytes=3-"]
+
+    async def test_async_download_input_artifact_restarts_changed_part_file(self, tmp_path: Path):
+        requests_headers = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests_headers.append(request.headers)
+            if len(requests_headers) == 1:
+                return httpx.Response(416, headers={"Content-Range": "bytes */2"})
+            return httpx.Response(200, content=b"xy", headers={"ETag": '"v2"'})
+
+        (tmp_path / "data.txt.part").write_bytes(b"abc")
+        (tmp_path / "data.txt.part.validator").write_text('"v1"')
+        session = AsyncClient(transport=httpx.MockTransport(handler))
+        service = AsyncWorkflowsService(host="https://localhost:2746", namespace="argo", session=session)
+        size = await service.download_input_artifact("w", "node-1", "data", tmp_path / "data.txt")
+
+        assert size == 2
+        assert (tmp_path / "data.txt").read_bytes() == b"xy"
+        assert requests_headers[0]["If-Range"] == '"v1"'
+        assert "Range" not in requests_headers[1]
@@ -2,6 +2,7 @@ from textwrap import dedent
 from unittest.mock import patch
 
 import pytest
+import yaml
 
 from hera import _yaml
 
@@ -73,6 +74,45 @@ def test_dump_does_not_modify_block_scalars():
     )
 
 
+@pytest.mark.skipif(_yaml._CDumper is None, reason="PyYAML was not built with libyaml")
+@pytest.mark.parametrize(
+    "value",
+    [
+        "plain string",
+        "ref={{= sprig.trunc(7, workflow.parameters.gh-ref) }}, push={{ workflow.parameters.push }} " * 3,
+        "multiline\n  string\n",
+        "multiline string with a trailing space \n" * 5,
+        "string with a tab\tand non-ascii characters: é, ü " * 5,
+        "",
+        "- item: {{inputs.parameters.x}}",
+    ],
+)
+@pytest.mark.parametrize("kwargs", [{}, {"width": 20}, {"indent": 4}])
+def test_dump_libyaml_emitter_output_is_identical(value, kwargs):
+    data = {"key": value, "list": [value, {"nested key": value}]}
+
+    with patch.object(_yaml, "_CDumper", new=None):
+        python_result = _yaml.dump(data, **kwargs)
+
+    assert _yaml.dump(data, **kwargs) == python_result
+
+
+@pytest.mark.skipif(_yaml._CDumper is None, reason="PyYAML was not built with libyaml")
+def test_dump_uses_libyaml_emitter():
+    with patch.object(yaml, "dump", wraps=yaml.dump) as mock_dump:
+        _yaml.dump({"key": "value"})
+        _yaml.dump({"key": "value"}, Dumper=yaml.Dumper)
+        _yaml.dump({"key": "string with a tab\tand a trailing space "})
+
+    assert [call.kwargs.get("Dumper", yaml.Dumper) for call in mock_dump.call_args_list] == [
+        _yaml._CDumper,
+        yaml.Dumper,
+        _yaml._CDumper,
+        # The pure-Python emitter is used when libyaml could emit a string differently
+        yaml.Dumper,
+    ]
+
+
 def test_yaml_missing():
     with patch("hera._yaml._yaml", new=None):
         with pytest.raises(ImportError) as e: